@@ -0,0 +1,44 @@
+"""add_transcript_idempotency_key
+
+Revision ID: b3e1c7d9f2a4
+Revises: 738f30c0e1d2
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e1c7d9f2a4'
+down_revision: Union[str, None] = '738f30c0e1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. transcripts 테이블에 배치 수집 멱등성 키 컬럼 추가
+    op.add_column(
+        'transcripts',
+        sa.Column(
+            'idempotency_key',
+            sa.String(length=64),
+            nullable=True,
+            comment='배치 수집 멱등성 키 (Worker 생성)',
+        ),
+    )
+
+    # 2. 회의별 키 유니크 인덱스 (기존 행은 NULL → 충돌 없음)
+    op.create_index(
+        'ix_transcripts_meeting_id_idempotency_key',
+        'transcripts',
+        ['meeting_id', 'idempotency_key'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transcripts_meeting_id_idempotency_key', table_name='transcripts')
+    op.drop_column('transcripts', 'idempotency_key')
@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 from openai import RateLimitError
 from pydantic import BaseModel, Field
@@ -27,6 +27,7 @@ from app.services.context_runtime import (
     get_transcript_start_ms,
     update_runtime_from_db,
 )
+from app.services.context_sharding import route_context_request
 from app.services.transcript_service import TranscriptService
 
 logger = logging.getLogger(__name__)
@@ -92,9 +93,15 @@ def get_agent_service() -> AgentService:
 )
 async def update_agent_context(
     request: AgentMeetingCallRequest,
+    http_request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Agent context update -200만 반환"""
+    # 다른 레플리카가 회의 런타임 오너면 그쪽으로 전달
+    forwarded = await route_context_request(http_request, str(request.meeting_id))
+    if forwarded is not None:
+        return forwarded
+
     logger.info(
         "Agent context update 요청: meeting_id=%s, pre_transcript_id=%s",
         request.meeting_id,
@@ -129,8 +136,14 @@ async def update_agent_context(
 )
 async def run_agent_with_context(
     request: AgentMeetingRequest,
+    http_request: Request,
     agent_service: Annotated[AgentService, Depends(get_agent_service)],
 ):
+    # 다른 레플리카가 회의 런타임 오너면 SSE 스트림을 프록시
+    forwarded = await route_context_request(http_request, str(request.meeting_id))
+    if forwarded is not None:
+        return forwarded
+
     # ===== 1. 스트리밍 전 DB 작업 완료 (자체 세션 - 즉시 반환) =====
     async with async_session_maker() as db:
         # transcriptId로 현재 발화 조회
@@ -16,6 +16,8 @@ from app.core.topic_pubsub import subscribe_topic_updates
 from app.models.meeting import Meeting
 from app.schemas.context import TopicFeedResponse, TopicItem
 from app.services.context_runtime import get_or_create_runtime, update_runtime_from_db
+from app.services.context_sharding import route_context_request
+from app.services.topic_feed import get_topic_feed
 
 logger = logging.getLogger(__name__)
 
@@ -36,32 +38,9 @@ async def _build_topic_response(
     if runtime.manager.has_pending_l1 or runtime.manager.is_l1_running:
         await runtime.manager.await_l1_idle()
 
+    # 최신순 정렬된 전체 토픽 + 델타 기준점(epoch/seq)
     async with runtime.lock:
-        manager = runtime.manager
-
-        topics = [
-            {
-                "id": seg.id,
-                "name": seg.name,
-                "summary": seg.summary,
-                "startTurn": seg.start_utterance_id,
-                "endTurn": seg.end_utterance_id,
-                "keywords": seg.keywords,
-            }
-            for seg in manager.l1_segments
-        ]
-
-        # 최신순 정렬 (endTurn 내림차순)
-        topics.sort(key=lambda t: t["endTurn"], reverse=True)
-
-        return {
-            "meetingId": meeting_id,
-            "pendingChunks": len(manager._pending_l1_chunks),
-            "isL1Running": manager.is_l1_running,
-            "currentTopic": manager.current_topic,
-            "topics": topics,
-            "updatedAt": datetime.now(timezone.utc).isoformat(),
-        }
+        return get_topic_feed(meeting_id, runtime).snapshot()
 
 
 @router.get(
@@ -75,6 +54,7 @@ async def _build_topic_response(
     },
 )
 async def get_meeting_topics(
+    request: Request,
     meeting: Annotated[Meeting, Depends(require_meeting_participant)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> TopicFeedResponse:
@@ -83,9 +63,16 @@ async def get_meeting_topics(
     토픽은 25발화 단위로 생성되며, 최신 토픽이 먼저 반환됩니다.
 
     **권장**: SSE 스트리밍 엔드포인트 `/context/topics/stream` 사용
+
+    SSE 델타에서 seq 누락(또는 epoch 변경)을 감지한 클라이언트의 재동기화 기준으로도 사용합니다.
     """
     meeting_id = str(meeting.id)
 
+    # 다른 레플리카가 회의 런타임 오너면 그쪽 응답을 그대로 반환
+    forwarded = await route_context_request(request, meeting_id)
+    if forwarded is not None:
+        return forwarded
+
     runtime = await get_or_create_runtime(meeting_id)
 
     # 최신 발화 반영
@@ -98,6 +85,7 @@ async def get_meeting_topics(
 
     async with runtime.lock:
         manager = runtime.manager
+        feed = get_topic_feed(meeting_id, runtime)
 
         topics = [
             TopicItem(
@@ -120,6 +108,8 @@ async def get_meeting_topics(
             current_topic=manager.current_topic,
             topics=topics,
             updated_at=datetime.now(timezone.utc),
+            epoch=feed.epoch,
+            seq=feed.seq,
         )
 
 
@@ -138,19 +128,27 @@ async def stream_meeting_topics(
     """회의의 L1 토픽을 SSE로 스트리밍합니다.
 
     **이벤트 타입:**
-    - `init`: 초기 토픽 데이터 (연결 직후)
-    - `update`: 토픽 변경 시
+    - `init`: 초기 토픽 데이터 (연결 직후, 전체 토픽 + epoch/seq)
+    - `update`: 토픽 변경 델타 (debounce, `changedTopics`/`removedTopicIds` + seq)
     - `heartbeat`: 30초마다 keep-alive
 
+    **델타 적용:** `update.seq`가 마지막 seq + 1이면 적용, 이하면 무시,
+    건너뛰었거나 epoch가 다르면 `GET /context/topics`로 재동기화
+
     **사용 예시:**
     ```javascript
     const es = new EventSource('/api/v1/meetings/{id}/context/topics/stream');
     es.onmessage = (e) => console.log(JSON.parse(e.data));
-    es.addEventListener('update', (e) => setTopics(JSON.parse(e.data)));
+    es.addEventListener('update', (e) => applyTopicDelta(JSON.parse(e.data)));
     ```
     """
     meeting_id = str(meeting.id)
 
+    # 초기 데이터는 오너 런타임 기준이어야 하므로 오너로 스트림 프록시
+    forwarded = await route_context_request(request, meeting_id)
+    if forwarded is not None:
+        return forwarded
+
     # 초기 데이터 조회 (자체 세션 사용 - 스트리밍 중 커넥션 풀 고갈 방지)
     async with async_session_maker() as db:
         initial_data = await _build_topic_response(meeting_id, db)
@@ -170,7 +168,14 @@ async def stream_meeting_topics(
                 if message["type"] == "heartbeat":
                     yield ": heartbeat\n\n"
                 elif message["type"] == "update":
-                    data = json.dumps(message["data"], ensure_ascii=False)
+                    delta = message["data"]
+                    # init snapshot에 이미 반영된 델타는 건너뜀
+                    if (
+                        delta.get("epoch") == initial_data["epoch"]
+                        and delta.get("seq", 0) <= initial_data["seq"]
+                    ):
+                        continue
+                    data = json.dumps(delta, ensure_ascii=False)
                     yield f"event: update\ndata: {data}\n\n"
 
         except asyncio.CancelledError:
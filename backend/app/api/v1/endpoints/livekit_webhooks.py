@@ -23,6 +23,7 @@ from app.core.neo4j_sync import neo4j_sync
 from app.core.telemetry import get_mit_metrics
 from app.infrastructure.worker_manager import WorkerStatusEnum, get_worker_manager
 from app.models.meeting import Meeting, MeetingStatus
+from app.services.context_runtime import discard_runtime
 from app.services.vad_event_service import vad_event_service
 
 logger = logging.getLogger(__name__)
@@ -233,7 +234,7 @@ async def handle_room_finished(body: dict, db: AsyncSession) -> None:
 
     happy path: Worker가 이미 /complete 호출 → COMPLETED 상태 → Job 삭제만 수행
     fallback: Worker 크래시 등으로 미완료 → 전체 완료 처리 + Job 삭제
-    항상 수행: Clova API 키 반환, VAD 메타데이터 저장, Job 삭제
+    항상 수행: Clova API 키 반환, VAD 메타데이터 저장, Context 런타임/스냅샷 정리, Job 삭제
     """
     room = body.get("room", {})
     room_name = room.get("name", "")
@@ -270,6 +271,12 @@ async def handle_room_finished(body: dict, db: AsyncSession) -> None:
     except Exception as e:
         logger.error(f"[LiveKit] Failed to save VAD metadata: {e}")
 
+    # Context 런타임/스냅샷 정리 (재입장 시 종료 시점 스냅샷 복원 방지)
+    try:
+        await discard_runtime(meeting_id_str)
+    except Exception as e:
+        logger.error(f"[LiveKit] Failed to discard context runtime: {e}")
+
     # Meeting 상태 확인 및 fallback 처리
     try:
         meeting_uuid = UUID(meeting_id_str)
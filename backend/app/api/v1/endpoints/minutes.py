@@ -7,14 +7,14 @@ import json
 from typing import Annotated
 
 from arq.jobs import Job, JobStatus
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import get_arq_pool, get_current_user, handle_service_error
 from app.core.neo4j import get_neo4j_driver
 from app.models.user import User
 from app.schemas import ErrorResponse
-from app.schemas.minutes import MinutesResponse, MinutesStatusResponse
+from app.schemas.minutes import MinutesDeltaResponse, MinutesResponse, MinutesStatusResponse
 from app.services.minutes_events import minutes_event_manager
 from app.services.minutes_service import MinutesService
 
@@ -29,24 +29,45 @@ def get_minutes_service() -> MinutesService:
 
 @meetings_minutes_router.get(
     "/{meeting_id}/minutes",
-    response_model=MinutesResponse,
+    response_model=MinutesResponse | MinutesDeltaResponse,
     summary="Minutes View 조회",
-    description="회의록 전체 View를 중첩 구조로 조회합니다. (Agenda → Decision → Suggestion/Comment)",
+    description=(
+        "회의록 전체 View를 중첩 구조로 조회합니다. (Agenda → Decision → Suggestion/Comment)\n\n"
+        "응답의 ETag를 If-None-Match로 보내면 변경이 없을 때 304를 반환합니다. "
+        "since_version(이전 응답 또는 minutes 이벤트의 version)을 보내면 "
+        "그 이후 바뀐 Decision만 델타로 반환하며, 델타를 만들 수 없으면 전체 View를 반환합니다."
+    ),
     responses={
+        304: {"description": "변경 없음 (If-None-Match 일치)"},
         401: {"model": ErrorResponse},
         404: {"model": ErrorResponse},
     },
 )
 async def get_minutes(
     meeting_id: str,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
     service: Annotated[MinutesService, Depends(get_minutes_service)],
-) -> MinutesResponse:
+    since_version: Annotated[int | None, Query(ge=0, description="클라이언트가 가진 스냅샷 버전")] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> MinutesResponse | MinutesDeltaResponse | Response:
     try:
-        return await service.get_minutes(meeting_id)
+        result = await service.get_minutes_view(
+            meeting_id, since_version=since_version, if_none_match=if_none_match
+        )
     except ValueError as e:
         handle_service_error(e)
 
+    if result.etag is None:
+        return result.body
+
+    # 브라우저가 매번 ETag로 재검증하도록
+    headers = {"ETag": result.etag, "Cache-Control": "private, no-cache"}
+    if result.body is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return result.body
+
 
 @meetings_minutes_router.get(
     "/{meeting_id}/minutes/status",
@@ -104,6 +125,7 @@ async def minutes_events(meeting_id: str) -> StreamingResponse:
     - suggestion_created: 제안 생성
     - decision_updated: 결정 수정
     - decision_review_changed: 승인/거절
+    - (모든 변경 이벤트에 Minutes 스냅샷 version 포함 → since_version 델타 조회)
     - keepalive: 연결 유지 (30초 간격)
 
     Args:
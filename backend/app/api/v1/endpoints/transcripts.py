@@ -5,7 +5,7 @@ import logging
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_arq_pool, require_meeting_participant
@@ -14,6 +14,8 @@ from app.core.database import get_db
 from app.core.telemetry import get_mit_metrics
 from app.models.meeting import Meeting
 from app.schemas.transcript import (
+    CreateTranscriptBatchRequest,
+    CreateTranscriptBatchResponse,
     CreateTranscriptRequest,
     CreateTranscriptResponse,
     GetMeetingTranscriptsResponse,
@@ -23,6 +25,7 @@ from app.services.context_runtime import (
     get_runtime_if_exists,
     update_runtime_from_db,
 )
+from app.services.context_sharding import route_context_request
 from app.services.transcript_service import TranscriptService
 
 logger = logging.getLogger(__name__)
@@ -52,6 +55,43 @@ def _serialize_runtime_topics(runtime: ContextRuntimeState) -> list[dict]:
     return topics
 
 
+def _transcript_error(e: ValueError) -> HTTPException:
+    """TranscriptService ValueError → HTTPException"""
+    error_code = str(e)
+    if error_code == "MEETING_ID_MISMATCH":
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "MEETING_ID_MISMATCH",
+                "message": "Path meeting_id와 body meetingId가 일치하지 않습니다.",
+            },
+        )
+    if error_code == "INVALID_TIME_RANGE":
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "INVALID_TIME_RANGE",
+                "message": "endMs는 startMs보다 커야 합니다.",
+            },
+        )
+    if error_code == "MEETING_NOT_FOUND":
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "MEETING_NOT_FOUND",
+                "message": "회의를 찾을 수 없습니다.",
+            },
+        )
+    # 예상치 못한 에러
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={
+            "error": "VALIDATION_ERROR",
+            "message": str(e),
+        },
+    )
+
+
 @router.post(
     "/{meeting_id}/transcripts",
     response_model=CreateTranscriptResponse,
@@ -98,40 +138,65 @@ async def create_transcript(
     try:
         return await transcript_service.create_transcript(meeting_id, request)
     except ValueError as e:
-        error_code = str(e)
-        if error_code == "MEETING_ID_MISMATCH":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "MEETING_ID_MISMATCH",
-                    "message": "Path meeting_id와 body meetingId가 일치하지 않습니다.",
-                },
-            )
-        if error_code == "INVALID_TIME_RANGE":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": "INVALID_TIME_RANGE",
-                    "message": "endMs는 startMs보다 커야 합니다.",
-                },
-            )
-        if error_code == "MEETING_NOT_FOUND":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "MEETING_NOT_FOUND",
-                    "message": "회의를 찾을 수 없습니다.",
-                },
-            )
-        # 예상치 못한 에러
+        raise _transcript_error(e)
+
+
+@router.post(
+    "/{meeting_id}/transcripts/batch",
+    response_model=CreateTranscriptBatchResponse,
+    response_model_by_alias=True,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        400: {"description": "Invalid request"},
+        404: {"description": "Meeting not found"},
+    },
+)
+async def create_transcripts_batch(
+    meeting_id: UUID,
+    request: CreateTranscriptBatchRequest,
+    http_request: Request,
+    transcript_service: Annotated[TranscriptService, Depends(get_transcript_service)],
+):
+    """발화 segment 배치 저장 (Worker → Backend)
+
+    Worker가 짧은 구간에 모은 segment들을 다건 INSERT 1회로 저장하고,
+    같은 요청에서 Context 런타임까지 반영합니다 (/agent/meeting/call 별도 호출 불필요).
+    재전송된 idempotencyKey는 중복 저장하지 않고 기존 segment ID를 반환합니다.
+
+    Args:
+        meeting_id: 회의 ID (path parameter)
+        request: segment 배치 (최대 100개)
+        http_request: 오너 레플리카 포워딩용 원본 요청
+        transcript_service: TranscriptService 의존성
+
+    Returns:
+        CreateTranscriptBatchResponse: 요청 순서대로 segment ID와 생성 시간
+
+    Raises:
+        HTTPException:
+            - 400: path meeting_id와 body meetingId 불일치, startMs/endMs 유효하지 않음
+            - 403: system user ID 사용 시도
+            - 404: meeting 존재하지 않음
+    """
+    if any(segment.user_id == AGENT_USER_ID for segment in request.segments):
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_403_FORBIDDEN,
             detail={
-                "error": "VALIDATION_ERROR",
-                "message": str(e),
+                "error": "FORBIDDEN_USER_ID",
+                "message": "System user ID는 사용할 수 없습니다.",
             },
         )
 
+    # 런타임 반영까지 한 요청에서 끝내도록 회의 오너 레플리카에서 저장
+    forwarded = await route_context_request(http_request, str(meeting_id))
+    if forwarded is not None:
+        return forwarded
+
+    try:
+        return await transcript_service.create_transcripts_batch(meeting_id, request)
+    except ValueError as e:
+        raise _transcript_error(e)
+
 
 @router.get(
     "/{meeting_id}/transcripts",
@@ -0,0 +1,70 @@
+"""Realtime 워커 풀 엔드포인트
+
+멀티 회의 워커 호스트(WORKER_MODE=multi)가 하트비트를 보내고 배정 목록을 받습니다.
+"""
+
+import hmac
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.core.config import get_settings
+from app.infrastructure.worker_manager import get_worker_manager
+from app.infrastructure.worker_manager.pool import PooledWorkerManager
+from app.schemas.worker import (
+    WorkerAssignment,
+    WorkerHeartbeatRequest,
+    WorkerHeartbeatResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+
+
+def verify_worker_key(
+    x_worker_key: Annotated[str | None, Header(alias="X-Worker-Key")] = None,
+) -> None:
+    """워커 내부 인증 (X-Worker-Key를 BACKEND_API_KEY와 상수 시간 비교)
+
+    키가 설정되지 않았으면 모든 요청을 거부합니다.
+    """
+    expected = get_settings().backend_api_key
+    if not expected or not hmac.compare_digest(
+        (x_worker_key or "").encode("utf-8"), expected.encode("utf-8")
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": "INVALID_WORKER_KEY", "message": "Invalid worker key"},
+        )
+
+
+router = APIRouter(
+    prefix="/workers", tags=["Workers"], dependencies=[Depends(verify_worker_key)]
+)
+
+
+@router.post(
+    "/hosts/{host_id}/heartbeat",
+    response_model=WorkerHeartbeatResponse,
+    response_model_by_alias=True,
+)
+async def worker_host_heartbeat(
+    host_id: str,
+    request: WorkerHeartbeatRequest,
+) -> WorkerHeartbeatResponse:
+    """워커 호스트 하트비트 (용량/실행 중 회의 보고 → 배정 목록 반환)"""
+    worker_manager = get_worker_manager()
+    if not isinstance(worker_manager, PooledWorkerManager):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "NOT_FOUND", "message": "Worker pool is disabled"},
+        )
+
+    assignments = await worker_manager.heartbeat(host_id, request.capacity, request.meetings)
+    return WorkerHeartbeatResponse(
+        assignments=[
+            WorkerAssignment(meeting_id=meeting_id, clova_key_index=key_index)
+            for meeting_id, key_index in assignments
+        ]
+    )
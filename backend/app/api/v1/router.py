@@ -21,6 +21,7 @@ from app.api.v1.endpoints import (
     teams,
     transcripts,
     webrtc,
+    worker_pool,
 )
 
 api_router = APIRouter(prefix="/api/v1")
@@ -38,6 +39,7 @@ api_router.include_router(webrtc.router)
 api_router.include_router(transcripts.router)
 api_router.include_router(chat.router)
 api_router.include_router(livekit_webhooks.router)
+api_router.include_router(worker_pool.router)
 api_router.include_router(decisions.router)
 api_router.include_router(decisions.meetings_decisions_router)
 
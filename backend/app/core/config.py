@@ -82,6 +82,70 @@ class Settings(BaseSettings):
     clova_router_id: str = ""  # Clova Studio Router ID
     clova_router_version: int = 1  # Router 버전 (1 이상)
 
+    # 임베딩 캐시 설정 (in-process LRU + 선택적 Redis 2차 캐시)
+    embedding_cache_max_bytes: int = 64 * 1024 * 1024  # 인메모리 LRU 최대 크기 (64MB)
+    embedding_cache_redis_enabled: bool = False  # Redis 2차 캐시 사용 여부 (float16 저장)
+    embedding_cache_ttl_seconds: int = 7 * 24 * 3600  # Redis 캐시 TTL (7일)
+
+    # Context 런타임 스냅샷 (L1 상태 Redis 저장 → 축출/재시작 후 복원)
+    context_snapshot_enabled: bool = True
+    context_snapshot_ttl_seconds: int = 24 * 3600  # 24시간
+
+    # Context 런타임 샤딩 (멀티 레플리카, 회의별 오너 레플리카로 라우팅)
+    context_sharding_enabled: bool = False
+    replica_id: str = ""  # 비어있으면 hostname 사용
+    replica_advertise_url: str = ""  # 다른 레플리카가 포워딩할 주소 (예: http://10.0.0.5:8000)
+    context_owner_lease_seconds: int = 30  # 오너 lease TTL (lease/3 주기로 갱신)
+
+    # KG 벡터 인덱스 (Decision/Agenda/Meeting 임베딩 + hybrid 검색)
+    kg_vector_index_enabled: bool = False
+    hybrid_search_alpha: float = 0.5  # 최종 점수 = alpha * 벡터 + (1 - alpha) * BM25
+    hybrid_search_top_k: int = 20  # 검색 경로별 후보 수
+
+    # MIT Search 결과 캐시 (Redis, KG 쓰기 시 팀 버전 증가로 무효화)
+    search_result_cache_enabled: bool = True
+    search_result_cache_ttl_seconds: int = 300
+
+    # Minutes View 스냅샷 캐시 (Redis, minutes 이벤트마다 버전 증가 + ETag/델타 조회)
+    minutes_view_cache_enabled: bool = True
+    minutes_view_cache_ttl_seconds: int = 3600
+
+    # SSE Pub/Sub 허브 (레플리카당 패턴 구독 1개 → 프로세스 내 구독자 큐로 팬아웃)
+    sse_subscriber_buffer_size: int = 64  # 구독자별 대기 메시지 한도 (넘으면 느린 구독자 퇴출)
+    sse_heartbeat_seconds: float = 30.0
+
+    # 토픽 피드 발행 (발화 burst를 묶어 변경된 토픽만 델타로 발행)
+    topic_feed_debounce_ms: int = 250
+
+    # MIT Search 리랭커 (auto: 원격 p90 지연이 예산 안이면 Clova, 아니면 로컬 lexical)
+    reranker_mode: str = "auto"  # auto, remote, local
+    reranker_latency_budget_ms: int = 800
+
+    # Voice 투기적 검색 (의도 분석 중 fulltext 선조회 + 경로별 지연 예산 + 단일 리랭크)
+    voice_speculative_search_enabled: bool = False
+    voice_search_budget_ms: int = 1500  # 템플릿/LLM Cypher 경로 대기 한도
+
+    # 의미론적 답변 캐시 (Spotlight/Voice, 질의 임베딩 유사도 + KG 버전 무효화)
+    semantic_cache_enabled: bool = False
+    semantic_cache_similarity_threshold: float = 0.92
+    semantic_cache_ttl_seconds: int = 3600
+    semantic_cache_max_bytes: int = 32 * 1024 * 1024  # 인메모리 인덱스 최대 크기 (32MB)
+    semantic_cache_redis_enabled: bool = True  # 레플리카 간 공유
+    semantic_cache_max_entries_per_scope: int = 256  # scope(사용자/회의)별 최대 항목 수
+
+    # Orchestration Planner 우회 (로컬 의도 분류기 + 계획 LRU 캐시)
+    local_intent_router_enabled: bool = False
+    local_intent_confidence_threshold: float = 0.4
+    intent_classifier_examples_path: str = ""  # Langfuse 트레이스에서 내보낸 JSONL (query/label)
+    plan_cache_enabled: bool = False
+    plan_cache_size: int = 512
+    plan_cache_ttl_seconds: int = 600
+
+    # Realtime 워커 풀 (멀티 회의 워커 호스트에 배정, 여유 없으면 회의별 Job으로 fallback)
+    worker_pool_enabled: bool = False
+    worker_host_ttl_seconds: int = 10  # 하트비트가 끊긴 호스트를 죽은 것으로 판단하는 시간
+    backend_api_key: str = ""  # 워커 → 백엔드 내부 인증 (X-Worker-Key, 비어있으면 워커 API 거부)
+
     # OpenTelemetry
     otel_sdk_disabled: bool = False
 
@@ -0,0 +1,270 @@
+"""SSE용 Redis Pub/Sub 팬아웃 허브
+
+SSE 클라이언트마다 Redis 연결 + pubsub을 만들던 방식 대신, 레플리카당 전용 연결 하나로
+패턴 구독(PSUBSCRIBE)하고 수신한 메시지를 프로세스 내 구독자 큐로 나눠줍니다.
+
+- 채널별 구독자에게 제한 크기 asyncio.Queue로 브로드캐스트 (JSON 파싱은 메시지당 1회)
+- 큐가 가득 찬 느린 구독자는 퇴출 → 스트림 종료 (EventSource 재연결 시 최신 상태 재조회)
+- keep-alive는 허브 타이머 하나가 모든 구독자에게 HEARTBEAT 전달
+- 마지막 구독자가 나가면 연결을 닫고, 다음 구독 시 다시 연결
+
+사용:
+    async with get_pubsub_hub().subscribe("minutes:{meeting_id}") as subscription:
+        async for message in subscription:
+            if message is HEARTBEAT:
+                ...
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
+
+logger = logging.getLogger(__name__)
+
+# minutes 이벤트 (minutes_events) + 토픽 피드 (topic_pubsub) 채널
+SUBSCRIBE_PATTERNS = ("minutes:*", "meeting:topics:*")
+
+_RECONNECT_MIN_SECONDS = 0.5
+_RECONNECT_MAX_SECONDS = 10.0
+
+# 구독자에게 전달되는 keep-alive 표식 (message is HEARTBEAT로 비교)
+HEARTBEAT: Any = object()
+_CLOSED: Any = object()
+
+
+class Subscription:
+    """채널 구독자 (허브가 채우는 제한 크기 큐)
+
+    전달되는 메시지 dict는 같은 채널 구독자들이 공유하므로 수정하지 않습니다.
+    """
+
+    def __init__(self, channel: str, buffer_size: int):
+        self.channel = channel
+        self.evicted = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self._done = False
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._done:
+            raise StopAsyncIteration
+        message = await self._queue.get()
+        if message is _CLOSED:
+            self._done = True
+            raise StopAsyncIteration
+        return message
+
+    def offer(self, message: Any) -> bool:
+        """큐에 넣기 (가득 차면 False)"""
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def close(self) -> None:
+        """밀린 메시지를 버리고 종료 표시 (소비 중인 이터레이션이 끝남)"""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+
+
+class PubSubHub:
+    """레플리카당 Redis 패턴 구독 1개 → 프로세스 내 구독자 팬아웃"""
+
+    def __init__(
+        self,
+        redis_url: str,
+        patterns: tuple[str, ...] = SUBSCRIBE_PATTERNS,
+        buffer_size: int = 64,
+        heartbeat_seconds: float = 30.0,
+    ):
+        self.redis_url = redis_url
+        self.patterns = patterns
+        self.buffer_size = buffer_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self._channels: dict[str, set[Subscription]] = {}
+        self._client: Optional[Redis] = None
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._channels.values())
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        """채널 구독 (컨텍스트를 벗어나면 해제, 마지막 구독자면 연결 정리)"""
+        subscription = Subscription(channel, self.buffer_size)
+        self._channels.setdefault(channel, set()).add(subscription)
+        logger.debug(f"[PubSub Hub] 구독: channel={channel}, subscribers={self.subscriber_count}")
+        try:
+            await self._ensure_started()
+            yield subscription
+        finally:
+            self._discard(subscription)
+            if not self._channels:
+                await self._stop()
+
+    async def close(self) -> None:
+        """모든 구독 종료 + 연결 정리 (애플리케이션 종료 시)"""
+        for subscribers in list(self._channels.values()):
+            for subscription in subscribers:
+                subscription.close()
+        self._channels.clear()
+        await self._stop()
+
+    def dispatch(self, channel: str, data: str) -> None:
+        """수신 메시지를 채널 구독자 큐로 브로드캐스트"""
+        subscribers = self._channels.get(channel)
+        if not subscribers:
+            return
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"[PubSub Hub] 잘못된 메시지 무시: channel={channel}, error={e}")
+            return
+
+        for subscription in list(subscribers):
+            if not subscription.offer(message):
+                self._evict(subscription)
+
+    def broadcast_heartbeat(self) -> None:
+        """모든 구독자에게 keep-alive (밀린 구독자는 보낼 데이터가 이미 있으므로 건너뜀)"""
+        for subscribers in list(self._channels.values()):
+            for subscription in list(subscribers):
+                subscription.offer(HEARTBEAT)
+
+    async def _ensure_started(self) -> None:
+        if self._reader is not None and not self._reader.done():
+            return
+        async with self._lock:
+            if self._reader is not None and not self._reader.done():
+                return
+            # 구독 확정 후 반환 → 호출자가 이후 발행된 메시지를 놓치지 않음
+            self._pubsub = await self._connect()
+            self._reader = asyncio.create_task(self._read_loop())
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+            logger.info(f"[PubSub Hub] 패턴 구독 시작: {', '.join(self.patterns)}")
+
+    async def _stop(self) -> None:
+        async with self._lock:
+            if self._channels:
+                return  # 정리 대기 중 새 구독자가 들어옴
+            tasks = [task for task in (self._reader, self._heartbeat) if task is not None]
+            self._reader = None
+            self._heartbeat = None
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await _close_pubsub(self._pubsub)
+            self._pubsub = None
+            if self._client is not None:
+                client, self._client = self._client, None
+                try:
+                    await client.close()
+                except Exception as e:
+                    logger.debug(f"[PubSub Hub] 연결 종료 실패: {e}")
+            if tasks:
+                logger.info("[PubSub Hub] 구독자 없음 → 패턴 구독 종료")
+
+    async def _connect(self):
+        if self._client is None:
+            # pubsub은 연결을 점유하므로 get_redis() 풀과 별도 연결
+            self._client = Redis.from_url(
+                self.redis_url,
+                decode_responses=True,
+                socket_connect_timeout=5.0,
+            )
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.psubscribe(*self.patterns)
+        return pubsub
+
+    async def _read_loop(self) -> None:
+        delay = _RECONNECT_MIN_SECONDS
+        while True:
+            try:
+                if self._pubsub is None:
+                    self._pubsub = await self._connect()
+                    logger.info("[PubSub Hub] 재연결 완료")
+                async for message in self._pubsub.listen():
+                    delay = _RECONNECT_MIN_SECONDS
+                    if message["type"] == "pmessage":
+                        self.dispatch(message["channel"], message["data"])
+                raise ConnectionError("pubsub listen 종료")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 끊긴 동안의 메시지는 유실 (구독자 스트림은 유지)
+                logger.warning(f"[PubSub Hub] 수신 오류, {delay:.1f}초 후 재연결: {e}")
+                pubsub, self._pubsub = self._pubsub, None
+                await _close_pubsub(pubsub)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            self.broadcast_heartbeat()
+
+    def _discard(self, subscription: Subscription) -> None:
+        subscribers = self._channels.get(subscription.channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._channels[subscription.channel]
+
+    def _evict(self, subscription: Subscription) -> None:
+        subscription.evicted = True
+        self._discard(subscription)
+        subscription.close()
+        logger.warning(f"[PubSub Hub] 느린 구독자 퇴출: channel={subscription.channel}")
+        metrics = get_mit_metrics()
+        if metrics:
+            metrics.sse_slow_consumer_evictions_total.add(1)
+
+
+async def _close_pubsub(pubsub) -> None:
+    if pubsub is None:
+        return
+    try:
+        await pubsub.close()
+    except Exception as e:
+        logger.debug(f"[PubSub Hub] pubsub 종료 실패: {e}")
+
+
+_pubsub_hub: Optional[PubSubHub] = None
+
+
+def get_pubsub_hub() -> PubSubHub:
+    """글로벌 Pub/Sub 허브 반환"""
+    global _pubsub_hub
+    if _pubsub_hub is None:
+        settings = get_settings()
+        _pubsub_hub = PubSubHub(
+            settings.redis_url,
+            buffer_size=settings.sse_subscriber_buffer_size,
+            heartbeat_seconds=settings.sse_heartbeat_seconds,
+        )
+    return _pubsub_hub
+
+
+async def close_pubsub_hub() -> None:
+    """Pub/Sub 허브 정리 (애플리케이션 종료 시)"""
+    global _pubsub_hub
+    if _pubsub_hub is not None:
+        await _pubsub_hub.close()
+        _pubsub_hub = None
@@ -13,6 +13,7 @@ from app.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 _redis_client: redis.Redis | None = None
+_binary_redis_client: redis.Redis | None = None
 
 
 async def get_redis() -> redis.Redis:
@@ -35,14 +36,40 @@ async def get_redis() -> redis.Redis:
     return _redis_client
 
 
+async def get_binary_redis() -> redis.Redis:
+    """바이너리 값(bytes)용 Redis 클라이언트 싱글톤 반환
+
+    decode_responses=False로 생성하여 임베딩 blob 등을 그대로 저장/조회.
+
+    Returns:
+        Redis 클라이언트 인스턴스
+    """
+    global _binary_redis_client
+
+    if _binary_redis_client is None:
+        settings = get_settings()
+        _binary_redis_client = redis.from_url(
+            settings.redis_url,
+            decode_responses=False,
+        )
+        logger.info(f"[Redis] Binary client connected to {settings.redis_url}")
+
+    return _binary_redis_client
+
+
 async def close_redis() -> None:
     """Redis 연결 종료
 
     애플리케이션 종료 시 호출.
     """
-    global _redis_client
+    global _redis_client, _binary_redis_client
 
     if _redis_client is not None:
         await _redis_client.close()
         _redis_client = None
         logger.info("[Redis] Connection closed")
+
+    if _binary_redis_client is not None:
+        await _binary_redis_client.close()
+        _binary_redis_client = None
+        logger.info("[Redis] Binary connection closed")
@@ -149,6 +149,11 @@ class MITMetrics:
         self._init_realtime_metrics()
         self._init_k8s_metrics()
         self._init_activity_metrics()
+        self._init_cache_metrics()
+        self._init_context_metrics()
+        self._init_search_metrics()
+        self._init_orchestration_metrics()
+        self._init_sse_metrics()
 
     def _init_http_metrics(self) -> None:
         """HTTP 요청 메트릭"""
@@ -218,6 +223,65 @@ class MITMetrics:
             description="사용자 활동 이벤트 수",
         )
 
+    def _init_cache_metrics(self) -> None:
+        """캐시 히트/미스 메트릭"""
+        self.embedding_cache_requests_total = self.meter.create_counter(
+            name="mit_embedding_cache_requests_total",
+            description="임베딩 캐시 조회 수 (tier: memory/redis, result: hit/miss)",
+        )
+        self.search_result_cache_requests_total = self.meter.create_counter(
+            name="mit_search_result_cache_requests_total",
+            description="MIT Search 결과 캐시 조회 수 (result: hit/miss)",
+        )
+        self.semantic_cache_requests_total = self.meter.create_counter(
+            name="mit_semantic_cache_requests_total",
+            description="의미론적 답변 캐시 조회 수 (result: hit/miss/stale)",
+        )
+        self.minutes_view_cache_requests_total = self.meter.create_counter(
+            name="mit_minutes_view_cache_requests_total",
+            description="Minutes View 스냅샷 캐시 조회 수 (result: hit/miss, tier: memory/redis)",
+        )
+
+    def _init_context_metrics(self) -> None:
+        """Context 런타임 샤딩 메트릭"""
+        self.context_route_total = self.meter.create_counter(
+            name="mit_context_route_total",
+            description="Context 요청 라우팅 수 (result: local/forwarded/failover/unavailable)",
+        )
+
+    def _init_search_metrics(self) -> None:
+        """MIT Search Cypher 생성 경로 / 투기적 검색 / 리랭커 메트릭"""
+        self.search_cypher_source_total = self.meter.create_counter(
+            name="mit_search_cypher_source_total",
+            description="Cypher 생성 경로 수 (source: plan_cache/template/hybrid/llm/fallback)",
+        )
+        self.search_speculative_branch_total = self.meter.create_counter(
+            name="mit_search_speculative_branch_total",
+            description="Voice 투기적 검색 경로 결과 수 (branch: template/llm, outcome: completed/timeout/error)",
+        )
+        self.search_reranker_requests_total = self.meter.create_counter(
+            name="mit_search_reranker_requests_total",
+            description="리랭커 호출 수 (backend: remote/local, result: ok/timeout/error/skipped)",
+        )
+
+    def _init_orchestration_metrics(self) -> None:
+        """Orchestration 라우팅 / Planner 우회 메트릭"""
+        self.orchestration_route_source_total = self.meter.create_counter(
+            name="mit_orchestration_route_source_total",
+            description="Simple Router 판정 경로 수 (source: local/clova, category)",
+        )
+        self.plan_cache_requests_total = self.meter.create_counter(
+            name="mit_plan_cache_requests_total",
+            description="Planner 계획 캐시 조회 수 (result: hit/miss)",
+        )
+
+    def _init_sse_metrics(self) -> None:
+        """SSE Pub/Sub 허브 메트릭"""
+        self.sse_slow_consumer_evictions_total = self.meter.create_counter(
+            name="mit_sse_slow_consumer_evictions_total",
+            description="버퍼가 가득 차 퇴출된 SSE 구독자 수",
+        )
+
     def _init_k8s_metrics(self) -> None:
         """K8s Job 관련 메트릭"""
         self.webhook_to_job_latency = self.meter.create_histogram(
@@ -229,6 +293,10 @@ class MITMetrics:
             name="mit_realtime_worker_jobs_total",
             description="Realtime Worker Job 생성 수",
         )
+        self.worker_pool_placement_total = self.meter.create_counter(
+            name="mit_worker_pool_placement_total",
+            description="워커 풀 회의 배정 수 (result: pooled/reassigned/fallback)",
+        )
 
 
 # ===========================================
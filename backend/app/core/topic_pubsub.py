@@ -8,6 +8,7 @@ import json
 import logging
 from typing import AsyncGenerator
 
+from app.core.pubsub_hub import HEARTBEAT, get_pubsub_hub
 from app.core.redis import get_redis
 
 logger = logging.getLogger(__name__)
@@ -41,50 +42,30 @@ async def publish_topic_update(meeting_id: str, data: dict) -> None:
 async def subscribe_topic_updates(meeting_id: str) -> AsyncGenerator[dict, None]:
     """토픽 변경 이벤트 구독 (SSE용 제너레이터)
 
+    클라이언트별 pubsub/폴링 루프 없이 프로세스 공용 허브에서 채널 메시지를 받습니다.
+    허브 버퍼를 넘겨 퇴출되면 제너레이터가 끝납니다 (클라이언트 재연결 시 init 재전송).
+
     Args:
         meeting_id: 회의 ID
 
     Yields:
-        토픽 데이터 dict
+        {"type": "update", "data": 토픽 데이터} 또는 {"type": "heartbeat"}
     """
-    redis = await get_redis()
     channel = get_topic_channel(meeting_id)
-    pubsub = redis.pubsub()
 
     try:
-        await pubsub.subscribe(channel)
-        logger.info("토픽 구독 시작: channel=%s", channel)
-
-        while True:
-            try:
-                # get_message(timeout=1.0): 최대 1초 대기 후 메시지 없으면 None 반환
-                # wait_for(timeout=30.0): Redis 연결이 응답하지 않을 경우 안전장치
-                #
-                # 동작 흐름:
-                # 1. 메시지 있음 → 즉시 반환 → update 이벤트 전송
-                # 2. 메시지 없음 → 1초 후 None 반환 → heartbeat 전송 → 루프 반복
-                message = await asyncio.wait_for(
-                    pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0),
-                    timeout=30.0,
-                )
-
-                if message is None:
-                    # Heartbeat (keep-alive)
+        async with get_pubsub_hub().subscribe(channel) as subscription:
+            logger.info("토픽 구독 시작: channel=%s", channel)
+            async for message in subscription:
+                if message is HEARTBEAT:
                     yield {"type": "heartbeat"}
-                    continue
-
-                if message["type"] == "message":
-                    data = json.loads(message["data"])
-                    yield {"type": "update", "data": data}
-
-            except asyncio.TimeoutError:
-                # 30초 heartbeat
-                yield {"type": "heartbeat"}
+                else:
+                    yield {"type": "update", "data": message}
+            if subscription.evicted:
+                logger.info("토픽 구독 퇴출 (느린 구독자): channel=%s", channel)
 
     except asyncio.CancelledError:
         logger.info("토픽 구독 취소: channel=%s", channel)
         raise
     finally:
-        await pubsub.unsubscribe(channel)
-        await pubsub.close()
         logger.info("토픽 구독 종료: channel=%s", channel)
@@ -1,5 +1,19 @@
 """캐시 시스템"""
 
+from .embedding_cache import EmbeddingCache, get_embedding_cache
+from .kg_version import bump_kg_versions
+from .minutes_cache import MinutesViewCache, get_minutes_view_cache
+from .search_result_cache import SearchResultCache, get_search_result_cache
 from .semantic_cache import SemanticCacheManager, get_semantic_cache
 
-__all__ = ["SemanticCacheManager", "get_semantic_cache"]
+__all__ = [
+    "EmbeddingCache",
+    "MinutesViewCache",
+    "SearchResultCache",
+    "SemanticCacheManager",
+    "bump_kg_versions",
+    "get_embedding_cache",
+    "get_minutes_view_cache",
+    "get_search_result_cache",
+    "get_semantic_cache",
+]
@@ -0,0 +1,248 @@
+"""임베딩 캐시 - 콘텐츠 주소 기반 (model + 정규화 텍스트 해시)
+
+계층:
+1. 인메모리 LRU (바이트 기준 상한, float32 벡터)
+2. Redis (선택, float16 blob + TTL) - 프로세스/레플리카 간 공유
+
+동일 텍스트(토픽 요약, 에이전트 쿼리, 검색 결과 본문)를 반복 임베딩하지 않도록
+TopicEmbedder, mit_search 스코어러 등이 공통으로 사용합니다.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "emb:"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFKC + 공백 정리)"""
+    normalized = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+def make_embedding_key(model: str, text: str) -> str:
+    """model + 정규화 텍스트의 SHA-256 해시 키 생성"""
+    payload = f"{model}\x00{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class EmbeddingCache:
+    """임베딩 2계층 캐시.
+
+    인메모리 조회(get_local/put_local)는 동기, Redis까지 포함한 조회는 비동기입니다.
+
+    Example:
+        cache = get_embedding_cache()
+        vec = await cache.get("bge-m3", "예산 2억 확정")
+        if vec is None:
+            vec = await embed(...)
+            await cache.put("bge-m3", "예산 2억 확정", vec)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        redis_enabled: bool = False,
+        ttl_seconds: int = 7 * 24 * 3600,
+    ):
+        self.max_bytes = max_bytes
+        self.redis_enabled = redis_enabled
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._current_bytes = 0
+        # 동기 임베딩 경로는 별도 스레드에서 실행될 수 있음
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    # === 인메모리 LRU ===
+
+    def get_local(self, model: str, text: str) -> np.ndarray | None:
+        """인메모리 LRU 조회 (동기)"""
+        key = make_embedding_key(model, text)
+        vector = self._get_by_key(key)
+        self._record("memory", "hit" if vector is not None else "miss")
+        return vector
+
+    def put_local(self, model: str, text: str, vector: np.ndarray) -> None:
+        """인메모리 LRU 저장 (동기)"""
+        self._put_by_key(make_embedding_key(model, text), vector)
+
+    def _get_by_key(self, key: str) -> np.ndarray | None:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                return None
+            self._entries.move_to_end(key)
+            return vector
+
+    def _put_by_key(self, key: str, vector: np.ndarray) -> None:
+        array = np.asarray(vector, dtype=np.float32)
+        if array.nbytes > self.max_bytes or not np.any(array):
+            # 상한 초과 또는 영벡터(임베딩 실패)는 캐싱하지 않음
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous.nbytes
+
+            self._entries[key] = array
+            self._current_bytes += array.nbytes
+
+            while self._current_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= evicted.nbytes
+
+    # === 2계층 조회 (Redis 포함) ===
+
+    async def get(self, model: str, text: str) -> np.ndarray | None:
+        """인메모리 → Redis 순서로 조회"""
+        return (await self.get_many(model, [text]))[0]
+
+    async def put(self, model: str, text: str, vector: np.ndarray) -> None:
+        """인메모리 + Redis 저장"""
+        await self.put_many(model, [text], [vector])
+
+    async def get_many(self, model: str, texts: list[str]) -> list[np.ndarray | None]:
+        """여러 텍스트 조회 (Redis는 MGET 1회)
+
+        Returns:
+            입력 순서와 동일한 벡터 리스트 (미스는 None)
+        """
+        keys = [make_embedding_key(model, text) for text in texts]
+        results: list[np.ndarray | None] = [self._get_by_key(key) for key in keys]
+
+        memory_hits = sum(1 for vector in results if vector is not None)
+        if memory_hits:
+            self._record("memory", "hit", memory_hits)
+
+        missing = [idx for idx, vector in enumerate(results) if vector is None]
+        if missing and self.redis_enabled:
+            blobs = await self._redis_mget([keys[idx] for idx in missing])
+            for idx, blob in zip(missing, blobs):
+                if not blob:
+                    continue
+                vector = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+                results[idx] = vector
+                self._put_by_key(keys[idx], vector)
+                self._record("redis", "hit")
+
+        miss_count = sum(1 for vector in results if vector is None)
+        if miss_count:
+            # 마지막으로 확인한 계층 기준으로 미스 기록
+            self._record("redis" if self.redis_enabled else "memory", "miss", miss_count)
+
+        return results
+
+    async def put_many(
+        self,
+        model: str,
+        texts: list[str],
+        vectors: list[np.ndarray | None],
+    ) -> None:
+        """여러 벡터 저장 (None/영벡터는 건너뜀)"""
+        to_redis: dict[str, bytes] = {}
+        for text, vector in zip(texts, vectors):
+            if vector is None:
+                continue
+            array = np.asarray(vector, dtype=np.float32)
+            if not np.any(array):
+                continue
+            key = make_embedding_key(model, text)
+            self._put_by_key(key, array)
+            if self.redis_enabled:
+                to_redis[key] = array.astype(np.float16).tobytes()
+
+        if to_redis:
+            await self._redis_mset(to_redis)
+
+    async def _redis_mget(self, keys: list[str]) -> list[Optional[bytes]]:
+        try:
+            from app.core.redis import get_binary_redis
+
+            client = await get_binary_redis()
+            return await client.mget([f"{REDIS_KEY_PREFIX}{key}" for key in keys])
+        except Exception as e:
+            logger.warning(f"[Embedding Cache] Redis 조회 실패: {e}")
+            return [None] * len(keys)
+
+    async def _redis_mset(self, blobs: dict[str, bytes]) -> None:
+        try:
+            from app.core.redis import get_binary_redis
+
+            client = await get_binary_redis()
+            pipe = client.pipeline(transaction=False)
+            for key, blob in blobs.items():
+                pipe.set(f"{REDIS_KEY_PREFIX}{key}", blob, ex=self.ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[Embedding Cache] Redis 저장 실패: {e}")
+
+    # === 통계 ===
+
+    def _record(self, tier: str, result: str, count: int = 1) -> None:
+        if result == "hit":
+            if tier == "memory":
+                self.memory_hits += count
+            else:
+                self.redis_hits += count
+        else:
+            self.misses += count
+
+        metrics = get_mit_metrics()
+        if metrics:
+            metrics.embedding_cache_requests_total.add(count, {"tier": tier, "result": result})
+
+    def clear(self) -> None:
+        """인메모리 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def get_stats(self) -> dict[str, int | float]:
+        """캐시 통계 반환"""
+        total = self.memory_hits + self.redis_hits + self.misses
+        hits = self.memory_hits + self.redis_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "entries": len(self._entries),
+            "memory_bytes": self._current_bytes,
+        }
+
+
+# 글로벌 캐시 인스턴스
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """글로벌 임베딩 캐시 인스턴스 반환"""
+    global _embedding_cache
+    if _embedding_cache is None:
+        settings = get_settings()
+        _embedding_cache = EmbeddingCache(
+            max_bytes=settings.embedding_cache_max_bytes,
+            redis_enabled=settings.embedding_cache_redis_enabled,
+            ttl_seconds=settings.embedding_cache_ttl_seconds,
+        )
+    return _embedding_cache
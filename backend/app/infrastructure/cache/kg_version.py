@@ -0,0 +1,58 @@
+"""KG 버전 카운터 (Redis)
+
+KG 쓰기마다 회의/팀 단위 카운터를 올리고, 읽기 캐시는 키에 현재 버전을 포함시켜
+쓰기 이후의 캐시 항목이 자연스럽게 조회되지 않도록 합니다 (오래된 항목은 TTL로 정리).
+
+키:
+    kg:ver:meeting:{meeting_id}
+    kg:ver:team:{team_id}
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+MEETING_VERSION_PREFIX = "kg:ver:meeting:"
+TEAM_VERSION_PREFIX = "kg:ver:team:"
+
+
+async def bump_kg_versions(
+    meeting_ids: list[str] | None = None,
+    team_ids: list[str] | None = None,
+) -> None:
+    """회의/팀 버전 증가 (실패해도 예외를 올리지 않음)"""
+    keys = [f"{MEETING_VERSION_PREFIX}{mid}" for mid in meeting_ids or [] if mid]
+    keys += [f"{TEAM_VERSION_PREFIX}{tid}" for tid in team_ids or [] if tid]
+    if not keys:
+        return
+
+    try:
+        from app.core.redis import get_redis
+
+        client = await get_redis()
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.incr(key)
+        await pipe.execute()
+    except Exception as e:
+        logger.warning(f"[KG Version] 버전 증가 실패: {e}")
+
+
+async def _get_versions(prefix: str, ids: list[str]) -> dict[str, int]:
+    if not ids:
+        return {}
+    from app.core.redis import get_redis
+
+    client = await get_redis()
+    values = await client.mget([f"{prefix}{item_id}" for item_id in ids])
+    return {item_id: int(value or 0) for item_id, value in zip(ids, values)}
+
+
+async def get_team_versions(team_ids: list[str]) -> dict[str, int]:
+    """팀 버전 조회 (없으면 0)"""
+    return await _get_versions(TEAM_VERSION_PREFIX, team_ids)
+
+
+async def get_meeting_versions(meeting_ids: list[str]) -> dict[str, int]:
+    """회의 버전 조회 (없으면 0)"""
+    return await _get_versions(MEETING_VERSION_PREFIX, meeting_ids)
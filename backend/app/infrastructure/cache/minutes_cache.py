@@ -0,0 +1,339 @@
+"""Minutes View 스냅샷 캐시 (Redis, 회의별 단조 증가 버전)
+
+Minutes 페이지와 minutes_events SSE 구독자는 댓글/제안/승인/머지마다 전체 View를
+다시 조회합니다. 회의별 스냅샷을 버전과 함께 저장하고, 쓰기는 버전만 올려
+다음 조회 한 번만 KG에서 다시 만들도록 합니다 (읽기 >> 쓰기).
+
+버전:
+    minutes 이벤트 발행(ReviewService, ARQ 태스크, Agenda API)마다 record_minutes_change로
+    증가하며, 변경된 Decision ID를 변경 로그에 남겨 since_version 델타 조회에 사용합니다.
+    이벤트 없이 일어난 KG 쓰기(회의록 생성, ActionItem 수정 등)는 KG 회의 버전
+    (kg_version) 변화로 감지해 전체 변경으로 기록합니다. 마지막으로 본
+    (버전, KG 버전)을 따로 보관하므로 스냅샷이 만료된 뒤에도 감지됩니다.
+
+키:
+    minutes:ver:{meeting_id}   버전 카운터 (만료 없음 - ETag 재사용 방지)
+    minutes:log:{meeting_id}   변경 로그 "버전|decision_id,..." (전체 변경은 "버전|*")
+    minutes:view:{meeting_id}  스냅샷 {"version", "kg_version", "data"}
+    minutes:kg:{meeting_id}    마지막으로 본 "버전|KG 버전" (만료 없음)
+"""
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
+from app.infrastructure.cache.kg_version import MEETING_VERSION_PREFIX
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "minutes:ver:"
+LOG_KEY_PREFIX = "minutes:log:"
+VIEW_KEY_PREFIX = "minutes:view:"
+KG_SEEN_KEY_PREFIX = "minutes:kg:"
+
+FULL_CHANGE = "*"
+LOG_SIZE = 200  # 회의별 변경 로그 보관 개수 (넘어선 since_version은 전체 응답)
+LOCAL_SNAPSHOTS = 256  # 프로세스 내 파싱된 스냅샷 보관 회의 수
+
+# 버전 증가 + 변경 로그 추가를 원자적으로 (로그 항목에 증가된 버전을 기록)
+_RECORD_CHANGE_SCRIPT = """
+local version = redis.call('INCR', KEYS[1])
+redis.call('RPUSH', KEYS[2], version .. '|' .. ARGV[1])
+redis.call('LTRIM', KEYS[2], -tonumber(ARGV[2]), -1)
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[3]))
+return version
+"""
+
+# 같은 버전에서 KG 버전만 올랐으면 전체 변경으로 기록 (버전 증가 + "버전|*")
+# KEYS: [1] = 버전 카운터, [2] = 변경 로그, [3] = 마지막으로 본 "버전|KG 버전"
+# ARGV: [1] = 조회한 버전, [2] = 조회한 KG 버전, [3] = 로그 크기, [4] = 로그 TTL
+_SYNC_KG_VERSION_SCRIPT = """
+local version = tonumber(ARGV[1])
+local kg_version = tonumber(ARGV[2])
+local seen = redis.call('GET', KEYS[3])
+if seen then
+    local sep = string.find(seen, '|', 1, true)
+    local seen_version = tonumber(string.sub(seen, 1, sep - 1))
+    local seen_kg_version = tonumber(string.sub(seen, sep + 1))
+    if seen_version == version and kg_version > seen_kg_version then
+        version = redis.call('INCR', KEYS[1])
+        redis.call('RPUSH', KEYS[2], version .. '|*')
+        redis.call('LTRIM', KEYS[2], -tonumber(ARGV[3]), -1)
+        redis.call('EXPIRE', KEYS[2], tonumber(ARGV[4]))
+    elseif seen_version > version or (seen_version == version and seen_kg_version >= kg_version) then
+        -- 늦게 도착한 조회는 기록을 되돌리지 않음
+        return version
+    end
+end
+redis.call('SET', KEYS[3], version .. '|' .. kg_version)
+return version
+"""
+
+
+@dataclass
+class MinutesSnapshot:
+    """버전이 붙은 Minutes View"""
+
+    version: int
+    kg_version: int
+    data: dict[str, Any]
+
+    @property
+    def etag(self) -> str:
+        return make_etag(self.version, self.kg_version)
+
+
+def make_etag(version: int, kg_version: int) -> str:
+    """이벤트 버전 + KG 버전 (어느 쪽이 바뀌어도 다른 ETag)"""
+    return f'"{version}.{kg_version}"'
+
+
+def changed_decision_ids(event: dict) -> Optional[list[str]]:
+    """이벤트가 바꾼 Decision ID 목록 (Decision 단위로 특정할 수 없으면 None = 전체 변경)"""
+    if str(event.get("event", "")).startswith("agenda"):
+        return None
+    ids = [
+        value
+        for key, value in event.items()
+        if key.endswith("decision_id") and isinstance(value, str) and value
+    ]
+    return ids or None
+
+
+def parse_change_log(entries: list[str], since_version: int, version: int) -> Optional[set[str]]:
+    """(since_version, version] 구간에 바뀐 Decision ID
+
+    구간의 모든 버전이 로그에 있고 전체 변경이 없을 때만 델타를 만들 수 있습니다.
+    그렇지 않으면 None (전체 응답 필요).
+    """
+    if since_version > version:
+        return None
+
+    changed: set[str] = set()
+    covered: set[int] = set()
+    for entry in entries:
+        raw_version, _, ids = entry.partition("|")
+        try:
+            entry_version = int(raw_version)
+        except ValueError:
+            continue
+        if entry_version <= since_version or entry_version > version:
+            continue
+        if ids == FULL_CHANGE:
+            return None
+        covered.add(entry_version)
+        changed.update(item for item in ids.split(",") if item)
+
+    if len(covered) != version - since_version:
+        return None
+    return changed
+
+
+class MinutesViewCache:
+    """회의별 Minutes View 스냅샷 캐시 (Redis + 프로세스 내 파싱본)"""
+
+    def __init__(self, ttl_seconds: int = 3600):
+        self.ttl_seconds = ttl_seconds
+        self._local: OrderedDict[str, MinutesSnapshot] = OrderedDict()
+        # 같은 (회의, 버전) 재구성은 하나로 합침 (인기 회의 쓰기 직후 동시 조회)
+        self._builds: dict[tuple[str, int, int], asyncio.Future] = {}
+
+    async def read_versions(self, meeting_id: str) -> tuple[int, int]:
+        """(이벤트 버전, KG 회의 버전) - Redis 왕복 1회"""
+        from app.core.redis import get_redis
+
+        client = await get_redis()
+        version, kg_version = await client.mget(
+            [f"{VERSION_KEY_PREFIX}{meeting_id}", f"{MEETING_VERSION_PREFIX}{meeting_id}"]
+        )
+        return int(version or 0), int(kg_version or 0)
+
+    async def get(
+        self,
+        meeting_id: str,
+        build: Callable[[], Awaitable[dict[str, Any]]],
+        versions: Optional[tuple[int, int]] = None,
+    ) -> Optional[MinutesSnapshot]:
+        """현재 버전의 스냅샷 (없거나 오래되면 build로 재구성, 회의가 없으면 None)
+
+        Args:
+            meeting_id: 회의 ID
+            build: KG에서 Minutes View를 조회하는 함수 (회의가 없으면 빈 dict)
+            versions: 호출자가 이미 읽은 read_versions 결과 (Redis 왕복 절약)
+        """
+        version, kg_version = versions or await self.read_versions(meeting_id)
+
+        local = self._local.get(meeting_id)
+        if local is not None and (local.version, local.kg_version) == (version, kg_version):
+            self._local.move_to_end(meeting_id)
+            self._record("hit", "memory")
+            return local
+
+        stored = await self._load(meeting_id)
+        if stored is not None and (stored.version, stored.kg_version) == (version, kg_version):
+            self._remember(meeting_id, stored)
+            self._record("hit", "redis")
+            return stored
+
+        self._record("miss", "redis")
+        key = (meeting_id, version, kg_version)
+        future = self._builds.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._build(meeting_id, version, kg_version, build))
+            self._builds[key] = future
+            future.add_done_callback(lambda _: self._builds.pop(key, None))
+        # 먼저 요청한 클라이언트가 끊겨도 재구성은 계속 (대기 중인 다른 요청 공유)
+        return await asyncio.shield(future)
+
+    async def changes_since(self, meeting_id: str, since_version: int, version: int) -> Optional[set[str]]:
+        """since_version 이후 바뀐 Decision ID (델타 불가 시 None)"""
+        if since_version == version:
+            return set()
+
+        try:
+            from app.core.redis import get_redis
+
+            client = await get_redis()
+            entries = await client.lrange(f"{LOG_KEY_PREFIX}{meeting_id}", 0, -1)
+        except Exception as e:
+            logger.warning(f"[Minutes Cache] 변경 로그 조회 실패: {e}")
+            return None
+        return parse_change_log(entries, since_version, version)
+
+    async def record_change(self, meeting_id: str, decision_ids: Optional[list[str]]) -> Optional[int]:
+        """버전 증가 + 변경 로그 기록 → 새 버전 (실패 시 None, 예외를 올리지 않음)"""
+        from app.core.redis import get_redis
+
+        payload = ",".join(decision_ids) if decision_ids else FULL_CHANGE
+        try:
+            client = await get_redis()
+            version = await client.eval(
+                _RECORD_CHANGE_SCRIPT,
+                2,
+                f"{VERSION_KEY_PREFIX}{meeting_id}",
+                f"{LOG_KEY_PREFIX}{meeting_id}",
+                payload,
+                LOG_SIZE,
+                self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"[Minutes Cache] 버전 증가 실패: {e}")
+            return None
+        return int(version)
+
+    async def _sync_kg_version(self, meeting_id: str, version: int, kg_version: int) -> int:
+        """KG만 바뀌었으면 전체 변경을 기록한 새 버전 (그 외/실패 시 version 그대로)"""
+        try:
+            from app.core.redis import get_redis
+
+            client = await get_redis()
+            synced = await client.eval(
+                _SYNC_KG_VERSION_SCRIPT,
+                3,
+                f"{VERSION_KEY_PREFIX}{meeting_id}",
+                f"{LOG_KEY_PREFIX}{meeting_id}",
+                f"{KG_SEEN_KEY_PREFIX}{meeting_id}",
+                version,
+                kg_version,
+                LOG_SIZE,
+                self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"[Minutes Cache] KG 버전 확인 실패: {e}")
+            return version
+        return int(synced)
+
+    async def _build(
+        self,
+        meeting_id: str,
+        version: int,
+        kg_version: int,
+        build: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> Optional[MinutesSnapshot]:
+        # 버전은 조회 전에 확정 → 조회 중 발생한 쓰기는 다음 요청에서 다시 재구성됨
+        data = await build()
+        if not data:
+            return None
+
+        # 이벤트 없이 KG만 바뀜 → 전체 변경으로 기록해 델타 구독자도 전체를 다시 받게 함
+        version = await self._sync_kg_version(meeting_id, version, kg_version)
+
+        snapshot = MinutesSnapshot(version=version, kg_version=kg_version, data=data)
+        self._remember(meeting_id, snapshot)
+        try:
+            from app.core.redis import get_redis
+
+            client = await get_redis()
+            await client.set(
+                f"{VIEW_KEY_PREFIX}{meeting_id}",
+                json.dumps(
+                    {"version": version, "kg_version": kg_version, "data": data},
+                    ensure_ascii=False,
+                    default=str,
+                ),
+                ex=self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"[Minutes Cache] 스냅샷 저장 실패: {e}")
+        return snapshot
+
+    async def _load(self, meeting_id: str) -> Optional[MinutesSnapshot]:
+        try:
+            from app.core.redis import get_redis
+
+            client = await get_redis()
+            raw = await client.get(f"{VIEW_KEY_PREFIX}{meeting_id}")
+        except Exception as e:
+            logger.warning(f"[Minutes Cache] 스냅샷 조회 실패: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            stored = json.loads(raw)
+            return MinutesSnapshot(
+                version=int(stored["version"]),
+                kg_version=int(stored["kg_version"]),
+                data=stored["data"],
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"[Minutes Cache] 손상된 스냅샷 무시: {e}")
+            return None
+
+    def _remember(self, meeting_id: str, snapshot: MinutesSnapshot) -> None:
+        self._local[meeting_id] = snapshot
+        self._local.move_to_end(meeting_id)
+        while len(self._local) > LOCAL_SNAPSHOTS:
+            self._local.popitem(last=False)
+
+    def _record(self, result: str, tier: str) -> None:
+        metrics = get_mit_metrics()
+        if metrics:
+            metrics.minutes_view_cache_requests_total.add(1, {"result": result, "tier": tier})
+
+
+async def record_minutes_change(meeting_id: str, event: dict) -> Optional[int]:
+    """minutes 이벤트 → 스냅샷 버전 증가 (캐시 비활성화 시 None)"""
+    cache = get_minutes_view_cache()
+    if cache is None or not meeting_id:
+        return None
+    return await cache.record_change(meeting_id, changed_decision_ids(event))
+
+
+_minutes_view_cache: Optional[MinutesViewCache] = None
+
+
+def get_minutes_view_cache() -> Optional[MinutesViewCache]:
+    """글로벌 Minutes View 캐시 반환 (비활성화 시 None)"""
+    global _minutes_view_cache
+    settings = get_settings()
+    if not settings.minutes_view_cache_enabled:
+        return None
+    if _minutes_view_cache is None:
+        _minutes_view_cache = MinutesViewCache(ttl_seconds=settings.minutes_view_cache_ttl_seconds)
+    return _minutes_view_cache
@@ -0,0 +1,169 @@
+"""MIT Search Cypher 결과 캐시 (Redis)
+
+키 = 정규화된 Cypher + Cypher가 참조하는 파라미터 + 요청자 팀들의 KG 버전.
+KGRepository 쓰기가 팀 버전을 올리면 이전 항목은 더 이상 조회되지 않습니다.
+
+값은 이미 직렬화된(JSON 호환) 결과이므로 히트 시 Neo4j 조회와
+Neo4j 타입 변환을 모두 건너뜁니다.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Optional
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
+from app.infrastructure.cache.kg_version import get_team_versions
+
+logger = logging.getLogger(__name__)
+
+RESULT_KEY_PREFIX = "kg:search:"
+USER_TEAMS_KEY_PREFIX = "kg:user_teams:"
+USER_TEAMS_TTL_SECONDS = 300
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PARAM_RE = re.compile(r"\$(\w+)")
+
+
+def normalize_cypher(cypher: str) -> str:
+    """공백 차이를 무시하도록 Cypher 정규화"""
+    return _WHITESPACE_RE.sub(" ", cypher).strip()
+
+
+def referenced_parameters(cypher: str, parameters: dict[str, Any]) -> dict[str, Any]:
+    """Cypher가 실제로 참조하는 파라미터만 추출
+
+    $user_id를 쓰지 않는 쿼리는 사용자 간에 결과를 공유할 수 있습니다.
+    """
+    names = set(_PARAM_RE.findall(cypher))
+    return {name: parameters[name] for name in sorted(names) if name in parameters}
+
+
+def make_result_key(
+    cypher: str,
+    parameters: dict[str, Any],
+    team_versions: dict[str, int],
+) -> str:
+    """결과 캐시 키 생성"""
+    payload = json.dumps(
+        {
+            "cypher": normalize_cypher(cypher),
+            "params": referenced_parameters(cypher, parameters),
+            "teams": sorted(team_versions.items()),
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return RESULT_KEY_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def get_user_team_ids(user_id: str) -> list[str]:
+    """사용자 소속 팀 ID (Redis에 짧게 캐시)"""
+    if not user_id:
+        return []
+
+    from app.core.redis import get_redis
+
+    client = await get_redis()
+    cache_key = f"{USER_TEAMS_KEY_PREFIX}{user_id}"
+    cached = await client.get(cache_key)
+    if cached is not None:
+        return json.loads(cached)
+
+    from app.core.neo4j import get_neo4j_driver
+    from neo4j import READ_ACCESS
+
+    driver = get_neo4j_driver()
+    async with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = await session.run(
+            "MATCH (:User {id: $user_id})-[:MEMBER_OF]->(t:Team) RETURN t.id AS id",
+            {"user_id": user_id},
+        )
+        team_ids = sorted([record["id"] async for record in result])
+
+    await client.set(cache_key, json.dumps(team_ids), ex=USER_TEAMS_TTL_SECONDS)
+    return team_ids
+
+
+class SearchResultCache:
+    """팀 버전 기반 무효화를 지원하는 Cypher 결과 캐시"""
+
+    def __init__(self, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    async def lookup(
+        self, cypher: str, parameters: dict[str, Any]
+    ) -> tuple[Optional[str], Optional[list[dict]]]:
+        """(캐시 키, 결과) 반환
+
+        키는 쿼리 실행 전에 확정해야 실행 중 발생한 쓰기가 무시되지 않습니다.
+        Redis 장애 시 (None, None)을 반환하며 호출자는 캐시 없이 진행합니다.
+        """
+        try:
+            from app.core.redis import get_redis
+
+            team_ids = await self._get_user_team_ids(parameters.get("user_id") or "")
+            team_versions = await get_team_versions(team_ids)
+            key = make_result_key(cypher, parameters, team_versions)
+
+            client = await get_redis()
+            cached = await client.get(key)
+        except Exception as e:
+            logger.warning(f"[Search Cache] 조회 실패: {e}")
+            return None, None
+
+        if cached is None:
+            self._record("miss")
+            return key, None
+
+        self._record("hit")
+        return key, json.loads(cached)
+
+    async def store(self, key: str, results: list[dict]) -> None:
+        """결과 저장 (직렬화된 결과만)"""
+        try:
+            from app.core.redis import get_redis
+
+            client = await get_redis()
+            await client.set(
+                key,
+                json.dumps(results, ensure_ascii=False, default=str),
+                ex=self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"[Search Cache] 저장 실패: {e}")
+
+    async def _get_user_team_ids(self, user_id: str) -> list[str]:
+        return await get_user_team_ids(user_id)
+
+    def _record(self, result: str) -> None:
+        if result == "hit":
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        metrics = get_mit_metrics()
+        if metrics:
+            metrics.search_result_cache_requests_total.add(1, {"result": result})
+
+
+# 글로벌 캐시 인스턴스
+_search_result_cache: Optional[SearchResultCache] = None
+
+
+def get_search_result_cache() -> Optional[SearchResultCache]:
+    """글로벌 결과 캐시 인스턴스 반환 (비활성화 시 None)"""
+    global _search_result_cache
+    settings = get_settings()
+    if not settings.search_result_cache_enabled:
+        return None
+    if _search_result_cache is None:
+        _search_result_cache = SearchResultCache(
+            ttl_seconds=settings.search_result_cache_ttl_seconds
+        )
+    return _search_result_cache
@@ -1,187 +1,287 @@
-"""의미론적 캐싱 시스템 - Semantic Cache Manager"""
+"""의미론적 캐싱 시스템 - Semantic Cache Manager
 
-import asyncio
-import hashlib
+질의 임베딩이 충분히 가까운(코사인 ≥ threshold) 이전 질의의 답변을 재사용합니다.
+
+계층:
+1. 인메모리 벡터 인덱스 (scope별 정규화 임베딩 행렬, 메모리 상한 + LFU/LRU 축출)
+2. Redis (선택, scope별 hash + TTL) - 프로세스/레플리카 간 공유, scope 첫 조회 시 로드
+   scope별 항목 수 상한: 저장 시 생성 시각 순서(sorted set)로 오래된/만료 항목 제거
+
+무효화:
+    항목은 저장 시점의 KG 버전(kg_version의 팀 버전)을 함께 기록합니다.
+    KGRepository 쓰기가 버전을 올리면 조회 시 버전 불일치로 해당 항목을 버립니다.
+"""
+
+import base64
 import json
 import logging
+import threading
+import time
+import uuid
 from typing import Any, Optional
-from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
 
 logger = logging.getLogger(__name__)
 
+REDIS_KEY_PREFIX = "semcache:"
+REDIS_ORDER_KEY_PREFIX = "semcache_order:"  # scope별 항목 생성 시각 (sorted set)
+SCOPE_RELOAD_SECONDS = 30  # 다른 레플리카가 저장한 항목을 다시 읽어오는 주기
+
 
 class CacheEntry:
     """캐시 항목"""
 
-    def __init__(self, query: str, answer: str, embedding: list[float], confidence: float):
+    def __init__(
+        self,
+        query: str,
+        answer: str,
+        embedding: np.ndarray,
+        scope: str,
+        versions: dict[str, int],
+        confidence: float,
+        entry_id: Optional[str] = None,
+        created_at: Optional[float] = None,
+    ):
+        self.entry_id = entry_id or uuid.uuid4().hex
         self.query = query
         self.answer = answer
-        self.embedding = embedding
+        self.embedding = _unit(embedding)
+        self.scope = scope
+        self.versions = versions
         self.confidence = confidence
-        self.created_at = datetime.now()
+        self.created_at = created_at or time.time()
         self.access_count = 0
-        self.last_accessed = datetime.now()
+        self.last_accessed = self.created_at
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.embedding.nbytes
+            + len(self.query.encode("utf-8"))
+            + len(self.answer.encode("utf-8"))
+        )
 
-    def is_expired(self, ttl_hours: int = 24) -> bool:
+    def is_expired(self, ttl_seconds: int) -> bool:
         """캐시 만료 확인"""
-        return datetime.now() - self.created_at > timedelta(hours=ttl_hours)
+        return time.time() - self.created_at > ttl_seconds
 
     def update_access(self):
         """접근 통계 업데이트"""
         self.access_count += 1
-        self.last_accessed = datetime.now()
+        self.last_accessed = time.time()
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "query": self.query,
+                "answer": self.answer,
+                "embedding": base64.b64encode(
+                    self.embedding.astype(np.float16).tobytes()
+                ).decode("ascii"),
+                "versions": self.versions,
+                "confidence": self.confidence,
+                "created_at": self.created_at,
+            },
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, entry_id: str, scope: str, raw: str) -> "CacheEntry":
+        data = json.loads(raw)
+        embedding = np.frombuffer(
+            base64.b64decode(data["embedding"]), dtype=np.float16
+        ).astype(np.float32)
+        return cls(
+            query=data["query"],
+            answer=data["answer"],
+            embedding=embedding,
+            scope=scope,
+            versions=data.get("versions") or {},
+            confidence=data.get("confidence", 0.0),
+            entry_id=entry_id,
+            created_at=data.get("created_at"),
+        )
+
+
+def _unit(vector: Any) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32).ravel()
+    norm = np.linalg.norm(array)
+    return array / norm if norm > 0 else array
+
+
+class _ScopeIndex:
+    """scope별 임베딩 행렬 (항목 변경 시 lazy 재구성)"""
+
+    def __init__(self):
+        self.entry_ids: list[str] = []
+        self.matrix: Optional[np.ndarray] = None
+        self.dirty = True
+        self.loaded_at = 0.0
 
 
 class SemanticCacheManager:
-    """의미론적 캐시 관리자 (향후 Redis + Vector DB 연동)
-    
+    """의미론적 캐시 관리자 (인메모리 벡터 인덱스 + Redis)
+
     전략:
-    1. 쿼리 임베딩 생성 (BGE)
-    2. 벡터 DB에서 유사도 검색 (threshold > 0.9)
-    3. 유사한 쿼리 발견 시 캐시된 답변 반환
-    4. 캐시 미스 시 정상 처리 후 결과 캐시
-    
-    예상 효과:
-    - 캐시 히트율: 20-30%
-    - 히트 시 지연: 0.1s (50x 빠름)
+    1. 쿼리 임베딩과 scope 내 캐시 임베딩의 코사인 유사도 계산 (행렬 1회 곱)
+    2. 최고 유사도가 threshold 이상이고 KG 버전이 같으면 캐시된 답변 반환
+    3. 캐시 미스 시 정상 처리 후 결과 캐시
+
+    Example:
+        cache = get_semantic_cache()
+        hit = await cache.get_cached_answer(query, embedding, scope, versions)
+        if hit is None:
+            answer = await generate(...)
+            await cache.cache_answer(query, answer, embedding, scope, versions)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: int = 3600,
+        similarity_threshold: float = 0.92,
+        redis_enabled: bool = False,
+        max_entries_per_scope: int = 256,
+    ):
         """캐시 관리자 초기화"""
+        self.max_bytes = max_bytes
+        self.max_entries_per_scope = max_entries_per_scope
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.redis_enabled = redis_enabled
+
         self.memory_cache: dict[str, CacheEntry] = {}
+        self._scopes: dict[str, _ScopeIndex] = {}
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
         self.total_hits = 0
         self.total_misses = 0
-
-        # TODO: Redis 클라이언트 초기화
-        # self.redis_client = redis.Redis(host='localhost', port=6379)
-
-        # TODO: Vector DB 클라이언트 초기화
-        # self.vector_db = VectorDatabase(host='localhost', port=19530)
+        self.total_stale = 0
 
     async def get_cached_answer(
         self,
         query: str,
-        embedding: Optional[list[float]] = None,
-        similarity_threshold: float = 0.9,
+        embedding: Any,
+        scope: str,
+        versions: dict[str, int],
+        similarity_threshold: Optional[float] = None,
     ) -> Optional[dict[str, Any]]:
         """캐시에서 유사한 답변 조회
 
         Args:
             query: 사용자 쿼리
-            embedding: 쿼리 임베딩 (None이면 생성)
-            similarity_threshold: 유사도 임계값
+            embedding: 쿼리 임베딩
+            scope: 캐시 공유 범위 (예: 사용자/회의 단위)
+            versions: 현재 KG 버전 (저장 시점과 다르면 무효)
+            similarity_threshold: 유사도 임계값 (기본: 생성 시 설정값)
 
         Returns:
-            캐시된 결과 또는 None
+            {"answer", "similarity", "cached_query", "source"} 또는 None
         """
-        logger.info(f"[Semantic Cache] 캐시 조회 중: {query[:50]}")
-
+        threshold = similarity_threshold or self.similarity_threshold
         try:
-            # 1단계: 메모리 캐시에서 정확 매칭 확인
-            cache_key = self._make_cache_key(query)
-            if cache_key in self.memory_cache:
-                entry = self.memory_cache[cache_key]
-                if not entry.is_expired():
-                    entry.update_access()
-                    self.total_hits += 1
-                    logger.info(
-                        f"[Semantic Cache] 메모리 캐시 히트 "
-                        f"(총 {self.total_hits}회)"
-                    )
-                    return {"answer": entry.answer, "source": "memory_cache"}
-
-            # 2단계: 벡터 DB에서 의미론적 유사 검색
-            # TODO: 실제 벡터 DB 연동
-            # if embedding:
-            #     similar_results = await self.vector_db.search(
-            #         embedding=embedding,
-            #         top_k=1,
-            #         threshold=similarity_threshold
-            #     )
-            #     if similar_results:
-            #         cached_entry = similar_results[0]
-            #         if cached_entry["similarity"] > similarity_threshold:
-            #             logger.info(
-            #                 f"[Semantic Cache] 벡터 캐시 히트 "
-            #                 f"(유사도: {cached_entry['similarity']:.2f})"
-            #             )
-            #             self.total_hits += 1
-            #             return {
-            #                 "answer": cached_entry["answer"],
-            #                 "source": "vector_cache"
-            #             }
+            await self._ensure_scope_loaded(scope)
+            match = self._search(scope, _unit(embedding))
+        except Exception as e:
+            logger.error(f"[Semantic Cache] 캐시 조회 에러: {str(e)}", exc_info=True)
+            return None
 
-            self.total_misses += 1
-            logger.info(f"[Semantic Cache] 캐시 미스 (총 {self.total_misses}회)")
+        if match is None or match[1] < threshold:
+            self._record("miss")
             return None
 
-        except Exception as e:
-            logger.error(f"[Semantic Cache] 캐시 조회 에러: {str(e)}", exc_info=True)
+        entry, similarity = match
+        if entry.is_expired(self.ttl_seconds) or entry.versions != versions:
+            # KG 쓰기 이후 저장된 답변이 아니면 폐기
+            await self._remove(entry)
+            self._record("stale")
             return None
 
+        entry.update_access()
+        self._record("hit")
+        logger.info(
+            f"[Semantic Cache] 히트 (유사도: {similarity:.3f}): "
+            f"'{query[:30]}' ≈ '{entry.query[:30]}'"
+        )
+        return {
+            "answer": entry.answer,
+            "similarity": similarity,
+            "cached_query": entry.query,
+            "source": "semantic_cache",
+        }
+
     async def cache_answer(
         self,
         query: str,
         answer: str,
-        embedding: list[float],
+        embedding: Any,
+        scope: str,
+        versions: dict[str, int],
         confidence: float = 0.95,
     ) -> None:
-        """검색 결과를 캐시에 저장
+        """답변을 캐시에 저장
 
         Args:
             query: 사용자 쿼리
             answer: 생성된 답변
             embedding: 쿼리 임베딩
+            scope: 캐시 공유 범위
+            versions: 답변 생성 시점의 KG 버전
             confidence: 답변 신뢰도
         """
-        logger.info(f"[Semantic Cache] 캐시 저장 중: {query[:50]}")
-
+        if not answer:
+            return
         try:
-            # 1단계: 메모리 캐시 저장
-            cache_key = self._make_cache_key(query)
-            entry = CacheEntry(query, answer, embedding, confidence)
-            self.memory_cache[cache_key] = entry
-            logger.info(f"[Semantic Cache] 메모리 캐시 저장 완료")
-
-            # 2단계: 벡터 DB에 저장 (백그라운드)
-            # TODO: 비동기 백그라운드로 벡터 DB 저장
-            # await self.vector_db.insert({
-            #     "query": query,
-            #     "answer": answer,
-            #     "embedding": embedding,
-            #     "confidence": confidence,
-            #     "timestamp": datetime.now()
-            # })
-
+            entry = CacheEntry(query, answer, embedding, scope, versions, confidence)
+            self._add(entry)
+            if self.redis_enabled:
+                await self._redis_store(entry)
         except Exception as e:
             logger.error(f"[Semantic Cache] 캐시 저장 에러: {str(e)}", exc_info=True)
 
-    def clear_expired_cache(self, ttl_hours: int = 24) -> int:
-        """만료된 캐시 삭제
+    async def invalidate_scope(self, scope: str) -> None:
+        """scope의 모든 항목 삭제 (인메모리 + Redis)"""
+        with self._lock:
+            for entry_id in list(self._scope(scope).entry_ids):
+                self._evict_locked(entry_id)
+            self._scopes.pop(scope, None)
 
-        Args:
-            ttl_hours: 캐시 유효 시간 (시간)
+        if self.redis_enabled:
+            try:
+                from app.core.redis import get_redis
+
+                client = await get_redis()
+                await client.delete(f"{REDIS_KEY_PREFIX}{scope}", f"{REDIS_ORDER_KEY_PREFIX}{scope}")
+            except Exception as e:
+                logger.warning(f"[Semantic Cache] Redis 삭제 실패: {e}")
+
+    def clear_expired_cache(self) -> int:
+        """만료된 인메모리 항목 삭제
 
         Returns:
             삭제된 항목 수
         """
-        expired_keys = [
-            key
-            for key, entry in self.memory_cache.items()
-            if entry.is_expired(ttl_hours)
-        ]
-
-        for key in expired_keys:
-            del self.memory_cache[key]
-
-        if expired_keys:
-            logger.info(f"[Semantic Cache] {len(expired_keys)}개 만료 캐시 삭제")
-
-        return len(expired_keys)
+        with self._lock:
+            expired = [
+                entry_id
+                for entry_id, entry in self.memory_cache.items()
+                if entry.is_expired(self.ttl_seconds)
+            ]
+            for entry_id in expired:
+                self._evict_locked(entry_id)
+
+        if expired:
+            logger.info(f"[Semantic Cache] {len(expired)}개 만료 캐시 삭제")
+        return len(expired)
 
     def get_cache_stats(self) -> dict[str, Any]:
         """캐시 통계 반환"""
-        total_requests = self.total_hits + self.total_misses
+        total_requests = self.total_hits + self.total_misses + self.total_stale
         hit_rate = (
             (self.total_hits / total_requests * 100)
             if total_requests > 0
@@ -191,24 +291,164 @@ class SemanticCacheManager:
         return {
             "total_hits": self.total_hits,
             "total_misses": self.total_misses,
+            "total_stale": self.total_stale,
             "total_requests": total_requests,
             "hit_rate": f"{hit_rate:.1f}%",
             "cache_size": len(self.memory_cache),
-            "memory_usage_mb": self._estimate_memory_usage(),
+            "scopes": len(self._scopes),
+            "memory_usage_mb": self._current_bytes / (1024 * 1024),
         }
 
-    def _make_cache_key(self, query: str) -> str:
-        """쿼리 해시로 캐시 키 생성"""
-        return hashlib.md5(query.encode()).hexdigest()
+    # === 인메모리 벡터 인덱스 ===
+
+    def _scope(self, scope: str) -> _ScopeIndex:
+        index = self._scopes.get(scope)
+        if index is None:
+            index = _ScopeIndex()
+            self._scopes[scope] = index
+        return index
+
+    def _search(self, scope: str, query_vector: np.ndarray) -> Optional[tuple[CacheEntry, float]]:
+        """scope 내 최고 유사도 항목 (없으면 None)"""
+        with self._lock:
+            index = self._scopes.get(scope)
+            if index is None or not index.entry_ids:
+                return None
+            if index.dirty:
+                index.matrix = np.stack(
+                    [self.memory_cache[entry_id].embedding for entry_id in index.entry_ids]
+                )
+                index.dirty = False
+            if index.matrix.shape[1] != query_vector.shape[0]:
+                return None
+
+            similarities = index.matrix @ query_vector
+            best = int(np.argmax(similarities))
+            return self.memory_cache[index.entry_ids[best]], float(similarities[best])
+
+    def _add(self, entry: CacheEntry) -> None:
+        with self._lock:
+            if entry.entry_id in self.memory_cache:
+                self._evict_locked(entry.entry_id)
+            if entry.nbytes > self.max_bytes:
+                return
+
+            self.memory_cache[entry.entry_id] = entry
+            index = self._scope(entry.scope)
+            index.entry_ids.append(entry.entry_id)
+            index.dirty = True
+            self._current_bytes += entry.nbytes
+
+            while len(index.entry_ids) > self.max_entries_per_scope:
+                # scope 항목 수 상한 → 가장 오래된 항목부터
+                oldest = min(index.entry_ids, key=lambda i: self.memory_cache[i].created_at)
+                self._evict_locked(oldest)
+
+            while self._current_bytes > self.max_bytes and self.memory_cache:
+                # LFU (접근 횟수) 우선, 같으면 LRU
+                victim = min(
+                    self.memory_cache.values(),
+                    key=lambda e: (e.access_count, e.last_accessed),
+                )
+                self._evict_locked(victim.entry_id)
+
+    def _evict_locked(self, entry_id: str) -> None:
+        entry = self.memory_cache.pop(entry_id, None)
+        if entry is None:
+            return
+        self._current_bytes -= entry.nbytes
+        index = self._scopes.get(entry.scope)
+        if index is not None and entry_id in index.entry_ids:
+            index.entry_ids.remove(entry_id)
+            index.dirty = True
+
+    async def _remove(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self._evict_locked(entry.entry_id)
+        if self.redis_enabled:
+            try:
+                from app.core.redis import get_redis
+
+                client = await get_redis()
+                pipe = client.pipeline(transaction=False)
+                pipe.hdel(f"{REDIS_KEY_PREFIX}{entry.scope}", entry.entry_id)
+                pipe.zrem(f"{REDIS_ORDER_KEY_PREFIX}{entry.scope}", entry.entry_id)
+                await pipe.execute()
+            except Exception as e:
+                logger.warning(f"[Semantic Cache] Redis 삭제 실패: {e}")
+
+    # === Redis ===
+
+    async def _ensure_scope_loaded(self, scope: str) -> None:
+        """scope를 처음(또는 주기적으로) 조회할 때 Redis 항목을 인메모리 인덱스로 로드"""
+        if not self.redis_enabled:
+            return
+        index = self._scope(scope)
+        if time.time() - index.loaded_at < SCOPE_RELOAD_SECONDS:
+            return
+        index.loaded_at = time.time()
 
-    def _estimate_memory_usage(self) -> float:
-        """메모리 사용량 추정 (MB)"""
-        total_bytes = 0
-        for entry in self.memory_cache.values():
-            total_bytes += len(entry.query.encode())
-            total_bytes += len(entry.answer.encode())
-            total_bytes += len(entry.embedding) * 4  # float32
-        return total_bytes / (1024 * 1024)
+        try:
+            from app.core.redis import get_redis
+
+            client = await get_redis()
+            raw_entries = await client.hgetall(f"{REDIS_KEY_PREFIX}{scope}")
+        except Exception as e:
+            logger.warning(f"[Semantic Cache] Redis 조회 실패: {e}")
+            return
+
+        for entry_id, raw in raw_entries.items():
+            if entry_id in self.memory_cache:
+                continue
+            try:
+                entry = CacheEntry.from_json(entry_id, scope, raw)
+            except (ValueError, KeyError) as e:
+                logger.warning(f"[Semantic Cache] 손상된 항목 무시: {e}")
+                continue
+            if not entry.is_expired(self.ttl_seconds):
+                self._add(entry)
+
+    async def _redis_store(self, entry: CacheEntry) -> None:
+        """항목 저장 + scope hash 정리
+
+        활성 scope는 저장마다 TTL이 갱신되어 hash 자체가 만료되지 않으므로,
+        상한을 넘는 오래된 항목과 TTL이 지난 항목을 저장 시점에 함께 제거합니다.
+        """
+        try:
+            from app.core.redis import get_redis
+
+            client = await get_redis()
+            key = f"{REDIS_KEY_PREFIX}{entry.scope}"
+            order_key = f"{REDIS_ORDER_KEY_PREFIX}{entry.scope}"
+            pipe = client.pipeline(transaction=False)
+            pipe.hset(key, entry.entry_id, entry.to_json())
+            pipe.zadd(order_key, {entry.entry_id: entry.created_at})
+            pipe.zrange(order_key, 0, -(self.max_entries_per_scope + 1))
+            pipe.zrangebyscore(order_key, "-inf", time.time() - self.ttl_seconds)
+            pipe.expire(key, self.ttl_seconds)
+            pipe.expire(order_key, self.ttl_seconds)
+            results = await pipe.execute()
+
+            victims = set(results[2]) | set(results[3])
+            if victims:
+                pipe = client.pipeline(transaction=False)
+                pipe.hdel(key, *victims)
+                pipe.zrem(order_key, *victims)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[Semantic Cache] Redis 저장 실패: {e}")
+
+    def _record(self, result: str) -> None:
+        if result == "hit":
+            self.total_hits += 1
+        elif result == "stale":
+            self.total_stale += 1
+        else:
+            self.total_misses += 1
+
+        metrics = get_mit_metrics()
+        if metrics:
+            metrics.semantic_cache_requests_total.add(1, {"result": result})
 
 
 # 글로벌 캐시 인스턴스
@@ -219,5 +459,12 @@ def get_semantic_cache() -> SemanticCacheManager:
     """글로벌 의미론적 캐시 인스턴스 반환"""
     global _semantic_cache
     if _semantic_cache is None:
-        _semantic_cache = SemanticCacheManager()
+        settings = get_settings()
+        _semantic_cache = SemanticCacheManager(
+            max_bytes=settings.semantic_cache_max_bytes,
+            ttl_seconds=settings.semantic_cache_ttl_seconds,
+            similarity_threshold=settings.semantic_cache_similarity_threshold,
+            redis_enabled=settings.semantic_cache_redis_enabled,
+            max_entries_per_scope=settings.semantic_cache_max_entries_per_scope,
+        )
     return _semantic_cache
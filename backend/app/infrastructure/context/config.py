@@ -30,6 +30,11 @@ class ContextConfig(BaseSettings):
     l0_topic_buffer_max_turns: int = 100  # 토픽 내 최대 발화 수
     l0_topic_buffer_max_tokens: int = 10000  # 토픽 내 최대 토큰
 
+    # === L1 설정 (Topic Segmentation) ===
+    # load_from_db 등으로 청크가 여러 개 쌓이면 1차 요약을 병렬 처리
+    l1_max_concurrency: int = 4  # 청크 1차 요약 동시 LLM 호출 수
+    l1_chunk_timeout_seconds: float = 30.0  # 병렬 1차 요약 청크별 LLM 타임아웃 (초과 시 fallback, 실시간 경로 미적용)
+
     # === 화자 컨텍스트 설정 ===
     speaker_buffer_max_per_speaker: int = 25  # 화자별 최대 발화 버퍼 크기
 
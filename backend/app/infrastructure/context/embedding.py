@@ -2,15 +2,24 @@
 
 토픽 요약을 벡터로 변환하여 시맨틱 서치를 지원합니다.
 CLOVA Studio Embedding API(v2)를 httpx로 직접 호출하여 서버 메모리 부담 없이 임베딩을 생성합니다.
+
+HTTP 연결은 프로세스(이벤트 루프) 단위로 공유되는 ClovaEmbeddingClient가 관리합니다.
+- keep-alive 연결 풀 (요청마다 TLS 핸드셰이크 제거)
+- 동시 요청 수 제한 (Semaphore)
+- 동일 텍스트 in-flight 요청 병합 (여러 회의에서 동시에 요청해도 1회 호출)
+- 429/5xx 응답 시 지수 백오프 재시도
 """
 
 import asyncio
 import logging
+import random
+import weakref
 
 import httpx
 import numpy as np
 
 from app.core.config import get_settings
+from app.infrastructure.cache.embedding_cache import EmbeddingCache, get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,73 +34,249 @@ CLOVA_EMBEDDING_ENDPOINT = (
 EMBEDDING_MODEL = "bge-m3"
 EMBEDDING_DIMENSION = 1024
 
+# 연결 풀 / 동시성 설정
+EMBEDDING_MAX_CONCURRENCY = 8  # 프로세스 전체 동시 요청 수
+EMBEDDING_MAX_CONNECTIONS = 16
+EMBEDDING_MAX_KEEPALIVE = 8
+EMBEDDING_TIMEOUT = 30.0
 
-async def _call_clova_embedding(text: str) -> list[float] | None:
-    """Clova Studio Embedding API v2 호출.
+# 재시도 설정 (429 / 5xx)
+EMBEDDING_MAX_RETRIES = 3
+EMBEDDING_BACKOFF_BASE = 0.5  # 초
+EMBEDDING_BACKOFF_MAX = 8.0  # 초
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
-    Args:
-        text: 임베딩할 텍스트
 
-    Returns:
-        임베딩 벡터 (list[float]) 또는 None (실패 시)
-    """
-    settings = get_settings()
-    api_key = settings.ncp_clovastudio_api_key
+class ClovaEmbeddingClient:
+    """CLOVA Studio Embedding API 풀링 클라이언트.
 
-    if not api_key:
-        logger.warning("NCP_CLOVASTUDIO_API_KEY not configured")
-        return None
+    Embedding API v2는 요청당 텍스트 1개만 받으므로, 배치는 하나의 keep-alive
+    연결 풀 위에서 동시성 제한을 두고 병렬 전송합니다.
+
+    Example:
+        client = get_embedding_client()
+        vectors = await client.embed_many(["예산 확정", "출시 일정"])
+    """
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+        max_retries: int = EMBEDDING_MAX_RETRIES,
+    ):
+        self._api_key = api_key if api_key is not None else get_settings().ncp_clovastudio_api_key
+        self._max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._client: httpx.AsyncClient | None = None
 
-    payload = {"text": text}
+    @property
+    def is_available(self) -> bool:
+        """API 키 설정 여부"""
+        return bool(self._api_key)
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                CLOVA_EMBEDDING_ENDPOINT,
-                headers=headers,
-                json=payload,
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """keep-alive HTTP 클라이언트 (lazy 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(EMBEDDING_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=EMBEDDING_MAX_CONNECTIONS,
+                    max_keepalive_connections=EMBEDDING_MAX_KEEPALIVE,
+                ),
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": "application/json",
+                },
             )
-            response.raise_for_status()
-            result = response.json()
+        return self._client
 
-            status = result.get("status") or {}
-            code = status.get("code")
-            if code and str(code) != "20000":
-                logger.warning(f"Clova Embedding API returned error code: {code}")
-                return None
+    async def aclose(self) -> None:
+        """HTTP 연결 풀 종료"""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-            embedding = (result.get("result") or {}).get("embedding")
-            if isinstance(embedding, list) and embedding:
-                return embedding
+    async def embed(self, text: str) -> list[float] | None:
+        """단일 텍스트 임베딩 (동일 텍스트 in-flight 요청은 병합).
 
-            logger.warning(f"Unexpected Clova Embedding response format: {result}")
+        Args:
+            text: 임베딩할 텍스트
+
+        Returns:
+            임베딩 벡터 (list[float]) 또는 None (실패 시)
+        """
+        if not self._api_key:
+            logger.warning("NCP_CLOVASTUDIO_API_KEY not configured")
             return None
 
-    except httpx.HTTPStatusError as e:
-        logger.error(f"Clova Embedding API HTTP error: {e.response.status_code}")
+        task = self._inflight.get(text)
+        if task is None:
+            task = asyncio.ensure_future(self._request_with_retry(text))
+            self._inflight[text] = task
+            task.add_done_callback(lambda _t, key=text: self._inflight.pop(key, None))
+        else:
+            logger.debug("Coalesced in-flight embedding request")
+
+        # 한 호출자의 취소가 공유 요청을 취소하지 않도록 shield
+        return await asyncio.shield(task)
+
+    async def embed_many(self, texts: list[str]) -> list[list[float] | None]:
+        """여러 텍스트 임베딩 (중복 제거 후 제한된 동시성으로 전송).
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+
+        Returns:
+            입력 순서와 동일한 임베딩 리스트 (실패 항목은 None)
+        """
+        unique = list(dict.fromkeys(texts))
+        results = await asyncio.gather(
+            *(self.embed(text) for text in unique), return_exceptions=True
+        )
+        by_text = {
+            text: result if isinstance(result, list) else None
+            for text, result in zip(unique, results)
+        }
+        return [by_text[text] for text in texts]
+
+    async def _request_with_retry(self, text: str) -> list[float] | None:
+        """429/5xx 시 지수 백오프로 재시도하는 API 호출"""
+        for attempt in range(self._max_retries + 1):
+            async with self._semaphore:
+                try:
+                    response = await self._get_http_client().post(
+                        CLOVA_EMBEDDING_ENDPOINT,
+                        json={"text": text},
+                    )
+                except (httpx.TimeoutException, httpx.TransportError) as e:
+                    if attempt >= self._max_retries:
+                        logger.error(f"Clova Embedding API error: {e}")
+                        return None
+                    delay = self._backoff_delay(attempt)
+                    logger.warning(
+                        f"Clova Embedding API transport error, retrying in {delay:.2f}s: {e}"
+                    )
+                    response = None
+
+            if response is None:
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < self._max_retries:
+                delay = self._backoff_delay(attempt, response.headers.get("Retry-After"))
+                logger.warning(
+                    f"Clova Embedding API HTTP {response.status_code}, "
+                    f"retry {attempt + 1}/{self._max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            return self._parse_response(response)
+
         return None
-    except Exception as e:
-        logger.error(f"Clova Embedding API error: {e}")
+
+    @staticmethod
+    def _backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+        """재시도 대기 시간 (Retry-After 우선, 없으면 지수 백오프 + jitter)"""
+        if retry_after:
+            try:
+                return min(float(retry_after), EMBEDDING_BACKOFF_MAX)
+            except ValueError:
+                pass
+        delay = min(EMBEDDING_BACKOFF_BASE * (2**attempt), EMBEDDING_BACKOFF_MAX)
+        return delay * (0.5 + random.random() / 2)
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> list[float] | None:
+        """API 응답에서 임베딩 추출"""
+        try:
+            response.raise_for_status()
+            result = response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Clova Embedding API HTTP error: {e.response.status_code}")
+            return None
+        except Exception as e:
+            logger.error(f"Clova Embedding API error: {e}")
+            return None
+
+        status = result.get("status") or {}
+        code = status.get("code")
+        if code and str(code) != "20000":
+            logger.warning(f"Clova Embedding API returned error code: {code}")
+            return None
+
+        embedding = (result.get("result") or {}).get("embedding")
+        if isinstance(embedding, list) and embedding:
+            return embedding
+
+        logger.warning(f"Unexpected Clova Embedding response format: {result}")
         return None
 
 
+# 이벤트 루프별 공유 클라이언트 (httpx 연결/Semaphore는 루프에 종속)
+_embedding_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ClovaEmbeddingClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_embedding_client() -> ClovaEmbeddingClient:
+    """현재 이벤트 루프의 공유 임베딩 클라이언트 반환 (lazy 생성)"""
+    loop = asyncio.get_running_loop()
+    client = _embedding_clients.get(loop)
+    if client is None:
+        client = ClovaEmbeddingClient()
+        _embedding_clients[loop] = client
+    return client
+
+
+async def close_embedding_client() -> None:
+    """현재 이벤트 루프의 공유 임베딩 클라이언트 종료
+
+    애플리케이션 종료 시 호출.
+    """
+    loop = asyncio.get_running_loop()
+    client = _embedding_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+        logger.info("[Embedding] Client closed")
+
+
+async def _call_clova_embedding(text: str) -> list[float] | None:
+    """Clova Studio Embedding API v2 호출 (공유 풀링 클라이언트 사용).
+
+    Args:
+        text: 임베딩할 텍스트
+
+    Returns:
+        임베딩 벡터 (list[float]) 또는 None (실패 시)
+    """
+    return await get_embedding_client().embed(text)
+
+
+async def _call_clova_embedding_once(text: str) -> list[float] | None:
+    """일회성 이벤트 루프용 호출 (루프 종료 전 연결 정리)."""
+    try:
+        return await _call_clova_embedding(text)
+    finally:
+        await close_embedding_client()
+
+
 def _call_clova_embedding_sync(text: str) -> list[float] | None:
     """Clova Studio Embedding API 동기 호출 (테스트/fallback용)."""
     try:
         asyncio.get_running_loop()
     except RuntimeError:
         # 이벤트 루프가 없으면 새로 생성
-        return asyncio.run(_call_clova_embedding(text))
+        return asyncio.run(_call_clova_embedding_once(text))
 
     # 이벤트 루프가 있으면 새 스레드에서 실행
     import concurrent.futures
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        future = executor.submit(asyncio.run, _call_clova_embedding(text))
+        future = executor.submit(asyncio.run, _call_clova_embedding_once(text))
         return future.result()
 
 
@@ -108,10 +293,15 @@ class TopicEmbedder:
             print(f"Embedding shape: {vec.shape}")  # (1024,)
     """
 
-    def __init__(self):
-        """TopicEmbedder 초기화."""
+    def __init__(self, cache: EmbeddingCache | None = None):
+        """TopicEmbedder 초기화.
+
+        Args:
+            cache: 임베딩 캐시 (기본: 글로벌 캐시)
+        """
         settings = get_settings()
         self._api_key = settings.ncp_clovastudio_api_key
+        self._cache = cache or get_embedding_cache()
 
     @property
     def is_available(self) -> bool:
@@ -135,9 +325,15 @@ class TopicEmbedder:
             logger.warning("Empty text provided for embedding")
             return None
 
+        cached = await self._cache.get(EMBEDDING_MODEL, text)
+        if cached is not None:
+            return cached
+
         embedding = await _call_clova_embedding(text)
         if embedding is not None:
-            return np.array(embedding, dtype=np.float32)
+            vector = np.array(embedding, dtype=np.float32)
+            await self._cache.put(EMBEDDING_MODEL, text, vector)
+            return vector
         return None
 
     def embed_text(self, text: str) -> np.ndarray | None:
@@ -157,9 +353,16 @@ class TopicEmbedder:
             logger.warning("Empty text provided for embedding")
             return None
 
+        # 동기 경로는 별도 이벤트 루프에서 실행되므로 인메모리 캐시만 사용
+        cached = self._cache.get_local(EMBEDDING_MODEL, text)
+        if cached is not None:
+            return cached
+
         embedding = _call_clova_embedding_sync(text)
         if embedding is not None:
-            return np.array(embedding, dtype=np.float32)
+            vector = np.array(embedding, dtype=np.float32)
+            self._cache.put_local(EMBEDDING_MODEL, text, vector)
+            return vector
         return None
 
     async def embed_batch_async(self, texts: list[str]) -> list[np.ndarray]:
@@ -178,17 +381,45 @@ class TopicEmbedder:
         if not valid_texts:
             return []
 
-        # 병렬로 API 호출
-        tasks = [_call_clova_embedding(t) for t in valid_texts]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return await self._embed_batch_cached(valid_texts, shared_tier=True)
 
-        embeddings = []
-        for result in results:
-            if isinstance(result, list):
-                embeddings.append(np.array(result, dtype=np.float32))
+    async def _embed_batch_cached(
+        self, texts: list[str], shared_tier: bool
+    ) -> list[np.ndarray]:
+        """캐시 조회 후 미스만 API 호출.
+
+        Args:
+            texts: 비어있지 않은 텍스트 리스트
+            shared_tier: Redis 2차 캐시 사용 여부 (일회성 이벤트 루프에서는 False)
+        """
+        if shared_tier:
+            cached = await self._cache.get_many(EMBEDDING_MODEL, texts)
+        else:
+            cached = [self._cache.get_local(EMBEDDING_MODEL, t) for t in texts]
+
+        missing = list(dict.fromkeys(t for t, vec in zip(texts, cached) if vec is None))
+        fetched: dict[str, np.ndarray] = {}
+        if missing:
+            # 공유 풀링 클라이언트로 전송 (중복 제거 + 동시성 제한)
+            results = await get_embedding_client().embed_many(missing)
+            for text, result in zip(missing, results):
+                if isinstance(result, list):
+                    fetched[text] = np.array(result, dtype=np.float32)
+
+            if shared_tier:
+                await self._cache.put_many(
+                    EMBEDDING_MODEL, list(fetched), list(fetched.values())
+                )
             else:
-                # 실패한 경우 영벡터
-                embeddings.append(self.zero_vector())
+                for text, vector in fetched.items():
+                    self._cache.put_local(EMBEDDING_MODEL, text, vector)
+
+        embeddings = []
+        for text, vector in zip(texts, cached):
+            if vector is None:
+                vector = fetched.get(text)
+            # 실패한 경우 영벡터
+            embeddings.append(vector if vector is not None else self.zero_vector())
 
         return embeddings
 
@@ -208,14 +439,20 @@ class TopicEmbedder:
         if not valid_texts:
             return []
 
+        async def _run_once() -> list[np.ndarray]:
+            try:
+                return await self._embed_batch_cached(valid_texts, shared_tier=False)
+            finally:
+                await close_embedding_client()
+
         try:
             asyncio.get_running_loop()
         except RuntimeError:
-            return asyncio.run(self.embed_batch_async(valid_texts))
+            return asyncio.run(_run_once())
 
         import concurrent.futures
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, self.embed_batch_async(valid_texts))
+            future = executor.submit(asyncio.run, _run_once())
             return future.result()
 
     @staticmethod
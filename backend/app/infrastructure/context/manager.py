@@ -16,6 +16,7 @@ import json
 import logging
 import uuid as uuid_module
 from collections import deque
+from collections.abc import Callable
 from datetime import datetime, timezone
 from uuid import UUID
 
@@ -42,12 +43,14 @@ try:
     import numpy as np
 
     from app.infrastructure.context.embedding import TopicEmbedder
+    from app.infrastructure.context.topic_index import TopicEmbeddingIndex
 
     EMBEDDING_AVAILABLE = True
 except ImportError:
     EMBEDDING_AVAILABLE = False
     np = None  # type: ignore
     TopicEmbedder = None  # type: ignore
+    TopicEmbeddingIndex = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +86,10 @@ class ContextManager:
 
         # 인메모리 임베딩 (시맨틱 서치용)
         self._embedder = TopicEmbedder() if EMBEDDING_AVAILABLE else None
-        self._topic_embeddings: dict[str, list[float]] = {}  # topic_id -> embedding
+        # topic_id -> 정규화 임베딩 행 (연속 float32 행렬)
+        self._topic_embeddings: TopicEmbeddingIndex | None = (
+            TopicEmbeddingIndex(self.config.embedding_dimension) if EMBEDDING_AVAILABLE else None
+        )
 
         # L0: Raw Window (모드별 턴 수 적용)
         self.l0_buffer: deque[Utterance] = deque(maxlen=self.context_turns)
@@ -109,6 +115,23 @@ class ContextManager:
         self._l1_task: asyncio.Task | None = None
         self._l1_processing: bool = False
 
+        # L1 처리 완료 리스너 (스냅샷 저장 등, 동기 호출)
+        self._l1_listeners: list[Callable[["ContextManager"], None]] = []
+
+    def add_l1_listener(self, callback: Callable[["ContextManager"], None]) -> None:
+        """L1 처리 완료 시 호출될 콜백 등록
+
+        콜백은 await_pending_l1 종료 직전에 동기로 호출되므로 상태를 일관되게 읽을 수 있습니다.
+        """
+        self._l1_listeners.append(callback)
+
+    def _notify_l1_listeners(self) -> None:
+        for callback in self._l1_listeners:
+            try:
+                callback(self)
+            except Exception as e:
+                logger.warning(f"L1 listener failed: {e}")
+
     async def add_utterance(self, utterance: Utterance) -> None:
         """새 발화 추가 (L1은 비동기 처리)
 
@@ -202,6 +225,8 @@ class ContextManager:
         완료된 상태에서 컨텍스트를 제공합니다.
 
         25턴 단위로 발화를 토픽별로 분할하여 요약하고, 인메모리 임베딩을 생성합니다.
+        청크가 여러 개면(load_from_db 직후 등) 1차 요약을 l1_max_concurrency만큼 병렬로
+        실행한 뒤, 토픽명/임베딩 유사도 기준으로 기존 토픽에 병합합니다.
         """
         if self._l1_processing and self._l1_task and self._l1_task is not asyncio.current_task():
             await self._l1_task
@@ -213,7 +238,6 @@ class ContextManager:
 
         logger.info(f"Awaiting {len(self._pending_l1_chunks)} pending L1 chunks...")
 
-        # 모든 대기 청크를 순차 처리 (토픽 분할은 재귀적으로 진행)
         chunks = self._pending_l1_chunks.copy()
         self._pending_l1_chunks.clear()
 
@@ -221,83 +245,32 @@ class ContextManager:
         new_segments: list[TopicSegment] = []
         queued_for_embedding: set[str] = set()
 
-        for chunk_idx, chunk in enumerate(chunks):
-            is_first = len(self.l1_segments) == 0 and chunk_idx == 0
-
-            # 토픽 분할 처리 (인메모리)
-            segments = await self._separate_topics_lightweight(
-                chunk, is_first=is_first
-            )
-
-            # 같은 토픽명은 append 방식으로 병합
-            for seg in segments:
-                existing_segment = self._find_segment_by_name(seg.name)
-
-                if not existing_segment:
-                    self.l1_segments.append(seg)
-                    if seg.id not in queued_for_embedding:
-                        new_segments.append(seg)
-                        queued_for_embedding.add(seg.id)
-                    continue
-
-                delta_summary = seg.summary.strip()
-                summary_updated = False
-
-                # 기존 요약과 동일/부분중복이면 append 생략
-                if delta_summary and delta_summary not in existing_segment.summary:
-                    existing_segment.summary = (
-                        f"{existing_segment.summary} {delta_summary}".strip()
-                    )
-                    summary_updated = True
-
-                existing_segment.start_utterance_id = min(
-                    existing_segment.start_utterance_id, seg.start_utterance_id
-                )
-                existing_segment.end_utterance_id = max(
-                    existing_segment.end_utterance_id, seg.end_utterance_id
-                )
-
-                merged_keywords = self._merge_unique(existing_segment.keywords, seg.keywords, limit=10)
-                keywords_updated = merged_keywords != existing_segment.keywords
-                if keywords_updated:
-                    existing_segment.keywords = merged_keywords
-
-                merged_participants = self._merge_unique(
-                    existing_segment.participants, seg.participants
+        if len(chunks) == 1:
+            # 실시간 경로: 기존 토픽을 프롬프트에 포함한 재귀 분할
+            is_first = len(self.l1_segments) == 0
+            segments = await self._separate_topics_lightweight(chunks[0], is_first=is_first)
+            self._apply_chunk_segments(chunks[0], 0, segments, new_segments, queued_for_embedding)
+            created_segment_ids: set[str] = set()
+        else:
+            # 대량 경로: 청크별 1차 요약을 동시 실행 후 순서대로 병합
+            existing_ids = {seg.id for seg in self.l1_segments}
+            first_pass = await self._separate_chunks_parallel(chunks)
+            for chunk_idx, (chunk, segments) in enumerate(zip(chunks, first_pass)):
+                self._apply_chunk_segments(
+                    chunk, chunk_idx, segments, new_segments, queued_for_embedding
                 )
-                if merged_participants != existing_segment.participants:
-                    existing_segment.participants = merged_participants
-
-                if summary_updated:
-                    # 요약이 바뀌었으므로 stale embedding 무효화
-                    self._topic_embeddings.pop(existing_segment.id, None)
-                    if existing_segment.id not in queued_for_embedding:
-                        new_segments.append(existing_segment)
-                        queued_for_embedding.add(existing_segment.id)
-                    logger.info(
-                        "Appended new topic delta: name=%s, id=%s, turn=%d~%d",
-                        existing_segment.name,
-                        existing_segment.id[:8],
-                        seg.start_utterance_id,
-                        seg.end_utterance_id,
-                    )
-                else:
-                    logger.info(
-                        "No new topic delta: name=%s, turn=%d~%d",
-                        existing_segment.name,
-                        seg.start_utterance_id,
-                        seg.end_utterance_id,
-                    )
-
-            logger.info(
-                f"Chunk {chunk_idx + 1}: {len(segments)} topics from "
-                f"turn {chunk[0].id}~{chunk[-1].id}"
-            )
+            created_segment_ids = {
+                seg.id for seg in self.l1_segments if seg.id not in existing_ids
+            }
 
         # 배치 임베딩 (병렬 API 호출)
         if new_segments:
             await self._embed_topics_batch_async(new_segments)
 
+        # 병렬 1차 요약은 서로의 토픽을 보지 못하므로 임베딩 기반으로 재조정
+        if created_segment_ids:
+            await self._reconcile_parallel_segments(created_segment_ids)
+
         # 토픽 수 초과 시 유사 토픽 병합
         await self._check_and_merge_topics()
 
@@ -306,6 +279,167 @@ class ContextManager:
             self.current_topic = self.l1_segments[-1].name
 
         logger.info(f"L1 processing complete: {len(self.l1_segments)} total segments")
+        self._notify_l1_listeners()
+
+    async def _separate_topics_with_timeout(
+        self,
+        utterances: list[Utterance],
+        is_first: bool,
+    ) -> list[TopicSegment]:
+        """병렬 1차 요약용 토픽 분할 (청크별 타임아웃, 초과 시 fallback 세그먼트)."""
+        try:
+            return await asyncio.wait_for(
+                self._separate_topics_lightweight(utterances, is_first=is_first),
+                timeout=self.config.l1_chunk_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "L1 topic separation timed out (%.1fs): turn=%d~%d",
+                self.config.l1_chunk_timeout_seconds,
+                utterances[0].id,
+                utterances[-1].id,
+            )
+            return [
+                self._create_fallback_segment(
+                    utterances, utterances[0].id, utterances[-1].id, is_first=is_first
+                )
+            ]
+
+    async def _separate_chunks_parallel(
+        self, chunks: list[list[Utterance]]
+    ) -> list[list[TopicSegment]]:
+        """여러 청크의 1차 토픽 분할을 동시성 제한 하에 병렬 실행.
+
+        모든 청크는 처리 시작 시점의 기존 토픽만 참고합니다.
+        결과는 입력 청크 순서대로 반환됩니다.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.config.l1_max_concurrency))
+        has_existing = bool(self.l1_segments)
+
+        async def _run(chunk_idx: int, chunk: list[Utterance]) -> list[TopicSegment]:
+            async with semaphore:
+                return await self._separate_topics_with_timeout(
+                    chunk, is_first=not has_existing and chunk_idx == 0
+                )
+
+        logger.info(
+            "L1 parallel first pass: %d chunks, concurrency=%d",
+            len(chunks),
+            self.config.l1_max_concurrency,
+        )
+        return list(await asyncio.gather(*(_run(i, c) for i, c in enumerate(chunks))))
+
+    def _apply_chunk_segments(
+        self,
+        chunk: list[Utterance],
+        chunk_idx: int,
+        segments: list[TopicSegment],
+        new_segments: list[TopicSegment],
+        queued_for_embedding: set[str],
+    ) -> None:
+        """청크 분할 결과를 L1에 반영 (같은 토픽명은 append 방식으로 병합)."""
+        for seg in segments:
+            existing_segment = self._find_segment_by_name(seg.name)
+
+            if not existing_segment:
+                self.l1_segments.append(seg)
+                if seg.id not in queued_for_embedding:
+                    new_segments.append(seg)
+                    queued_for_embedding.add(seg.id)
+                continue
+
+            summary_updated = self._absorb_segment(existing_segment, seg)
+
+            if summary_updated:
+                if existing_segment.id not in queued_for_embedding:
+                    new_segments.append(existing_segment)
+                    queued_for_embedding.add(existing_segment.id)
+                logger.info(
+                    "Appended new topic delta: name=%s, id=%s, turn=%d~%d",
+                    existing_segment.name,
+                    existing_segment.id[:8],
+                    seg.start_utterance_id,
+                    seg.end_utterance_id,
+                )
+            else:
+                logger.info(
+                    "No new topic delta: name=%s, turn=%d~%d",
+                    existing_segment.name,
+                    seg.start_utterance_id,
+                    seg.end_utterance_id,
+                )
+
+        logger.info(
+            f"Chunk {chunk_idx + 1}: {len(segments)} topics from "
+            f"turn {chunk[0].id}~{chunk[-1].id}"
+        )
+
+    def _absorb_segment(self, target: TopicSegment, seg: TopicSegment) -> bool:
+        """seg의 요약/구간/키워드/참여자를 target에 병합.
+
+        Returns:
+            bool: 요약 변경 여부 (변경 시 target의 stale embedding 무효화)
+        """
+        delta_summary = seg.summary.strip()
+        summary_updated = False
+
+        # 기존 요약과 동일/부분중복이면 append 생략
+        if delta_summary and delta_summary not in target.summary:
+            target.summary = f"{target.summary} {delta_summary}".strip()
+            summary_updated = True
+
+        target.start_utterance_id = min(target.start_utterance_id, seg.start_utterance_id)
+        target.end_utterance_id = max(target.end_utterance_id, seg.end_utterance_id)
+
+        merged_keywords = self._merge_unique(target.keywords, seg.keywords, limit=10)
+        if merged_keywords != target.keywords:
+            target.keywords = merged_keywords
+
+        merged_participants = self._merge_unique(target.participants, seg.participants)
+        if merged_participants != target.participants:
+            target.participants = merged_participants
+
+        if summary_updated and self._topic_embeddings is not None:
+            # 요약이 바뀌었으므로 stale embedding 무효화
+            self._topic_embeddings.remove(target.id)
+
+        return summary_updated
+
+    async def _reconcile_parallel_segments(self, created_segment_ids: set[str]) -> None:
+        """병렬 1차 요약으로 새로 생긴 토픽을 유사한 앞선 토픽에 흡수 (LLM 미사용).
+
+        토픽명이 달라도 임베딩 유사도가 topic_merge_threshold 이상이면 같은 토픽으로 봅니다.
+        """
+        if self._topic_embeddings is None or not self._topic_embeddings:
+            return
+
+        threshold = self.config.topic_merge_threshold
+
+        for seg in list(self.l1_segments):
+            if seg.id not in created_segment_ids:
+                continue
+            query = self._topic_embeddings.get(seg.id)
+            if query is None:
+                continue
+
+            # 자신보다 앞선(먼저 시작한) 토픽 중 가장 유사한 것에 흡수
+            position = {s.id: idx for idx, s in enumerate(self.l1_segments)}
+            target = None
+            for topic_id, _ in self._topic_embeddings.rank(
+                query, top_k=len(self._topic_embeddings), threshold=threshold
+            ):
+                if topic_id != seg.id and position.get(topic_id, len(position)) < position[seg.id]:
+                    target = self.l1_segments[position[topic_id]]
+                    break
+            if target is None:
+                continue
+
+            logger.info("Reconciled topic '%s' into '%s'", seg.name, target.name)
+            self.l1_segments.remove(seg)
+            self._topic_embeddings.remove(seg.id)
+            if self._absorb_segment(target, seg):
+                # 요약이 바뀐 target을 바로 재임베딩 → 이후 유사도 비교가 갱신된 요약 기준
+                await self._embed_topics_batch_async([target])
 
     @property
     def has_pending_l1(self) -> bool:
@@ -477,7 +611,9 @@ class ContextManager:
         response = await self._call_llm(system_prompt, user_prompt)
         if not response:
             # fallback: 단일 토픽 생성
-            return [self._create_fallback_segment(utterances, start_turn, end_turn)]
+            return [
+                self._create_fallback_segment(utterances, start_turn, end_turn, is_first=is_first)
+            ]
 
         if logger.isEnabledFor(logging.DEBUG):
             preview = response.replace("\n", "\\n")
@@ -491,7 +627,9 @@ class ContextManager:
         )
 
         if not segments:
-            return [self._create_fallback_segment(utterances, start_turn, end_turn)]
+            return [
+                self._create_fallback_segment(utterances, start_turn, end_turn, is_first=is_first)
+            ]
 
         return segments
 
@@ -642,10 +780,11 @@ class ContextManager:
         utterances: list[Utterance],
         start_turn: int,
         end_turn: int,
+        is_first: bool = True,
     ) -> TopicSegment:
         """Fallback 세그먼트 생성."""
         topic_name = f"Topic_{start_turn}_{end_turn}"
-        if not self.l1_segments:
+        if is_first and not self.l1_segments:
             topic_name = "Intro"
 
         return TopicSegment(
@@ -671,6 +810,8 @@ class ContextManager:
         """
         if not self._embedder or not self._embedder.is_available:
             return 0
+        if self._topic_embeddings is None:
+            return 0
 
         # 이미 임베딩된 토픽 제외 + 동일 토픽 중복 요청 제거
         to_embed: list[tuple[TopicSegment, str]] = []
@@ -690,9 +831,8 @@ class ContextManager:
 
         embedded_count = 0
         for (seg, _), emb in zip(to_embed, embeddings):
-            # 영벡터(실패)가 아닌 경우만 저장
-            if emb is not None and not np.all(emb == 0):
-                self._topic_embeddings[seg.id] = emb.tolist()
+            # 영벡터(실패)가 아닌 경우만 저장 (upsert가 영벡터 거부)
+            if emb is not None and self._topic_embeddings.upsert(seg.id, emb):
                 embedded_count += 1
 
         if embedded_count > 0:
@@ -708,10 +848,11 @@ class ContextManager:
         """
         if not self._embedder or not self._embedder.is_available:
             return
+        if self._topic_embeddings is None:
+            return
 
         embedding = self._embedder.embed_text(segment.summary)
-        if embedding is not None:
-            self._topic_embeddings[segment.id] = embedding.tolist()
+        if embedding is not None and self._topic_embeddings.upsert(segment.id, embedding):
             logger.debug(f"Embedded topic '{segment.name}' (id={segment.id[:8]}...)")
 
     # === 토픽 병합 ===
@@ -752,33 +893,31 @@ class ContextManager:
         if len(self.l1_segments) < 2:
             return False
 
-        # 유사도 행렬 계산
-        best_pair: tuple[int, int] | None = None
-        best_similarity = 0.0
-
-        for i in range(len(self.l1_segments)):
-            for j in range(i + 1, len(self.l1_segments)):
-                seg_i = self.l1_segments[i]
-                seg_j = self.l1_segments[j]
+        if self._topic_embeddings is None:
+            return False
 
-                if seg_i.id not in self._topic_embeddings:
-                    continue
-                if seg_j.id not in self._topic_embeddings:
-                    continue
+        # 제거/교체된 토픽의 잔여 임베딩 정리 (stale 쌍이 최고 유사도로 잡혀 병합이 멈추지 않도록)
+        live_ids = {seg.id for seg in self.l1_segments}
+        for topic_id in self._topic_embeddings.ids():
+            if topic_id not in live_ids:
+                self._topic_embeddings.remove(topic_id)
 
-                emb_i = np.array(self._topic_embeddings[seg_i.id], dtype=np.float32)
-                emb_j = np.array(self._topic_embeddings[seg_j.id], dtype=np.float32)
-                similarity = self._embedder.cosine_similarity(emb_i, emb_j)
+        # 정규화 행렬 곱 1회로 최고 유사도 쌍 탐색
+        best = self._topic_embeddings.most_similar_pair()
+        if best is None:
+            return False
 
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_pair = (i, j)
+        topic_id_a, topic_id_b, best_similarity = best
 
         # 임계값 미만이면 병합하지 않음
-        if best_pair is None or best_similarity < self.config.topic_merge_threshold:
+        if best_similarity < self.config.topic_merge_threshold:
             return False
 
-        i, j = best_pair
+        index_by_id = {seg.id: idx for idx, seg in enumerate(self.l1_segments)}
+        if topic_id_a not in index_by_id or topic_id_b not in index_by_id:
+            return False
+
+        i, j = sorted((index_by_id[topic_id_a], index_by_id[topic_id_b]))
         seg_i = self.l1_segments[i]
         seg_j = self.l1_segments[j]
 
@@ -797,8 +936,8 @@ class ContextManager:
         del self.l1_segments[i]
 
         # 임베딩 제거
-        self._topic_embeddings.pop(seg_i.id, None)
-        self._topic_embeddings.pop(seg_j.id, None)
+        self._topic_embeddings.remove(seg_i.id)
+        self._topic_embeddings.remove(seg_j.id)
 
         # 병합된 토픽 추가
         self.l1_segments.append(merged_segment)
@@ -814,19 +953,15 @@ class ContextManager:
         threshold: float,
     ) -> list[TopicSegment]:
         """쿼리 임베딩 기준으로 토픽 유사도 계산 후 Top-K 반환."""
-        similarities: list[tuple[TopicSegment, float]] = []
-        for seg in self.l1_segments:
-            topic_embedding_values = self._topic_embeddings.get(seg.id)
-            if topic_embedding_values is None:
-                continue
-
-            topic_embedding = np.array(topic_embedding_values, dtype=np.float32)
-            similarity = self._embedder.cosine_similarity(query_embedding, topic_embedding)
-            if similarity >= threshold:
-                similarities.append((seg, similarity))
+        if self._topic_embeddings is None:
+            return []
 
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return [seg for seg, _ in similarities[:top_k]]
+        segments_by_id = {seg.id: seg for seg in self.l1_segments}
+        ranked = self._topic_embeddings.rank(
+            query_embedding, top_k=len(self._topic_embeddings), threshold=threshold
+        )
+        results = [segments_by_id[topic_id] for topic_id, _ in ranked if topic_id in segments_by_id]
+        return results[:top_k]
 
     async def _merge_topics_with_llm(
         self, seg1: TopicSegment, seg2: TopicSegment
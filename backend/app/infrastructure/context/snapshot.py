@@ -0,0 +1,228 @@
+"""Context Snapshot - ContextManager L1 상태 스냅샷/복원
+
+런타임 캐시 축출이나 파드 재시작 후 전체 발화를 LLM으로 재요약하지 않도록
+L1 처리 직후 상태를 Redis에 저장하고, 캐시 미스 시 복원합니다.
+
+저장 형식 (Redis Hash, key=context:snapshot:{meeting_id}):
+- meta: ContextSnapshot JSON (L1 세그먼트, L0 버퍼, 대기 청크, 진행 위치)
+- embeddings: 정규화된 토픽 임베딩 행렬 (float32 raw bytes, 행 순서 = meta.embedding_ids)
+"""
+
+import logging
+from datetime import datetime, timezone
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from app.core.config import get_settings
+from app.infrastructure.context.models import TopicSegment, Utterance
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_KEY_PREFIX = "context:snapshot:"
+
+
+class ContextSnapshot(BaseModel):
+    """ContextManager + 런타임 진행 위치 스냅샷"""
+
+    version: int = SNAPSHOT_VERSION
+    meeting_id: str
+    mode: str = "voice"
+    current_topic: str = "Intro"
+
+    # L1
+    l1_segments: list[TopicSegment] = Field(default_factory=list)
+    pending_l1_chunks: list[list[Utterance]] = Field(default_factory=list)
+    last_summarized_utterance_id: int | None = None
+
+    # L0 (요약 대기 중인 발화 포함)
+    l0_buffer: list[Utterance] = Field(default_factory=list)
+    l0_topic_buffer: list[Utterance] = Field(default_factory=list)
+
+    # 런타임 진행 위치 (이후 발화만 DB에서 replay)
+    last_utterance_id: int = 0
+    last_processed_start_ms: int | None = None
+
+    # 임베딩 행렬 메타데이터
+    embedding_ids: list[str] = Field(default_factory=list)
+    embedding_dimension: int = 0
+
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def capture_snapshot(
+    manager,
+    last_utterance_id: int,
+    last_processed_start_ms: int | None,
+) -> tuple[ContextSnapshot, bytes]:
+    """ContextManager 상태를 스냅샷으로 캡처 (동기, await 없음 → 일관된 시점)
+
+    Args:
+        manager: ContextManager
+        last_utterance_id: 런타임 마지막 발화 ID
+        last_processed_start_ms: 런타임 마지막 반영 start_ms
+
+    Returns:
+        (스냅샷 메타데이터, 임베딩 행렬 bytes)
+    """
+    index = manager._topic_embeddings
+    if index is not None and len(index):
+        embedding_ids = index.ids()
+        embedding_dimension = index.dimension
+        embeddings = np.ascontiguousarray(index.matrix, dtype=np.float32).tobytes()
+    else:
+        embedding_ids = []
+        embedding_dimension = 0
+        embeddings = b""
+
+    snapshot = ContextSnapshot(
+        meeting_id=manager.meeting_id,
+        mode=manager.mode,
+        current_topic=manager.current_topic,
+        l1_segments=[seg.model_copy(deep=True) for seg in manager.l1_segments],
+        pending_l1_chunks=[list(chunk) for chunk in manager._pending_l1_chunks],
+        last_summarized_utterance_id=manager._last_summarized_utterance_id,
+        l0_buffer=list(manager.l0_buffer),
+        l0_topic_buffer=list(manager.l0_topic_buffer),
+        last_utterance_id=last_utterance_id,
+        last_processed_start_ms=last_processed_start_ms,
+        embedding_ids=embedding_ids,
+        embedding_dimension=embedding_dimension,
+    )
+    return snapshot, embeddings
+
+
+def restore_snapshot(manager, snapshot: ContextSnapshot, embeddings: bytes) -> None:
+    """스냅샷을 새 ContextManager에 복원
+
+    대기 중이던 L1 청크는 다시 큐에 넣고 백그라운드 처리를 예약합니다.
+    """
+    manager.current_topic = snapshot.current_topic
+    manager.l1_segments = [seg.model_copy(deep=True) for seg in snapshot.l1_segments]
+    manager._last_summarized_utterance_id = snapshot.last_summarized_utterance_id
+
+    manager.l0_buffer.clear()
+    manager.l0_buffer.extend(snapshot.l0_buffer)
+    manager.l0_topic_buffer.clear()
+    manager.l0_topic_buffer.extend(snapshot.l0_topic_buffer)
+
+    # 화자 컨텍스트는 보존된 L0 발화로 재구성
+    seen_ids: set[int] = set()
+    for utterance in sorted(
+        [*snapshot.l0_topic_buffer, *snapshot.l0_buffer], key=lambda u: u.id
+    ):
+        if utterance.id in seen_ids:
+            continue
+        seen_ids.add(utterance.id)
+        manager.speaker_context.add_utterance(utterance)
+
+    index = manager._topic_embeddings
+    if index is not None and embeddings and snapshot.embedding_ids:
+        if snapshot.embedding_dimension != index.dimension:
+            logger.warning(
+                "Snapshot embedding dimension mismatch (%d != %d), skipping embeddings",
+                snapshot.embedding_dimension,
+                index.dimension,
+            )
+        else:
+            matrix = np.frombuffer(embeddings, dtype=np.float32).reshape(
+                len(snapshot.embedding_ids), snapshot.embedding_dimension
+            )
+            segment_ids = {seg.id for seg in manager.l1_segments}
+            for topic_id, row in zip(snapshot.embedding_ids, matrix):
+                if topic_id in segment_ids:
+                    index.upsert(topic_id, row)
+
+    if snapshot.pending_l1_chunks:
+        manager._pending_l1_chunks.extend(list(chunk) for chunk in snapshot.pending_l1_chunks)
+        manager._schedule_background_l1()
+
+
+class ContextSnapshotStore:
+    """Redis 기반 스냅샷 저장소"""
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(meeting_id: str) -> str:
+        return f"{SNAPSHOT_KEY_PREFIX}{meeting_id}"
+
+    async def save(self, snapshot: ContextSnapshot, embeddings: bytes) -> bool:
+        """스냅샷 저장 (실패 시 False)"""
+        try:
+            from app.core.redis import get_binary_redis
+
+            client = await get_binary_redis()
+            key = self._key(snapshot.meeting_id)
+            pipe = client.pipeline(transaction=True)
+            pipe.hset(
+                key,
+                mapping={
+                    "meta": snapshot.model_dump_json().encode("utf-8"),
+                    "embeddings": embeddings,
+                },
+            )
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+            logger.debug(
+                "Context snapshot saved: meeting_id=%s, topics=%d, last_start_ms=%s",
+                snapshot.meeting_id,
+                len(snapshot.l1_segments),
+                snapshot.last_processed_start_ms,
+            )
+            return True
+        except Exception as e:
+            logger.warning("Context snapshot save failed (non-fatal): %s", e)
+            return False
+
+    async def load(self, meeting_id: str) -> tuple[ContextSnapshot, bytes] | None:
+        """스냅샷 조회 (없거나 버전 불일치/손상 시 None)"""
+        try:
+            from app.core.redis import get_binary_redis
+
+            client = await get_binary_redis()
+            meta, embeddings = await client.hmget(self._key(meeting_id), ["meta", "embeddings"])
+        except Exception as e:
+            logger.warning("Context snapshot load failed (non-fatal): %s", e)
+            return None
+
+        if not meta:
+            return None
+
+        try:
+            snapshot = ContextSnapshot.model_validate_json(meta)
+        except Exception as e:
+            logger.warning("Invalid context snapshot ignored: meeting_id=%s, %s", meeting_id, e)
+            return None
+
+        if snapshot.version != SNAPSHOT_VERSION:
+            return None
+
+        return snapshot, embeddings or b""
+
+    async def delete(self, meeting_id: str) -> None:
+        """스냅샷 삭제"""
+        try:
+            from app.core.redis import get_binary_redis
+
+            client = await get_binary_redis()
+            await client.delete(self._key(meeting_id))
+        except Exception as e:
+            logger.warning("Context snapshot delete failed (non-fatal): %s", e)
+
+
+# 글로벌 저장소 인스턴스
+_snapshot_store: ContextSnapshotStore | None = None
+
+
+def get_snapshot_store() -> ContextSnapshotStore | None:
+    """글로벌 스냅샷 저장소 반환 (비활성화 시 None)"""
+    global _snapshot_store
+    settings = get_settings()
+    if not settings.context_snapshot_enabled:
+        return None
+    if _snapshot_store is None:
+        _snapshot_store = ContextSnapshotStore(ttl_seconds=settings.context_snapshot_ttl_seconds)
+    return _snapshot_store
@@ -0,0 +1,176 @@
+"""TopicEmbeddingIndex - 토픽 임베딩 행렬 인덱스
+
+토픽 임베딩을 연속된 float32 행렬에 L2 정규화된 상태로 보관합니다.
+- 쿼리 랭킹: 행렬-벡터 곱 1회
+- 병합 후보 탐색: 행렬-행렬 곱 1회 (Python 이중 루프 제거)
+"""
+
+import numpy as np
+
+
+class TopicEmbeddingIndex:
+    """토픽 ID → 행 인덱스 매핑을 가진 정규화 임베딩 행렬.
+
+    행 삭제 시 마지막 행을 빈 자리로 옮겨 행렬을 연속 상태로 유지합니다.
+
+    Example:
+        index = TopicEmbeddingIndex(dimension=1024)
+        index.upsert("topic-1", vec)
+        ranked = index.rank(query_vec, top_k=5, threshold=0.3)
+    """
+
+    _INITIAL_CAPACITY = 32
+
+    def __init__(self, dimension: int):
+        self._dimension = dimension
+        self._matrix = np.zeros((self._INITIAL_CAPACITY, dimension), dtype=np.float32)
+        self._row_of: dict[str, int] = {}
+        self._ids: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, topic_id: object) -> bool:
+        return topic_id in self._row_of
+
+    @property
+    def dimension(self) -> int:
+        """임베딩 차원"""
+        return self._dimension
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """사용 중인 행만 담은 정규화 행렬 뷰 (복사 없음)"""
+        return self._matrix[: len(self._ids)]
+
+    def ids(self) -> list[str]:
+        """행 순서대로 토픽 ID 반환"""
+        return list(self._ids)
+
+    def get(self, topic_id: str) -> np.ndarray | None:
+        """정규화된 임베딩 반환 (없으면 None)"""
+        row = self._row_of.get(topic_id)
+        if row is None:
+            return None
+        return self._matrix[row].copy()
+
+    def upsert(self, topic_id: str, embedding: np.ndarray | list[float]) -> bool:
+        """임베딩 추가/갱신.
+
+        Args:
+            topic_id: 토픽 세그먼트 ID
+            embedding: 원본 임베딩 벡터
+
+        Returns:
+            bool: 저장 여부 (영벡터/차원 불일치면 False)
+        """
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if vector.shape[0] != self._dimension:
+            return False
+
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return False
+
+        row = self._row_of.get(topic_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._row_of[topic_id] = row
+            self._ids.append(topic_id)
+
+        np.divide(vector, norm, out=self._matrix[row])
+        return True
+
+    def remove(self, topic_id: str) -> bool:
+        """임베딩 제거 (마지막 행을 빈 자리로 이동).
+
+        Returns:
+            bool: 제거 여부
+        """
+        row = self._row_of.pop(topic_id, None)
+        if row is None:
+            return False
+
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved_id
+            self._row_of[moved_id] = row
+
+        self._ids.pop()
+        self._matrix[last] = 0.0
+        return True
+
+    def clear(self) -> None:
+        """모든 임베딩 제거"""
+        self._row_of.clear()
+        self._ids.clear()
+        self._matrix[:] = 0.0
+
+    def rank(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int,
+        threshold: float,
+    ) -> list[tuple[str, float]]:
+        """쿼리와의 코사인 유사도 상위 Top-K 반환.
+
+        Args:
+            query_embedding: 쿼리 임베딩 (정규화 불필요)
+            top_k: 최대 반환 개수
+            threshold: 최소 유사도 임계값
+
+        Returns:
+            (topic_id, similarity) 리스트 (유사도 내림차순)
+        """
+        if not self._ids or top_k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        if query.shape[0] != self._dimension:
+            return []
+
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return []
+
+        scores = self.matrix @ (query / norm)
+        candidates = np.flatnonzero(scores >= threshold)
+        if candidates.size == 0:
+            return []
+
+        # 동점은 행 순서 유지 (stable sort)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")][:top_k]
+        return [(self._ids[row], float(scores[row])) for row in order]
+
+    def most_similar_pair(self) -> tuple[str, str, float] | None:
+        """가장 유사한 토픽 쌍 반환.
+
+        Returns:
+            (topic_id_a, topic_id_b, similarity) 또는 None (토픽 2개 미만)
+        """
+        count = len(self._ids)
+        if count < 2:
+            return None
+
+        matrix = self.matrix
+        similarities = matrix @ matrix.T
+        # 대각선 및 하삼각 제외 (자기 자신/중복 쌍)
+        similarities[np.tril_indices(count)] = -np.inf
+
+        flat_index = int(np.argmax(similarities))
+        row_a, row_b = divmod(flat_index, count)
+        return self._ids[row_a], self._ids[row_b], float(similarities[row_a, row_b])
+
+    def _ensure_capacity(self, required: int) -> None:
+        """행렬 용량 확보 (2배씩 증가)"""
+        capacity = self._matrix.shape[0]
+        if required <= capacity:
+            return
+
+        new_capacity = max(required, capacity * 2)
+        grown = np.zeros((new_capacity, self._dimension), dtype=np.float32)
+        grown[:capacity] = self._matrix
+        self._matrix = grown
@@ -0,0 +1,204 @@
+"""CLOVA Studio Reranker 풀링 클라이언트
+
+요청마다 httpx.AsyncClient를 새로 만들던 방식을 이벤트 루프 단위 공유 클라이언트로 대체합니다.
+- keep-alive 연결 풀 (요청마다 TLS 핸드셰이크 제거)
+- 문서가 많으면 배치로 나눠 병렬 전송 후 점수 병합
+- 동일 (query, 문서) 요청의 in-flight 병합
+- 최근 응답 시간 기록 (지연 기반 리랭커 선택 정책에서 사용)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+import weakref
+from collections import deque
+from typing import Any
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+CLOVA_RERANKER_ENDPOINT = "https://clovastudio.stream.ntruss.com/v1/api-tools/reranker"
+
+RERANKER_MAX_CONNECTIONS = 8
+RERANKER_MAX_KEEPALIVE = 4
+RERANKER_TIMEOUT = 10.0
+RERANKER_BATCH_SIZE = 20  # 요청당 문서 수
+LATENCY_WINDOW = 50  # 지연 통계에 사용할 최근 요청 수
+
+
+class ClovaRerankerClient:
+    """CLOVA Studio Reranker API 풀링 클라이언트.
+
+    Example:
+        client = get_reranker_client()
+        ranked = await client.rerank("예산 결정", [{"id": "0", "doc": "..."}])
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        batch_size: int = RERANKER_BATCH_SIZE,
+    ):
+        self._api_key = api_key if api_key is not None else get_settings().ncp_clovastudio_api_key
+        self._batch_size = batch_size
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def is_available(self) -> bool:
+        """API 키 설정 여부"""
+        return bool(self._api_key)
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """최근 요청 응답 시간 백분위 (초, 표본 없으면 None)"""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile))
+        return ordered[index]
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._latencies)
+
+    def record_latency(self, seconds: float) -> None:
+        """응답 시간 기록 (호출자가 시간 초과로 포기한 요청 포함)"""
+        self._latencies.append(seconds)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """keep-alive HTTP 클라이언트 (lazy 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(RERANKER_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=RERANKER_MAX_CONNECTIONS,
+                    max_keepalive_connections=RERANKER_MAX_KEEPALIVE,
+                ),
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """HTTP 연결 풀 종료"""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def rerank(
+        self, query: str, documents: list[dict[str, str]]
+    ) -> list[dict[str, Any]] | None:
+        """문서 재순위화 (배치 분할 + in-flight 병합).
+
+        Args:
+            query: 검색 쿼리
+            documents: [{"id": "...", "doc": "..."}] 형식의 문서 리스트
+
+        Returns:
+            [{"id": "...", "score": ...}] 리스트 또는 None (실패 시)
+        """
+        if not self._api_key:
+            logger.warning("NCP_CLOVASTUDIO_API_KEY not configured")
+            return None
+        if not documents:
+            return []
+
+        key = hashlib.sha256(
+            json.dumps([query, documents], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._rerank_batches(query, documents))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+        else:
+            logger.debug("Coalesced in-flight rerank request")
+
+        # 한 호출자의 취소(지연 예산 초과)가 공유 요청을 취소하지 않도록 shield
+        return await asyncio.shield(task)
+
+    async def _rerank_batches(
+        self, query: str, documents: list[dict[str, str]]
+    ) -> list[dict[str, Any]] | None:
+        start = time.perf_counter()
+        batches = [
+            documents[i:i + self._batch_size]
+            for i in range(0, len(documents), self._batch_size)
+        ]
+        outcomes = await asyncio.gather(
+            *(self._request(query, batch) for batch in batches)
+        )
+        self.record_latency(time.perf_counter() - start)
+
+        if all(outcome is None for outcome in outcomes):
+            return None
+        # 일부 배치만 실패하면 해당 문서는 점수 없이 (0점) 처리
+        return [item for outcome in outcomes if outcome for item in outcome]
+
+    async def _request(
+        self, query: str, documents: list[dict[str, str]]
+    ) -> list[dict[str, Any]] | None:
+        try:
+            response = await self._get_http_client().post(
+                CLOVA_RERANKER_ENDPOINT,
+                headers={"X-NCP-CLOVASTUDIO-REQUEST-ID": str(uuid.uuid4())},
+                json={"query": query, "documents": documents},
+            )
+            response.raise_for_status()
+            result = response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Clova Reranker API HTTP error: {e.response.status_code}")
+            return None
+        except Exception as e:
+            logger.error(f"Clova Reranker API error: {e}")
+            return None
+
+        # Clova Reranker는 result.rankedResults 형태로 반환
+        if "result" in result and "rankedResults" in result.get("result", {}):
+            return result["result"]["rankedResults"]
+        if "rankedResults" in result:
+            return result["rankedResults"]
+        if "data" in result:
+            return result["data"]
+        logger.warning(f"Unexpected Clova Reranker response format: {result}")
+        return None
+
+
+# 이벤트 루프별 공유 클라이언트 (httpx 연결은 루프에 종속)
+_reranker_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ClovaRerankerClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_reranker_client() -> ClovaRerankerClient:
+    """현재 이벤트 루프의 공유 리랭커 클라이언트 반환 (lazy 생성)"""
+    loop = asyncio.get_running_loop()
+    client = _reranker_clients.get(loop)
+    if client is None:
+        client = ClovaRerankerClient()
+        _reranker_clients[loop] = client
+    return client
+
+
+async def close_reranker_client() -> None:
+    """현재 이벤트 루프의 공유 리랭커 클라이언트 종료
+
+    애플리케이션 종료 시 호출.
+    """
+    loop = asyncio.get_running_loop()
+    client = _reranker_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+        logger.info("[Reranker] Client closed")
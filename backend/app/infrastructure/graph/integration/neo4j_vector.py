@@ -1,7 +1,293 @@
-"""Deprecated Neo4j vector utilities.
+"""Neo4j 벡터 인덱스 유틸리티 (KG 노드 임베딩)
 
-Vector index and embedding backfill utilities were removed with the
-vector_search parallelization logic.
+Decision / Agenda / Meeting 텍스트 임베딩을 노드 속성으로 저장하고
+Neo4j 네이티브 벡터 인덱스(HNSW, cosine)로 ANN 검색합니다.
+
+- 증분 upsert: KG 쓰기(create_minutes, update_decision_content, merge_decision) 후 백그라운드 실행
+- 원문 해시(embedding_hash)가 같으면 재임베딩 생략 → 백필 재실행/재개 비용 최소화
+- 임베딩은 TopicEmbedder(CLOVA bge-m3 + EmbeddingCache)로 생성
 """
 
-__all__: list[str] = []
+import asyncio
+import hashlib
+import logging
+from typing import Any
+
+import numpy as np
+
+from app.core.config import get_settings
+from app.infrastructure.cache.embedding_cache import normalize_text
+from app.infrastructure.context.embedding import EMBEDDING_DIMENSION, TopicEmbedder
+from neo4j import READ_ACCESS, AsyncDriver
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_PROPERTY = "embedding"
+EMBEDDING_HASH_PROPERTY = "embedding_hash"
+
+# 라벨 → 벡터 인덱스 이름
+VECTOR_INDEXES: dict[str, str] = {
+    "Decision": "decision_embedding",
+    "Agenda": "agenda_embedding",
+    "Meeting": "meeting_embedding",
+}
+
+# 라벨 → 임베딩 원문 필드 (순서대로 이어붙임)
+EMBEDDING_TEXT_FIELDS: dict[str, tuple[str, ...]] = {
+    "Decision": ("content", "context"),
+    "Agenda": ("topic", "description"),
+    "Meeting": ("title", "summary"),
+}
+
+# fire-and-forget 태스크 참조 유지 (GC 방지)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def build_embedding_text(label: str, properties: dict[str, Any]) -> str:
+    """노드 속성에서 임베딩 원문 생성 (비어있는 필드 제외)"""
+    parts = [
+        str(properties.get(field) or "").strip()
+        for field in EMBEDDING_TEXT_FIELDS[label]
+    ]
+    return "\n".join(part for part in parts if part)
+
+
+def embedding_text_hash(text: str) -> str:
+    """임베딩 원문 해시 (정규화 후 SHA-256 앞 16자)"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()[:16]
+
+
+async def ensure_vector_indexes(
+    driver: AsyncDriver,
+    dimension: int = EMBEDDING_DIMENSION,
+) -> None:
+    """벡터 인덱스 생성 (이미 있으면 무시)"""
+    async with driver.session() as session:
+        for label, index_name in VECTOR_INDEXES.items():
+            await session.run(
+                f"""
+                CREATE VECTOR INDEX {index_name} IF NOT EXISTS
+                FOR (n:{label}) ON n.{EMBEDDING_PROPERTY}
+                OPTIONS {{indexConfig: {{
+                    `vector.dimensions`: {int(dimension)},
+                    `vector.similarity_function`: 'cosine'
+                }}}}
+                """
+            )
+    logger.info("Vector indexes ensured: %s", ", ".join(VECTOR_INDEXES.values()))
+
+
+async def upsert_node_embeddings(
+    driver: AsyncDriver,
+    label: str,
+    node_ids: list[str],
+    embedder: TopicEmbedder | None = None,
+    force: bool = False,
+) -> int:
+    """노드 임베딩 upsert
+
+    Args:
+        driver: Neo4j 드라이버
+        label: Decision / Agenda / Meeting
+        node_ids: 대상 노드 ID 목록
+        embedder: 임베딩 생성기 (기본: TopicEmbedder)
+        force: 원문 해시가 같아도 재임베딩
+
+    Returns:
+        갱신된 노드 수
+    """
+    if label not in VECTOR_INDEXES:
+        raise ValueError(f"Unsupported label for vector index: {label}")
+    if not node_ids:
+        return 0
+
+    embedder = embedder or TopicEmbedder()
+    if not embedder.is_available:
+        logger.debug("Embedding API unavailable, skip vector upsert")
+        return 0
+
+    fields = EMBEDDING_TEXT_FIELDS[label]
+    projection = ", ".join(f"n.{field} AS {field}" for field in fields)
+    async with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = await session.run(
+            f"""
+            MATCH (n:{label}) WHERE n.id IN $ids
+            RETURN n.id AS id, {projection}, n.{EMBEDDING_HASH_PROPERTY} AS hash
+            """,
+            {"ids": node_ids},
+        )
+        records = [dict(record) async for record in result]
+
+    pending: list[tuple[str, str, str]] = []
+    for record in records:
+        text = build_embedding_text(label, record)
+        if not text:
+            continue
+        text_hash = embedding_text_hash(text)
+        if not force and record.get("hash") == text_hash:
+            continue
+        pending.append((record["id"], text, text_hash))
+
+    if not pending:
+        return 0
+
+    vectors = await embedder.embed_batch_async([text for _, text, _ in pending])
+    rows = [
+        {"id": node_id, "embedding": vector.tolist(), "hash": text_hash}
+        for (node_id, _, text_hash), vector in zip(pending, vectors)
+        # 임베딩 실패(영벡터)는 건너뛰어 다음 실행에서 재시도
+        if np.any(vector)
+    ]
+    if not rows:
+        return 0
+
+    async def _write_tx(tx):
+        await tx.run(
+            f"""
+            UNWIND $rows AS row
+            MATCH (n:{label} {{id: row.id}})
+            CALL db.create.setNodeVectorProperty(n, '{EMBEDDING_PROPERTY}', row.embedding)
+            SET n.{EMBEDDING_HASH_PROPERTY} = row.hash
+            """,
+            {"rows": rows},
+        )
+
+    async with driver.session() as session:
+        await session.execute_write(_write_tx)
+
+    logger.info("Vector upsert: label=%s, updated=%d/%d", label, len(rows), len(node_ids))
+    return len(rows)
+
+
+async def upsert_meeting_embeddings(
+    driver: AsyncDriver,
+    meeting_id: str,
+    embedder: TopicEmbedder | None = None,
+) -> int:
+    """회의 + 하위 Agenda/Decision 임베딩 upsert (회의록 생성 직후)"""
+    async with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = await session.run(
+            """
+            MATCH (m:Meeting {id: $meeting_id})
+            OPTIONAL MATCH (m)-[:CONTAINS]->(a:Agenda)
+            OPTIONAL MATCH (a)-[:HAS_DECISION]->(d:Decision)
+            RETURN collect(DISTINCT a.id) AS agenda_ids,
+                   collect(DISTINCT d.id) AS decision_ids
+            """,
+            {"meeting_id": meeting_id},
+        )
+        record = await result.single()
+
+    if record is None:
+        return 0
+
+    embedder = embedder or TopicEmbedder()
+    updated = await upsert_node_embeddings(driver, "Meeting", [meeting_id], embedder)
+    updated += await upsert_node_embeddings(driver, "Agenda", record["agenda_ids"], embedder)
+    updated += await upsert_node_embeddings(driver, "Decision", record["decision_ids"], embedder)
+    return updated
+
+
+async def fetch_node_id_page(
+    driver: AsyncDriver,
+    label: str,
+    after_id: str | None,
+    limit: int,
+) -> list[str]:
+    """id 오름차순 페이지 조회 (백필 커서용)"""
+    if label not in VECTOR_INDEXES:
+        raise ValueError(f"Unsupported label for vector index: {label}")
+
+    async with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = await session.run(
+            f"""
+            MATCH (n:{label})
+            WHERE $after_id IS NULL OR n.id > $after_id
+            RETURN n.id AS id
+            ORDER BY n.id ASC
+            LIMIT $limit
+            """,
+            {"after_id": after_id, "limit": limit},
+        )
+        return [record["id"] async for record in result]
+
+
+async def query_vector_index(
+    driver: AsyncDriver,
+    label: str,
+    embedding: list[float],
+    top_k: int,
+    projection: str,
+    parameters: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """벡터 인덱스 ANN 검색
+
+    Args:
+        driver: Neo4j 드라이버
+        label: Decision / Agenda / Meeting
+        embedding: 질의 임베딩
+        top_k: 후보 수
+        projection: `YIELD node, score` 이후 이어붙일 Cypher (MATCH/RETURN)
+        parameters: projection에서 사용할 추가 파라미터
+
+    Returns:
+        projection RETURN 결과
+    """
+    cypher = (
+        f"CALL db.index.vector.queryNodes('{VECTOR_INDEXES[label]}', $top_k, $embedding)\n"
+        "YIELD node, score\n"
+        f"{projection}"
+    )
+    params = {**(parameters or {}), "top_k": top_k, "embedding": embedding}
+    async with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = await session.run(cypher, params)
+        return await result.data()
+
+
+def _schedule(coro, description: str) -> None:
+    """백그라운드 실행 (실패해도 KG 쓰기에는 영향 없음)"""
+
+    async def _runner():
+        try:
+            await coro
+        except Exception as e:
+            logger.warning("Vector upsert failed (%s): %s", description, e)
+
+    try:
+        task = asyncio.get_running_loop().create_task(_runner())
+    except RuntimeError:
+        coro.close()
+        return
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def schedule_node_embeddings(driver: AsyncDriver, label: str, node_ids: list[str]) -> None:
+    """노드 임베딩 upsert 예약 (kg_vector_index_enabled일 때만)"""
+    if not get_settings().kg_vector_index_enabled or not node_ids:
+        return
+    _schedule(upsert_node_embeddings(driver, label, node_ids), f"{label}:{len(node_ids)}")
+
+
+def schedule_meeting_embeddings(driver: AsyncDriver, meeting_id: str) -> None:
+    """회의 임베딩 upsert 예약 (kg_vector_index_enabled일 때만)"""
+    if not get_settings().kg_vector_index_enabled:
+        return
+    _schedule(upsert_meeting_embeddings(driver, meeting_id), f"Meeting:{meeting_id}")
+
+
+__all__ = [
+    "EMBEDDING_HASH_PROPERTY",
+    "EMBEDDING_PROPERTY",
+    "EMBEDDING_TEXT_FIELDS",
+    "VECTOR_INDEXES",
+    "build_embedding_text",
+    "embedding_text_hash",
+    "ensure_vector_indexes",
+    "fetch_node_id_page",
+    "query_vector_index",
+    "schedule_meeting_embeddings",
+    "schedule_node_embeddings",
+    "upsert_meeting_embeddings",
+    "upsert_node_embeddings",
+]
@@ -0,0 +1,117 @@
+"""Orchestration 의미론적 답변 캐시 헬퍼 (Spotlight/Voice 공용)
+
+흐름:
+    answer_cache 노드: 질의 임베딩 + 현재 KG 버전으로 캐시 조회
+        - 히트: generator가 LLM 호출 없이 캐시 답변 반환
+        - 미스: 기존 경로(simple_router → planner → ...)로 진행
+    generator: MIT Search 결과에 근거한 답변만 조회 시점의 KG 버전과 함께 저장
+
+이전 대화 턴이 있는 후속 질문은 조회/저장하지 않습니다 (cacheable_query).
+KG 버전은 조회 시점에 확정해 상태(answer_cache_versions)에 보관합니다.
+답변 생성 중에 발생한 KG 쓰기는 버전 불일치로 다음 조회에서 무효화됩니다.
+"""
+
+import logging
+from typing import Any, Optional
+
+from langchain_core.messages import BaseMessage
+
+from app.core.config import get_settings
+from app.infrastructure.cache.kg_version import get_meeting_versions, get_team_versions
+from app.infrastructure.cache.search_result_cache import get_user_team_ids
+from app.infrastructure.cache.semantic_cache import get_semantic_cache
+from app.infrastructure.context.embedding import TopicEmbedder
+
+logger = logging.getLogger(__name__)
+
+
+def cacheable_query(messages: list[BaseMessage]) -> str:
+    """답변 캐시 키로 쓸 최근 사용자 메시지 (이전 대화 턴이 있으면 빈 문자열)
+
+    "그럼 그건 언제 결정됐어?" 같은 후속 질문은 앞선 대화에 따라 답이 달라지므로,
+    최근 메시지만으로 조회/저장하면 다른 대화의 답변이 재생될 수 있습니다.
+    스레드의 첫 질문만 캐시합니다.
+    """
+    for idx in range(len(messages) - 1, -1, -1):
+        msg = messages[idx]
+        if getattr(msg, "type", None) != "human":
+            continue
+        if any(getattr(prior, "type", None) in ("human", "ai") for prior in messages[:idx]):
+            return ""
+        return msg.content if isinstance(msg.content, str) else str(msg.content)
+    return ""
+
+
+async def resolve_kg_versions(user_id: str, meeting_id: Optional[str] = None) -> dict[str, int]:
+    """사용자 소속 팀 (+ 회의) KG 버전 스냅샷"""
+    team_versions = await get_team_versions(await get_user_team_ids(user_id))
+    versions = {f"team:{team_id}": version for team_id, version in team_versions.items()}
+    if meeting_id:
+        meeting_versions = await get_meeting_versions([meeting_id])
+        versions.update({f"meeting:{mid}": version for mid, version in meeting_versions.items()})
+    return versions
+
+
+async def _embed(query: str):
+    embedder = TopicEmbedder()
+    if not embedder.is_available:
+        return None
+    # 같은 질의로 MIT Search 벡터 검색이 이어지면 임베딩 캐시에서 재사용됨
+    return await embedder.embed_text_async(query)
+
+
+async def lookup_cached_answer(
+    query: str,
+    scope: str,
+    user_id: str,
+    meeting_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """answer_cache 노드용 상태 업데이트 반환
+
+    Returns:
+        {"cached_answer": str | None, "answer_cache_grounded": False,
+         "answer_cache_versions": dict | None}
+    """
+    update: dict[str, Any] = {
+        "cached_answer": None,
+        "answer_cache_grounded": False,
+        "answer_cache_versions": None,
+    }
+    if not get_settings().semantic_cache_enabled or not query:
+        return update
+
+    try:
+        versions = await resolve_kg_versions(user_id, meeting_id)
+        embedding = await _embed(query)
+    except Exception as e:
+        logger.warning(f"[Answer Cache] 조회 준비 실패: {e}")
+        return update
+
+    if embedding is None:
+        return update
+
+    update["answer_cache_versions"] = versions
+    hit = await get_semantic_cache().get_cached_answer(query, embedding, scope, versions)
+    if hit is not None:
+        update["cached_answer"] = hit["answer"]
+    return update
+
+
+async def store_cached_answer(
+    query: str,
+    answer: str,
+    scope: str,
+    versions: Optional[dict[str, int]],
+) -> None:
+    """MIT Search 근거 답변 저장 (조회 단계에서 버전을 확정한 경우만)"""
+    if not get_settings().semantic_cache_enabled or versions is None or not query or not answer:
+        return
+
+    try:
+        embedding = await _embed(query)
+    except Exception as e:
+        logger.warning(f"[Answer Cache] 임베딩 실패: {e}")
+        return
+
+    if embedding is not None:
+        await get_semantic_cache().cache_answer(query, answer, embedding, scope, versions)
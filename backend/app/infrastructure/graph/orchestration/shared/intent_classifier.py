@@ -0,0 +1,208 @@
+"""로컬 의도 분류기 (Simple Router 앞단, CPU 전용)
+
+자주 들어오는 질의 형태(인사/맞장구, 사용법 안내, 단순 MIT 검색)는 Clova Router와
+Planner LLM을 거치지 않고 바로 generator 또는 MIT 검색으로 보냅니다.
+
+모델:
+    1. 키워드 규칙: 정규화된 질의가 짧은 인사/맞장구 표현과 일치하면 즉시 판정
+    2. 문자 n-gram 1-NN: 라벨별 예시 중 코사인 유사도가 가장 높은 예시의 라벨
+       (1위 라벨 점수 - 2위 라벨 점수 차이가 작으면 확신 없음으로 처리)
+
+예시는 기본 시드 + (설정 시) Langfuse 트레이스에서 내보낸 JSONL
+({"query": "...", "label": "..."} 한 줄씩)을 합쳐 학습합니다.
+"""
+
+import json
+import logging
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
+
+from .simple_router import SimpleRouterOutput
+
+logger = logging.getLogger(__name__)
+
+# 라벨
+LABEL_SIMPLE_TALK = "simple_talk"  # 인사/감사/맞장구 → generator
+LABEL_GUIDE = "guide"  # 사용법 안내 → generator (guide 프롬프트)
+LABEL_MIT_SEARCH = "mit_search"  # 회의 기록 검색 → mit_tools_analyze
+LABEL_PLANNING = "planning_needed"  # 그 외 → 기존 경로 (Clova Router + Planner)
+
+# 로컬에서 바로 라우팅하는 라벨 (planning_needed는 항상 기존 경로)
+DIRECT_LABELS = {LABEL_SIMPLE_TALK, LABEL_GUIDE, LABEL_MIT_SEARCH}
+
+MIN_MARGIN = 0.1  # 1위/2위 라벨 점수 차이 하한
+
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣ㄱ-ㅎ\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+# 정규화 후 정확히 일치하면 simple_talk
+SIMPLE_TALK_PHRASES = {
+    "안녕", "안녕하세요", "하이", "hi", "hello", "고마워", "고마워요", "감사해요",
+    "감사합니다", "땡큐", "응", "네", "넵", "예", "알겠어", "알겠습니다", "ㅇㅋ",
+    "오케이", "ok", "okay", "좋아", "좋아요", "그래", "수고했어", "수고하셨습니다",
+}
+
+SEED_EXAMPLES: dict[str, list[str]] = {
+    LABEL_SIMPLE_TALK: [
+        "안녕 반가워", "좋은 아침이야", "고마워 도움이 됐어", "알겠어 고마워",
+        "오늘 회의 수고했어", "잘 부탁해", "좋아 그렇게 하자", "응 알겠어",
+        "넌 누구야", "잘 지냈어",
+    ],
+    LABEL_GUIDE: [
+        "어떻게 사용해", "사용법 알려줘", "뭘 할 수 있어", "무슨 기능이 있어",
+        "어떤 질문을 할 수 있어", "너 뭐 할 줄 알아", "도움말 보여줘",
+        "이거 어떻게 쓰는 거야", "기능 설명해줘",
+    ],
+    LABEL_MIT_SEARCH: [
+        "지난 회의에서 결정된 거 뭐야", "예산 관련 결정사항 알려줘",
+        "출시 일정 어떻게 결정됐어", "액션 아이템 누가 담당해",
+        "내 액션 아이템 뭐 있어", "지난주 회의에서 뭐 논의했어",
+        "마케팅 예산 결정 찾아줘", "디자인 리뷰 결과 알려줘",
+        "담당자가 누구야", "이 안건 전에 논의된 적 있어",
+        "최근 결정사항 요약해줘", "그 건 마감일이 언제야",
+    ],
+    LABEL_PLANNING: [
+        "내일 오후 3시에 회의 만들어줘", "회의 일정 수정해줘", "회의 삭제해줘",
+        "우리 팀원 목록 보여줘", "팀 회의 목록 알려줘", "오늘 회의 몇 개 있어",
+        "이 회의 참석자 누구야", "회의록 정리해서 공유해줘",
+        "이번 주 일정 알려줘", "새 팀 만들어줘",
+    ],
+}
+
+
+def normalize_text(text: str) -> str:
+    """소문자 + 구두점 제거 + 공백 정리"""
+    return _SPACE_RE.sub(" ", _NON_WORD_RE.sub(" ", text.lower())).strip()
+
+
+def _features(text: str) -> Counter:
+    """어절 + 문자 2/3-gram 특징 (어절 경계는 공백 문자로 포함)"""
+    normalized = normalize_text(text)
+    features: Counter = Counter(f"w:{word}" for word in normalized.split())
+    padded = f" {normalized} "
+    for n in (2, 3):
+        features.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return features
+
+
+def _norm(vector: Counter) -> float:
+    return math.sqrt(sum(value * value for value in vector.values()))
+
+
+class LocalIntentClassifier:
+    """키워드 규칙 + 문자 n-gram 1-NN 의도 분류기
+
+    Example:
+        classifier = get_intent_classifier()
+        label, confidence = classifier.predict("지난 회의 결정사항 알려줘")
+    """
+
+    def __init__(self, examples: Optional[dict[str, list[str]]] = None):
+        self._examples: list[tuple[str, Counter, float]] = []
+        self.train(examples or SEED_EXAMPLES)
+
+    def train(self, examples: dict[str, list[str]]) -> None:
+        """예시 추가 학습 (기존 예시 유지)"""
+        for label, queries in examples.items():
+            for query in queries:
+                features = _features(query)
+                norm = _norm(features)
+                if norm > 0:
+                    self._examples.append((label, features, norm))
+
+    def __len__(self) -> int:
+        return len(self._examples)
+
+    def predict(self, query: str) -> tuple[str, float]:
+        """(라벨, 신뢰도 0~1) 반환"""
+        normalized = normalize_text(query)
+        if normalized in SIMPLE_TALK_PHRASES:
+            return LABEL_SIMPLE_TALK, 1.0
+
+        features = _features(query)
+        norm = _norm(features)
+        if norm == 0 or not self._examples:
+            return LABEL_PLANNING, 0.0
+
+        best: dict[str, float] = {}
+        for label, example, example_norm in self._examples:
+            dot = sum(count * example.get(feature, 0) for feature, count in features.items())
+            similarity = dot / (norm * example_norm)
+            if similarity > best.get(label, 0.0):
+                best[label] = similarity
+
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        if not ranked:
+            return LABEL_PLANNING, 0.0
+        label, score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if score - runner_up < MIN_MARGIN:
+            return label, min(score, runner_up)
+        return label, score
+
+
+def load_examples(path: str) -> dict[str, list[str]]:
+    """JSONL 예시 로드 ({"query": ..., "label": ...} 한 줄씩, 잘못된 줄은 무시)"""
+    examples: dict[str, list[str]] = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(row, dict) and row.get("query") and row.get("label"):
+            examples.setdefault(row["label"], []).append(row["query"])
+    return examples
+
+
+def classify_locally(query: str) -> Optional[SimpleRouterOutput]:
+    """로컬 분류 결과를 Simple Router 출력으로 변환 (확신이 없으면 None → Clova Router)"""
+    settings = get_settings()
+    label, confidence = get_intent_classifier().predict(query)
+    if label not in DIRECT_LABELS or confidence < settings.local_intent_confidence_threshold:
+        return None
+
+    from app.infrastructure.graph.integration.router_mapper import RouterResponseMapper
+
+    # 회의 생성/수정 등 mutation 의도는 Planner가 도구를 골라야 함
+    if RouterResponseMapper._has_mutation_intent(query):
+        return None
+
+    return SimpleRouterOutput(
+        is_simple_query=label != LABEL_MIT_SEARCH,
+        category=label,
+        simple_response=None,
+        confidence=confidence,
+        reasoning=f"로컬 분류기 판정: {label} ({confidence:.2f})",
+    )
+
+
+def record_route_source(source: str, category: str) -> None:
+    """Simple Router 판정 경로 기록 (source: local/clova)"""
+    metrics = get_mit_metrics()
+    if metrics:
+        metrics.orchestration_route_source_total.add(1, {"source": source, "category": category})
+
+
+_intent_classifier: Optional[LocalIntentClassifier] = None
+
+
+def get_intent_classifier() -> LocalIntentClassifier:
+    """프로세스 전역 분류기 반환 (최초 호출 시 시드 + 트레이스 예시로 학습)"""
+    global _intent_classifier
+    if _intent_classifier is None:
+        classifier = LocalIntentClassifier()
+        path = get_settings().intent_classifier_examples_path
+        if path:
+            try:
+                classifier.train(load_examples(path))
+            except OSError as e:
+                logger.warning(f"[Intent Classifier] 예시 파일 로드 실패: {e}")
+        logger.info(f"[Intent Classifier] 학습 완료 (예시 {len(classifier)}개)")
+        _intent_classifier = classifier
+    return _intent_classifier
@@ -0,0 +1,131 @@
+"""Planner 결과 LRU 캐시 (정규화 질의 + 회의/사용자 컨텍스트 → 계획)
+
+같은 회의에서 같은 질문이 반복되면 Planner LLM 호출 없이 이전 도구 선택/인자를
+재사용합니다. 도구 인자에 상대 날짜가 해석되어 들어가므로 키에 날짜(KST)를 포함하고,
+이전 대화나 도구 결과에 의존하는 계획(첫 단계가 아닌 계획, 지시어 질의)은 캐시하지 않습니다.
+"""
+
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from langchain_core.messages import AIMessage
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
+
+from .intent_classifier import normalize_text
+from .planning_utils import is_subquery
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9))
+
+# 이전 턴을 가리키는 표현 (같은 문장이라도 대화마다 다른 계획이 필요)
+_REFERENTIAL_MARKERS = ("그거", "그건", "그게", "그 ", "아까", "방금", "이전", "위에", "거기")
+
+
+def plan_cache_key(query: str, context_key: str) -> tuple[str, str, str]:
+    """(정규화 질의, 회의/사용자 컨텍스트, 날짜) 키"""
+    today = datetime.now(KST).date().isoformat()
+    return normalize_text(query), context_key, today
+
+
+def is_first_planning_step(messages: list) -> bool:
+    """이번 턴의 첫 계획 단계인지 (마지막 메시지가 사용자 질문)"""
+    return bool(messages) and getattr(messages[-1], "type", None) == "human"
+
+
+def is_cacheable_query(query: str) -> bool:
+    """대화 맥락 없이 해석 가능한 질의인지"""
+    if not query or is_subquery(query):
+        return False
+    return not any(marker in query for marker in _REFERENTIAL_MARKERS)
+
+
+class PlanCache:
+    """TTL이 있는 LRU 계획 캐시
+
+    값: {"plan", "selected_tool", "tool_args", "tool_category"}
+    (selected_tool이 None이면 도구 없이 직접 응답하는 계획)
+    """
+
+    def __init__(self, max_plans: int = 512, ttl_seconds: int = 600):
+        self.max_plans = max_plans
+        self.ttl_seconds = ttl_seconds
+        self._plans: OrderedDict[tuple, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self, key: tuple) -> Optional[dict[str, Any]]:
+        entry = self._plans.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                del self._plans[key]
+            self._record("miss")
+            return None
+        self._plans.move_to_end(key)
+        self._record("hit")
+        return dict(entry[1])
+
+    def put(self, key: tuple, plan: dict[str, Any]) -> None:
+        self._plans[key] = (time.monotonic(), dict(plan))
+        self._plans.move_to_end(key)
+        while len(self._plans) > self.max_plans:
+            self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        self._plans.clear()
+
+    def _record(self, result: str) -> None:
+        if result == "hit":
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        metrics = get_mit_metrics()
+        if metrics:
+            metrics.plan_cache_requests_total.add(1, {"result": result})
+
+
+def build_cached_plan_message(plan: dict[str, Any]) -> Optional[AIMessage]:
+    """캐시된 도구 선택을 planner AIMessage(tool_calls) 형태로 재구성
+
+    tools 노드가 마지막 AIMessage의 tool_call_id로 ToolMessage를 만들기 때문에
+    도구 계획이면 새 id로 tool_call을 만들어 메시지 이력을 맞춥니다.
+    """
+    if not plan.get("selected_tool"):
+        return None
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {
+                "name": plan["selected_tool"],
+                "args": plan.get("tool_args") or {},
+                "id": f"call_{uuid.uuid4().hex[:24]}",
+            }
+        ],
+    )
+
+
+_plan_cache: Optional[PlanCache] = None
+
+
+def get_plan_cache() -> Optional[PlanCache]:
+    """프로세스 전역 계획 캐시 반환 (비활성화 시 None)"""
+    global _plan_cache
+    settings = get_settings()
+    if not settings.plan_cache_enabled:
+        return None
+    if _plan_cache is None:
+        _plan_cache = PlanCache(
+            max_plans=settings.plan_cache_size,
+            ttl_seconds=settings.plan_cache_ttl_seconds,
+        )
+    return _plan_cache
@@ -13,7 +13,9 @@ from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from app.infrastructure.graph.checkpointer import get_checkpointer
+from app.infrastructure.graph.orchestration.shared.intent_classifier import LABEL_MIT_SEARCH
 
+from .nodes.answer_cache import check_answer_cache
 from .nodes.answering import generate_answer
 from .nodes.mit_tools_analyze import execute_mit_tools_analyze
 from .nodes.mit_tools_search import execute_mit_tools_search
@@ -24,11 +26,22 @@ from .state import SpotlightOrchestrationState
 
 logger = logging.getLogger(__name__)
 
-# Simple Router 후 라우팅: 간단한 쿼리면 generator로, 복잡하면 planner로
+# 답변 캐시 조회 후 라우팅: 히트면 generator로, 미스면 simple_router로
+def route_after_answer_cache(state: SpotlightOrchestrationState) -> str:
+    """캐시 히트 여부에 따라 라우팅"""
+    if state.get("cached_answer"):
+        return "generator"
+    return "simple_router"
+
+
+# Simple Router 후 라우팅: 간단한 쿼리면 generator로, 단순 검색이면 MIT 검색으로, 복잡하면 planner로
 def route_after_simple_check(state: SpotlightOrchestrationState) -> str:
     """간단한 쿼리 여부에 따라 라우팅"""
     if state.get("is_simple_query", False):
         return "generator"  # 간단한 쿼리면 직접 응답 생성
+    simple_router_output = state.get("simple_router_output") or {}
+    if simple_router_output.get("category") == LABEL_MIT_SEARCH:
+        return "mit_tools_analyze"  # 로컬 분류기가 판정한 단순 검색
     return "planner"  # 복잡한 쿼리면 계획 수립
 
 
@@ -72,6 +85,8 @@ def build_spotlight_orchestration_workflow() -> StateGraph:
         StateGraph: 컴파일 전 워크플로우 그래프
 
     Workflow:
+        answer_cache -> [generator (캐시 히트) | simple_router]
+        simple_router -> [generator | mit_tools_analyze | planner]
         planner -> [tools | mit_tools_analyze | generator]
         tools -> [planner | generator | END] (cancel 여부에 따라 분기)
         mit_tools_analyze -> mit_tools_search -> planner
@@ -81,6 +96,7 @@ def build_spotlight_orchestration_workflow() -> StateGraph:
     workflow = StateGraph(SpotlightOrchestrationState)
 
     # 노드 등록
+    workflow.add_node("answer_cache", check_answer_cache)
     workflow.add_node("simple_router", route_simple_query)  # 새로운 라우터 노드
     workflow.add_node("planner", create_plan)
     workflow.add_node("mit_tools_analyze", execute_mit_tools_analyze)
@@ -89,13 +105,24 @@ def build_spotlight_orchestration_workflow() -> StateGraph:
     workflow.add_node("generator", generate_answer)
 
     # 엣지 연결
-    workflow.set_entry_point("simple_router")  # Simple Router로 시작
+    workflow.set_entry_point("answer_cache")  # 답변 캐시 조회로 시작
+
+    # Answer Cache -> 조건부 라우팅
+    workflow.add_conditional_edges(
+        "answer_cache",
+        route_after_answer_cache,
+        {"generator": "generator", "simple_router": "simple_router"},
+    )
 
     # Simple Router -> 조건부 라우팅
     workflow.add_conditional_edges(
         "simple_router",
         route_after_simple_check,
-        {"generator": "generator", "planner": "planner"},
+        {
+            "generator": "generator",
+            "mit_tools_analyze": "mit_tools_analyze",
+            "planner": "planner",
+        },
     )
 
     # Planning -> 도구 필요 여부에 따라 라우팅
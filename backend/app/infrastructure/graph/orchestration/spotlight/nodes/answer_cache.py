@@ -0,0 +1,34 @@
+import logging
+
+from app.infrastructure.graph.orchestration.shared.answer_cache import (
+    cacheable_query,
+    lookup_cached_answer,
+)
+
+from ..state import SpotlightOrchestrationState
+
+logger = logging.getLogger(__name__)
+
+
+async def check_answer_cache(state: SpotlightOrchestrationState) -> SpotlightOrchestrationState:
+    """의미론적 답변 캐시 조회 노드 (Simple Router 이전)
+
+    같은 사용자가 이전과 의미가 같은 질문을 하면
+    KG가 바뀌지 않은 한 이전 답변을 재사용합니다.
+
+    Contract:
+        reads: messages, user_id
+        writes: cached_answer, answer_cache_grounded, answer_cache_versions
+        side-effects: Embedding API 호출 (캐시 미스 시), Redis 조회
+    """
+    user_id = state.get("user_id", "")
+    query = cacheable_query(state.get("messages", []))
+
+    update = await lookup_cached_answer(
+        query,
+        scope=f"spotlight:{user_id}",
+        user_id=user_id,
+    )
+    if update["cached_answer"] is not None:
+        logger.info("Spotlight 답변 캐시 히트 → generator")
+    return SpotlightOrchestrationState(**update)
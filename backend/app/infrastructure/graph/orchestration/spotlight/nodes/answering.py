@@ -3,6 +3,10 @@ import logging
 from langchain_core.messages import AIMessage
 
 from app.infrastructure.graph.integration.llm import get_answer_generator_llm
+from app.infrastructure.graph.orchestration.shared.answer_cache import (
+    cacheable_query,
+    store_cached_answer,
+)
 from app.infrastructure.graph.orchestration.shared.message_utils import (
     build_generator_chat_messages,
 )
@@ -22,12 +26,19 @@ async def generate_answer(state: SpotlightOrchestrationState):
 
         Contract:
         reads: messages, tool_results, tool_execution_status,
-               additional_context, planning_context, simple_router_output
+               additional_context, planning_context, simple_router_output,
+               cached_answer, answer_cache_grounded, answer_cache_versions
         writes: response
-        side-effects: LLM API 호출, stdout 출력 (스트리밍)
+        side-effects: LLM API 호출, stdout 출력 (스트리밍), MIT Search 근거 답변 캐시 저장
     """
     logger.info("최종 응답 생성 단계 진입")
 
+    # 답변 캐시 히트 시 LLM 호출 없이 직접 반환
+    cached_answer = state.get("cached_answer")
+    if cached_answer:
+        logger.info(f"캐시 답변 반환 (길이: {len(cached_answer)}자)")
+        return SpotlightOrchestrationState(response=cached_answer, messages=[AIMessage(content=cached_answer)])
+
     # Cancel 시 LLM 호출 없이 직접 반환
     if state.get("tool_execution_status") == "cancelled":
         cancel_msg = state.get("tool_results", "").strip() or "작업이 취소되었습니다."
@@ -113,4 +124,13 @@ async def generate_answer(state: SpotlightOrchestrationState):
     response_text = "".join(response_chunks)
     logger.info(f"응답 생성 완료 (길이: {len(response_text)}자)")
 
+    # MIT Search 결과에 근거한 답변만 캐시 (간단한 쿼리/잡담 제외)
+    if state.get("answer_cache_grounded") and not state.get("is_simple_query"):
+        await store_cached_answer(
+            cacheable_query(messages),
+            response_text,
+            scope=f"spotlight:{state.get('user_id', '')}",
+            versions=state.get("answer_cache_versions"),
+        )
+
     return SpotlightOrchestrationState(response=response_text, messages=[AIMessage(content=response_text)])
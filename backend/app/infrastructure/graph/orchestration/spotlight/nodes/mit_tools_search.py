@@ -15,7 +15,7 @@ async def execute_mit_tools_search(state: SpotlightOrchestrationState, config: R
 
     Contract:
         reads: messages, user_id, mit_search_query_intent, retry_count
-        writes: tool_results
+        writes: tool_results, answer_cache_grounded
         side-effects: MIT Search 서브그래프 실행 (cypher_generator + tool_executor)
         failures: TOOL_EXECUTION_FAILED -> 빈 결과 반환
 
@@ -79,7 +79,7 @@ async def execute_mit_tools_search(state: SpotlightOrchestrationState, config: R
                 result_summary += f"{idx}. {title} (점수: {score:.2f})\n"
 
             logger.info(f"✓ MIT Search 성공: {len(final_results)}개 결과 반환")
-            return SpotlightOrchestrationState(tool_results=result_summary)
+            return SpotlightOrchestrationState(tool_results=result_summary, answer_cache_grounded=True)
         logger.warning("✗ MIT Search 결과 없음")
         return SpotlightOrchestrationState(tool_results="\n[MIT Search 결과] 검색 결과가 없습니다\n")
 
@@ -9,6 +9,13 @@ from app.infrastructure.graph.orchestration.shared.message_utils import (
     build_planner_chat_messages,
     extract_last_human_query,
 )
+from app.infrastructure.graph.orchestration.shared.plan_cache import (
+    build_cached_plan_message,
+    get_plan_cache,
+    is_cacheable_query,
+    is_first_planning_step,
+    plan_cache_key,
+)
 from app.infrastructure.graph.orchestration.shared.planning_utils import (
     MUTATION_SUCCESS_MARKERS,
     PLANNING_MAX_RETRY,
@@ -39,7 +46,7 @@ async def create_plan(state: SpotlightOrchestrationState) -> SpotlightOrchestrat
     Contract:
         reads: messages, retry_count, planning_context, tool_results, user_context, skip_planning, hitl_status
         writes: plan, need_tools, can_answer, selected_tool, tool_category, tool_args
-        side-effects: LLM API 호출
+        side-effects: LLM API 호출 (계획 캐시 히트 시 생략)
         failures: PLANNING_FAILED -> 기본 계획 반환
     """
     logger.info("Planning 단계 진입")
@@ -108,6 +115,16 @@ async def create_plan(state: SpotlightOrchestrationState) -> SpotlightOrchestrat
             tool_args={},
         )
 
+    # 계획 캐시: 대화 맥락 없이 해석되는 질문의 첫 계획 단계만 재사용
+    plan_cache = get_plan_cache()
+    cache_key = None
+    if plan_cache is not None and is_first_planning_step(messages) and is_cacheable_query(query):
+        cache_key = plan_cache_key(query, state.get("user_id", ""))
+        cached_plan = plan_cache.get(cache_key)
+        if cached_plan is not None:
+            logger.info(f"[Plan Cache] 히트: {cached_plan.get('selected_tool') or '직접 응답'}")
+            return _state_from_cached_plan(cached_plan)
+
     # Spotlight 전용 도구만 가져오기 (모드 필터링 적용)
     langchain_tools = get_spotlight_tools()
     logger.info(f"Spotlight mode, tools count: {len(langchain_tools)}")
@@ -164,6 +181,14 @@ async def create_plan(state: SpotlightOrchestrationState) -> SpotlightOrchestrat
             thought_summary = thought[:100] if thought else ""
             plan_text = f"[Thought] {thought_summary}\n[Action] {tool_name}" if thought_summary else f"도구 실행: {tool_name}"
 
+            if cache_key is not None and tool_category == "query":
+                plan_cache.put(cache_key, {
+                    "plan": plan_text,
+                    "selected_tool": tool_name,
+                    "tool_args": tool_args,
+                    "tool_category": tool_category,
+                })
+
             new_retry_count = retry_count + 1 if tool_results else retry_count
             return SpotlightOrchestrationState(
                 messages=[response],
@@ -181,10 +206,13 @@ async def create_plan(state: SpotlightOrchestrationState) -> SpotlightOrchestrat
             logger.info("[ReAct] 도구 없이 직접 응답")
             logger.info(f"응답 내용: {response.content[:100]}..." if response.content else "응답 없음")
 
+            plan_text = f"[Thought] {thought[:100]}" if thought else "직접 응답"
+            if cache_key is not None:
+                plan_cache.put(cache_key, {"plan": plan_text, "selected_tool": None})
             return SpotlightOrchestrationState(
                 can_answer=True,
                 need_tools=False,
-                plan=f"[Thought] {thought[:100]}" if thought else "직접 응답",
+                plan=plan_text,
                 selected_tool=None,
                 tool_category=None,
                 tool_args={},
@@ -201,3 +229,27 @@ async def create_plan(state: SpotlightOrchestrationState) -> SpotlightOrchestrat
             tool_category=None,
             tool_args={},
         )
+
+
+def _state_from_cached_plan(plan: dict) -> SpotlightOrchestrationState:
+    """캐시된 계획을 Planner 출력 상태로 변환 (LLM 호출 없음)"""
+    message = build_cached_plan_message(plan)
+    if message is None:
+        return SpotlightOrchestrationState(
+            can_answer=True,
+            need_tools=False,
+            plan=plan["plan"],
+            selected_tool=None,
+            tool_category=None,
+            tool_args={},
+        )
+    return SpotlightOrchestrationState(
+        messages=[message],
+        selected_tool=plan["selected_tool"],
+        tool_args=plan.get("tool_args") or {},
+        tool_category=plan.get("tool_category") or "query",
+        need_tools=False,
+        can_answer=True,
+        plan=plan["plan"],
+        missing_requirements=[],
+    )
@@ -1,6 +1,11 @@
 import logging
 
 from app.core.config import get_settings
+from app.infrastructure.graph.orchestration.shared.intent_classifier import (
+    LABEL_MIT_SEARCH,
+    classify_locally,
+    record_route_source,
+)
 from app.infrastructure.graph.orchestration.shared.simple_router import SimpleRouterOutput
 from ..state import SpotlightOrchestrationState
 
@@ -10,12 +15,13 @@ logger = logging.getLogger(__name__)
 async def route_simple_query(state: SpotlightOrchestrationState) -> SpotlightOrchestrationState:
     """간단한 쿼리 사전 필터링 노드 (Planning 이전)
 
-    Clova Router API를 사용하여 쿼리를 분류합니다.
+    로컬 의도 분류기가 확신하는 질의(인사/안내/단순 MIT 검색)는 바로 판정하고,
+    나머지는 Clova Router API를 사용하여 쿼리를 분류합니다.
 
     Contract:
         reads: messages
-        writes: is_simple_query, simple_router_output, need_tools, plan
-        side-effects: Clova Router API 호출
+        writes: is_simple_query, simple_router_output, need_tools, plan, next_subquery
+        side-effects: Clova Router API 호출 (로컬 판정 실패 시)
 
     Returns:
         SpotlightOrchestrationState: 간단한 쿼리 판정 결과 포함
@@ -30,6 +36,17 @@ async def route_simple_query(state: SpotlightOrchestrationState) -> SpotlightOrc
         logger.warning("쿼리가 비어있습니다")
         return _create_empty_router_output()
 
+    # 로컬 분류기 우선 (Clova Router + Planner LLM 우회)
+    if settings.local_intent_router_enabled:
+        local_result = classify_locally(query)
+        if local_result is not None:
+            logger.info(
+                f"로컬 분류기 판정: category={local_result.category}, "
+                f"confidence={local_result.confidence:.2f}"
+            )
+            record_route_source("local", local_result.category)
+            return _create_router_state(local_result)
+
     # Clova Router 필수 설정 확인
     if not settings.clova_router_id:
         error_msg = "CLOVA_ROUTER_ID가 설정되지 않았습니다"
@@ -48,6 +65,7 @@ async def route_simple_query(state: SpotlightOrchestrationState) -> SpotlightOrc
             f"Clova Router 성공: is_simple={result.is_simple_query}, "
             f"category={result.category}, confidence={result.confidence:.2f}"
         )
+        record_route_source("clova", result.category)
         return _create_router_state(result)
     except Exception as e:
         logger.error(f"Clova Router 실패: {e}")
@@ -106,6 +124,21 @@ def _create_router_state(result: SimpleRouterOutput) -> dict:
             "need_tools": False,
             "plan": f"간단한 쿼리: {result.category}",
         }
+    elif result.category == LABEL_MIT_SEARCH:
+        # 단순 회의 기록 검색: Planner 없이 mit_tools_analyze로 직행
+        return {
+            "is_simple_query": False,
+            "simple_router_output": {
+                "is_simple_query": result.is_simple_query,
+                "category": result.category,
+                "simple_response": None,
+                "confidence": result.confidence,
+                "reasoning": result.reasoning,
+            },
+            "need_tools": True,
+            "next_subquery": None,
+            "plan": "로컬 분류: MIT 검색",
+        }
     else:
         return {
             "is_simple_query": False,
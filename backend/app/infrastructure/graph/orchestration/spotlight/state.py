@@ -31,6 +31,11 @@ class SpotlightOrchestrationState(TypedDict):
     user_id: Annotated[str, "user_id"]
     user_context: NotRequired[dict]  # Spotlight 전용: {"teams": [...], "current_time": "..."}
 
+    # 의미론적 답변 캐시
+    cached_answer: NotRequired[str | None]  # 히트 시 generator가 그대로 반환
+    answer_cache_grounded: NotRequired[bool]  # 이번 턴 답변이 MIT Search 결과에 근거했는지 (저장 조건)
+    answer_cache_versions: NotRequired[dict | None]  # 조회 시점 KG 버전 스냅샷
+
     # Simple Query Routing
     is_simple_query: NotRequired[bool]
     simple_router_output: NotRequired[dict]
@@ -0,0 +1,36 @@
+import logging
+
+from app.infrastructure.graph.orchestration.shared.answer_cache import (
+    cacheable_query,
+    lookup_cached_answer,
+)
+
+from ..state import VoiceOrchestrationState
+
+logger = logging.getLogger(__name__)
+
+
+async def check_answer_cache(state: VoiceOrchestrationState) -> VoiceOrchestrationState:
+    """의미론적 답변 캐시 조회 노드 (Simple Router 이전)
+
+    같은 회의에서 같은 사용자가 이전과 의미가 같은 질문을 하면
+    KG가 바뀌지 않은 한 이전 답변을 재사용합니다.
+
+    Contract:
+        reads: messages, user_id, meeting_id
+        writes: cached_answer, answer_cache_grounded, answer_cache_versions
+        side-effects: Embedding API 호출 (캐시 미스 시), Redis 조회
+    """
+    user_id = state.get("user_id", "")
+    meeting_id = state.get("meeting_id", "")
+    query = cacheable_query(state.get("messages", []))
+
+    update = await lookup_cached_answer(
+        query,
+        scope=f"voice:{meeting_id}:{user_id}",
+        user_id=user_id,
+        meeting_id=meeting_id,
+    )
+    if update["cached_answer"] is not None:
+        logger.info("Voice 답변 캐시 히트 → generator")
+    return VoiceOrchestrationState(**update)
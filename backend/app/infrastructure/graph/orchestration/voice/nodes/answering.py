@@ -6,6 +6,10 @@ from datetime import datetime, timedelta, timezone
 from langchain_core.messages import AIMessage
 
 from app.infrastructure.graph.integration.llm import get_answer_generator_llm
+from app.infrastructure.graph.orchestration.shared.answer_cache import (
+    cacheable_query,
+    store_cached_answer,
+)
 from app.infrastructure.graph.orchestration.shared.message_utils import (
     build_generator_chat_messages,
 )
@@ -24,12 +28,19 @@ async def generate_answer(state: VoiceOrchestrationState):
     """Voice 최종 응답 생성 노드 - 항상 voice 채널 사용
 
     Contract:
-        reads: messages, additional_context, planning_context, simple_router_output
+        reads: messages, additional_context, planning_context, simple_router_output,
+               cached_answer, answer_cache_grounded, answer_cache_versions
         writes: response
-        side-effects: LLM API 호출
+        side-effects: LLM API 호출, MIT Search 근거 답변 캐시 저장
     """
     logger.info("Voice 최종 응답 생성 단계 진입")
 
+    # 답변 캐시 히트 시 LLM 호출 없이 직접 반환
+    cached_answer = state.get("cached_answer")
+    if cached_answer:
+        logger.info(f"캐시 답변 반환 (길이: {len(cached_answer)})")
+        return VoiceOrchestrationState(response=cached_answer, messages=[AIMessage(content=cached_answer)])
+
     messages = state.get("messages", [])
     additional_context = state.get("additional_context", "")
     planning_context = state.get("planning_context", "")
@@ -76,4 +87,15 @@ async def generate_answer(state: VoiceOrchestrationState):
     response_text = "".join(response_chunks)
     logger.info(f"Voice 응답 생성 완료 (길이: {len(response_text)})")
 
+    # MIT Search 결과에 근거한 답변만 캐시 (간단한 쿼리/잡담 제외)
+    if state.get("answer_cache_grounded") and not state.get("is_simple_query"):
+        meeting_id = state.get("meeting_id", "")
+        user_id = state.get("user_id", "")
+        await store_cached_answer(
+            cacheable_query(messages),
+            response_text,
+            scope=f"voice:{meeting_id}:{user_id}",
+            versions=state.get("answer_cache_versions"),
+        )
+
     return VoiceOrchestrationState(response=response_text, messages=[AIMessage(content=response_text)])
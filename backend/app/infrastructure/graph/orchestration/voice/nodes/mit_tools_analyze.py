@@ -1,9 +1,14 @@
+import asyncio
 import logging
 
 from ..state import VoiceOrchestrationState
+from app.core.config import get_settings
 from app.infrastructure.graph.workflows.mit_search.nodes.query_intent_analyzer import (
     query_intent_analyzer_async,
 )
+from app.infrastructure.graph.workflows.mit_search.nodes.speculative_retrieval import (
+    prefetch_candidates_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -13,12 +18,15 @@ async def execute_mit_tools_analyze(state: VoiceOrchestrationState) -> VoiceOrch
 
     Contract:
         reads: messages, user_id, next_subquery
-        writes: mit_search_primary_entity, mit_search_query_intent
-        side-effects: LLM API 호출 (query_intent_analyzer)
+        writes: mit_search_primary_entity, mit_search_query_intent,
+                mit_search_prefetched_results
+        side-effects: LLM API 호출 (query_intent_analyzer),
+                      투기적 검색 활성화 시 fulltext 선조회 (Neo4j)
         failures: LLM 오류 → primary_entity=None, 기본 intent 반환
 
     MIT Search의 query_intent_analyzer만 실행하여 검색 의도를 분석합니다.
     분석된 primary_entity는 event streaming에 사용됩니다.
+    투기적 검색이 켜져 있으면 의도 분석과 동시에 fulltext 후보를 미리 조회합니다.
     """
     logger.info("MIT-Tools 의도 분석 단계 진입")
 
@@ -47,6 +55,11 @@ async def execute_mit_tools_analyze(state: VoiceOrchestrationState) -> VoiceOrch
 
     logger.info(f"의도 분석 쿼리: {query[:50]}..., 사용자: {user_id}")
 
+    # 투기적 검색: 의도 분석(LLM)을 기다리는 동안 fulltext 후보 선조회
+    prefetch_task = None
+    if get_settings().voice_speculative_search_enabled and query:
+        prefetch_task = asyncio.create_task(prefetch_candidates_async(query, user_id))
+
     try:
         # query_intent_analyzer만 실행
         intent_result = await query_intent_analyzer_async({
@@ -54,6 +67,7 @@ async def execute_mit_tools_analyze(state: VoiceOrchestrationState) -> VoiceOrch
             "messages": messages,
             "user_id": user_id,
         })
+        prefetched = await prefetch_task if prefetch_task else []
 
         # 의도 분석 결과 추출
         query_intent = intent_result.get("mit_search_query_intent", {})
@@ -69,13 +83,16 @@ async def execute_mit_tools_analyze(state: VoiceOrchestrationState) -> VoiceOrch
         return VoiceOrchestrationState(
             mit_search_primary_entity=primary_entity,
             mit_search_query_intent=query_intent,
+            mit_search_prefetched_results=prefetched,
         )
 
     except Exception as e:
         logger.error(f"MIT-Tools 의도 분석 중 오류: {e}", exc_info=True)
-        # 오류 발생 시 기본값 반환
+        # 오류 발생 시 기본값 반환 (선조회 후보는 그대로 활용)
+        prefetched = await prefetch_task if prefetch_task else []
         return VoiceOrchestrationState(
             mit_search_primary_entity=None,
+            mit_search_prefetched_results=prefetched,
             mit_search_query_intent={
                 "intent_type": "general_search",
                 "primary_entity": None,
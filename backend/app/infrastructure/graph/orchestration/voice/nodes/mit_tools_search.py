@@ -3,9 +3,13 @@ import logging
 from langchain_core.runnables import RunnableConfig
 
 from ..state import VoiceOrchestrationState
+from app.core.config import get_settings
 from app.infrastructure.graph.workflows.mit_search.graph import (
     mit_search_graph_from_cypher,
 )
+from app.infrastructure.graph.workflows.mit_search.nodes.speculative_retrieval import (
+    speculative_search_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +18,17 @@ async def execute_mit_tools_search(state: VoiceOrchestrationState, config: Runna
     """MIT-Tools 검색 실행 노드
 
     Contract:
-        reads: messages, user_id, mit_search_query_intent, retry_count
-        writes: tool_results
-        side-effects: MIT Search 서브그래프 실행 (cypher_generator + tool_executor)
+        reads: messages, user_id, mit_search_query_intent, retry_count,
+               mit_search_prefetched_results
+        writes: tool_results, answer_cache_grounded
+        side-effects: MIT Search 서브그래프 실행 (cypher_generator + tool_executor),
+                      투기적 검색 활성화 시 Clova Reranker 호출
         failures: TOOL_EXECUTION_FAILED -> 빈 결과 반환
 
     MIT Search 서브그래프의 cypher 생성 및 실행 단계만 수행합니다.
     의도 분석(query_intent)은 이미 mit_tools_analyze에서 완료된 상태입니다.
+    투기적 검색이 켜져 있으면 지연 예산 안에 끝난 경로 결과와 선조회 후보를 합쳐
+    한 번에 리랭크합니다.
     """
     logger.info("MIT-Tools 검색 실행 단계 진입")
 
@@ -58,17 +66,27 @@ async def execute_mit_tools_search(state: VoiceOrchestrationState, config: Runna
     )
 
     try:
-        # MIT Search 서브그래프 실행 (cypher_generator부터)
-        # pre-filled query_intent를 전달
-        search_result = await mit_search_graph_from_cypher.ainvoke({
-            "mit_search_query": query,
-            "mit_search_query_intent": query_intent,  # 이미 분석된 의도
-            "messages": messages,
-            "user_id": user_id,
-        }, config=config)
-
-        # 검색 결과 추출
-        final_results = search_result.get("mit_search_raw_results", [])
+        if get_settings().voice_speculative_search_enabled:
+            final_results = await speculative_search_async(
+                query=query,
+                query_intent=query_intent,
+                user_id=user_id,
+                messages=messages,
+                prefetched=state.get('mit_search_prefetched_results', []),
+                config=config,
+            )
+        else:
+            # MIT Search 서브그래프 실행 (cypher_generator부터)
+            # pre-filled query_intent를 전달
+            search_result = await mit_search_graph_from_cypher.ainvoke({
+                "mit_search_query": query,
+                "mit_search_query_intent": query_intent,  # 이미 분석된 의도
+                "messages": messages,
+                "user_id": user_id,
+            }, config=config)
+
+            # 검색 결과 추출
+            final_results = search_result.get("mit_search_raw_results", [])
 
         # 결과를 tool_results에 추가
         if final_results:
@@ -79,7 +97,7 @@ async def execute_mit_tools_search(state: VoiceOrchestrationState, config: Runna
                 result_summary += f"{idx}. {title} (점수: {score:.2f})\n"
 
             logger.info(f"✓ MIT Search 성공: {len(final_results)}개 결과 반환")
-            return VoiceOrchestrationState(tool_results=result_summary)
+            return VoiceOrchestrationState(tool_results=result_summary, answer_cache_grounded=True)
         logger.warning("✗ MIT Search 결과 없음")
         return VoiceOrchestrationState(tool_results="\n[MIT Search 결과] 검색 결과가 없습니다\n")
 
@@ -12,6 +12,13 @@ from app.infrastructure.graph.orchestration.shared.message_utils import (
     build_planner_chat_messages,
     extract_last_human_query,
 )
+from app.infrastructure.graph.orchestration.shared.plan_cache import (
+    build_cached_plan_message,
+    get_plan_cache,
+    is_cacheable_query,
+    is_first_planning_step,
+    plan_cache_key,
+)
 from app.infrastructure.graph.orchestration.shared.planning_utils import (
     MUTATION_SUCCESS_MARKERS,
     PLANNING_MAX_RETRY,
@@ -41,7 +48,7 @@ async def create_plan(state: VoiceOrchestrationState) -> VoiceOrchestrationState
     Contract:
         reads: messages, retry_count, planning_context, tool_results, meeting_id
         writes: plan, need_tools, can_answer, selected_tool, tool_category, tool_args
-        side-effects: LLM API 호출
+        side-effects: LLM API 호출 (계획 캐시 히트 시 생략)
         failures: PLANNING_FAILED -> 기본 계획 반환
     """
     logger.info("Voice Planning 단계 진입")
@@ -95,6 +102,16 @@ async def create_plan(state: VoiceOrchestrationState) -> VoiceOrchestrationState
             tool_args={},
         )
 
+    # 계획 캐시: 대화 맥락 없이 해석되는 질문의 첫 계획 단계만 재사용
+    plan_cache = get_plan_cache()
+    cache_key = None
+    if plan_cache is not None and is_first_planning_step(messages) and is_cacheable_query(query):
+        cache_key = plan_cache_key(query, meeting_id)
+        cached_plan = plan_cache.get(cache_key)
+        if cached_plan is not None:
+            logger.info(f"[Plan Cache] 히트: {cached_plan.get('selected_tool') or '직접 응답'}")
+            return _state_from_cached_plan(cached_plan)
+
     # Voice 전용 도구만 가져오기 (모드 필터링 적용)
     langchain_tools = get_voice_tools()
     logger.info(f"Voice mode, tools count: {len(langchain_tools)}")
@@ -146,6 +163,14 @@ async def create_plan(state: VoiceOrchestrationState) -> VoiceOrchestrationState
             thought_summary = thought[:100] if thought else ""
             plan_text = f"[Thought] {thought_summary}\n[Action] {tool_name}" if thought_summary else f"도구 실행: {tool_name}"
 
+            if cache_key is not None:
+                plan_cache.put(cache_key, {
+                    "plan": plan_text,
+                    "selected_tool": tool_name,
+                    "tool_args": tool_args,
+                    "tool_category": tool_category,
+                })
+
             new_retry_count = retry_count + 1 if tool_results else retry_count
             return VoiceOrchestrationState(
                 messages=[response],
@@ -161,10 +186,13 @@ async def create_plan(state: VoiceOrchestrationState) -> VoiceOrchestrationState
         else:
             # 도구 없이 직접 응답
             logger.info("[ReAct] 도구 없이 직접 응답")
+            plan_text = f"[Thought] {thought[:100]}" if thought else "직접 응답"
+            if cache_key is not None:
+                plan_cache.put(cache_key, {"plan": plan_text, "selected_tool": None})
             return VoiceOrchestrationState(
                 can_answer=True,
                 need_tools=False,
-                plan=f"[Thought] {thought[:100]}" if thought else "직접 응답",
+                plan=plan_text,
                 selected_tool=None,
                 tool_category=None,
                 tool_args={},
@@ -179,3 +207,27 @@ async def create_plan(state: VoiceOrchestrationState) -> VoiceOrchestrationState
             can_answer=True,
             response=f"죄송합니다. 요청을 처리하는 중 오류가 발생했습니다: {str(e)}",
         )
+
+
+def _state_from_cached_plan(plan: dict) -> VoiceOrchestrationState:
+    """캐시된 계획을 Planner 출력 상태로 변환 (LLM 호출 없음)"""
+    message = build_cached_plan_message(plan)
+    if message is None:
+        return VoiceOrchestrationState(
+            can_answer=True,
+            need_tools=False,
+            plan=plan["plan"],
+            selected_tool=None,
+            tool_category=None,
+            tool_args={},
+        )
+    return VoiceOrchestrationState(
+        messages=[message],
+        selected_tool=plan["selected_tool"],
+        tool_args=plan.get("tool_args") or {},
+        tool_category=plan.get("tool_category") or "query",
+        need_tools=False,
+        can_answer=True,
+        plan=plan["plan"],
+        missing_requirements=[],
+    )
@@ -31,6 +31,11 @@ class VoiceOrchestrationState(TypedDict):
     user_id: Annotated[str, "user_id"]
     meeting_id: Annotated[str, "meeting_id"]  # Voice 전용: 현재 진행 중인 회의 ID
     
+    # 의미론적 답변 캐시
+    cached_answer: NotRequired[str | None]  # 히트 시 generator가 그대로 반환
+    answer_cache_grounded: NotRequired[bool]  # 이번 턴 답변이 MIT Search 결과에 근거했는지 (저장 조건)
+    answer_cache_versions: NotRequired[dict | None]  # 조회 시점 KG 버전 스냅샷
+
     # Simple Query Routing
     is_simple_query: NotRequired[bool]
     simple_router_output: NotRequired[dict]
@@ -51,6 +56,7 @@ class VoiceOrchestrationState(TypedDict):
     # MIT Search 관련
     mit_search_primary_entity: NotRequired[str]
     mit_search_query_intent: NotRequired[dict]
+    mit_search_prefetched_results: NotRequired[list[dict]]  # 의도 분석 중 선조회한 fulltext 후보
     
     # Replanning
     next_subquery: NotRequired[str]
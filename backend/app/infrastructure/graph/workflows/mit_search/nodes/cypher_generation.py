@@ -19,7 +19,20 @@ from app.prompt.v1.mit_search.cypher import (
 from ..nodes.tool_retrieval import generate_cypher_by_strategy, normalize_query
 from ..state import MitSearchState
 from ..utils.search_strategy_router import SearchStrategyRouter
-from ..utils.template_cypher import generate_template_cypher
+from ..utils.query_plan_cache import (
+    SOURCE_FALLBACK,
+    SOURCE_HYBRID,
+    SOURCE_LLM,
+    SOURCE_PLAN_CACHE,
+    SOURCE_TEMPLATE,
+    get_query_plan_cache,
+    is_reusable_llm_cypher,
+)
+from ..utils.template_cypher import (
+    bind_template_parameters,
+    generate_template_cypher,
+    template_shape,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -162,8 +175,10 @@ async def _generate_text_to_cypher(
     query: str, query_intent: dict, user_id: str
 ) -> str:
     """LLM Cypher 생성 + 품질/안전성 피드백 기반 재시도 (캐싱 포함)."""
-    # 캐시 키 생성
-    cache_key = f"{query}|{query_intent.get('intent_type')}|{query_intent.get('search_focus')}"
+    # 캐시 키 생성 (LLM 프롬프트에 사용자 ID가 들어가므로 사용자별)
+    cache_key = (
+        f"{user_id}|{query}|{query_intent.get('intent_type')}|{query_intent.get('search_focus')}"
+    )
 
     # 캐시 확인
     if cache_key in _cypher_cache:
@@ -179,7 +194,7 @@ async def _generate_text_to_cypher(
     for subquery in subqueries:
         cypher = await _attempt_cypher_with_feedback(subquery, query_intent, user_id)
         if cypher:
-            # 캐시에 저장 (최대 50개, FIFO)
+            # 품질/안전성 검증을 통과한 Cypher만 캐시에 저장 (최대 50개, FIFO)
             if len(_cypher_cache) >= 50:
                 _cypher_cache.pop(next(iter(_cypher_cache)))
             _cypher_cache[cache_key] = cypher
@@ -189,7 +204,9 @@ async def _generate_text_to_cypher(
 
 
 async def cypher_generator_async(state: MitSearchState) -> Dict[str, Any]:
-    """SearchStrategyRouter 기반 Cypher 쿼리 생성 (Template Fallback 포함).
+    """SearchStrategyRouter 기반 Cypher 쿼리 생성.
+
+    Plan 캐시 → Template → LLM 순으로 시도하며, 앞 단계에서 만들어지면 LLM을 호출하지 않습니다.
 
     Contract:
         reads: mit_search_query, mit_search_query_intent, user_id
@@ -219,6 +236,10 @@ async def cypher_generator_async(state: MitSearchState) -> Dict[str, Any]:
         normalized_keywords = normalize_query(query)
         logger.info(f"[Cypher Generator] 정규화: '{query}' → '{normalized_keywords}'")
 
+        # 날짜 바인딩 (의도 분석에 없으면 원문 시간 표현에서 추출)
+        date_range, _ = bind_template_parameters(query, query_intent, user_id)
+        filters["date_range"] = date_range
+
         # 전략 결정
         entity_types = filters.get("entity_types", [])
         router = SearchStrategyRouter()
@@ -228,85 +249,92 @@ async def cypher_generator_async(state: MitSearchState) -> Dict[str, Any]:
             normalized_keywords=normalized_keywords,
             user_id=user_id,
         )
+        strategy["date_range"] = date_range
 
         logger.info(
             f"[Cypher Generator] 전략 선택: {strategy['strategy']} (Fallback: {strategy.get('use_fallback', False)})"
         )
 
         cypher = ""
+        source = ""
+        plan_cache = get_query_plan_cache()
+        plan_key = template_shape(
+            intent_type=query_intent.get("intent_type"),
+            search_focus=query_intent.get("search_focus"),
+            primary_entity=query_intent.get("primary_entity"),
+            keywords=query_intent.get("keywords"),
+            date_filter=date_range,
+        )
 
-        # Case 1: Template 우선 전략
-        if strategy["strategy"] == "template_based":
-            logger.info("[Cypher Generator] Template 우선 시도")
-            template_cypher = generate_template_cypher(
-                intent_type=query_intent.get("intent_type"),
-                search_focus=query_intent.get("search_focus"),
-                primary_entity=query_intent.get("primary_entity"),
-                keywords=query_intent.get("keywords"),
-                user_id=user_id,
-                date_filter=filters.get("date_range"),
-            )
-
-            if template_cypher:
-                cypher = template_cypher
-                strategy["reasoning"] = "Template (pattern matched)"
-                logger.info("[Cypher Generator] ✓ Template 성공")
+        # Fast path: plan 캐시 → 템플릿 (LLM 우회)
+        if strategy["strategy"] == "hybrid_search":
+            # BM25 + 벡터는 tool_executor에서 실행
+            cypher = _get_fulltext_template()
+            source = SOURCE_HYBRID
+            logger.info("[Cypher Generator] Hybrid 검색 (LLM 생략)")
+        else:
+            cached_plan = plan_cache.get(plan_key)
+            if cached_plan:
+                cypher, strategy["strategy"] = cached_plan
+                strategy["reasoning"] = "Compiled plan cache"
+                source = SOURCE_PLAN_CACHE
+                logger.info("[Cypher Generator] ✓ Plan 캐시 히트")
             else:
-                logger.info("[Cypher Generator] Template 없음 → LLM Fallback")
-                llm_cypher = await _generate_text_to_cypher(query, query_intent, user_id)
-                if llm_cypher:
-                    cypher = llm_cypher
-                    strategy["reasoning"] = "Template 없음 → LLM Fallback"
-                    logger.info("[Cypher Generator] ✓ LLM Fallback 성공")
-
-        # Case 2: LLM 우선 전략
-        elif strategy["strategy"] == "text_to_cypher":
-            logger.info("[Cypher Generator] LLM 우선 시도")
-            llm_cypher = await _generate_text_to_cypher(query, query_intent, user_id)
-
-            if llm_cypher:
-                cypher = llm_cypher
-                strategy["reasoning"] = "LLM (text-to-cypher)"
-                logger.info("[Cypher Generator] ✓ LLM 성공")
-
-            # LLM 실패 시 Fallback
-            elif strategy.get("use_fallback", False):
-                logger.warning("[Cypher Generator] LLM 실패 → Template Fallback 시도")
                 template_cypher = generate_template_cypher(
                     intent_type=query_intent.get("intent_type"),
                     search_focus=query_intent.get("search_focus"),
                     primary_entity=query_intent.get("primary_entity"),
                     keywords=query_intent.get("keywords"),
                     user_id=user_id,
-                    date_filter=filters.get("date_range"),
+                    date_filter=date_range,
                 )
-
                 if template_cypher:
                     cypher = template_cypher
-                    strategy["reasoning"] = "LLM 실패 → Template Fallback"
                     strategy["strategy"] = "template_based"
-                    logger.info("[Cypher Generator] ✓ Template Fallback 성공")
+                    strategy["reasoning"] = "Template (pattern matched)"
+                    source = SOURCE_TEMPLATE
+                    logger.info("[Cypher Generator] ✓ Template 성공")
+        fast_path_template = source == SOURCE_TEMPLATE
+
+        if not cypher:
+            # Case 1: Template 우선 전략이지만 템플릿 없음 → LLM
+            if strategy["strategy"] == "template_based":
+                logger.info("[Cypher Generator] Template 없음 → LLM Fallback")
+                llm_cypher = await _generate_text_to_cypher(query, query_intent, user_id)
+                if llm_cypher:
+                    cypher = llm_cypher
+                    source = SOURCE_LLM
+                    strategy["reasoning"] = "Template 없음 → LLM Fallback"
+                    logger.info("[Cypher Generator] ✓ LLM Fallback 성공")
+
+            # Case 2: LLM 우선 전략
+            elif strategy["strategy"] == "text_to_cypher":
+                logger.info("[Cypher Generator] LLM 우선 시도")
+                llm_cypher = await _generate_text_to_cypher(query, query_intent, user_id)
+
+                if llm_cypher:
+                    cypher = llm_cypher
+                    source = SOURCE_LLM
+                    strategy["reasoning"] = "LLM (text-to-cypher)"
+                    logger.info("[Cypher Generator] ✓ LLM 성공")
+
+                # LLM 실패 시 Fallback (템플릿은 fast path에서 이미 없음 확인)
                 else:
-                    logger.warning("[Cypher Generator] Template도 없음 → fulltext fallback")
-                    cypher, strategy = _apply_focus_fallback(
-                        cypher, strategy, query_intent
-                    )
+                    logger.warning("[Cypher Generator] LLM 실패 → fulltext fallback")
+                    cypher, strategy = _apply_focus_fallback(cypher, strategy, query_intent)
+                    source = SOURCE_FALLBACK
+
             else:
-                logger.warning(
-                    "[Cypher Generator] LLM 실패 (Fallback 비활성화) → fulltext fallback"
+                # 기타 전략
+                cypher = generate_cypher_by_strategy(
+                    strategy=strategy["strategy"],
+                    query_intent=query_intent,
+                    entity_types=entity_types,
+                    normalized_keywords=normalized_keywords,
+                    filters=filters,
+                    cypher_template=_get_fulltext_template(),
                 )
-                cypher, strategy = _apply_focus_fallback(cypher, strategy, query_intent)
-
-        else:
-            # 기타 전략
-            cypher = generate_cypher_by_strategy(
-                strategy=strategy["strategy"],
-                query_intent=query_intent,
-                entity_types=entity_types,
-                normalized_keywords=normalized_keywords,
-                filters=filters,
-                cypher_template=_get_fulltext_template(),
-            )
+                source = SOURCE_TEMPLATE
 
         # 품질 검증 및 최종 출력
         quality_issues = _collect_cypher_issues(cypher, query_intent)
@@ -315,15 +343,30 @@ async def cypher_generator_async(state: MitSearchState) -> Dict[str, Any]:
                 "[Cypher Generator] 품질/의도 검증 실패", extra={"issues": quality_issues}
             )
             # 심각한 이슈(보안 등)가 있으면 Fallback
-            if "missing_user_scope" in quality_issues or "unsafe_cypher" in quality_issues:
+            if "unsafe_cypher" in quality_issues:
                 cypher, strategy = _apply_focus_fallback(cypher, strategy, query_intent)
+                source = SOURCE_FALLBACK
+
+        # 검증을 통과한 Cypher만 같은 형태에 재사용
+        # (템플릿은 값이 모두 파라미터, LLM Cypher는 파라미터로만 바인딩된 경우)
+        if not quality_issues:
+            if fast_path_template:
+                plan_cache.put(plan_key, cypher, "template_based")
+            elif source == SOURCE_LLM and is_reusable_llm_cypher(cypher):
+                plan_cache.put(plan_key, cypher, strategy["strategy"])
+
+        if source:
+            plan_cache.record_source(source)
 
         print(f"\n{'='*80}")
         print(f"[최종 실행 Cypher] (전략: {strategy['strategy']})")
         print(f"{'='*80}")
         print(cypher)
         print(f"{'='*80}\n")
-        logger.info(f"[Cypher Generator] 완료 (소요시간: {time.time() - start_time:.2f}s)")
+        logger.info(
+            f"[Cypher Generator] 완료 (소요시간: {time.time() - start_time:.2f}s, "
+            f"경로: {source}, LLM 우회율: {plan_cache.bypass_rate:.0%})"
+        )
 
         return {"mit_search_cypher": cypher, "mit_search_strategy": strategy}
 
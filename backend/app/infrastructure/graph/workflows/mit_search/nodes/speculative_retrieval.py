@@ -0,0 +1,218 @@
+"""Voice용 투기적(speculative) 검색 실행.
+
+의도 분석과 동시에 값싼 fulltext 후보를 미리 가져오고, 의도 분석 후에는
+템플릿/LLM Cypher 경로를 지연 예산 안에서만 기다린 뒤 선조회 후보와 합쳐
+리랭커를 한 번만 호출합니다. LLM이 예산을 넘기면 선조회 후보로 답합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
+
+from ..tools.search_tools import execute_cypher_search_async
+from ..utils.hybrid_fusion import merge_candidate_sets
+from ..utils.template_cypher import bind_template_parameters, generate_template_cypher
+from .reranking import reranker_async
+from .tool_retrieval import normalize_query, tool_executor_async
+
+logger = logging.getLogger(__name__)
+
+BRANCH_TEMPLATE = "template"
+BRANCH_LLM = "llm"
+
+# 리랭커 입력 후보 상한 (경로별 최대 20개 × 3)
+MAX_RERANK_CANDIDATES = 40
+
+# 선조회 fulltext: 요청 사용자가 참여한 회의의 결정사항으로 한정
+PREFETCH_CYPHER = """CALL db.index.fulltext.queryNodes('decision_search', $query)
+YIELD node, score
+MATCH (:User {id: $user_id})-[:PARTICIPATED_IN]->(m:Meeting)-[:CONTAINS]->(a:Agenda)-[:HAS_DECISION]->(node)
+RETURN node.id AS id, node.content AS content, node.status AS status, node.created_at AS created_at, m.id AS meeting_id, m.title AS meeting_title, score,
+       m.title + ' 회의의 ' + coalesce(a.topic, '안건') + '에서 도출된 결정: ' + node.content AS graph_context
+ORDER BY score DESC, node.created_at DESC
+LIMIT 20"""
+
+
+def _record_branch(branch: str, outcome: str) -> None:
+    metrics = get_mit_metrics()
+    if metrics:
+        metrics.search_speculative_branch_total.add(
+            1, {"branch": branch, "outcome": outcome}
+        )
+
+
+async def gather_within_budget(
+    branches: dict[str, Awaitable[list[dict]]],
+    budget_seconds: float,
+) -> dict[str, list[dict]]:
+    """경로들을 동시에 실행하고 예산 안에 끝난 결과만 반환.
+
+    예산을 넘긴 경로는 취소하고, 실패한 경로는 빈 결과로 간주합니다.
+
+    Args:
+        branches: 경로 이름 → 결과 리스트를 반환하는 코루틴
+        budget_seconds: 전체 대기 한도 (초)
+
+    Returns:
+        경로 이름 → 결과 리스트 (시간 초과/실패 경로는 제외)
+    """
+    tasks = {asyncio.ensure_future(coro): name for name, coro in branches.items()}
+    if not tasks:
+        return {}
+
+    done, pending = await asyncio.wait(tasks, timeout=max(budget_seconds, 0.0))
+    for task in pending:
+        task.cancel()
+        _record_branch(tasks[task], "timeout")
+        logger.info(f"[Speculative] {tasks[task]} 경로 예산 초과 → 취소")
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    results: dict[str, list[dict]] = {}
+    for task in done:
+        name = tasks[task]
+        if task.exception() is not None:
+            _record_branch(name, "error")
+            logger.warning(f"[Speculative] {name} 경로 실패: {task.exception()}")
+            continue
+        _record_branch(name, "completed")
+        results[name] = task.result() or []
+    return results
+
+
+async def prefetch_candidates_async(query: str, user_id: str) -> list[dict]:
+    """의도 분석과 병렬로 실행하는 값싼 fulltext 후보 조회 (LLM 미사용, 사용자 참여 회의 한정)"""
+    keywords = normalize_query(query) if query else ""
+    if not keywords or not user_id:
+        return []
+    try:
+        return await execute_cypher_search_async(
+            PREFETCH_CYPHER, {"query": keywords, "user_id": user_id}
+        )
+    except Exception as e:
+        logger.warning(f"[Speculative] fulltext 선조회 실패: {e}")
+        return []
+
+
+def _build_template_cypher(
+    query: str, query_intent: dict, user_id: str
+) -> tuple[str | None, dict | None]:
+    date_range, _ = bind_template_parameters(query, query_intent, user_id)
+    cypher = generate_template_cypher(
+        intent_type=query_intent.get("intent_type"),
+        search_focus=query_intent.get("search_focus"),
+        primary_entity=query_intent.get("primary_entity"),
+        keywords=query_intent.get("keywords"),
+        user_id=user_id,
+        date_filter=date_range,
+    )
+    return cypher, date_range
+
+
+async def _run_template_branch(
+    cypher: str, date_range: dict | None, query_intent: dict, user_id: str
+) -> list[dict]:
+    result = await tool_executor_async({
+        "mit_search_cypher": cypher,
+        "mit_search_strategy": {"strategy": "template_based", "date_range": date_range},
+        "mit_search_query_intent": query_intent,
+        "user_id": user_id,
+    })
+    return result.get("mit_search_raw_results", [])
+
+
+async def _run_llm_branch(
+    query: str,
+    query_intent: dict,
+    user_id: str,
+    messages: list,
+    config: Optional[RunnableConfig],
+) -> list[dict]:
+    # 순환 import 방지 (graph → connect → nodes)
+    from ..graph import mit_search_graph_from_cypher
+
+    result = await mit_search_graph_from_cypher.ainvoke({
+        "mit_search_query": query,
+        "mit_search_query_intent": query_intent,
+        "messages": messages,
+        "user_id": user_id,
+    }, config=config)
+    return result.get("mit_search_raw_results", [])
+
+
+async def speculative_search_async(
+    query: str,
+    query_intent: dict,
+    user_id: str,
+    messages: list | None = None,
+    prefetched: list[dict] | None = None,
+    budget_ms: int | None = None,
+    config: Optional[RunnableConfig] = None,
+) -> list[dict[str, Any]]:
+    """예산 내 경로 실행 + 후보 병합 + 단일 리랭크.
+
+    템플릿이 있으면 cypher_generator도 같은 템플릿을 고르므로 템플릿 경로만 실행하고,
+    없을 때만 LLM Cypher 경로를 실행합니다. 어느 경로든 예산을 넘기면 취소하고
+    선조회(prefetch) 후보만으로 답합니다.
+
+    Args:
+        query: 검색 질의
+        query_intent: mit_tools_analyze의 의도 분석 결과
+        user_id: 요청 사용자 ID
+        messages: 대화 메시지 (LLM Cypher 생성 컨텍스트)
+        prefetched: 의도 분석 중 미리 가져온 fulltext 후보
+        budget_ms: 경로 대기 한도 (기본: settings.voice_search_budget_ms)
+        config: 서브그래프 실행 config (콜백/트레이싱 전달)
+
+    Returns:
+        final_score 내림차순 결과 리스트
+    """
+    start_time = time.time()
+    if budget_ms is None:
+        budget_ms = get_settings().voice_search_budget_ms
+
+    # 템플릿 조립은 I/O가 없으므로 바로 판단
+    template_cypher, date_range = _build_template_cypher(query, query_intent, user_id)
+
+    branches: dict[str, Awaitable[list[dict]]] = {}
+    if template_cypher:
+        branches[BRANCH_TEMPLATE] = _run_template_branch(
+            template_cypher, date_range, query_intent, user_id
+        )
+    else:
+        branches[BRANCH_LLM] = _run_llm_branch(
+            query, query_intent, user_id, messages or [], config
+        )
+
+    branch_results = await gather_within_budget(branches, budget_ms / 1000)
+    template_results = branch_results.get(BRANCH_TEMPLATE, [])
+    llm_results = branch_results.get(BRANCH_LLM, [])
+
+    candidates = merge_candidate_sets(
+        template_results,
+        llm_results,
+        prefetched or [],
+        limit=MAX_RERANK_CANDIDATES,
+    )
+    if not candidates:
+        return []
+
+    reranked = await reranker_async({
+        "mit_search_raw_results": candidates,
+        "mit_search_query": query,
+        "mit_search_query_intent": query_intent,
+    })
+    ranked = reranked.get("mit_search_ranked_results", [])
+
+    logger.info(
+        f"[Speculative] 완료: {len(ranked)}개 후보 "
+        f"(template={len(template_results)}, llm={len(llm_results)}, "
+        f"prefetch={len(prefetched or [])}, {(time.time() - start_time) * 1000:.0f}ms)"
+    )
+    return ranked
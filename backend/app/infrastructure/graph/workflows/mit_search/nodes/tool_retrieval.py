@@ -7,7 +7,7 @@ import time
 from typing import Any, Dict, List
 
 from ..state import MitSearchState
-from ..tools.search_tools import execute_cypher_search_async
+from ..tools.search_tools import execute_cypher_search_async, execute_hybrid_search_async
 
 logger = logging.getLogger(__name__)
 
@@ -236,8 +236,9 @@ async def tool_executor_async(state: MitSearchState) -> Dict[str, Any]:
         user_id = state.get("user_id", "")
 
         # filters는 query_intent에서 추출 (일관성 유지)
+        # date_range가 없으면 cypher_generator가 원문에서 추출한 값 사용
         filters = {
-            "date_range": intent.get("date_range"),
+            "date_range": intent.get("date_range") or strategy.get("date_range"),
             "entity_types": intent.get("entity_types"),
         }
 
@@ -279,10 +280,22 @@ async def tool_executor_async(state: MitSearchState) -> Dict[str, Any]:
         
         # Cypher 실행 (비동기)
         db_start = time.time()
-        results = await execute_cypher_search_async(
-            cypher_query=cypher,
-            parameters=parameters
-        )
+        if strategy.get("strategy") == "hybrid_search":
+            # 벡터 매칭에는 키워드보다 정규화된 전체 질의가 유리
+            hybrid_query = strategy.get("search_term", "")
+            if not hybrid_query or hybrid_query == "*":
+                hybrid_query = search_term_value
+            results = await execute_hybrid_search_async(
+                query=hybrid_query,
+                user_id=user_id,
+                start_date=parameters.get("start_date"),
+                end_date=parameters.get("end_date"),
+            )
+        else:
+            results = await execute_cypher_search_async(
+                cypher_query=cypher,
+                parameters=parameters
+            )
         total_time = (time.time() - exec_start) * 1000
 
         # Text-to-Cypher 결과가 없으면 entity_search 기반 fallback 시도
@@ -1,7 +1,8 @@
 """MIT Search tools for Neo4j operations."""
 
-from .search_tools import execute_cypher_search
+from .search_tools import execute_cypher_search, execute_hybrid_search_async
 
 __all__ = [
     "execute_cypher_search",
+    "execute_hybrid_search_async",
 ]
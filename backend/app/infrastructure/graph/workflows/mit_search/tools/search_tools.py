@@ -65,6 +65,17 @@ async def execute_cypher_search_async(cypher_query: str, parameters: dict[str, A
             if re.search(rf'\b{keyword}\b', query_upper):
                 raise ValueError(f"Dangerous Cypher keyword detected: {keyword}")
 
+        # 결과 캐시 (히트 시 Neo4j 조회 + 타입 변환 생략)
+        from app.infrastructure.cache.search_result_cache import get_search_result_cache
+
+        result_cache = get_search_result_cache()
+        cache_key = None
+        if result_cache is not None:
+            cache_key, cached_results = await result_cache.lookup(cypher_query, parameters)
+            if cached_results is not None:
+                logger.info(f"Cypher search cache hit: {len(cached_results)} results")
+                return cached_results
+
         # Neo4j driver integration
         from app.core.neo4j import get_neo4j_driver
 
@@ -91,7 +102,10 @@ async def execute_cypher_search_async(cypher_query: str, parameters: dict[str, A
 
         logger.info(f"Cypher search returned {len(records)} results")
         # Neo4j DateTime 객체를 ISO 문자열로 변환하여 msgpack 직렬화 가능하도록 처리
-        return [_serialize_neo4j_types(record) for record in records]
+        serialized = [_serialize_neo4j_types(record) for record in records]
+        if cache_key is not None:
+            await result_cache.store(cache_key, serialized)
+        return serialized
 
     except ValueError as ve:
         # 보안 에러는 로그 후 빈 결과 반환
@@ -105,6 +119,133 @@ async def execute_cypher_search_async(cypher_query: str, parameters: dict[str, A
         return []
 
 
+# Hybrid 검색 projection: 모든 경로를 $user_id가 참여한 회의로 한정
+_HYBRID_DATE_FILTER = """
+WHERE ($start_date IS NULL OR node.created_at >= datetime($start_date))
+  AND ($end_date IS NULL OR node.created_at <= datetime($end_date))"""
+
+_DECISION_PROJECTION = """
+MATCH (:User {id: $user_id})-[:PARTICIPATED_IN]->(m:Meeting)-[:CONTAINS]->(a:Agenda)-[:HAS_DECISION]->(node)""" + _HYBRID_DATE_FILTER + """
+RETURN node.id AS id, node.content AS content, node.status AS status, node.created_at AS created_at,
+       m.id AS meeting_id, m.title AS meeting_title, score,
+       m.title + ' 회의의 ' + coalesce(a.topic, '안건') + '에서 도출된 결정: ' + node.content AS graph_context"""
+
+_AGENDA_PROJECTION = """
+MATCH (:User {id: $user_id})-[:PARTICIPATED_IN]->(m:Meeting)-[:CONTAINS]->(node)""" + _HYBRID_DATE_FILTER + """
+RETURN node.id AS id, node.topic AS title, coalesce(node.description, node.topic) AS content,
+       m.status AS status, node.created_at AS created_at, m.id AS meeting_id, m.title AS meeting_title, score,
+       m.title + ' 회의의 안건: ' + node.topic AS graph_context"""
+
+_MEETING_PROJECTION = """
+MATCH (:User {id: $user_id})-[:PARTICIPATED_IN]->(node)
+WHERE ($start_date IS NULL OR node.scheduled_at >= datetime($start_date))
+  AND ($end_date IS NULL OR node.scheduled_at <= datetime($end_date))
+RETURN node.id AS id, node.title AS title, coalesce(node.summary, node.title) AS content,
+       node.status AS status, node.scheduled_at AS created_at, node.id AS meeting_id,
+       node.title AS meeting_title, score,
+       '회의: ' + node.title AS graph_context"""
+
+
+# 벡터 인덱스는 사용자 필터 이전에 top-k를 고르므로 후보를 넉넉히 조회
+_VECTOR_OVERFETCH = 4
+
+
+async def execute_hybrid_search_async(
+    query: str,
+    user_id: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    top_k: int | None = None,
+    alpha: float | None = None,
+) -> list[dict]:
+    """fulltext(BM25) + 벡터 인덱스(ANN) 결과를 점수 결합하여 반환.
+
+    Decision/Meeting fulltext 인덱스와 Decision/Agenda/Meeting 벡터 인덱스를
+    동시에 조회합니다. 임베딩을 만들 수 없으면 BM25 결과만 사용합니다.
+    모든 경로는 user_id가 참여한 회의의 노드로 한정됩니다.
+
+    Args:
+        query: 자연어 검색어
+        user_id: 검색 사용자 ID (참여 회의 범위 제한)
+        start_date: 시작 일시 (ISO, 선택)
+        end_date: 종료 일시 (ISO, 선택)
+        top_k: 경로별 후보 수 (기본: settings.hybrid_search_top_k)
+        alpha: 벡터 점수 가중치 (기본: settings.hybrid_search_alpha)
+
+    Returns:
+        결합 점수 내림차순 결과 리스트
+    """
+    from app.core.config import get_settings
+    from app.core.neo4j import get_neo4j_driver
+    from app.infrastructure.context.embedding import TopicEmbedder
+    from app.infrastructure.graph.integration.neo4j_vector import query_vector_index
+
+    from ..utils.hybrid_fusion import fuse_hybrid_results
+
+    settings = get_settings()
+    top_k = top_k or settings.hybrid_search_top_k
+    alpha = settings.hybrid_search_alpha if alpha is None else alpha
+    driver = get_neo4j_driver()
+    params = {
+        "query": query,
+        "user_id": user_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "top_k": top_k,
+    }
+
+    async def _fulltext(index_name: str, projection: str) -> list[dict]:
+        cypher = (
+            f"CALL db.index.fulltext.queryNodes('{index_name}', $query)\n"
+            "YIELD node, score\n"
+            f"{projection}\n"
+            "ORDER BY score DESC\n"
+            "LIMIT $top_k"
+        )
+        async with driver.session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(cypher, params)
+            return await result.data()
+
+    async def _vector(label: str, projection: str, embedding: list[float]) -> list[dict]:
+        return await query_vector_index(
+            driver, label, embedding, top_k * _VECTOR_OVERFETCH, projection, parameters=params
+        )
+
+    embedder = TopicEmbedder()
+    query_embedding = await embedder.embed_text_async(query) if embedder.is_available else None
+
+    tasks = [
+        _fulltext("decision_search", _DECISION_PROJECTION),
+        _fulltext("meeting_search", _MEETING_PROJECTION),
+    ]
+    if query_embedding is not None:
+        embedding = query_embedding.tolist()
+        tasks += [
+            _vector("Decision", _DECISION_PROJECTION, embedding),
+            _vector("Agenda", _AGENDA_PROJECTION, embedding),
+            _vector("Meeting", _MEETING_PROJECTION, embedding),
+        ]
+
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    results: list[list[dict]] = []
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            logger.warning(f"Hybrid search branch failed: {outcome}")
+            results.append([])
+        else:
+            results.append(outcome)
+
+    bm25_results = results[0] + results[1]
+    vector_results = [row for branch in results[2:] for row in branch]
+    fused = fuse_hybrid_results(bm25_results, vector_results, alpha=alpha, limit=top_k)
+
+    logger.info(
+        f"Hybrid search returned {len(fused)} results "
+        f"(bm25={len(bm25_results)}, vector={len(vector_results)})"
+    )
+    return [_serialize_neo4j_types(record) for record in fused]
+
+
 def execute_cypher_search(cypher_query: str, parameters: dict[str, Any]) -> list[dict]:
     """
     Neo4j에 대해 파라미터와 함께 Cypher 쿼리 실행 (동기 래퍼).
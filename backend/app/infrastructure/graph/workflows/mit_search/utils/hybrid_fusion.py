@@ -0,0 +1,109 @@
+"""BM25(fulltext) + 벡터 점수 결합 (hybrid 검색)"""
+
+from typing import Any
+
+
+def normalize_bm25_scores(results: list[dict[str, Any]]) -> dict[str, float]:
+    """Lucene BM25 점수를 최대값 기준 0~1로 정규화 (id → 점수)"""
+    scores: dict[str, float] = {}
+    for result in results:
+        result_id = result.get("id")
+        if result_id is None:
+            continue
+        scores[result_id] = max(scores.get(result_id, 0.0), float(result.get("score") or 0.0))
+
+    top = max(scores.values(), default=0.0)
+    if top <= 0:
+        return {result_id: 0.0 for result_id in scores}
+    return {result_id: score / top for result_id, score in scores.items()}
+
+
+def fuse_hybrid_results(
+    bm25_results: list[dict[str, Any]],
+    vector_results: list[dict[str, Any]],
+    alpha: float = 0.5,
+    limit: int = 20,
+) -> list[dict[str, Any]]:
+    """BM25 결과와 벡터 결과를 id 기준으로 합쳐 가중 점수로 정렬
+
+    최종 점수 = alpha * 벡터 + (1 - alpha) * 정규화 BM25.
+    한쪽에만 있는 결과는 다른 쪽 점수를 0으로 간주합니다.
+
+    Args:
+        bm25_results: fulltext 검색 결과 (score: Lucene BM25)
+        vector_results: 벡터 검색 결과 (score: Neo4j cosine, 0~1)
+        alpha: 벡터 점수 가중치 (0~1)
+        limit: 최대 결과 수
+
+    Returns:
+        score/bm25_score/vector_score가 채워진 결과 리스트 (점수 내림차순)
+    """
+    alpha = min(max(alpha, 0.0), 1.0)
+    bm25_scores = normalize_bm25_scores(bm25_results)
+
+    vector_scores: dict[str, float] = {}
+    for result in vector_results:
+        result_id = result.get("id")
+        if result_id is None:
+            continue
+        vector_scores[result_id] = max(
+            vector_scores.get(result_id, 0.0), float(result.get("score") or 0.0)
+        )
+
+    # BM25 결과 행을 우선 사용 (fulltext 쪽이 graph_context가 더 구체적)
+    rows: dict[str, dict[str, Any]] = {}
+    for result in [*bm25_results, *vector_results]:
+        result_id = result.get("id")
+        if result_id is not None and result_id not in rows:
+            rows[result_id] = result
+
+    fused = []
+    for result_id, row in rows.items():
+        bm25_score = bm25_scores.get(result_id, 0.0)
+        vector_score = vector_scores.get(result_id, 0.0)
+        fused.append({
+            **row,
+            "score": alpha * vector_score + (1 - alpha) * bm25_score,
+            "bm25_score": bm25_score,
+            "vector_score": vector_score,
+        })
+
+    fused.sort(key=lambda item: item["score"], reverse=True)
+    return fused[:limit]
+
+
+def merge_candidate_sets(
+    *candidate_sets: list[dict[str, Any]],
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """여러 검색 경로의 후보를 id 기준으로 합침 (리랭커 입력용)
+
+    같은 id는 먼저 나온 행을 유지하고 점수는 최대값을 사용합니다.
+    앞쪽 인자의 경로일수록 의도에 더 맞는 결과라고 보고 순서를 보존합니다.
+    id가 없는 행은 그대로 포함합니다.
+
+    Args:
+        candidate_sets: 경로별 결과 리스트 (우선순위 순)
+        limit: 최대 후보 수 (None이면 전체)
+
+    Returns:
+        중복 제거된 후보 리스트
+    """
+    rows: dict[Any, dict[str, Any]] = {}
+    anonymous: list[dict[str, Any]] = []
+    for candidates in candidate_sets:
+        for result in candidates or []:
+            result_id = result.get("id")
+            if result_id is None:
+                anonymous.append(result)
+                continue
+            existing = rows.get(result_id)
+            if existing is None:
+                rows[result_id] = dict(result)
+                continue
+            score = float(result.get("score") or 0.0)
+            if score > float(existing.get("score") or 0.0):
+                existing["score"] = score
+
+    merged = [*rows.values(), *anonymous]
+    return merged if limit is None else merged[:limit]
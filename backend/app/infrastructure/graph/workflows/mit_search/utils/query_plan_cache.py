@@ -0,0 +1,90 @@
+"""컴파일된 Cypher plan 캐시 (쿼리 형태 → Cypher)
+
+값은 모두 $파라미터로 바인딩되므로 (intent, focus, 필터 형태)가 같으면
+같은 Cypher를 재사용할 수 있습니다. 반복되는 형태는 템플릿 조립/LLM 호출 없이
+바로 실행됩니다.
+"""
+
+import logging
+import re
+from collections import OrderedDict
+
+from app.core.telemetry import get_mit_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PLANS = 256
+
+# Cypher 생성 경로 (LLM 우회율 = 1 - llm / 전체)
+SOURCE_PLAN_CACHE = "plan_cache"
+SOURCE_TEMPLATE = "template"
+SOURCE_HYBRID = "hybrid"
+SOURCE_LLM = "llm"
+SOURCE_FALLBACK = "fallback"
+
+_QUOTED_LITERAL = re.compile(r"'[^']*'|\"[^\"]*\"")
+_USER_ID_PARAM = re.compile(r"\$user_id\b")
+
+
+def is_reusable_llm_cypher(cypher: str) -> bool:
+    """LLM Cypher를 형태 키로 다른 질의에 재사용해도 되는지 검사.
+
+    plan 키에는 사용자/날짜/엔티티 값이 없고, LLM 프롬프트에는 사용자 ID와 날짜가 포함되므로
+    문자열 리터럴이 하나라도 있으면 재사용하지 않습니다. $user_id로 범위가 제한된 Cypher만 허용합니다.
+    """
+    return bool(_USER_ID_PARAM.search(cypher)) and _QUOTED_LITERAL.search(cypher) is None
+
+
+class QueryPlanCache:
+    """형태 키 기반 LRU Cypher 캐시 + 생성 경로 통계"""
+
+    def __init__(self, max_plans: int = DEFAULT_MAX_PLANS):
+        self.max_plans = max_plans
+        self._plans: OrderedDict[tuple, tuple[str, str]] = OrderedDict()
+        self._source_counts: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self, key: tuple) -> tuple[str, str] | None:
+        """(cypher, strategy) 반환 (없으면 None)"""
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+        return plan
+
+    def put(self, key: tuple, cypher: str, strategy: str) -> None:
+        self._plans[key] = (cypher, strategy)
+        self._plans.move_to_end(key)
+        while len(self._plans) > self.max_plans:
+            self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        self._plans.clear()
+        self._source_counts.clear()
+
+    def record_source(self, source: str) -> None:
+        """Cypher 생성 경로 기록 (메트릭 + 프로세스 내 통계)"""
+        self._source_counts[source] = self._source_counts.get(source, 0) + 1
+        metrics = get_mit_metrics()
+        if metrics:
+            metrics.search_cypher_source_total.add(1, {"source": source})
+
+    @property
+    def bypass_rate(self) -> float:
+        """LLM을 거치지 않은 비율 (0~1)"""
+        total = sum(self._source_counts.values())
+        if total == 0:
+            return 0.0
+        return 1.0 - self._source_counts.get(SOURCE_LLM, 0) / total
+
+
+_plan_cache: QueryPlanCache | None = None
+
+
+def get_query_plan_cache() -> QueryPlanCache:
+    """프로세스 전역 plan 캐시 반환"""
+    global _plan_cache
+    if _plan_cache is None:
+        _plan_cache = QueryPlanCache()
+    return _plan_cache
@@ -1,8 +1,11 @@
 """Recency score 계산을 위한 유틸리티 함수."""
 
 import logging
+import math
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +113,37 @@ def calculate_recency_score(
         return _stepped_decay(days_ago)
 
 
+def calculate_recency_scores(
+    results: List[Dict[str, Any]],
+    reference_date: Optional[datetime] = None,
+    half_life: float = 90.0,
+) -> np.ndarray:
+    """검색 결과 목록의 최신성 점수를 한 번에 계산 (지수 감쇠).
+
+    calculate_recency_score(..., decay_function="exponential")와 같은 규칙을
+    배열 연산으로 적용합니다. 날짜 없음: 0.5, 미래 날짜: 1.0.
+
+    Args:
+        results: 검색 결과 리스트
+        reference_date: 기준 날짜 (기본값: 현재 시각)
+        half_life: 반감기 (일)
+
+    Returns:
+        결과 순서와 같은 (N,) 점수 배열
+    """
+    reference_ts = (reference_date or datetime.now()).timestamp()
+    timestamps = np.full(len(results), np.nan)
+    for i, result in enumerate(results):
+        parsed = extract_date_from_result(result)
+        if parsed is not None:
+            timestamps[i] = parsed.timestamp()
+
+    days_ago = (reference_ts - timestamps) / 86400
+    scores = np.clip(np.exp(-math.log(2) / half_life * days_ago), 0.1, 1.0)
+    scores = np.where(days_ago < 0, 1.0, scores)
+    return np.where(np.isnan(timestamps), 0.5, scores)
+
+
 def _stepped_decay(days_ago: float) -> float:
     """단계별 감쇠 함수.
 
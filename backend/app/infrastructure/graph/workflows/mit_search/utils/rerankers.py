@@ -0,0 +1,273 @@
+"""MIT Search 리랭커 구현 및 지연 기반 선택 정책
+
+- LexicalReranker: 후보 집합 내 BM25 + result_scorer 신호(엔티티/최신성)로 계산하는 CPU 리랭커
+- ClovaReranker: CLOVA Studio Reranker API (풀링 클라이언트)
+- LatencyAwareRerankerPolicy: 원격 리랭커의 최근 응답 시간이 예산을 넘으면 로컬로 대체,
+  원격 호출이 예산을 넘기거나 실패해도 로컬 결과로 응답
+
+모든 리랭커는 후보 순서와 같은 0~1 점수 리스트를 반환합니다.
+"""
+
+import asyncio
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any, Optional, Protocol
+
+from app.core.config import get_settings
+from app.core.telemetry import get_mit_metrics
+
+from .recency_calculator import calculate_recency_scores
+from .result_scorer import SearchResultRelevanceScorer
+
+logger = logging.getLogger(__name__)
+
+BACKEND_LOCAL = "local"
+BACKEND_REMOTE = "remote"
+
+MAX_DOCUMENT_CHARS = 4096  # Clova Reranker 문서 길이 제한
+
+# 원격 리랭커 지연 판단
+LATENCY_PERCENTILE = 0.9
+MIN_LATENCY_SAMPLES = 5
+REMOTE_PROBE_INTERVAL = 10  # 원격을 건너뛰는 중에도 N번에 한 번은 원격으로 지연 재측정
+
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+def candidate_text(result: dict[str, Any]) -> str:
+    """리랭크 대상 텍스트 (graph_context 우선)"""
+    text = result.get("graph_context") or f"{result.get('title', '')} {result.get('content', '')}"
+    return text[:MAX_DOCUMENT_CHARS]
+
+
+def tokenize(text: str) -> list[str]:
+    """단어 + 문자 bigram 토큰 (조사가 붙은 한국어 어절도 부분 일치하도록)"""
+    tokens: list[str] = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        tokens.append(word)
+        if len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class Reranker(Protocol):
+    """리랭커 인터페이스"""
+
+    name: str
+
+    async def rerank(
+        self, query: str, candidates: list[dict[str, Any]], query_intent: dict[str, Any]
+    ) -> Optional[list[float]]:
+        """후보 순서와 같은 0~1 점수 리스트 반환 (실패 시 None)"""
+        ...
+
+
+class LexicalReranker:
+    """후보 집합을 코퍼스로 한 BM25 + 엔티티/최신성 신호 리랭커 (외부 호출 없음)"""
+
+    name = BACKEND_LOCAL
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def bm25_scores(self, query: str, texts: list[str]) -> list[float]:
+        """후보 텍스트별 BM25 점수 (최대값 기준 0~1 정규화)"""
+        query_terms = set(tokenize(query))
+        docs = [Counter(tokenize(text)) for text in texts]
+        if not query_terms or not docs:
+            return [0.0] * len(texts)
+
+        doc_count = len(docs)
+        avg_len = sum(sum(doc.values()) for doc in docs) / doc_count or 1.0
+        doc_freq = {term: sum(1 for doc in docs if term in doc) for term in query_terms}
+
+        scores = []
+        for doc in docs:
+            doc_len = sum(doc.values())
+            score = 0.0
+            for term in query_terms:
+                tf = doc.get(term, 0)
+                if not tf:
+                    continue
+                idf = math.log(1 + (doc_count - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+                score += idf * tf * (self.k1 + 1) / (
+                    tf + self.k1 * (1 - self.b + self.b * doc_len / avg_len)
+                )
+            scores.append(score)
+
+        top = max(scores)
+        return [score / top if top > 0 else 0.0 for score in scores]
+
+    @staticmethod
+    def _entity_score(result: dict[str, Any], entity: Optional[str]) -> float:
+        if not entity:
+            return 1.0
+        entity = entity.lower()
+        for field in ("name", "title", "assignee", "member", "username", "user", "content", "graph_context"):
+            if entity in str(result.get(field) or "").lower():
+                return 1.0
+        return 0.3
+
+    def score(
+        self, query: str, candidates: list[dict[str, Any]], query_intent: dict[str, Any]
+    ) -> list[float]:
+        """동기 점수 계산 (SearchResultRelevanceScorer의 focus별 가중치 사용)"""
+        if not candidates:
+            return []
+
+        weights = SearchResultRelevanceScorer.FOCUS_SPECIFIC_WEIGHTS.get(
+            query_intent.get("search_focus"), SearchResultRelevanceScorer.DEFAULT_WEIGHTS
+        )
+        # 임베딩 신호(semantic_similarity)는 원격 리랭커 몫이므로 키워드 가중치로 합산
+        lexical_weight = weights["keyword_match"] + weights["semantic_similarity"]
+        entity_weight = weights["entity_presence"]
+        recency_weight = weights["recency"]
+        total_weight = lexical_weight + entity_weight + recency_weight
+
+        entity = query_intent.get("primary_entity")
+        lexical = self.bm25_scores(query, [candidate_text(result) for result in candidates])
+        recency = calculate_recency_scores(candidates)
+        return [
+            float(
+                lexical_weight * lexical[i]
+                + entity_weight * self._entity_score(result, entity)
+                + recency_weight * recency[i]
+            ) / total_weight
+            for i, result in enumerate(candidates)
+        ]
+
+    async def rerank(
+        self, query: str, candidates: list[dict[str, Any]], query_intent: dict[str, Any]
+    ) -> Optional[list[float]]:
+        return self.score(query, candidates, query_intent)
+
+
+class ClovaReranker:
+    """CLOVA Studio Reranker API 리랭커"""
+
+    name = BACKEND_REMOTE
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            from app.infrastructure.graph.integration.clova_reranker import get_reranker_client
+
+            return get_reranker_client()
+        return self._client
+
+    async def rerank(
+        self, query: str, candidates: list[dict[str, Any]], query_intent: dict[str, Any]
+    ) -> Optional[list[float]]:
+        documents = [
+            {"id": str(i), "doc": candidate_text(result)}
+            for i, result in enumerate(candidates)
+        ]
+        ranked = await self.client.rerank(query, documents)
+        if ranked is None:
+            return None
+
+        # Clova API 응답 형식에 따라 id/score 필드명이 다를 수 있음
+        score_map: dict[str, float] = {}
+        for item in ranked:
+            doc_id = str(item.get("id", item.get("index", "")))
+            score = item.get("score", item.get("relevance_score", item.get("rank_score", 0)))
+            score = float(score or 0)
+            # 0~1 범위가 아니면 정규화
+            score_map[doc_id] = min(1.0, score / 100) if score > 1 else score
+        return [score_map.get(str(i), 0.0) for i in range(len(candidates))]
+
+
+class LatencyAwareRerankerPolicy:
+    """원격 리랭커 지연 통계를 보고 원격/로컬을 선택"""
+
+    def __init__(
+        self,
+        remote: Reranker,
+        local: Reranker,
+        mode: str = "auto",
+        budget_ms: int = 800,
+    ):
+        self.remote = remote
+        self.local = local
+        self.mode = mode
+        self.budget_ms = budget_ms
+        self._skipped = 0
+
+    def should_try_remote(self) -> bool:
+        """auto 모드: 최근 p90 응답 시간이 예산 안이면 원격 사용"""
+        if self.mode == BACKEND_LOCAL:
+            return False
+        client = getattr(self.remote, "client", None)
+        if client is not None and not client.is_available:
+            return False
+        if self.mode == BACKEND_REMOTE or client is None:
+            return True
+        if client.sample_count < MIN_LATENCY_SAMPLES:
+            return True
+
+        p90 = client.latency_percentile(LATENCY_PERCENTILE)
+        if p90 is None or p90 * 1000 <= self.budget_ms:
+            self._skipped = 0
+            return True
+
+        # 느린 상태가 굳어지지 않도록 주기적으로 원격을 다시 측정
+        self._skipped += 1
+        if self._skipped >= REMOTE_PROBE_INTERVAL:
+            self._skipped = 0
+            return True
+        return False
+
+    async def rerank(
+        self, query: str, candidates: list[dict[str, Any]], query_intent: dict[str, Any]
+    ) -> tuple[list[float], str]:
+        """(점수 리스트, 사용한 백엔드) 반환. 원격 실패/예산 초과 시 로컬로 대체."""
+        if self.should_try_remote():
+            # remote 모드는 예산 없이 클라이언트 타임아웃까지 기다림
+            timeout = self.budget_ms / 1000 if self.mode != BACKEND_REMOTE else None
+            try:
+                scores = await asyncio.wait_for(
+                    self.remote.rerank(query, candidates, query_intent),
+                    timeout=timeout,
+                )
+                if scores is not None:
+                    _record(BACKEND_REMOTE, "ok")
+                    return scores, BACKEND_REMOTE
+                _record(BACKEND_REMOTE, "error")
+            except asyncio.TimeoutError:
+                _record(BACKEND_REMOTE, "timeout")
+                logger.info(f"[Reranking] 원격 리랭커 예산 초과 ({self.budget_ms}ms) → 로컬")
+        else:
+            _record(BACKEND_REMOTE, "skipped")
+
+        scores = await self.local.rerank(query, candidates, query_intent)
+        _record(BACKEND_LOCAL, "ok")
+        return scores or [0.0] * len(candidates), BACKEND_LOCAL
+
+
+def _record(backend: str, result: str) -> None:
+    metrics = get_mit_metrics()
+    if metrics:
+        metrics.search_reranker_requests_total.add(1, {"backend": backend, "result": result})
+
+
+_reranker_policy: Optional[LatencyAwareRerankerPolicy] = None
+
+
+def get_reranker_policy() -> LatencyAwareRerankerPolicy:
+    """프로세스 전역 리랭커 정책 반환 (원격 클라이언트는 이벤트 루프별로 조회)"""
+    global _reranker_policy
+    if _reranker_policy is None:
+        settings = get_settings()
+        _reranker_policy = LatencyAwareRerankerPolicy(
+            remote=ClovaReranker(),
+            local=LexicalReranker(),
+            mode=settings.reranker_mode,
+            budget_ms=settings.reranker_latency_budget_ms,
+        )
+    return _reranker_policy
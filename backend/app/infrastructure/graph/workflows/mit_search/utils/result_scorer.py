@@ -1,11 +1,17 @@
-"""검색 결과의 관련성 점수 계산 (Semantic + Intent-Aware)"""
+"""검색 결과의 관련성 점수 계산 (Semantic + Intent-Aware)
+
+후보 목록에서 신호별 특징 배열을 한 번에 추출하고 (본문 임베딩은 배치 1회),
+가중 합을 행렬 연산으로 계산합니다.
+"""
 
 import logging
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 
-from .recency_calculator import calculate_recency_score, extract_date_from_result
+from app.infrastructure.cache.embedding_cache import EmbeddingCache, get_embedding_cache
+
+from .recency_calculator import calculate_recency_scores
 
 logger = logging.getLogger(__name__)
 
@@ -47,14 +53,16 @@ class SearchResultRelevanceScorer:
         "rank_position": 0.15,
     }
 
-    def __init__(self, embedding_model=None):
+    def __init__(self, embedding_model=None, embedding_cache: Optional[EmbeddingCache] = None):
         """초기화
 
         Args:
             embedding_model: SentenceTransformer 등의 임베딩 모델 (선택)
+            embedding_cache: 임베딩 캐시 (기본: 글로벌 캐시)
         """
         self.weights = self.DEFAULT_WEIGHTS.copy()
         self.embedding_model = embedding_model
+        self.embedding_cache = embedding_cache or get_embedding_cache()
 
     def get_adaptive_weights(self, search_focus: Optional[str]) -> Dict[str, float]:
         """Focus에 맞는 적응형 가중치 반환"""
@@ -96,21 +104,10 @@ class SearchResultRelevanceScorer:
         # Focus에 맞게 가중치 적응
         adaptive_weights = self.get_adaptive_weights(search_focus)
 
-        scores = []
-        for idx, result in enumerate(results):
-            item_score = self._score_single_result(
-                result,
-                idx,
-                len(results),
-                expected_entity,
-                search_focus,
-                query,
-                adaptive_weights,
-            )
-            scores.append(item_score)
+        total_scores = self._score_batch(results, query, expected_entity, adaptive_weights)
 
         # 상위 5개 결과 기준으로 평가
-        top_scores = [s["total_score"] for s in scores[:5]]
+        top_scores = total_scores[:5].tolist()
         overall_score = sum(top_scores) / len(top_scores) if top_scores else 0
 
         assessment = self._assess_quality(overall_score, len(results))
@@ -126,11 +123,7 @@ class SearchResultRelevanceScorer:
             },
         )
 
-        average_score = (
-            sum(item["total_score"] for item in scores) / len(scores)
-            if scores
-            else 0.0
-        )
+        average_score = float(total_scores.mean())
 
         return {
             "quality_score": round(overall_score, 2),
@@ -145,60 +138,56 @@ class SearchResultRelevanceScorer:
             },
         }
 
-    def _score_single_result(
+    def _extract_features(
         self,
-        result: Dict[str, Any],
-        position: int,
-        total_results: int,
-        expected_entity: Optional[str],
-        search_focus: Optional[str],
+        results: List[Dict[str, Any]],
         query: str,
-        weights: Dict[str, float],
-    ) -> Dict[str, Any]:
-        """단일 결과의 점수 계산"""
-
-        scores = {}
-
-        # 1. Keyword Match score (FULLTEXT 스코어)
-        keyword_score = min(result.get("score", 0) / 10, 1.0)  # Normalize
-        scores["keyword_match"] = keyword_score * weights.get("keyword_match", 0.25)
-
-        # 2. Semantic Similarity (의미적 유사도)
-        semantic_score = self._calculate_semantic_similarity(result, query)
-        scores["semantic_similarity"] = semantic_score * weights.get("semantic_similarity", 0.35)
-
-        # 3. Entity presence (예상 엔티티 포함 여부)
-        entity_score = self._check_entity_presence(result, expected_entity)
-        scores["entity_presence"] = entity_score * weights.get("entity_presence", 0.15)
-
-        # 4. Recency (최신성, Focus 기반으로 조정됨)
-        recency_score = self._calculate_recency(result)
-        scores["recency"] = recency_score * weights.get("recency", 0.1)
-
-        # 5. Rank position (결과 내 위치)
-        rank_score = 1 - (position / total_results) if total_results > 0 else 1
-        scores["rank_position"] = rank_score * weights.get("rank_position", 0.15)
-
-        # Intent alignment 고려 (결과가 실제로 content를 포함하는지)
-        intent_alignment = result.get("intent_alignment", 0.8)
+        expected_entity: Optional[str],
+    ) -> Dict[str, np.ndarray]:
+        """결과 목록에서 신호별 (N,) 특징 배열 추출 (가중치 미적용, 0~1)"""
+        count = len(results)
+        fulltext = np.array([float(r.get("score") or 0) for r in results], dtype=np.float32)
 
-        total_score = sum(scores.values())
+        return {
+            # 1. Keyword Match score (FULLTEXT 스코어 정규화)
+            "keyword_match": np.minimum(fulltext / 10, 1.0),
+            # 2. Semantic Similarity (배치 임베딩 + 행렬 코사인)
+            "semantic_similarity": self._calculate_semantic_similarities(results, query),
+            # 3. Entity presence (예상 엔티티 포함 여부)
+            "entity_presence": np.array(
+                [self._check_entity_presence(r, expected_entity) for r in results],
+                dtype=np.float32,
+            ),
+            # 4. Recency (최신성)
+            "recency": calculate_recency_scores(results).astype(np.float32),
+            # 5. Rank position (결과 내 위치)
+            "rank_position": 1 - np.arange(count, dtype=np.float32) / count,
+        }
 
-        # Intent alignment가 낮으면 페널티 적용
-        if intent_alignment < 0.3:
-            total_score *= 0.5
-        elif intent_alignment < 0.6:
-            total_score *= 0.8
-        # else: 패널티 없음 (intent_alignment >= 0.6)
+    def _score_batch(
+        self,
+        results: List[Dict[str, Any]],
+        query: str,
+        expected_entity: Optional[str],
+        weights: Dict[str, float],
+    ) -> np.ndarray:
+        """결과 목록의 종합 점수 (N,) 계산 (0-100 scale)"""
+        features = self._extract_features(results, query, expected_entity)
+        names = list(self.DEFAULT_WEIGHTS)
+        matrix = np.stack([features[name] for name in names], axis=1)
+        weight_vector = np.array(
+            [weights.get(name, self.DEFAULT_WEIGHTS[name]) for name in names],
+            dtype=np.float32,
+        )
+        total = matrix @ weight_vector
 
-        total_score = min(total_score, 1.0)  # Cap at 1.0
+        # Intent alignment가 낮으면 페널티 적용 (결과가 실제로 content를 포함하는지)
+        alignment = np.array(
+            [float(r.get("intent_alignment", 0.8)) for r in results], dtype=np.float32
+        )
+        total = total * np.select([alignment < 0.3, alignment < 0.6], [0.5, 0.8], 1.0)
 
-        return {
-            "position": position,
-            "component_scores": scores,
-            "intent_alignment": intent_alignment,
-            "total_score": total_score * 100,  # 0-100 scale
-        }
+        return np.minimum(total, 1.0) * 100  # Cap at 1.0, 0-100 scale
 
     def _check_entity_presence(
         self, result: Dict[str, Any], expected_entity: Optional[str]
@@ -216,48 +205,58 @@ class SearchResultRelevanceScorer:
 
         return 0.3  # 엔티티 미발견 시 부분 점수
 
-    def _calculate_semantic_similarity(self, result: Dict[str, Any], query: str) -> float:
-        """쿼리와 결과의 의미적 유사도 계산 (임베딩 기반)
+    def _calculate_semantic_similarities(
+        self, results: List[Dict[str, Any]], query: str
+    ) -> np.ndarray:
+        """쿼리와 결과들의 의미적 유사도 (N,) 계산
+
+        결과 본문(그래프 맥락 우선)은 캐시 미스만 모아 한 번에 임베딩합니다.
+        내용이 없는 결과는 0.3, 모델이 없거나 실패하면 0.0.
         """
+        count = len(results)
         if not self.embedding_model:
-            return 0.0
+            return np.zeros(count, dtype=np.float32)
 
+        contents = [r.get("graph_context") or r.get("content", "") for r in results]
         try:
-            # 쿼리 임베딩
-            query_embedding = self.embedding_model.encode(query)
-
-            # 결과 본문 임베딩 (그래프 맥락 우선)
-            content = result.get("graph_context") or result.get("content", "")
-            if not content:
-                return 0.3  # 내용이 없으면 낮은 점수
-
-            content_embedding = self.embedding_model.encode(content)
+            texts = list(dict.fromkeys([query, *(c for c in contents if c)]))
+            vectors = dict(zip(texts, self._encode_many(texts)))
 
-            # 코사인 유사도
-            similarity = self._cosine_similarity(query_embedding, content_embedding)
-            return float(similarity)
+            query_vector = vectors[query]
+            content_matrix = np.stack(
+                [vectors[c] if c else np.zeros_like(query_vector) for c in contents]
+            )
+            norms = np.linalg.norm(content_matrix, axis=1) * np.linalg.norm(query_vector)
+            dots = content_matrix @ query_vector
+            similarities = np.divide(
+                dots, norms, out=np.zeros(count, dtype=np.float32), where=norms > 0
+            )
         except Exception as e:
             logger.warning(f"Semantic similarity calculation failed: {e}")
-            return 0.0
+            return np.zeros(count, dtype=np.float32)
 
-    def _cosine_similarity(self, vec1, vec2) -> float:
-        """코사인 유사도 계산"""
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        return float(np.dot(vec1, vec2) / (norm1 * norm2))
+        empty = np.array([not c for c in contents])
+        return np.where(empty, 0.3, similarities).astype(np.float32)
 
-    def _calculate_recency(self, result: Dict[str, Any]) -> float:
-        """문서의 최신성 계산
-
-        최근 3개월: 1.0, 6개월: 0.7, 1년: 0.5, 그 외: 0.3
-        """
-        parsed_date = extract_date_from_result(result)
-        if not parsed_date:
-            return 0.5
-
-        return calculate_recency_score(parsed_date)
+    def _encode_many(self, texts: List[str]) -> List[np.ndarray]:
+        """임베딩 캐시를 거쳐 여러 텍스트를 인코딩 (미스는 모델 1회 호출)"""
+        model_name = getattr(
+            self.embedding_model, "model_name", type(self.embedding_model).__name__
+        )
+        vectors = [self.embedding_cache.get_local(model_name, text) for text in texts]
+        missing = [text for text, vector in zip(texts, vectors) if vector is None]
+        if missing:
+            encoded = np.asarray(self.embedding_model.encode(missing), dtype=np.float32)
+            if encoded.ndim == 1:
+                encoded = encoded.reshape(len(missing), -1)
+            fetched = dict(zip(missing, encoded))
+            for text, vector in fetched.items():
+                self.embedding_cache.put_local(model_name, text, vector)
+            vectors = [
+                vector if vector is not None else fetched[text]
+                for text, vector in zip(texts, vectors)
+            ]
+        return vectors
 
     def _assess_quality(self, score: float, result_count: int) -> str:
         """점수 기반 품질 평가"""
@@ -2,6 +2,8 @@
 
 import logging
 
+from app.core.config import get_settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +23,7 @@ class SearchStrategyRouter:
         - High confidence (>0.7): Text-to-Cypher만
         - Medium confidence (0.4-0.7): Text-to-Cypher + Template Fallback
         - Low confidence (<0.4): Template-based 우선
+        - 벡터 인덱스 활성화 + 인물 조건 없는 내용 검색: Hybrid (BM25 + 벡터, LLM 생략)
 
         Args:
             query_intent: query_intent_analyzer 출력 (intent_type, primary_entity, search_focus)
@@ -30,7 +33,7 @@ class SearchStrategyRouter:
 
         Returns:
             {
-                "strategy": "text_to_cypher" | "template_based",
+                "strategy": "text_to_cypher" | "template_based" | "hybrid_search",
                 "search_term": "원본 쿼리",
                 "reasoning": "전략 선택 이유",
                 "use_fallback": True/False,
@@ -56,7 +59,22 @@ class SearchStrategyRouter:
                 "primary_entity": primary_entity,
             }
 
-        # 🎯 Case 2: 높은 신뢰도 → Text-to-Cypher만
+        # 🎯 Case 2: 내용 기반 검색 (표현이 달라도 벡터로 매칭) → Hybrid
+        if get_settings().kg_vector_index_enabled and _is_content_pattern(
+            intent_type, search_focus, primary_entity
+        ):
+            return {
+                "strategy": "hybrid_search",
+                "search_term": original_query,
+                "reasoning": "Content query - Hybrid (BM25 + vector) 검색",
+                "use_fallback": False,
+                "confidence": confidence,
+                "intent_type": intent_type,
+                "search_focus": search_focus,
+                "primary_entity": primary_entity,
+            }
+
+        # 🎯 Case 3: 높은 신뢰도 → Text-to-Cypher만
         if confidence > 0.7:
             return {
                 "strategy": "text_to_cypher",
@@ -66,7 +84,7 @@ class SearchStrategyRouter:
                 "confidence": confidence
             }
 
-        # 🎯 Case 3: 중간/낮은 신뢰도 → LLM 시도 + Template Fallback
+        # 🎯 Case 4: 중간/낮은 신뢰도 → LLM 시도 + Template Fallback
         return {
             "strategy": "text_to_cypher",
             "search_term": original_query,
@@ -91,6 +109,22 @@ def _is_simple_pattern(intent_type: str, search_focus: str, primary_entity: str)
     return False
 
 
+# Hybrid 검색 대상 (벡터 인덱스가 있는 노드)
+_HYBRID_FOCUSES = {None, "Decision", "Meeting", "Agenda"}
+
+
+def _is_content_pattern(intent_type: str, search_focus: str, primary_entity: str) -> bool:
+    """내용 기반 검색 감지 (Hybrid 검색으로 충분한 경우)
+
+    인물/관계 조건이 있으면 그래프 탐색이 필요하므로 Cypher 경로를 유지합니다.
+    """
+    if primary_entity:
+        return False
+    if intent_type not in ("general_search", "temporal_search"):
+        return False
+    return search_focus in _HYBRID_FOCUSES
+
+
 
 
 # 사용 예시
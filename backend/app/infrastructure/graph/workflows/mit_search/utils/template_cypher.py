@@ -6,6 +6,8 @@
 
 import logging
 
+from .temporal_extractor import ContextAwareTemporalExtractor
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +21,51 @@ def _clean_search_term(search_term: str, entity: str) -> str:
     return search_term.replace(entity, "").strip()
 
 
+def _effective_search_term(
+    intent_type: str,
+    primary_entity: str,
+    keywords: list = None,
+    search_term: str = None,
+) -> str:
+    """keywords 우선, 없으면 (엔티티 이름을 뺀) search_term."""
+    if keywords and len(keywords) > 0:
+        return keywords[0]
+    if search_term:  # 하위 호환성
+        if intent_type == "entity_search" and primary_entity:
+            return _clean_search_term(search_term, primary_entity)
+        return search_term
+    return ""
+
+
+def _is_team_name(primary_entity: str) -> bool:
+    """팀 이름 패턴 감지 (하이픈, "팀" 문자열 포함 등)"""
+    return "-" in primary_entity or "팀" in primary_entity or "Team" in primary_entity
+
+
+def template_shape(
+    intent_type: str,
+    search_focus: str,
+    primary_entity: str,
+    keywords: list = None,
+    date_filter: dict = None,
+    search_term: str = None,
+) -> tuple:
+    """템플릿 선택에 영향을 주는 요소만 모은 쿼리 형태 (plan cache 키).
+
+    같은 shape이면 generate_template_cypher 결과가 동일합니다
+    (값은 모두 $파라미터로 바인딩).
+    """
+    effective = _effective_search_term(intent_type, primary_entity, keywords, search_term)
+    return (
+        intent_type,
+        search_focus,
+        bool(primary_entity),
+        bool(primary_entity) and _is_team_name(primary_entity),
+        bool(effective and effective.strip()),
+        bool(date_filter and date_filter.get("start") and date_filter.get("end")),
+    )
+
+
 def generate_template_cypher(
     intent_type: str,
     search_focus: str,
@@ -33,7 +80,11 @@ def generate_template_cypher(
     지원 패턴:
     1. Entity + Decision (옵션: 키워드, 날짜)
     2. Entity + Meeting (옵션: 키워드, 날짜)
-    3. Temporal + Decision (옵션: 키워드)
+    3. Entity + Membership / TeamMembers
+    4. Composite (담당자와 같은 팀원)
+    5. Temporal + Decision (옵션: 키워드)
+    6. Keyword + Decision / Meeting (옵션: 날짜)
+    7. Agenda / Action (옵션: 인물, 키워드)
 
     Args:
         keywords: 추가 검색 키워드 리스트 (primary_entity 제외)
@@ -43,11 +94,15 @@ def generate_template_cypher(
         Cypher 쿼리 또는 None (템플릿 없음)
     """
 
+    # start/end가 모두 있어야 날짜 필터로 간주 (template_shape와 동일 기준)
+    if not (date_filter and date_filter.get("start") and date_filter.get("end")):
+        date_filter = None
+
     # 1. 공통 조건절 조립 (Clause Builder)
     # -------------------------------------------------------
     # 날짜 필터 (모든 패턴에 공통 적용 가능)
     date_clause = ""
-    if date_filter and date_filter.get("start") and date_filter.get("end"):
+    if date_filter:
         # n은 쿼리 본문에서 대상 노드(Meeting 또는 Decision)로 alias 되어야 함
         date_clause = "AND target.created_at >= datetime($start_date) AND target.created_at <= datetime($end_date)"
 
@@ -56,13 +111,9 @@ def generate_template_cypher(
     team_keyword_clause = ""
 
     # keywords 리스트를 search_term으로 변환 (첫 번째 키워드 사용)
-    effective_search_term = None
-    if keywords and len(keywords) > 0:
-        effective_search_term = keywords[0]
-    elif search_term:  # 하위 호환성
-        effective_search_term = search_term
-        if intent_type == "entity_search" and primary_entity:
-            effective_search_term = _clean_search_term(search_term, primary_entity)
+    effective_search_term = _effective_search_term(
+        intent_type, primary_entity, keywords, search_term
+    )
 
     if effective_search_term and effective_search_term.strip():
         # 제목이나 내용에 키워드가 포함되어야 함
@@ -141,10 +192,7 @@ def generate_template_cypher(
 
     # Pattern 4: 팀원 검색 (팀 이름 또는 사용자 이름)
     if intent_type == "entity_search" and search_focus == "TeamMembers" and primary_entity:
-        # 팀 이름 패턴 감지 (하이픈, "팀" 문자열 포함 등)
-        is_team_name = "-" in primary_entity or "팀" in primary_entity or "Team" in primary_entity
-
-        if is_team_name:
+        if _is_team_name(primary_entity):
             # Pattern 4a: 팀 이름으로 직접 검색 (Team -> Members)
             cypher = f"""
             MATCH (team:Team)<-[:MEMBER_OF]-(member:User)
@@ -223,6 +271,124 @@ def generate_template_cypher(
         logger.info("[Template] Pattern 6: Temporal Decision")
         return cypher.strip()
 
+    # Pattern 7: 키워드 기반 결정사항 (인물 없음, 사용자가 참여한 회의 범위)
+    if (
+        intent_type in ("general_search", "temporal_search")
+        and search_focus == "Decision"
+        and not primary_entity
+        and effective_search_term
+    ):
+        cypher = f"""
+        MATCH (u:User {{id: $user_id}})-[:PARTICIPATED_IN]->(m:Meeting)-[:CONTAINS]->(a:Agenda)-[:HAS_DECISION]->(target:Decision)
+        WHERE (target.content CONTAINS $search_term OR target.context CONTAINS $search_term
+               OR a.topic CONTAINS $search_term)
+          {date_clause}
+        RETURN target.id AS id,
+               target.content AS content,
+               target.status AS status,
+               target.created_at AS created_at,
+               m.id AS meeting_id,
+               m.title AS meeting_title,
+               1.0 AS score,
+               m.title + ' 회의의 ' + a.topic + ' 안건에서 도출된 결정사항: ' + target.content AS graph_context
+        ORDER BY target.created_at DESC
+        LIMIT 20
+        """
+        logger.info("[Template] Pattern 7: Keyword Decision")
+        return cypher.strip()
+
+    # Pattern 8: 키워드/기간 기반 회의 (인물 없음, 사용자가 참여한 회의 범위)
+    if (
+        intent_type in ("general_search", "temporal_search")
+        and search_focus == "Meeting"
+        and not primary_entity
+        and (effective_search_term or date_filter)
+    ):
+        date_clause_meeting = ""
+        if date_filter and date_filter.get("start") and date_filter.get("end"):
+            date_clause_meeting = "AND target.scheduled_at >= datetime($start_date) AND target.scheduled_at <= datetime($end_date)"
+        keyword_clause_meeting = ""
+        if effective_search_term and effective_search_term.strip():
+            keyword_clause_meeting = "AND (target.title CONTAINS $search_term OR target.summary CONTAINS $search_term)"
+
+        cypher = f"""
+        MATCH (u:User {{id: $user_id}})-[:PARTICIPATED_IN]->(target:Meeting)
+        WHERE true
+          {date_clause_meeting}
+          {keyword_clause_meeting}
+        RETURN target.id AS id,
+               target.title AS title,
+               coalesce(target.summary, target.title) AS content,
+               target.status AS status,
+               target.scheduled_at AS created_at,
+               target.id AS meeting_id,
+               target.title AS meeting_title,
+               1.0 AS score,
+               '회의: ' + target.title AS graph_context
+        ORDER BY target.scheduled_at DESC
+        LIMIT 20
+        """
+        logger.info("[Template] Pattern 8: Keyword/Temporal Meeting")
+        return cypher.strip()
+
+    # Pattern 9: 안건 검색 (옵션: 인물, 키워드, 날짜)
+    if search_focus == "Agenda" and (primary_entity or effective_search_term or date_filter):
+        entity_clause = "AND u.name CONTAINS $entity_name" if primary_entity else "AND u.id = $user_id"
+        keyword_clause_agenda = ""
+        if effective_search_term and effective_search_term.strip():
+            keyword_clause_agenda = "AND (target.topic CONTAINS $search_term OR target.description CONTAINS $search_term)"
+
+        cypher = f"""
+        MATCH (u:User)-[:PARTICIPATED_IN]->(m:Meeting)-[:CONTAINS]->(target:Agenda)
+        WHERE true
+          {entity_clause}
+          {date_clause}
+          {keyword_clause_agenda}
+        RETURN DISTINCT target.id AS id,
+               target.topic AS title,
+               coalesce(target.description, target.topic) AS content,
+               m.status AS status,
+               target.created_at AS created_at,
+               m.id AS meeting_id,
+               m.title AS meeting_title,
+               1.0 AS score,
+               m.title + ' 회의의 안건: ' + target.topic AS graph_context
+        ORDER BY created_at DESC
+        LIMIT 20
+        """
+        logger.info(f"[Template] Pattern 9: Agenda (Entity={bool(primary_entity)})")
+        return cypher.strip()
+
+    # Pattern 10: 액션 아이템 검색 (옵션: 담당자, 키워드, 사용자가 참여한 회의 범위)
+    if search_focus == "Action" and (primary_entity or effective_search_term):
+        entity_clause = "AND u.name CONTAINS $entity_name" if primary_entity else ""
+        keyword_clause_action = ""
+        if effective_search_term and effective_search_term.strip():
+            keyword_clause_action = "AND target.content CONTAINS $search_term"
+
+        cypher = f"""
+        MATCH (me:User {{id: $user_id}})-[:PARTICIPATED_IN]->(m:Meeting)-[:CONTAINS]->(:Agenda)-[:HAS_DECISION]->(:Decision)-[:TRIGGERS]->(target:ActionItem)
+        MATCH (u:User)-[:ASSIGNED_TO]->(target)
+        WHERE true
+          {entity_clause}
+          {keyword_clause_action}
+        RETURN target.id AS id,
+               target.content AS title,
+               target.content AS content,
+               target.status AS status,
+               target.due_date AS created_at,
+               u.name AS assignee,
+               u.id AS assignee_id,
+               m.id AS meeting_id,
+               m.title AS meeting_title,
+               1.0 AS score,
+               'Action Item: ' + target.content + ' (담당자: ' + u.name + ', 상태: ' + target.status + ')' AS graph_context
+        ORDER BY target.due_date DESC
+        LIMIT 20
+        """
+        logger.info(f"[Template] Pattern 10: Action Item (Assignee={bool(primary_entity)})")
+        return cypher.strip()
+
     # 템플릿 없음
     logger.info(f"[Template] No template for: {intent_type} / {search_focus}")
     return None
@@ -239,13 +405,7 @@ def get_template_parameters(
     """Template Cypher용 파라미터 생성 (일관성 유지)."""
 
     # keywords 리스트를 search_term으로 변환
-    final_search_term = ""
-    if keywords and len(keywords) > 0:
-        final_search_term = keywords[0]
-    elif search_term:  # 하위 호환성
-        final_search_term = search_term
-        if intent_type == "entity_search" and primary_entity:
-            final_search_term = _clean_search_term(search_term, primary_entity)
+    final_search_term = _effective_search_term(intent_type, primary_entity, keywords, search_term)
 
     # 기본 파라미터
     params = {
@@ -268,3 +428,30 @@ def get_template_parameters(
             params["end_date"] = date_filter["end"]
 
     return params
+
+
+def bind_template_parameters(
+    query: str,
+    query_intent: dict,
+    user_id: str = None,
+) -> tuple[dict | None, dict]:
+    """의도 분석 결과 + 원문 시간 표현으로 템플릿 파라미터 바인딩.
+
+    의도 분석에 date_range가 없으면 temporal_extractor로 원문에서 추출합니다.
+    (추출기는 기준 시각이 고정되므로 호출마다 새로 생성)
+
+    Returns:
+        (date_range 또는 None, Cypher 파라미터)
+    """
+    date_range = query_intent.get("date_range")
+    if not (date_range and date_range.get("start") and date_range.get("end")):
+        date_range = ContextAwareTemporalExtractor().extract_date_range(query) if query else None
+
+    params = get_template_parameters(
+        intent_type=query_intent.get("intent_type"),
+        primary_entity=query_intent.get("primary_entity"),
+        keywords=query_intent.get("keywords"),
+        user_id=user_id,
+        date_filter=date_range,
+    )
+    return date_range, params
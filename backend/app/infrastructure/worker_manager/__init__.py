@@ -23,6 +23,7 @@ def get_worker_manager() -> WorkerManager:
     """WorkerManager 싱글톤 반환
 
     K8s 환경이면 K8sWorkerManager, 아니면 DockerWorkerManager 반환
+    worker_pool_enabled면 PooledWorkerManager로 감싸 워커 풀에 우선 배정
     """
     global _worker_manager
     if _worker_manager is not None:
@@ -39,6 +40,14 @@ def get_worker_manager() -> WorkerManager:
         _worker_manager = DockerWorkerManager()
         logger.info("DockerWorkerManager 초기화 (Docker 환경)")
 
+    from app.core.config import get_settings
+
+    if get_settings().worker_pool_enabled:
+        from .pool import PooledWorkerManager
+
+        _worker_manager = PooledWorkerManager(fallback=_worker_manager)
+        logger.info("PooledWorkerManager 초기화 (워커 풀 우선 배정)")
+
     return _worker_manager
 
 
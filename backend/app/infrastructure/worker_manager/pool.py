@@ -0,0 +1,297 @@
+"""워커 풀 기반 WorkerManager 구현
+
+상시 실행 중인 멀티 회의 워커 호스트(WORKER_MODE=multi)에 회의를 배정합니다.
+- 호스트는 주기적으로 하트비트(용량 + 실행 중 회의)를 보내고 응답으로 배정 목록을 받음 (pull 방식)
+- 배정: 여유 슬롯이 있는 호스트 중 가장 많이 찬 호스트 우선 (best-fit bin packing)
+- 여유 호스트가 없으면 기존 회의별 Job/컨테이너 매니저로 콜드 스타트 (fallback)
+- 하트비트가 끊긴 호스트의 회의는 다른 호스트(또는 fallback)로 재배정
+
+Redis 키:
+- worker:hosts                     살아있는(것으로 알려진) 호스트 ID 집합
+- worker:host:{id}                 호스트 상태 JSON (TTL = worker_host_ttl_seconds)
+- worker:host:{id}:assignments     배정 해시 (meeting_id → Clova 키 인덱스)
+- worker:meeting:{meeting_id}      회의가 배정된 호스트 ID
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+
+from app.core.config import get_settings
+from app.core.redis import get_redis
+from app.core.telemetry import get_mit_metrics
+
+from .base import WorkerManager, WorkerStartError, WorkerStatus, WorkerStatusEnum
+
+logger = logging.getLogger(__name__)
+
+HOSTS_SET_KEY = "worker:hosts"
+HOST_KEY_PREFIX = "worker:host:"
+MEETING_KEY_PREFIX = "worker:meeting:"
+WORKER_ID_PREFIX = "realtime-worker-"
+
+# 슬롯 예약: 용량 이내일 때만 배정 추가 (이미 이 호스트에 배정돼 있으면 성공)
+# 다른 호스트에 이미 배정된 회의는 예약하지 않음 (동시 start_worker로 이중 배정 방지)
+# KEYS: [1] = assignments hash, [2] = meeting key
+# ARGV: [1] = meeting_id, [2] = key_index, [3] = capacity, [4] = host_id
+_RESERVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return redis.call('GET', KEYS[2]) == ARGV[4] and 1 or 0
+end
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
+    return 1
+end
+if redis.call('HLEN', KEYS[1]) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('SET', KEYS[2], ARGV[4])
+return 1
+"""
+
+
+@dataclass
+class HostLoad:
+    """호스트 부하 정보"""
+
+    host_id: str
+    capacity: int
+    assigned: int
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self.assigned
+
+
+def rank_hosts(hosts: list[HostLoad]) -> list[HostLoad]:
+    """배정 후보 호스트 정렬 (best-fit)
+
+    여유 슬롯이 있는 호스트만, 가장 많이 찬 호스트부터 반환합니다.
+    회의를 적은 수의 호스트에 몰아 유휴 호스트를 축소할 수 있게 합니다.
+    """
+    candidates = [host for host in hosts if host.free > 0]
+    return sorted(candidates, key=lambda host: (host.free, host.host_id))
+
+
+class PooledWorkerManager:
+    """워커 풀 우선 + 회의별 워커 fallback 관리자"""
+
+    def __init__(self, fallback: WorkerManager, host_ttl_seconds: int | None = None):
+        """
+        Args:
+            fallback: 풀에 여유가 없을 때 사용할 회의별 워커 매니저 (K8s/Docker)
+            host_ttl_seconds: 하트비트가 끊긴 호스트를 죽은 것으로 판단하는 시간
+        """
+        self.fallback = fallback
+        self.host_ttl_seconds = host_ttl_seconds or get_settings().worker_host_ttl_seconds
+
+    @staticmethod
+    def _host_key(host_id: str) -> str:
+        return f"{HOST_KEY_PREFIX}{host_id}"
+
+    @staticmethod
+    def _assignments_key(host_id: str) -> str:
+        return f"{HOST_KEY_PREFIX}{host_id}:assignments"
+
+    @staticmethod
+    def _meeting_key(meeting_id: str) -> str:
+        return f"{MEETING_KEY_PREFIX}{meeting_id}"
+
+    @staticmethod
+    def _worker_id(meeting_id: str) -> str:
+        return f"{WORKER_ID_PREFIX}{meeting_id}"
+
+    @staticmethod
+    def _extract_meeting_id(worker_id: str) -> str:
+        return worker_id.removeprefix(WORKER_ID_PREFIX)
+
+    # === 호스트 하트비트 ===
+
+    async def heartbeat(
+        self,
+        host_id: str,
+        capacity: int,
+        meetings: list[str],
+    ) -> list[tuple[str, int | None]]:
+        """호스트 하트비트 기록 후 배정 목록 반환
+
+        Args:
+            host_id: 워커 호스트 ID
+            capacity: 호스트가 동시에 처리할 수 있는 회의 수
+            meetings: 호스트에서 실행 중인 회의 ID 목록
+
+        Returns:
+            (meeting_id, Clova 키 인덱스) 배정 목록
+        """
+        redis = await get_redis()
+        state = json.dumps({"capacity": capacity, "meetings": meetings, "heartbeat": time.time()})
+        await redis.set(self._host_key(host_id), state, ex=self.host_ttl_seconds)
+        await redis.sadd(HOSTS_SET_KEY, host_id)
+
+        try:
+            await self._reap_dead_hosts()
+        except Exception as e:
+            logger.warning(f"죽은 워커 호스트 정리 실패: {e}")
+
+        assignments = await redis.hgetall(self._assignments_key(host_id))
+        return [
+            (meeting_id, int(key_index) if key_index not in ("", None) else None)
+            for meeting_id, key_index in assignments.items()
+        ]
+
+    async def _live_hosts(self) -> list[HostLoad]:
+        """하트비트가 살아있는 호스트 부하 목록"""
+        redis = await get_redis()
+        host_ids = sorted(await redis.smembers(HOSTS_SET_KEY))
+        if not host_ids:
+            return []
+
+        states = await redis.mget([self._host_key(host_id) for host_id in host_ids])
+        hosts = []
+        for host_id, raw in zip(host_ids, states):
+            if raw is None:
+                continue
+            capacity = int(json.loads(raw).get("capacity", 0))
+            assigned = await redis.hlen(self._assignments_key(host_id))
+            hosts.append(HostLoad(host_id=host_id, capacity=capacity, assigned=assigned))
+        return hosts
+
+    async def _reap_dead_hosts(self) -> None:
+        """하트비트가 끊긴 호스트의 회의를 재배정"""
+        redis = await get_redis()
+        for host_id in await redis.smembers(HOSTS_SET_KEY):
+            if await redis.exists(self._host_key(host_id)):
+                continue
+            # 여러 백엔드 레플리카가 동시에 정리하지 않도록 SREM 성공한 쪽만 처리
+            if not await redis.srem(HOSTS_SET_KEY, host_id):
+                continue
+
+            assignments_key = self._assignments_key(host_id)
+            orphaned = await redis.hgetall(assignments_key)
+            await redis.delete(assignments_key)
+            logger.warning(f"워커 호스트 응답 없음: host={host_id}, 재배정 회의 {len(orphaned)}개")
+
+            for meeting_id, key_index in orphaned.items():
+                meeting_key = self._meeting_key(meeting_id)
+                if await redis.get(meeting_key) == host_id:
+                    await redis.delete(meeting_key)
+                try:
+                    await self._place(meeting_id, key_index, reassigned=True)
+                except Exception as e:
+                    logger.error(f"회의 재배정 실패: meeting={meeting_id}, error={e}")
+
+    # === 배정 ===
+
+    async def _place(self, meeting_id: str, key_index: int | str, reassigned: bool = False) -> str:
+        """여유 호스트에 회의 배정, 없으면 fallback 워커 시작"""
+        redis = await get_redis()
+        for host in rank_hosts(await self._live_hosts()):
+            reserved = await redis.eval(
+                _RESERVE_SCRIPT,
+                2,
+                self._assignments_key(host.host_id),
+                self._meeting_key(meeting_id),
+                meeting_id,
+                key_index,
+                host.capacity,
+                host.host_id,
+            )
+            if reserved:
+                logger.info(
+                    f"워커 풀 배정: meeting={meeting_id}, host={host.host_id}, "
+                    f"load={host.assigned + 1}/{host.capacity}"
+                )
+                self._record_placement("reassigned" if reassigned else "pooled")
+                return self._worker_id(meeting_id)
+            assigned_host = await self._assigned_host(meeting_id)
+            if assigned_host is not None:
+                # 동시 요청이 먼저 다른 호스트에 배정
+                logger.info(f"회의가 이미 배정됨: meeting={meeting_id}, host={assigned_host}")
+                return self._worker_id(meeting_id)
+
+        logger.info(f"워커 풀 여유 없음, 회의별 워커로 시작: meeting={meeting_id}")
+        self._record_placement("fallback")
+        return await self.fallback.start_worker(meeting_id)
+
+    @staticmethod
+    def _record_placement(result: str) -> None:
+        metrics = get_mit_metrics()
+        if metrics:
+            metrics.worker_pool_placement_total.add(1, {"result": result})
+
+    async def _assigned_host(self, meeting_id: str) -> str | None:
+        redis = await get_redis()
+        return await redis.get(self._meeting_key(meeting_id))
+
+    # === WorkerManager 프로토콜 ===
+
+    async def start_worker(self, meeting_id: str) -> str:
+        """워커 풀에 회의 배정 (여유 없으면 회의별 워커 시작)"""
+        from app.services.clova_key_manager import get_clova_key_manager
+
+        host_id = await self._assigned_host(meeting_id)
+        if host_id is not None:
+            logger.warning(f"회의가 이미 워커 풀에 배정됨: meeting={meeting_id}, host={host_id}")
+            return self._worker_id(meeting_id)
+
+        # Clova API 키 할당 (회의 단위 멱등, fallback 경로에서도 같은 키 재사용)
+        key_manager = await get_clova_key_manager()
+        api_key_index = await key_manager.allocate_key(meeting_id)
+        if api_key_index is None:
+            raise WorkerStartError("사용 가능한 Clova API 키가 없습니다")
+
+        return await self._place(meeting_id, api_key_index)
+
+    async def stop_worker(self, worker_id: str) -> bool:
+        """배정 해제 (호스트는 다음 하트비트에서 회의 종료)"""
+        meeting_id = self._extract_meeting_id(worker_id)
+        host_id = await self._assigned_host(meeting_id)
+        if host_id is None:
+            return await self.fallback.stop_worker(worker_id)
+
+        redis = await get_redis()
+        await redis.hdel(self._assignments_key(host_id), meeting_id)
+        await redis.delete(self._meeting_key(meeting_id))
+        logger.info(f"워커 풀 배정 해제: meeting={meeting_id}, host={host_id}")
+        return True
+
+    async def get_status(self, worker_id: str) -> WorkerStatus:
+        """풀 배정 상태 조회 (풀에 없으면 fallback 조회)"""
+        meeting_id = self._extract_meeting_id(worker_id)
+        host_id = await self._assigned_host(meeting_id)
+        if host_id is None:
+            return await self.fallback.get_status(worker_id)
+
+        redis = await get_redis()
+        raw = await redis.get(self._host_key(host_id))
+        if raw is None:
+            return WorkerStatus(
+                worker_id=worker_id,
+                meeting_id=meeting_id,
+                status=WorkerStatusEnum.FAILED,
+                error_message=f"워커 호스트 응답 없음: {host_id}",
+            )
+
+        running = meeting_id in json.loads(raw).get("meetings", [])
+        return WorkerStatus(
+            worker_id=worker_id,
+            meeting_id=meeting_id,
+            status=WorkerStatusEnum.RUNNING if running else WorkerStatusEnum.PENDING,
+        )
+
+    async def list_workers(self, meeting_id: str | None = None) -> list[WorkerStatus]:
+        """풀 배정 + fallback 워커 목록"""
+        redis = await get_redis()
+        workers: list[WorkerStatus] = []
+        for host in await self._live_hosts():
+            for assigned_meeting in await redis.hkeys(self._assignments_key(host.host_id)):
+                if meeting_id and assigned_meeting != meeting_id:
+                    continue
+                workers.append(await self.get_status(self._worker_id(assigned_meeting)))
+
+        try:
+            workers.extend(await self.fallback.list_workers(meeting_id))
+        except Exception as e:
+            logger.warning(f"fallback 워커 목록 조회 실패: {e}")
+        return workers
@@ -8,8 +8,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
 from app.core.config import get_settings
 from app.core.database import engine
+from app.core.pubsub_hub import close_pubsub_hub
 from app.core.telemetry import instrument_fastapi, setup_telemetry
+from app.infrastructure.context.embedding import close_embedding_client
 from app.infrastructure.graph.checkpointer import close_checkpointer
+from app.infrastructure.graph.integration.clova_reranker import close_reranker_client
+from app.services.context_sharding import start_context_sharding, stop_context_sharding
 
 # 로깅 설정
 logging.basicConfig(
@@ -26,12 +30,17 @@ async def lifespan(_app: FastAPI):
     """애플리케이션 라이프사이클"""
     # 시작 시: Telemetry 초기화
     setup_telemetry("mit-backend", "0.1.0")
+    await start_context_sharding()  # 멀티 레플리카 시 회의 오너십 등록
     yield
     # 종료 시
     logger = logging.getLogger(__name__)
     logger.info("Waiting for Langfuse traces...")
     await asyncio.sleep(2.0)  # Langfuse 백그라운드 전송 대기
+    await stop_context_sharding()  # 오너 lease 반납 → 다른 레플리카가 스냅샷으로 인계
+    await close_pubsub_hub()  # SSE 구독 종료 + Pub/Sub 연결 정리
     await engine.dispose()
+    await close_embedding_client()  # 임베딩 HTTP 연결 풀 정리
+    await close_reranker_client()  # 리랭커 HTTP 연결 풀 정리
     await close_checkpointer()  # LangGraph checkpointer 연결 정리
 
 
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +14,15 @@ class Transcript(Base):
     """개별 발화 segment를 저장하는 테이블"""
 
     __tablename__ = "transcripts"
+    __table_args__ = (
+        # 배치 수집 재전송 중복 방지 (키 없는 단건 저장은 NULL → 제약 없음)
+        Index(
+            "ix_transcripts_meeting_id_idempotency_key",
+            "meeting_id",
+            "idempotency_key",
+            unique=True,
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -84,6 +93,11 @@ class Transcript(Base):
         nullable=False,
         comment="응답 상태 (completed/interrupted)",
     )
+    idempotency_key: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="배치 수집 멱등성 키 (Worker 생성)",
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -3,6 +3,8 @@
 Raw Cypher 기반 Knowledge Graph 저장소.
 """
 
+import json
+import logging
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
@@ -25,6 +27,8 @@ from app.models.kg import (
 )
 from neo4j import READ_ACCESS, AsyncDriver
 
+logger = logging.getLogger(__name__)
+
 
 def _convert_neo4j_datetime(value: Any) -> datetime:
     """Neo4j DateTime을 Python datetime으로 변환"""
@@ -69,6 +73,221 @@ def _build_comment_tree(flat_comments: list[dict]) -> list[dict]:
     return root_comments
 
 
+# Minutes View 1차 쿼리: 회의 골격 (Agenda/Decision/ActionItem을 각각 collect)
+# active Decision만 조회 (superseded, outdated 제외 - rejected는 포함)
+MINUTES_VIEW_QUERY = """
+MATCH (m:Meeting {id: $meeting_id})
+CALL {
+    WITH m
+    OPTIONAL MATCH (m)-[rel:CONTAINS]->(a:Agenda)
+    WITH a, rel
+    ORDER BY rel.order
+    RETURN collect(a {.id, .topic, .description, .evidence, order: rel.order}) AS agendas
+}
+CALL {
+    WITH m
+    MATCH (m)-[:CONTAINS]->(a:Agenda)-[:HAS_DECISION]->(d:Decision)
+    WHERE NOT (d.status IN ['superseded', 'outdated'])
+    OPTIONAL MATCH (approver:User)-[:APPROVES]->(d)
+    WITH a, d, [x IN collect(DISTINCT approver.id) WHERE x IS NOT NULL] AS approvers
+    OPTIONAL MATCH (rejector:User)-[:REJECTS]->(d)
+    WITH a, d, approvers, [x IN collect(DISTINCT rejector.id) WHERE x IS NOT NULL] AS rejectors
+    // 이전 GT 조회 (OUTDATES 관계 - latest → outdated)
+    OPTIONAL MATCH (d)-[:OUTDATES]->(prev:Decision)
+    WHERE prev.status = 'outdated'
+    RETURN collect(d {
+        .id, .content, .context, .status, .meeting_id, .created_at, .updated_at, .evidence,
+        agenda_id: a.id, approvers: approvers, rejectors: rejectors,
+        supersedes_id: prev.id, supersedes_content: prev.content,
+        supersedes_meeting_id: prev.meeting_id
+    }) AS decisions
+}
+CALL {
+    WITH m
+    OPTIONAL MATCH (m)-[:CONTAINS]->(:Agenda)-[:HAS_DECISION]->(:Decision)-[:TRIGGERS]->(ai:ActionItem)
+    OPTIONAL MATCH (assignee:User)-[:ASSIGNED_TO]->(ai)
+    RETURN collect(ai {.id, .content, .status, .due_date, assignee_id: assignee.id}) AS action_items
+}
+RETURN m.id AS meeting_id, m.title AS meeting_title, m.summary AS summary,
+       agendas, decisions, action_items
+"""
+
+# Minutes View 2차 쿼리: Decision별 Suggestions / Comments(모든 depth) / History
+# History: SUPERSEDES 체인을 따라 같은 Meeting 스코프 내 superseded된 Decision들
+# (Suggestion 히스토리, OUTDATES 관계(GT 변화)는 제외)
+MINUTES_DECISION_CHILDREN_QUERY = """
+UNWIND $decision_ids AS decision_id
+MATCH (d:Decision {id: decision_id})
+CALL {
+    WITH d
+    MATCH (s:Suggestion)-[:ON]->(d)
+    MATCH (u:User)-[:SUGGESTS]->(s)
+    OPTIONAL MATCH (s)-[:CREATES]->(cd:Decision)
+    RETURN collect(s {
+        .id, .content, .status, .created_at,
+        author_id: u.id, author_name: u.name, author_email: u.email,
+        cd_id: cd.id, cd_content: cd.content, cd_status: cd.status
+    }) AS suggestions
+}
+CALL {
+    WITH d
+    MATCH (u:User)-[:COMMENTS]->(c:Comment)-[:ON]->(d)
+    OPTIONAL MATCH (c)-[:REPLY_TO]->(parent:Comment)
+    WITH c, u, parent
+    ORDER BY c.created_at
+    RETURN collect(c {
+        .id, .content, .pending_agent_reply, .is_error_response, .created_at,
+        author_id: u.id, author_name: u.name, author_email: u.email,
+        parent_id: parent.id
+    }) AS comments
+}
+CALL {
+    WITH d
+    MATCH (d)-[:SUPERSEDES*]->(prev:Decision)
+    WHERE prev.meeting_id = $meeting_id AND prev.status = 'superseded'
+    WITH prev
+    ORDER BY prev.created_at DESC
+    RETURN collect(prev {.id, .content, .status, .created_at}) AS history
+}
+RETURN d.id AS decision_id, suggestions, comments, history
+"""
+
+
+def _parse_evidence(evidence_json: str | None) -> list[dict]:
+    """evidence JSON 문자열 → dict 리스트 (파싱 실패 시 빈 리스트)"""
+    if not evidence_json:
+        return []
+    try:
+        parsed = json.loads(evidence_json)
+    except (TypeError, json.JSONDecodeError):
+        return []
+    if not isinstance(parsed, list):
+        return []
+    return [item for item in parsed if isinstance(item, dict)]
+
+
+def _format_minutes_decision(d: dict, children: dict | None) -> dict:
+    """Decision 레코드 + 하위 레코드(suggestions/comments/history) → Minutes Decision"""
+    children = children or {}
+
+    suggestions = [
+        {
+            "id": s["id"],
+            "content": s["content"],
+            "author": {
+                "id": s["author_id"],
+                "name": s["author_name"] or "",
+                "email": s["author_email"] or "",
+            },
+            "created_decision": {
+                "id": s["cd_id"],
+                "content": s["cd_content"] or "",
+                "status": s["cd_status"] or "draft",
+            } if s["cd_id"] else None,
+            "created_at": _convert_neo4j_datetime(s["created_at"]).isoformat(),
+        }
+        for s in children.get("suggestions") or []
+    ]
+
+    flat_comments = [
+        {
+            "id": c["id"],
+            "content": c["content"],
+            "author": {
+                "id": c["author_id"],
+                "name": c["author_name"] or "",
+                "email": c["author_email"] or "",
+            },
+            "pending_agent_reply": c["pending_agent_reply"] or False,
+            "is_error_response": c.get("is_error_response") or False,
+            "created_at": _convert_neo4j_datetime(c["created_at"]).isoformat(),
+            "parent_id": c["parent_id"],
+        }
+        for c in children.get("comments") or []
+    ]
+
+    history = [
+        {
+            "id": h["id"],
+            "content": h["content"] or "",
+            "status": h["status"] or "superseded",
+            "created_at": _convert_neo4j_datetime(h["created_at"]).isoformat(),
+        }
+        for h in children.get("history") or []
+    ]
+
+    return {
+        "id": d["id"],
+        "content": d["content"] or "",
+        "context": d["context"],
+        "status": d["status"] or "draft",
+        "meeting_id": d["meeting_id"],
+        "approvers": d["approvers"] or [],
+        "rejectors": d["rejectors"] or [],
+        "evidence": _parse_evidence(d.get("evidence")),
+        "created_at": _convert_neo4j_datetime(d["created_at"]).isoformat(),
+        "updated_at": _convert_neo4j_datetime(d["updated_at"]).isoformat() if d.get("updated_at") else None,
+        "suggestions": suggestions,
+        # Tree 구조로 변환 (무제한 depth 지원)
+        "comments": _build_comment_tree(flat_comments),
+        # 이전 버전 정보 (GT 표시용)
+        "supersedes": {
+            "id": d["supersedes_id"],
+            "content": d["supersedes_content"] or "",
+            "meeting_id": d["supersedes_meeting_id"],
+        } if d.get("supersedes_id") else None,
+        # 히스토리: 같은 Meeting 스코프 내 superseded된 모든 이전 버전
+        "history": history,
+    }
+
+
+def _assemble_minutes_view(view: dict, children_records: list[dict]) -> dict:
+    """Minutes View 쿼리 결과를 중첩 구조로 조립
+
+    Args:
+        view: MINUTES_VIEW_QUERY 레코드 (agendas/decisions/action_items 리스트 포함)
+        children_records: MINUTES_DECISION_CHILDREN_QUERY 레코드 (decision_id별 1행)
+    """
+    children_by_decision = {r["decision_id"]: r for r in children_records}
+
+    decisions_by_agenda: dict[str, list[dict]] = {}
+    for d in view["decisions"]:
+        decisions_by_agenda.setdefault(d["agenda_id"], []).append(
+            _format_minutes_decision(d, children_by_decision.get(d["id"]))
+        )
+
+    agendas = [
+        {
+            "id": a["id"],
+            "topic": a["topic"] or "",
+            "description": a["description"],
+            "order": a["order"] or 0,
+            "decisions": decisions_by_agenda.get(a["id"], []),
+            "evidence": _parse_evidence(a.get("evidence")),
+        }
+        for a in view["agendas"]
+    ]
+
+    action_items = [
+        {
+            "id": ai["id"],
+            "content": ai["content"] or "",
+            "status": ai["status"] or "pending",
+            "assignee_id": ai["assignee_id"],
+            "due_date": _convert_neo4j_datetime(ai["due_date"]).isoformat() if ai["due_date"] else None,
+        }
+        for ai in view["action_items"]
+    ]
+
+    return {
+        "meeting_id": view["meeting_id"],
+        "meeting_title": view.get("meeting_title"),
+        "summary": view["summary"] or "",
+        "agendas": agendas,
+        "action_items": action_items,
+    }
+
+
 class KGRepository:
     """Neo4j KG Repository - Raw Cypher"""
 
@@ -105,6 +324,59 @@ class KGRepository:
         async with self.write_driver.session() as session:
             return await session.execute_write(_write_tx)
 
+    def _schedule_node_embeddings(self, label: str, node_ids: list[str]) -> None:
+        """벡터 인덱스 임베딩 갱신 예약 (백그라운드, best-effort)"""
+        from app.infrastructure.graph.integration.neo4j_vector import schedule_node_embeddings
+
+        schedule_node_embeddings(self.write_driver, label, node_ids)
+
+    def _schedule_meeting_embeddings(self, meeting_id: str) -> None:
+        """회의 + 하위 Agenda/Decision 임베딩 갱신 예약 (백그라운드, best-effort)"""
+        from app.infrastructure.graph.integration.neo4j_vector import (
+            schedule_meeting_embeddings,
+        )
+
+        schedule_meeting_embeddings(self.write_driver, meeting_id)
+
+    # 노드 → 소속 회의 조회 (검색 캐시 무효화 범위)
+    # 팀은 Meeting 속성이 아니라 (Team)-[:HOSTS]->(Meeting) 관계로 연결됨
+    _KG_SCOPE_QUERIES = {
+        "Meeting": "MATCH (m:Meeting {id: $id})",
+        "Agenda": "MATCH (m:Meeting)-[:CONTAINS]->(:Agenda {id: $id})",
+        "Decision": "MATCH (m:Meeting)-[:CONTAINS]->(:Agenda)-[:HAS_DECISION]->(:Decision {id: $id})",
+        "ActionItem": (
+            "MATCH (m:Meeting)-[:CONTAINS]->(:Agenda)-[:HAS_DECISION]->(:Decision)"
+            "-[:TRIGGERS]->(:ActionItem {id: $id})"
+        ),
+    }
+
+    async def _resolve_kg_scope(self, label: str, node_id: str) -> tuple[str | None, str | None]:
+        """노드가 속한 (meeting_id, team_id) 조회 (실패 시 (None, None))"""
+        try:
+            records = await self._execute_read(
+                self._KG_SCOPE_QUERIES[label]
+                + " OPTIONAL MATCH (t:Team)-[:HOSTS]->(m)"
+                + " RETURN m.id AS meeting_id, t.id AS team_id LIMIT 1",
+                {"id": node_id},
+            )
+        except Exception as e:
+            logger.warning(f"KG scope lookup failed ({label}:{node_id}): {e}")
+            return None, None
+        if not records:
+            return None, None
+        return records[0]["meeting_id"], records[0]["team_id"]
+
+    async def _bump_kg_scope(self, scope: tuple[str | None, str | None]) -> None:
+        """회의/팀 버전 증가 → 해당 범위의 검색 결과 캐시 무효화"""
+        from app.infrastructure.cache.kg_version import bump_kg_versions
+
+        meeting_id, team_id = scope
+        await bump_kg_versions(meeting_ids=[meeting_id], team_ids=[team_id])
+
+    async def _invalidate_kg_cache(self, label: str, node_id: str) -> None:
+        """쓰기 후 노드 범위의 캐시 무효화 (삭제는 삭제 전에 범위를 조회해 _bump_kg_scope 사용)"""
+        await self._bump_kg_scope(await self._resolve_kg_scope(label, node_id))
+
     # =========================================================================
     # Meeting - 회의
     # =========================================================================
@@ -125,6 +397,7 @@ class KGRepository:
         records = await self._execute_write(query, params)
         if not records:
             raise ValueError(f"Meeting not found: {meeting_id}")
+        await self._invalidate_kg_cache("Meeting", meeting_id)
 
         return await self.get_meeting(meeting_id)  # type: ignore
 
@@ -277,6 +550,8 @@ class KGRepository:
                 "agendas": agendas_with_serialized_evidence,
             },
         )
+        self._schedule_meeting_embeddings(meeting_id)
+        await self._invalidate_kg_cache("Meeting", meeting_id)
 
         # Projection으로 조회하여 반환
         return await self.get_minutes(meeting_id)  # type: ignore
@@ -433,6 +708,7 @@ class KGRepository:
 
         if not records:
             return {"rejected": False, "status": "not_found", "already_finalized": False}
+        await self._invalidate_kg_cache("Decision", decision_id)
 
         record = records[0]
         return {
@@ -473,6 +749,9 @@ class KGRepository:
             "decision_id": decision_id,
             "now": now,
         })
+        if records:
+            self._schedule_node_embeddings("Decision", [decision_id])
+            await self._invalidate_kg_cache("Decision", decision_id)
         return len(records) > 0
 
     async def approve_and_merge_if_complete(
@@ -569,6 +848,8 @@ class KGRepository:
             return {"approved": False, "merged": False, "status": "not_found", "already_rejected": False}
 
         record = records[0]
+        if record["merged"]:
+            await self._invalidate_kg_cache("Decision", decision_id)
         return {
             "approved": not record.get("already_rejected", False),
             "merged": record["merged"] if not record.get("already_rejected") else False,
@@ -699,6 +980,7 @@ class KGRepository:
         if not records:
             return []
 
+        await self._invalidate_kg_cache("Decision", decision_id)
         return records[0].get("action_ids", [])
 
     # =========================================================================
@@ -857,6 +1139,8 @@ class KGRepository:
         if not records:
             raise ValueError("Suggestion or Decision not found")
 
+        await self._invalidate_kg_cache("Decision", new_decision_id)
+        await self._invalidate_kg_cache("Meeting", meeting_id)
         r = records[0]
         return KGDecision(
             id=r["id"],
@@ -941,6 +1225,9 @@ class KGRepository:
             }
 
         records = await self._execute_write(query, params)
+        if records:
+            self._schedule_node_embeddings("Decision", [decision_id])
+            await self._invalidate_kg_cache("Decision", decision_id)
         return len(records) > 0
 
     # =========================================================================
@@ -1112,6 +1399,7 @@ class KGRepository:
         if not records:
             raise ValueError(f"Decision not found: {decision_id}")
 
+        await self._invalidate_kg_cache("Decision", decision_id)
         return await self.get_decision(decision_id)  # type: ignore
 
     async def delete_decision(self, decision_id: str, user_id: str) -> bool:
@@ -1136,7 +1424,10 @@ class KGRepository:
         DETACH DELETE d
         RETURN true as deleted
         """
+        scope = await self._resolve_kg_scope("Decision", decision_id)
         records = await self._execute_write(query, {"decision_id": decision_id})
+        if records:
+            await self._bump_kg_scope(scope)
         return len(records) > 0
 
     # =========================================================================
@@ -1169,6 +1460,7 @@ class KGRepository:
         if not records:
             raise ValueError(f"Agenda not found: {agenda_id}")
 
+        await self._invalidate_kg_cache("Agenda", agenda_id)
         r = records[0]
         return KGAgenda(
             id=r["id"],
@@ -1207,8 +1499,10 @@ class KGRepository:
 
         RETURN meeting_id
         """
+        scope = await self._resolve_kg_scope("Agenda", agenda_id)
         records = await self._execute_write(query, {"agenda_id": agenda_id})
         if records:
+            await self._bump_kg_scope(scope)
             r = records[0]
             return {"meeting_id": r.get("meeting_id")}
         return None
@@ -1292,6 +1586,7 @@ class KGRepository:
         if not records:
             raise ValueError(f"ActionItem not found: {action_item_id}")
 
+        await self._invalidate_kg_cache("ActionItem", action_item_id)
         r = records[0]
         return KGActionItem(
             id=r["id"],
@@ -1309,7 +1604,10 @@ class KGRepository:
         DETACH DELETE ai
         RETURN true as deleted
         """
+        scope = await self._resolve_kg_scope("ActionItem", action_item_id)
         records = await self._execute_write(query, {"action_item_id": action_item_id})
+        if records:
+            await self._bump_kg_scope(scope)
         return len(records) > 0
 
     # =========================================================================
@@ -1380,211 +1678,26 @@ class KGRepository:
         return bool(records[0]["has_minutes"])
 
     async def get_minutes_view(self, meeting_id: str) -> dict:
-        """Minutes 전체 View 조회 (중첩 구조)"""
-        import json
+        """Minutes 전체 View 조회 (중첩 구조)
 
-        def _parse_evidence(evidence_json: str | None) -> list[dict]:
-            if not evidence_json:
-                return []
-            try:
-                parsed = json.loads(evidence_json)
-            except (TypeError, json.JSONDecodeError):
-                return []
-            if not isinstance(parsed, list):
-                return []
-            return [item for item in parsed if isinstance(item, dict)]
-
-        # 1. Meeting + Summary 조회
-        meeting_query = """
-        MATCH (m:Meeting {id: $meeting_id})
-        RETURN m.id as meeting_id, m.title as meeting_title, m.summary as summary
+        Agenda/Decision별 개별 쿼리 대신 2회 왕복으로 조회한 뒤 메모리에서 조립합니다.
+            1. Meeting + Agendas + 활성 Decisions (approvers/rejectors/이전 GT) + ActionItems
+            2. Decision ID 목록 UNWIND → Suggestions / Comments / SUPERSEDES 히스토리
         """
-        meeting_records = await self._execute_read(meeting_query, {"meeting_id": meeting_id})
-        if not meeting_records:
+        view_records = await self._execute_read(MINUTES_VIEW_QUERY, {"meeting_id": meeting_id})
+        if not view_records:
             return {}
 
-        meeting = meeting_records[0]
-
-        # 2. Agendas 조회
-        agenda_query = """
-        MATCH (m:Meeting {id: $meeting_id})-[rel:CONTAINS]->(a:Agenda)
-        RETURN a.id as id, a.topic as topic, a.description as description, a.evidence as evidence, rel.order as order
-        ORDER BY rel.order
-        """
-        agenda_records = await self._execute_read(agenda_query, {"meeting_id": meeting_id})
-
-        agendas = []
-        for a in agenda_records:
-            # 3. Decisions per Agenda (with approvers/rejectors)
-            # active Decision만 조회 (superseded, outdated 제외 - rejected는 포함)
-            decision_query = """
-            MATCH (a:Agenda {id: $agenda_id})-[:HAS_DECISION]->(d:Decision)
-            WHERE NOT (d.status IN ['superseded', 'outdated'])
-            OPTIONAL MATCH (approver:User)-[:APPROVES]->(d)
-            OPTIONAL MATCH (rejector:User)-[:REJECTS]->(d)
-            // 이전 GT 조회 (OUTDATES 관계 - latest → outdated)
-            OPTIONAL MATCH (d)-[:OUTDATES]->(prev:Decision)
-            WHERE prev.status = 'outdated'
-            RETURN d.id as id, d.content as content, d.context as context,
-                   d.status as status, d.meeting_id as meeting_id,
-                   d.created_at as created_at, d.updated_at as updated_at,
-                   d.evidence as evidence,
-                   [x IN collect(DISTINCT approver.id) WHERE x IS NOT NULL] as approvers,
-                   [x IN collect(DISTINCT rejector.id) WHERE x IS NOT NULL] as rejectors,
-                   prev.id as supersedes_id, prev.content as supersedes_content,
-                   prev.meeting_id as supersedes_meeting_id
-            """
-            decision_records = await self._execute_read(decision_query, {"agenda_id": a["id"]})
-
-            decisions = []
-            for d in decision_records:
-                # 4. Suggestions per Decision ([:ON] 관계로 조회 - AI 분석 전 Suggestion도 포함)
-                suggestion_query = """
-                MATCH (s:Suggestion)-[:ON]->(d:Decision {id: $decision_id})
-                MATCH (u:User)-[:SUGGESTS]->(s)
-                OPTIONAL MATCH (s)-[:CREATES]->(cd:Decision)
-                RETURN s.id as id, s.content as content,
-                       u.id as author_id, u.name as author_name, u.email as author_email,
-                       s.status as status,
-                       cd.id as cd_id, cd.content as cd_content, cd.status as cd_status,
-                       s.created_at as created_at
-                """
-                suggestion_records = await self._execute_read(suggestion_query, {"decision_id": d["id"]})
-                suggestions = [
-                    {
-                        "id": s["id"],
-                        "content": s["content"],
-                        "author": {
-                            "id": s["author_id"],
-                            "name": s["author_name"] or "",
-                            "email": s["author_email"] or "",
-                        },
-                        "created_decision": {
-                            "id": s["cd_id"],
-                            "content": s["cd_content"] or "",
-                            "status": s["cd_status"] or "draft",
-                        } if s["cd_id"] else None,
-                        "created_at": _convert_neo4j_datetime(s["created_at"]).isoformat(),
-                    }
-                    for s in suggestion_records
-                ]
-
-                # 5. Comments per Decision (모든 depth를 단일 쿼리로 조회)
-                comment_query = """
-                MATCH (u:User)-[:COMMENTS]->(c:Comment)-[:ON]->(d:Decision {id: $decision_id})
-                OPTIONAL MATCH (c)-[:REPLY_TO]->(parent:Comment)
-                RETURN c.id as id, c.content as content,
-                       u.id as author_id, u.name as author_name, u.email as author_email,
-                       c.pending_agent_reply as pending_agent_reply,
-                       c.is_error_response as is_error_response,
-                       c.created_at as created_at,
-                       parent.id as parent_id
-                ORDER BY c.created_at
-                """
-                comment_records = await self._execute_read(comment_query, {"decision_id": d["id"]})
-
-                # 6. History: SUPERSEDES 체인을 따라 superseded된 Decision들 조회
-                # 같은 Meeting 스코프 내 + superseded 상태만 (Suggestion 히스토리)
-                # OUTDATES 관계(GT 변화)는 제외
-                history_query = """
-                MATCH (current:Decision {id: $decision_id})-[:SUPERSEDES*]->(prev:Decision)
-                WHERE prev.meeting_id = $meeting_id AND prev.status = 'superseded'
-                RETURN prev.id as id, prev.content as content, prev.status as status,
-                       prev.created_at as created_at
-                ORDER BY prev.created_at DESC
-                """
-                history_records = await self._execute_read(
-                    history_query, {"decision_id": d["id"], "meeting_id": meeting_id}
-                )
-                history = [
-                    {
-                        "id": h["id"],
-                        "content": h["content"] or "",
-                        "status": h["status"] or "superseded",
-                        "created_at": _convert_neo4j_datetime(h["created_at"]).isoformat(),
-                    }
-                    for h in history_records
-                ]
-
-                # Flat list 생성
-                flat_comments = [
-                    {
-                        "id": c["id"],
-                        "content": c["content"],
-                        "author": {
-                            "id": c["author_id"],
-                            "name": c["author_name"] or "",
-                            "email": c["author_email"] or "",
-                        },
-                        "pending_agent_reply": c["pending_agent_reply"] or False,
-                        "is_error_response": c.get("is_error_response") or False,
-                        "created_at": _convert_neo4j_datetime(c["created_at"]).isoformat(),
-                        "parent_id": c["parent_id"],
-                    }
-                    for c in comment_records
-                ]
-
-                # Tree 구조로 변환 (무제한 depth 지원)
-                comments = _build_comment_tree(flat_comments)
-
-                decisions.append({
-                    "id": d["id"],
-                    "content": d["content"] or "",
-                    "context": d["context"],
-                    "status": d["status"] or "draft",
-                    "meeting_id": d["meeting_id"],
-                    "approvers": d["approvers"] or [],
-                    "rejectors": d["rejectors"] or [],
-                    "evidence": _parse_evidence(d.get("evidence")),
-                    "created_at": _convert_neo4j_datetime(d["created_at"]).isoformat(),
-                    "updated_at": _convert_neo4j_datetime(d["updated_at"]).isoformat() if d.get("updated_at") else None,
-                    "suggestions": suggestions,
-                    "comments": comments,
-                    # 이전 버전 정보 (GT 표시용)
-                    "supersedes": {
-                        "id": d["supersedes_id"],
-                        "content": d["supersedes_content"] or "",
-                        "meeting_id": d["supersedes_meeting_id"],
-                    } if d.get("supersedes_id") else None,
-                    # 히스토리: 같은 Meeting 스코프 내 superseded된 모든 이전 버전
-                    "history": history,
-                })
-
-            agendas.append({
-                "id": a["id"],
-                "topic": a["topic"] or "",
-                "description": a["description"],
-                "order": a["order"] or 0,
-                "decisions": decisions,
-                "evidence": _parse_evidence(a.get("evidence")),
-            })
-
-        # 7. ActionItems 조회
-        action_item_query = """
-        MATCH (m:Meeting {id: $meeting_id})-[:CONTAINS]->(a:Agenda)-[:HAS_DECISION]->(d:Decision)-[:TRIGGERS]->(ai:ActionItem)
-        OPTIONAL MATCH (assignee:User)-[:ASSIGNED_TO]->(ai)
-        RETURN ai.id as id, ai.content as content, ai.status as status,
-               assignee.id as assignee_id, ai.due_date as due_date
-        """
-        action_item_records = await self._execute_read(action_item_query, {"meeting_id": meeting_id})
-        action_items = [
-            {
-                "id": ai["id"],
-                "content": ai["content"] or "",
-                "status": ai["status"] or "pending",
-                "assignee_id": ai["assignee_id"],
-                "due_date": _convert_neo4j_datetime(ai["due_date"]).isoformat() if ai["due_date"] else None,
-            }
-            for ai in action_item_records
-        ]
+        view = view_records[0]
+        decision_ids = list(dict.fromkeys(d["id"] for d in view["decisions"]))
+        children_records = []
+        if decision_ids:
+            children_records = await self._execute_read(
+                MINUTES_DECISION_CHILDREN_QUERY,
+                {"decision_ids": decision_ids, "meeting_id": meeting_id},
+            )
 
-        return {
-            "meeting_id": meeting["meeting_id"],
-            "meeting_title": meeting.get("meeting_title"),
-            "summary": meeting["summary"] or "",
-            "agendas": agendas,
-            "action_items": action_items,
-        }
+        return _assemble_minutes_view(view, children_records)
 
     async def get_or_create_system_agent(self) -> str:
         """MIT Agent 시스템 사용자 조회/생성
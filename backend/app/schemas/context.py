@@ -30,6 +30,8 @@ class TopicFeedResponse(BaseModel):
     )  # 현재 토픽
     topics: list[TopicItem] = Field(default_factory=list)  # 토픽 목록 (최신순)
     updated_at: datetime = Field(serialization_alias="updatedAt")  # 마지막 업데이트 시각
+    epoch: str | None = None  # 토픽 피드 식별자 (오너 레플리카 변경 시 바뀜)
+    seq: int = 0  # 이 snapshot에 반영된 마지막 델타 번호 (SSE update.seq 기준점)
 
     class Config:
         populate_by_name = True
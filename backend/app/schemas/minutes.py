@@ -98,6 +98,36 @@ class MinutesResponse(BaseModel):
     action_items: list[ActionItemBriefResponse] = Field(
         default=[], serialization_alias="actionItems"
     )
+    # 스냅샷 버전 (다음 조회의 since_version, 캐시 비활성화 시 None)
+    version: int | None = None
+
+    class Config:
+        populate_by_name = True
+
+
+class DecisionDeltaResponse(DecisionWithReviewResponse):
+    """델타 응답의 Decision (소속 Agenda 포함)"""
+
+    agenda_id: str = Field(serialization_alias="agendaId")
+
+
+class MinutesDeltaResponse(BaseModel):
+    """Minutes View 델타 응답 (since_version 이후 바뀐 Decision만)
+
+    decisions의 항목은 같은 id의 Decision을 통째로 교체하고 (없으면 agenda_id 아래 추가),
+    removed_decision_ids는 View에서 제거합니다.
+    """
+
+    meeting_id: str = Field(serialization_alias="meetingId")
+    version: int
+    since_version: int = Field(serialization_alias="sinceVersion")
+    decisions: list[DecisionDeltaResponse] = []
+    removed_decision_ids: list[str] = Field(
+        default=[], serialization_alias="removedDecisionIds"
+    )
+    action_items: list[ActionItemBriefResponse] = Field(
+        default=[], serialization_alias="actionItems"
+    )
 
     class Config:
         populate_by_name = True
@@ -53,6 +53,76 @@ class CreateTranscriptResponse(BaseModel):
         populate_by_name = True
 
 
+# ===== POST /meetings/{meeting_id}/transcripts/batch =====
+
+class TranscriptBatchItem(BaseModel):
+    """배치 내 발화 segment (meetingId는 배치 단위로 지정)"""
+
+    idempotency_key: str = Field(
+        serialization_alias="idempotencyKey",
+        validation_alias="idempotencyKey",
+        min_length=1,
+        max_length=64,
+    )
+    user_id: UUID = Field(serialization_alias="userId", validation_alias="userId")
+    start_ms: int = Field(serialization_alias="startMs", validation_alias="startMs", ge=0)
+    end_ms: int = Field(serialization_alias="endMs", validation_alias="endMs")
+    text: str = Field(min_length=1)
+    confidence: float
+    min_confidence: float = Field(serialization_alias="minConfidence", validation_alias="minConfidence")
+    agent_call: bool = Field(
+        default=False,
+        serialization_alias="agentCall",
+        validation_alias="agentCall",
+    )
+    agent_call_keyword: str | None = Field(
+        default=None,
+        serialization_alias="agentCallKeyword",
+        validation_alias="agentCallKeyword",
+        max_length=50,
+    )
+    agent_call_confidence: float | None = Field(
+        default=None,
+        serialization_alias="agentCallConfidence",
+        validation_alias="agentCallConfidence",
+    )
+    status: TranscriptStatus = Field(default="completed")
+
+    class Config:
+        populate_by_name = True
+
+
+class CreateTranscriptBatchRequest(BaseModel):
+    """발화 segment 배치 생성 요청 (Worker → Backend)"""
+
+    meeting_id: UUID = Field(serialization_alias="meetingId", validation_alias="meetingId")
+    segments: list[TranscriptBatchItem] = Field(min_length=1, max_length=100)
+
+    class Config:
+        populate_by_name = True
+
+
+class TranscriptBatchResult(BaseModel):
+    """배치 내 발화 저장 결과 (재전송된 키는 기존 segment 반환)"""
+
+    idempotency_key: str = Field(serialization_alias="idempotencyKey")
+    id: UUID
+    created_at: datetime = Field(serialization_alias="createdAt")
+    duplicate: bool = False
+
+    class Config:
+        populate_by_name = True
+
+
+class CreateTranscriptBatchResponse(BaseModel):
+    """발화 segment 배치 생성 응답 (요청 segments 순서)"""
+
+    items: list[TranscriptBatchResult]
+
+    class Config:
+        populate_by_name = True
+
+
 # ===== GET /meetings/{meeting_id}/transcripts =====
 
 class UtteranceItem(BaseModel):
@@ -0,0 +1,31 @@
+"""Realtime 워커 풀 API 스키마"""
+
+from pydantic import BaseModel, Field
+
+
+class WorkerHeartbeatRequest(BaseModel):
+    """POST /workers/hosts/{host_id}/heartbeat 요청"""
+
+    capacity: int = Field(ge=0)  # 동시 처리 가능한 회의 수
+    meetings: list[str] = Field(default_factory=list)  # 실행 중인 회의 ID 목록
+
+
+class WorkerAssignment(BaseModel):
+    """호스트에 배정된 회의"""
+
+    meeting_id: str = Field(serialization_alias="meetingId")  # 회의 ID (LiveKit room name)
+    clova_key_index: int | None = Field(
+        default=None, serialization_alias="clovaKeyIndex"
+    )  # 할당된 Clova STT 키 인덱스
+
+    class Config:
+        populate_by_name = True
+
+
+class WorkerHeartbeatResponse(BaseModel):
+    """POST /workers/hosts/{host_id}/heartbeat 응답"""
+
+    assignments: list[WorkerAssignment] = Field(default_factory=list)  # 배정 목록
+
+    class Config:
+        populate_by_name = True
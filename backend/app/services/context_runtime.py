@@ -3,14 +3,19 @@
 TTL Cache를 사용하여 메모리 누수 방지:
 - 최대 10개 회의 동시 캐시
 - 1시간 미접근 시 자동 삭제
+
+축출/재시작 대응:
+- L1 처리가 끝날 때마다 상태 스냅샷을 Redis에 저장
+- 캐시 미스 시 스냅샷을 복원하고, 이후 발화(tail)만 DB에서 replay
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from cachetools import TTLCache
@@ -18,8 +23,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.context import ContextConfig, ContextManager, Utterance
+from app.infrastructure.context.snapshot import (
+    capture_snapshot,
+    get_snapshot_store,
+    restore_snapshot,
+)
 from app.models.transcript import Transcript
 
+if TYPE_CHECKING:
+    from app.services.topic_feed import TopicFeedPublisher
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +43,10 @@ class ContextRuntimeState:
     last_processed_start_ms: int | None = None
     last_utterance_id: int = 0
     topic_publish_task: asyncio.Task | None = None
+    topic_feed: TopicFeedPublisher | None = None  # SSE 토픽 델타 발행기 (topic_feed.get_topic_feed)
+    snapshot_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    snapshot_task: asyncio.Task | None = None
+    discarded: bool = False  # 회의 종료로 정리됨 (이후 스냅샷 저장 생략)
 
 
 # TTL Cache: 동시 최대 10개 회의, 1시간 미접근 시 자동 삭제
@@ -52,14 +69,91 @@ async def get_or_create_runtime(
                 ),
                 lock=asyncio.Lock(),
             )
+            await _restore_runtime_snapshot(runtime, meeting_id)
+            runtime.manager.add_l1_listener(
+                lambda _manager: _schedule_snapshot_save(runtime)
+            )
             _runtime_cache[meeting_id] = runtime
         return runtime
 
 
+async def _restore_runtime_snapshot(runtime: ContextRuntimeState, meeting_id: str) -> bool:
+    """저장된 스냅샷이 있으면 새 런타임에 복원 (LLM 재요약 생략)."""
+    store = get_snapshot_store()
+    if store is None:
+        return False
+
+    loaded = await store.load(meeting_id)
+    if loaded is None:
+        return False
+
+    snapshot, embeddings = loaded
+    try:
+        restore_snapshot(runtime.manager, snapshot, embeddings)
+    except Exception as e:
+        logger.warning("Context snapshot restore failed, rebuilding from DB: %s", e)
+        runtime.manager = ContextManager(
+            meeting_id=meeting_id, config=ContextConfig(), mode=runtime.manager.mode
+        )
+        return False
+
+    runtime.last_utterance_id = snapshot.last_utterance_id
+    runtime.last_processed_start_ms = snapshot.last_processed_start_ms
+    logger.info(
+        "Context runtime restored from snapshot: meeting_id=%s, topics=%d, last_start_ms=%s",
+        meeting_id,
+        len(snapshot.l1_segments),
+        snapshot.last_processed_start_ms,
+    )
+    return True
+
+
+def _schedule_snapshot_save(runtime: ContextRuntimeState) -> None:
+    """L1 처리 완료 시점 상태를 캡처하고 비동기로 저장 (저장 순서 보장)."""
+    store = get_snapshot_store()
+    if store is None or runtime.discarded:
+        return
+
+    snapshot, embeddings = capture_snapshot(
+        runtime.manager,
+        last_utterance_id=runtime.last_utterance_id,
+        last_processed_start_ms=runtime.last_processed_start_ms,
+    )
+
+    async def _save() -> None:
+        # asyncio.Lock은 FIFO이므로 캡처 순서대로 저장됨
+        async with runtime.snapshot_lock:
+            await store.save(snapshot, embeddings)
+
+    runtime.snapshot_task = asyncio.create_task(_save())
+
+
 def get_runtime_if_exists(meeting_id: str) -> ContextRuntimeState | None:
     return _runtime_cache.get(meeting_id)
 
 
+def evict_runtime(meeting_id: str) -> None:
+    """로컬 런타임 제거 (오너십이 다른 레플리카로 넘어간 경우)"""
+    _runtime_cache.pop(meeting_id, None)
+
+
+async def discard_runtime(meeting_id: str) -> None:
+    """회의 종료 시 로컬 런타임과 Redis 스냅샷 정리.
+
+    스냅샷을 TTL까지 남겨두면 같은 회의 재입장 시 종료 시점 상태가 복원되므로 바로 삭제합니다.
+    """
+    runtime = _runtime_cache.pop(meeting_id, None)
+    if runtime is not None:
+        runtime.discarded = True
+        if runtime.snapshot_task is not None:
+            # 진행 중인 저장이 삭제 이후에 끝나 스냅샷이 되살아나지 않도록 대기
+            await asyncio.gather(runtime.snapshot_task, return_exceptions=True)
+
+    store = get_snapshot_store()
+    if store is not None:
+        await store.delete(meeting_id)
+
+
 async def get_transcript_start_ms(
     db: AsyncSession,
     transcript_id: UUID,
@@ -0,0 +1,557 @@
+"""Context 런타임 샤딩 - 회의별 오너 레플리카 라우팅
+
+Context 런타임(ContextRuntimeState)은 프로세스 메모리에 있으므로
+여러 백엔드 파드가 뜨면 같은 회의 요청이 같은 파드로 가야 합니다.
+
+구성 (Redis):
+- context:replica:{replica_id}   = advertise URL (EX lease, 하트비트로 갱신)
+- context:replicas               = 등록된 레플리카 ID Set
+- context:owner:{meeting_id}     = 오너 replica_id (EX lease, 오너가 갱신)
+
+라우팅:
+1. 살아있는 오너가 있으면 오너로 포워딩 (자기 자신이면 로컬 처리)
+2. 오너가 없거나 죽었으면 consistent hash 링의 선호 레플리카가 claim
+   (claim 경쟁에서 지면 이긴 오너로 포워딩 - 오너가 아닌 레플리카는 런타임을 만들지 않음)
+3. 오너 포워딩 연결 실패 시 오너의 하트비트 키가 만료됐을 때만 claim (failover)
+   → 런타임 캐시 미스 시 Redis 스냅샷 복원 + tail replay (context_runtime)
+   → 하트비트가 살아있으면(일시적 연결 실패) lease를 빼앗지 않고 503
+4. 포워딩된 요청은 항상 로컬 처리 (재포워딩 없음)
+"""
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import socket
+import time
+
+import httpx
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.core.config import get_settings
+from app.core.redis import get_redis
+from app.core.telemetry import get_mit_metrics
+from app.services.context_runtime import evict_runtime, get_runtime_if_exists
+
+logger = logging.getLogger(__name__)
+
+REPLICA_KEY_PREFIX = "context:replica:"
+REPLICAS_SET_KEY = "context:replicas"
+OWNER_KEY_PREFIX = "context:owner:"
+
+# 포워딩 루프 방지 헤더 (값: 포워딩한 replica_id)
+FORWARDED_HEADER = "X-Mit-Context-Forwarded"
+
+# 프록시 시 전달하지 않는 hop-by-hop 헤더
+_HOP_BY_HOP_HEADERS = {
+    "connection",
+    "content-length",
+    "host",
+    "keep-alive",
+    "proxy-connection",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+
+# 비어있거나, 기대한 오너의 하트비트 키(KEYS[2])가 만료됐을 때만 claim
+_CLAIM_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if (not current) or current == ARGV[1]
+    or (current == ARGV[2] and redis.call('EXISTS', KEYS[2]) == 0) then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# 자신이 오너일 때만 lease 연장
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# 자신이 오너일 때만 삭제
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ConsistentHashRing:
+    """가상 노드 기반 consistent hash 링.
+
+    레플리카가 추가/제거되어도 대부분의 회의는 기존 레플리카에 남습니다.
+    """
+
+    def __init__(self, nodes: list[str] | None = None, vnodes: int = 64):
+        self.vnodes = vnodes
+        self._nodes: set[str] = set()
+        self._hashes: list[int] = []
+        self._owners: list[str] = []
+        for node in nodes or []:
+            self.add(node)
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+    @property
+    def nodes(self) -> set[str]:
+        return set(self._nodes)
+
+    def add(self, node: str) -> None:
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for i in range(self.vnodes):
+            point = self._hash(f"{node}#{i}")
+            idx = bisect.bisect(self._hashes, point)
+            self._hashes.insert(idx, point)
+            self._owners.insert(idx, node)
+
+    def remove(self, node: str) -> None:
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        kept = [(h, o) for h, o in zip(self._hashes, self._owners) if o != node]
+        self._hashes = [h for h, _ in kept]
+        self._owners = [o for _, o in kept]
+
+    def get(self, key: str) -> str | None:
+        """키를 담당하는 노드 반환 (노드가 없으면 None)"""
+        if not self._hashes:
+            return None
+        idx = bisect.bisect(self._hashes, self._hash(key)) % len(self._hashes)
+        return self._owners[idx]
+
+
+class ContextShardRouter:
+    """회의 오너십 관리 + 오너 레플리카 포워딩"""
+
+    def __init__(self, replica_id: str, advertise_url: str, lease_seconds: int):
+        self.replica_id = replica_id
+        self.advertise_url = advertise_url.rstrip("/")
+        self.lease_seconds = lease_seconds
+
+        self._owned: set[str] = set()
+        self._replica_urls: dict[str, str] = {}
+        self._ring = ConsistentHashRing()
+        self._replicas_refreshed_at = 0.0
+
+        self._heartbeat_task: asyncio.Task | None = None
+        self._http_client: httpx.AsyncClient | None = None
+
+    @property
+    def heartbeat_interval(self) -> float:
+        return max(1.0, self.lease_seconds / 3)
+
+    # === 라이프사이클 ===
+
+    async def start(self) -> None:
+        """레플리카 등록 + 하트비트 시작"""
+        await self._register()
+        await self._refresh_replicas(force=True)
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        logger.info(
+            "Context sharding started: replica_id=%s, url=%s",
+            self.replica_id,
+            self.advertise_url,
+        )
+
+    async def stop(self) -> None:
+        """하트비트 중지 + 보유 lease 반납 (다른 레플리카가 스냅샷으로 인계)"""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+
+        try:
+            redis = await get_redis()
+            for meeting_id in list(self._owned):
+                await redis.eval(
+                    _RELEASE_SCRIPT, 1, self._owner_key(meeting_id), self.replica_id
+                )
+            await redis.srem(REPLICAS_SET_KEY, self.replica_id)
+            await redis.delete(f"{REPLICA_KEY_PREFIX}{self.replica_id}")
+        except Exception as e:
+            logger.warning("Context sharding shutdown cleanup failed: %s", e)
+        self._owned.clear()
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    # === 오너십 ===
+
+    def owns(self, meeting_id: str) -> bool:
+        """이 레플리카가 lease를 보유 중인지 (Redis 조회 없음)"""
+        return meeting_id in self._owned
+
+    @staticmethod
+    def _owner_key(meeting_id: str) -> str:
+        return f"{OWNER_KEY_PREFIX}{meeting_id}"
+
+    async def _claim(self, meeting_id: str, stale_owner: str = "") -> bool:
+        redis = await get_redis()
+        claimed = await redis.eval(
+            _CLAIM_SCRIPT,
+            2,
+            self._owner_key(meeting_id),
+            f"{REPLICA_KEY_PREFIX}{stale_owner}",
+            self.replica_id,
+            stale_owner,
+            self.lease_seconds,
+        )
+        if claimed:
+            self._owned.add(meeting_id)
+            return True
+        return False
+
+    async def _is_live_replica(self, replica_id: str) -> bool:
+        """URL을 아는 살아있는 레플리카인지 (모르면 레플리카 목록 갱신 후 판단)"""
+        if replica_id not in self._replica_urls:
+            await self._refresh_replicas(force=True)
+        return replica_id in self._replica_urls
+
+    async def _claim_or_current(self, meeting_id: str, stale_owner: str = "") -> str | None:
+        """claim 시도, 경쟁에서 지면 현재 오너 반환
+
+        Returns:
+            오너 replica_id (자기 자신이면 로컬 처리), 살아있는 오너를 찾지 못하면 None
+        """
+        if await self._claim(meeting_id, stale_owner=stale_owner):
+            return self.replica_id
+
+        redis = await get_redis()
+        current = await redis.get(self._owner_key(meeting_id))
+        if current == self.replica_id:
+            self._owned.add(meeting_id)
+            return current
+        if current and await self._is_live_replica(current):
+            return current
+        # 오너가 그 사이 lease를 반납했거나 하트비트가 만료됨 → 한 번 더 claim
+        if await self._claim(meeting_id, stale_owner=current or ""):
+            return self.replica_id
+        return None
+
+    async def resolve_owner(self, meeting_id: str, forwarded: bool = False) -> str | None:
+        """회의 오너 replica_id 결정 (필요 시 claim)
+
+        Args:
+            meeting_id: 회의 ID
+            forwarded: 다른 레플리카가 포워딩한 요청 여부
+
+        Returns:
+            오너 replica_id (자기 자신이면 로컬 처리, URL을 아는 레플리카만 반환),
+            살아있는 오너를 찾지 못하면 None
+        """
+        await self._refresh_replicas()
+        redis = await get_redis()
+        owner = await redis.get(self._owner_key(meeting_id))
+
+        if owner == self.replica_id:
+            self._owned.add(meeting_id)
+            return owner
+        if owner and await self._is_live_replica(owner):
+            # 살아있는 오너는 포워딩된 요청이어도 그대로 오너로 (lease를 빼앗지 않음)
+            return owner
+
+        # 오너 없음/죽음 → 선호 레플리카가 claim (포워딩된 요청은 되돌려 보내지 않고 직접 claim)
+        preferred = self._ring.get(meeting_id) or self.replica_id
+        if forwarded or preferred == self.replica_id or preferred not in self._replica_urls:
+            return await self._claim_or_current(meeting_id, stale_owner=owner or "")
+
+        return preferred
+
+    async def failover(self, meeting_id: str, dead_owner: str) -> str | None:
+        """오너 연결 실패 시 인계 (스냅샷 복원은 런타임 캐시 미스 시 수행)
+
+        오너의 하트비트 키가 만료된 뒤에만 claim합니다.
+        일시적인 연결 실패로 살아있는 lease를 빼앗으면 두 레플리카가 같은 회의를 갱신합니다.
+
+        Returns:
+            새 오너 replica_id (자기 자신이면 로컬 처리), 인계할 수 없으면 None
+        """
+        redis = await get_redis()
+        if await redis.exists(f"{REPLICA_KEY_PREFIX}{dead_owner}"):
+            logger.warning(
+                "Context owner unreachable but heartbeat alive: meeting_id=%s, owner=%s",
+                meeting_id,
+                dead_owner,
+            )
+            return None
+
+        self._replica_urls.pop(dead_owner, None)
+        self._ring.remove(dead_owner)
+        owner = await self._claim_or_current(meeting_id, stale_owner=dead_owner)
+        if owner == self.replica_id:
+            logger.warning(
+                "Context owner unreachable, taking over: meeting_id=%s, dead_owner=%s",
+                meeting_id,
+                dead_owner,
+            )
+        else:
+            logger.warning(
+                "Context failover claim lost: meeting_id=%s, dead_owner=%s, owner=%s",
+                meeting_id,
+                dead_owner,
+                owner,
+            )
+        return owner
+
+    # === 레플리카 목록 / 하트비트 ===
+
+    async def _register(self) -> None:
+        redis = await get_redis()
+        pipe = redis.pipeline(transaction=False)
+        pipe.set(
+            f"{REPLICA_KEY_PREFIX}{self.replica_id}",
+            self.advertise_url,
+            ex=self.lease_seconds,
+        )
+        pipe.sadd(REPLICAS_SET_KEY, self.replica_id)
+        await pipe.execute()
+
+    async def _refresh_replicas(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._replicas_refreshed_at < self.heartbeat_interval:
+            return
+        self._replicas_refreshed_at = now
+
+        redis = await get_redis()
+        replica_ids = sorted(await redis.smembers(REPLICAS_SET_KEY))
+        urls = (
+            await redis.mget([f"{REPLICA_KEY_PREFIX}{rid}" for rid in replica_ids])
+            if replica_ids
+            else []
+        )
+
+        live: dict[str, str] = {}
+        dead: list[str] = []
+        for rid, url in zip(replica_ids, urls):
+            if url:
+                live[rid] = url
+            else:
+                dead.append(rid)
+        live[self.replica_id] = self.advertise_url
+
+        if dead:
+            await redis.srem(REPLICAS_SET_KEY, *dead)
+
+        if set(live) != self._ring.nodes:
+            self._ring = ConsistentHashRing(list(live))
+        self._replica_urls = live
+
+    async def _renew_leases(self) -> None:
+        redis = await get_redis()
+        for meeting_id in list(self._owned):
+            if get_runtime_if_exists(meeting_id) is None:
+                # TTL 캐시에서 축출된 회의는 lease 반납 (재배치 허용)
+                await redis.eval(
+                    _RELEASE_SCRIPT, 1, self._owner_key(meeting_id), self.replica_id
+                )
+                self._owned.discard(meeting_id)
+                continue
+
+            renewed = await redis.eval(
+                _RENEW_SCRIPT,
+                1,
+                self._owner_key(meeting_id),
+                self.replica_id,
+                self.lease_seconds,
+            )
+            if not renewed:
+                # lease 상실 → 다른 레플리카가 인계했으므로 로컬 런타임 폐기
+                self._owned.discard(meeting_id)
+                evict_runtime(meeting_id)
+                logger.warning("Context lease lost, runtime evicted: meeting_id=%s", meeting_id)
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self._register()
+                await self._renew_leases()
+                await self._refresh_replicas(force=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Context sharding heartbeat failed: %s", e)
+
+    # === 포워딩 ===
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                # SSE 응답은 길게 유지되므로 read timeout 없음
+                timeout=httpx.Timeout(connect=2.0, read=None, write=10.0, pool=5.0),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._http_client
+
+    async def forward(self, request: Request, owner: str) -> Response:
+        """요청을 오너 레플리카로 그대로 전달 (JSON/SSE 모두 스트리밍 프록시)
+
+        Raises:
+            httpx.TransportError: 오너 연결 실패
+        """
+        url = f"{self._replica_urls[owner]}{request.url.path}"
+        headers = {
+            key: value
+            for key, value in request.headers.items()
+            if key.lower() not in _HOP_BY_HOP_HEADERS
+        }
+        headers[FORWARDED_HEADER] = self.replica_id
+
+        client = self._get_http_client()
+        upstream = await client.send(
+            client.build_request(
+                request.method,
+                url,
+                params=request.query_params,
+                headers=headers,
+                content=await request.body(),
+            ),
+            stream=True,
+        )
+        response_headers = {
+            key: value
+            for key, value in upstream.headers.items()
+            if key.lower() not in _HOP_BY_HOP_HEADERS
+        }
+        return StreamingResponse(
+            upstream.aiter_raw(),
+            status_code=upstream.status_code,
+            headers=response_headers,
+            background=BackgroundTask(upstream.aclose),
+        )
+
+
+def _record_route(result: str) -> None:
+    metrics = get_mit_metrics()
+    if metrics:
+        metrics.context_route_total.add(1, {"result": result})
+
+
+# 글로벌 라우터 인스턴스
+_router: ContextShardRouter | None = None
+
+
+def get_context_shard_router() -> ContextShardRouter | None:
+    """글로벌 샤드 라우터 반환 (샤딩 비활성화 시 None)"""
+    global _router
+    settings = get_settings()
+    if not settings.context_sharding_enabled:
+        return None
+    if _router is None:
+        hostname = socket.gethostname()
+        _router = ContextShardRouter(
+            replica_id=settings.replica_id or hostname,
+            advertise_url=settings.replica_advertise_url or f"http://{hostname}:{settings.port}",
+            lease_seconds=settings.context_owner_lease_seconds,
+        )
+    return _router
+
+
+async def start_context_sharding() -> None:
+    """앱 시작 시 레플리카 등록 (비활성화 시 no-op)"""
+    router = get_context_shard_router()
+    if router is None:
+        return
+    try:
+        await router.start()
+    except Exception as e:
+        logger.warning("Context sharding start failed (serving locally): %s", e)
+
+
+async def stop_context_sharding() -> None:
+    """앱 종료 시 lease 반납 + 연결 정리"""
+    global _router
+    if _router is not None:
+        await _router.stop()
+        _router = None
+
+
+def is_local_context_owner(meeting_id: str) -> bool:
+    """이 레플리카가 회의 런타임을 갱신해도 되는지 (샤딩 비활성화 시 항상 True)"""
+    router = get_context_shard_router()
+    return router is None or router.owns(meeting_id)
+
+
+def _owner_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={
+            "error": "CONTEXT_OWNER_UNAVAILABLE",
+            "message": "회의 담당 서버에 연결할 수 없습니다. 잠시 후 다시 시도하세요.",
+        },
+    )
+
+
+async def route_context_request(request: Request, meeting_id: str) -> Response | None:
+    """회의 오너가 다른 레플리카면 프록시 응답을 반환
+
+    Returns:
+        프록시 응답, 또는 None (로컬에서 처리해야 함)
+
+    Raises:
+        HTTPException: 503 - 오너에 연결할 수 없고 인계도 불가
+    """
+    router = get_context_shard_router()
+    if router is None:
+        return None
+
+    forwarded = FORWARDED_HEADER.lower() in request.headers
+    try:
+        owner = await router.resolve_owner(meeting_id, forwarded=forwarded)
+    except Exception as e:
+        # Redis 장애 시 로컬 처리 (단일 파드 동작과 동일)
+        logger.warning("Context owner resolve failed, serving locally: %s", e)
+        return None
+
+    if forwarded or owner == router.replica_id:
+        # 포워딩된 요청은 재포워딩하지 않음 (오너가 그 사이 바뀌어도 홉 1회로 제한)
+        _record_route("local")
+        return None
+    if owner is None:
+        _record_route("unavailable")
+        raise _owner_unavailable()
+
+    try:
+        response = await router.forward(request, owner)
+    except httpx.TransportError as e:
+        logger.warning("Context forward failed: owner=%s, error=%s", owner, e)
+        try:
+            owner = await router.failover(meeting_id, owner)
+        except Exception as claim_error:
+            logger.warning("Context failover claim failed: %s", claim_error)
+            owner = None
+
+        if owner == router.replica_id:
+            _record_route("failover")
+            return None
+        if owner is None:
+            _record_route("unavailable")
+            raise _owner_unavailable()
+
+        # 경쟁에서 이긴 새 오너로 한 번만 재시도
+        try:
+            response = await router.forward(request, owner)
+        except httpx.TransportError as retry_error:
+            logger.warning("Context forward failed: owner=%s, error=%s", owner, retry_error)
+            _record_route("unavailable")
+            raise _owner_unavailable()
+
+    _record_route("forwarded")
+    return response
@@ -2,6 +2,7 @@
 
 회의록 변경 이벤트를 구독자들에게 브로드캐스트합니다.
 Redis Pub/Sub 기반 - 프로세스 간 통신 지원 (API 서버 ↔ ARQ Worker).
+구독은 프로세스 공용 허브(app.core.pubsub_hub)의 패턴 구독을 공유합니다.
 """
 
 import asyncio
@@ -12,6 +13,8 @@ from typing import AsyncGenerator
 from redis.asyncio import Redis
 
 from app.core.config import get_settings
+from app.core.pubsub_hub import HEARTBEAT, get_pubsub_hub
+from app.infrastructure.cache.minutes_cache import record_minutes_change
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,7 @@ class MinutesEventManager:
     Redis Pub/Sub을 사용하여 프로세스 간 이벤트 전달을 지원합니다.
     - API 서버에서 publish → 모든 API 서버의 SSE 구독자에게 전달
     - ARQ Worker에서 publish → 모든 API 서버의 SSE 구독자에게 전달
+    - publish마다 Minutes View 스냅샷 버전을 올려 캐시된 View를 무효화
     """
 
     def __init__(self):
@@ -49,6 +53,11 @@ class MinutesEventManager:
             event: 이벤트 데이터 {"event": "...", ...}
         """
         try:
+            # 스냅샷 버전 증가 → 구독자는 이벤트의 version으로 델타 조회 (since_version)
+            version = await record_minutes_change(meeting_id, event)
+            if version is not None:
+                event = {**event, "version": version}
+
             redis = await self._get_publish_redis()
             channel = f"minutes:{meeting_id}"
             await redis.publish(channel, json.dumps(event))
@@ -57,52 +66,30 @@ class MinutesEventManager:
             logger.warning(f"Failed to publish event: {e}")
 
     async def subscribe(self, meeting_id: str) -> AsyncGenerator[dict, None]:
-        """이벤트 구독 (Redis Pub/Sub)
+        """이벤트 구독 (프로세스 공용 Pub/Sub 허브)
 
         SSE 엔드포인트에서 사용하는 async generator.
-        Redis Pub/Sub 채널을 구독하여 이벤트를 수신합니다.
+        클라이언트별 Redis 연결 없이 허브의 패턴 구독에서 이 회의 채널 메시지를 받습니다.
+        허브 버퍼를 넘겨 퇴출되면 스트림이 끝납니다 (클라이언트 재연결 후 재조회).
 
         Args:
             meeting_id: 구독할 회의 ID
 
         Yields:
-            이벤트 dict
+            이벤트 dict (허브 heartbeat마다 {"event": "keepalive"})
         """
-        settings = get_settings()
-        # Subscribe용 별도 Redis 연결 (pubsub은 연결을 점유함)
-        redis = Redis.from_url(
-            settings.redis_url,
-            decode_responses=True,
-            socket_connect_timeout=5.0,
-        )
-        pubsub = redis.pubsub()
         channel = f"minutes:{meeting_id}"
 
         try:
-            await pubsub.subscribe(channel)
-            logger.info(f"SSE subscriber connected: channel={channel}")
-
-            # listen()을 사용한 async iteration
-            last_event_time = asyncio.get_event_loop().time()
-
-            async for message in pubsub.listen():
-                # subscribe 확인 메시지 무시
-                if message["type"] == "subscribe":
-                    continue
-
-                if message["type"] == "message":
-                    try:
-                        event = json.loads(message["data"])
-                        last_event_time = asyncio.get_event_loop().time()
-                        yield event
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Invalid event JSON: {e}")
-
-                # 30초마다 keepalive 체크 (listen은 블로킹이므로 별도 태스크 필요)
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_event_time > 30:
-                    last_event_time = current_time
-                    yield {"event": "keepalive"}
+            async with get_pubsub_hub().subscribe(channel) as subscription:
+                logger.info(f"SSE subscriber connected: channel={channel}")
+                async for message in subscription:
+                    if message is HEARTBEAT:
+                        yield {"event": "keepalive"}
+                    else:
+                        yield message
+                if subscription.evicted:
+                    logger.info(f"SSE subscriber evicted (slow consumer): channel={channel}")
 
         except asyncio.CancelledError:
             logger.info(f"SSE subscription cancelled: channel={channel}")
@@ -111,9 +98,6 @@ class MinutesEventManager:
             logger.error(f"SSE subscription error: {e}")
             raise
         finally:
-            await pubsub.unsubscribe(channel)
-            await pubsub.close()
-            await redis.close()
             logger.info(f"SSE subscriber disconnected: channel={channel}")
 
 
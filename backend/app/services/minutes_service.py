@@ -4,19 +4,63 @@ Minutes View 조회 (중첩 구조: agendas → decisions → suggestions/commen
 """
 
 import logging
+from dataclasses import dataclass
 
+from app.infrastructure.cache.minutes_cache import get_minutes_view_cache, make_etag
 from app.repositories.kg.repository import KGRepository
-from app.schemas.minutes import MinutesResponse
+from app.schemas.minutes import MinutesDeltaResponse, MinutesResponse
 from neo4j import AsyncDriver
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class MinutesViewResult:
+    """Minutes View 조회 결과 (body가 None이면 If-None-Match 일치 → 304)"""
+
+    body: MinutesResponse | MinutesDeltaResponse | None
+    etag: str | None = None
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def build_minutes_delta(
+    meeting_id: str,
+    data: dict,
+    since_version: int,
+    version: int,
+    changed: set[str],
+) -> MinutesDeltaResponse:
+    """스냅샷에서 바뀐 Decision만 추려 델타 응답 생성"""
+    decisions = [
+        {**decision, "agenda_id": agenda["id"]}
+        for agenda in data["agendas"]
+        for decision in agenda["decisions"]
+        if decision["id"] in changed
+    ]
+    present = {decision["id"] for decision in decisions}
+    return MinutesDeltaResponse(
+        meeting_id=meeting_id,
+        version=version,
+        since_version=since_version,
+        decisions=decisions,
+        removed_decision_ids=sorted(changed - present),
+        action_items=data.get("action_items", []),
+    )
+
+
 class MinutesService:
     """Minutes 서비스"""
 
     def __init__(self, driver: AsyncDriver):
         self.kg_repo = KGRepository(driver)
+        self.cache = get_minutes_view_cache()
 
     async def has_minutes(self, meeting_id: str) -> bool:
         """회의록 존재 여부 경량 확인"""
@@ -33,6 +77,60 @@ class MinutesService:
             - agendas[].decisions[].comments[].replies[]
             - action_items[]
         """
+        result = await self.get_minutes_view(meeting_id)
+        return result.body  # type: ignore[return-value]
+
+    async def get_minutes_view(
+        self,
+        meeting_id: str,
+        since_version: int | None = None,
+        if_none_match: str | None = None,
+    ) -> MinutesViewResult:
+        """버전 스냅샷 기반 Minutes View 조회
+
+        Args:
+            meeting_id: 회의 ID
+            since_version: 클라이언트가 가진 스냅샷 버전 (있으면 바뀐 Decision만 응답)
+            if_none_match: If-None-Match 헤더 (현재 ETag와 같으면 본문 없이 반환)
+        """
+        if self.cache is None:
+            return MinutesViewResult(body=await self._load_minutes(meeting_id))
+
+        try:
+            versions = await self.cache.read_versions(meeting_id)
+        except Exception as e:
+            logger.warning(f"Minutes cache unavailable, reading KG directly: {e}")
+            return MinutesViewResult(body=await self._load_minutes(meeting_id))
+
+        etag = make_etag(*versions)
+        if etag_matches(if_none_match, etag):
+            return MinutesViewResult(body=None, etag=etag)
+
+        snapshot = await self.cache.get(
+            meeting_id,
+            lambda: self.kg_repo.get_minutes_view(meeting_id),
+            versions=versions,
+        )
+        if snapshot is None:
+            raise ValueError("MEETING_NOT_FOUND")
+
+        if since_version is not None:
+            changed = await self.cache.changes_since(meeting_id, since_version, snapshot.version)
+            if changed is not None:
+                return MinutesViewResult(
+                    body=build_minutes_delta(
+                        meeting_id, snapshot.data, since_version, snapshot.version, changed
+                    ),
+                    etag=snapshot.etag,
+                )
+
+        logger.info(f"Minutes retrieved: meeting={meeting_id}, version={snapshot.version}")
+        return MinutesViewResult(
+            body=MinutesResponse(**snapshot.data, version=snapshot.version),
+            etag=snapshot.etag,
+        )
+
+    async def _load_minutes(self, meeting_id: str) -> MinutesResponse:
         data = await self.kg_repo.get_minutes_view(meeting_id)
 
         if not data:
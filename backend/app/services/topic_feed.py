@@ -0,0 +1,173 @@
+"""토픽 피드 발행기 (디바운스 + 시퀀스 번호 + 변경 토픽 델타)
+
+발화마다 전체 토픽 목록(요약/키워드 포함)을 다시 만들어 발행하던 방식 대신,
+회의 런타임별로 발행 요청을 묶어(debounce) 마지막 발행 이후 바뀐 토픽만 보냅니다.
+
+델타 payload (meeting:topics:{meeting_id} 채널, SSE `update` 이벤트):
+    {
+        "meetingId", "epoch", "seq",
+        "pendingChunks", "isL1Running", "currentTopic",
+        "changedTopics": [...],     # 추가/수정된 토픽 (TopicItem 형태)
+        "removedTopicIds": [...],
+        "updatedAt"
+    }
+
+클라이언트는 snapshot(GET /context/topics 또는 SSE init)의 epoch/seq를 기준으로 델타를 적용하고,
+seq가 건너뛰거나 epoch가 바뀌면(오너 레플리카 변경) snapshot을 다시 조회합니다.
+snapshot과 델타는 runtime.lock 안에서 만들어지므로 snapshot의 seq까지의 델타는
+모두 snapshot에 반영되어 있습니다 (이후 델타는 멱등 upsert).
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+from app.core.config import get_settings
+from app.core.topic_pubsub import publish_topic_update
+
+if TYPE_CHECKING:
+    from app.services.context_runtime import ContextRuntimeState
+
+logger = logging.getLogger(__name__)
+
+
+def topic_item(seg: Any) -> dict:
+    """L1 세그먼트 → 토픽 항목 (camelCase)"""
+    return {
+        "id": seg.id,
+        "name": seg.name,
+        "summary": seg.summary,
+        "startTurn": seg.start_utterance_id,
+        "endTurn": seg.end_utterance_id,
+        "keywords": seg.keywords,
+    }
+
+
+def _fingerprint(seg: Any) -> tuple:
+    return (
+        seg.name,
+        seg.summary,
+        seg.start_utterance_id,
+        seg.end_utterance_id,
+        tuple(seg.keywords),
+    )
+
+
+class TopicFeedPublisher:
+    """회의 런타임별 토픽 피드 발행기
+
+    request_publish()는 runtime.lock 안에서도 호출할 수 있는 동기 함수이며,
+    debounce 구간 동안의 요청은 한 번의 발행으로 합쳐집니다.
+    """
+
+    def __init__(
+        self,
+        meeting_id: str,
+        runtime: "ContextRuntimeState",
+        debounce_seconds: float = 0.25,
+    ):
+        self.meeting_id = meeting_id
+        self.runtime = runtime
+        self.debounce_seconds = debounce_seconds
+        # 프로세스(오너)별 피드 식별자 - 오너가 바뀌면 seq가 이어지지 않으므로 클라이언트 재동기화
+        self.epoch = uuid.uuid4().hex[:12]
+        self.seq = 0
+        self._published: dict[str, tuple] = {}
+        self._status: Optional[tuple] = None
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+    def request_publish(self) -> None:
+        """발행 요청 (debounce 후 변경분만 발행)"""
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def snapshot(self) -> dict:
+        """현재 전체 토픽 상태 (runtime.lock 안에서 호출)"""
+        manager = self.runtime.manager
+        topics = [topic_item(seg) for seg in manager.l1_segments]
+        topics.sort(key=lambda t: t["endTurn"], reverse=True)
+        return {
+            "meetingId": self.meeting_id,
+            "epoch": self.epoch,
+            "seq": self.seq,
+            "pendingChunks": len(manager._pending_l1_chunks),
+            "isL1Running": manager.is_l1_running,
+            "currentTopic": manager.current_topic,
+            "topics": topics,
+            "updatedAt": datetime.now(timezone.utc).isoformat(),
+        }
+
+    async def flush(self) -> Optional[dict]:
+        """마지막 발행 이후 변경분을 즉시 발행 (변경 없으면 None)"""
+        async with self.runtime.lock:
+            delta = self._next_delta()
+        if delta is not None:
+            await publish_topic_update(self.meeting_id, delta)
+            logger.debug(
+                "토픽 델타 발행: meeting_id=%s, seq=%d, changed=%d, removed=%d",
+                self.meeting_id,
+                delta["seq"],
+                len(delta["changedTopics"]),
+                len(delta["removedTopicIds"]),
+            )
+        return delta
+
+    async def _run(self) -> None:
+        # 발행 중 들어온 요청은 _dirty로 남아 다음 루프에서 처리 (순서 보장: 발행 태스크는 1개)
+        while self._dirty:
+            await asyncio.sleep(self.debounce_seconds)
+            self._dirty = False
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("토픽 피드 발행 실패 (비치명적): %s", e)
+
+    def _next_delta(self) -> Optional[dict]:
+        manager = self.runtime.manager
+        current = {seg.id: seg for seg in manager.l1_segments}
+        fingerprints = {seg_id: _fingerprint(seg) for seg_id, seg in current.items()}
+
+        changed = [
+            topic_item(current[seg_id])
+            for seg_id, fingerprint in fingerprints.items()
+            if self._published.get(seg_id) != fingerprint
+        ]
+        removed = sorted(seg_id for seg_id in self._published if seg_id not in current)
+        status = (
+            len(manager._pending_l1_chunks),
+            manager.is_l1_running,
+            manager.current_topic,
+        )
+        if not changed and not removed and status == self._status:
+            return None
+
+        self.seq += 1
+        self._published = fingerprints
+        self._status = status
+        changed.sort(key=lambda t: t["endTurn"], reverse=True)
+        return {
+            "meetingId": self.meeting_id,
+            "epoch": self.epoch,
+            "seq": self.seq,
+            "pendingChunks": status[0],
+            "isL1Running": status[1],
+            "currentTopic": status[2],
+            "changedTopics": changed,
+            "removedTopicIds": removed,
+            "updatedAt": datetime.now(timezone.utc).isoformat(),
+        }
+
+
+def get_topic_feed(meeting_id: str, runtime: "ContextRuntimeState") -> TopicFeedPublisher:
+    """런타임의 토픽 피드 발행기 (없으면 생성)"""
+    if runtime.topic_feed is None:
+        runtime.topic_feed = TopicFeedPublisher(
+            meeting_id,
+            runtime,
+            debounce_seconds=get_settings().topic_feed_debounce_ms / 1000,
+        )
+    return runtime.topic_feed
@@ -2,78 +2,59 @@
 
 import asyncio
 import logging
+import uuid
 from datetime import datetime, timezone
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.topic_pubsub import publish_topic_update
 from app.infrastructure.context import Utterance as ContextUtterance
 from app.models.meeting import Meeting
 from app.models.transcript import Transcript
 from app.models.user import AuthProvider, User
 from app.schemas.transcript import (
+    CreateTranscriptBatchRequest,
+    CreateTranscriptBatchResponse,
     CreateTranscriptRequest,
     CreateTranscriptResponse,
     GetMeetingTranscriptsResponse,
     UtteranceItem,
 )
-from app.services.context_runtime import ContextRuntimeState, get_runtime_if_exists
+from app.services.context_runtime import (
+    ContextRuntimeState,
+    get_or_create_runtime,
+    get_runtime_if_exists,
+    update_runtime_from_db,
+)
+from app.services.context_sharding import is_local_context_owner
+from app.services.topic_feed import get_topic_feed
 
 logger = logging.getLogger(__name__)
 
 
+def _insert_values(transcript: Transcript) -> dict:
+    """다건 INSERT용 컬럼 값"""
+    return {column.key: getattr(transcript, column.key) for column in Transcript.__table__.columns}
+
+
 class TranscriptService:
     """Transcript 관리 서비스"""
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    def _build_topic_payload(
-        self,
-        meeting_id: str,
-        runtime: ContextRuntimeState,
-    ) -> dict:
-        """SSE publish용 토픽 payload 구성."""
-        manager = runtime.manager
-
-        topics_data = [
-            {
-                "id": seg.id,
-                "name": seg.name,
-                "summary": seg.summary,
-                "startTurn": seg.start_utterance_id,
-                "endTurn": seg.end_utterance_id,
-                "keywords": seg.keywords,
-            }
-            for seg in manager.l1_segments
-        ]
-        topics_data.sort(key=lambda t: t["endTurn"], reverse=True)
-
-        return {
-            "meetingId": meeting_id,
-            "pendingChunks": len(manager._pending_l1_chunks),
-            "isL1Running": manager.is_l1_running,
-            "currentTopic": manager.current_topic,
-            "topics": topics_data,
-            "updatedAt": datetime.now(timezone.utc).isoformat(),
-        }
-
     async def _publish_after_l1_idle(
         self,
         meeting_id: str,
         runtime: ContextRuntimeState,
     ) -> None:
-        """백그라운드 L1 처리 완료 후 최신 토픽 상태를 재발행."""
+        """백그라운드 L1 처리 완료 후 변경된 토픽을 발행 요청."""
         try:
             await runtime.manager.await_l1_idle()
-
-            async with runtime.lock:
-                payload = self._build_topic_payload(meeting_id, runtime)
-
-            await publish_topic_update(meeting_id, payload)
-            logger.debug("L1 완료 후 토픽 업데이트 발행: meeting_id=%s", meeting_id)
+            get_topic_feed(meeting_id, runtime).request_publish()
+            logger.debug("L1 완료 후 토픽 업데이트 발행 요청: meeting_id=%s", meeting_id)
         except Exception as e:
             logger.warning("L1 완료 후 토픽 발행 실패 (비치명적): %s", e)
         finally:
@@ -82,73 +63,59 @@ class TranscriptService:
                 if runtime.topic_publish_task is current_task:
                     runtime.topic_publish_task = None
 
+    def _request_topic_publish(
+        self,
+        meeting_id: str,
+        runtime: ContextRuntimeState,
+        prev_l1_count: int,
+        prev_pending: int,
+    ) -> None:
+        """L1 변경 감지 시 토픽 발행 요청 (runtime.lock 안에서 호출)"""
+        # L1 변경 감지 (새 토픽 생성 또는 pending 변경)
+        curr_l1_count = len(runtime.manager.l1_segments)
+        curr_pending = len(runtime.manager._pending_l1_chunks)
+        if curr_l1_count == prev_l1_count and curr_pending == prev_pending:
+            return
+
+        # 발화 burst는 debounce로 묶여 변경된 토픽만 델타로 발행됨 (lock 밖 태스크)
+        get_topic_feed(meeting_id, runtime).request_publish()
+
+        # 새 L1 청크가 들어온 경우, 완료 시점 publish를 1회 예약
+        if curr_pending > 0 and (
+            runtime.topic_publish_task is None or runtime.topic_publish_task.done()
+        ):
+            runtime.topic_publish_task = asyncio.create_task(
+                self._publish_after_l1_idle(meeting_id, runtime)
+            )
+
     async def _sync_to_context_runtime(
         self,
         meeting_id: UUID,
-        transcript: Transcript,
+        transcripts: list[Transcript],
     ) -> None:
         """Context 런타임에 발화 동기화 (best-effort, 실패해도 transcript 저장은 성공)
 
         Args:
             meeting_id: 회의 ID
-            transcript: 저장된 발화 객체
+            transcripts: 저장된 발화 객체 (시작 시간 순)
         """
         try:
             meeting_id_str = str(meeting_id)
             runtime = get_runtime_if_exists(meeting_id_str)
             if runtime is None:
                 return  # 활성 런타임 없음 (미팅룸에 아무도 없음)
-
-            should_publish = False
-            publish_data: dict | None = None
-            should_publish_after_l1 = False
+            if not is_local_context_owner(meeting_id_str):
+                # 오너가 다른 레플리카 → 오너가 /agent/meeting/call 포워딩으로 DB에서 반영
+                return
 
             async with runtime.lock:
                 # L1 상태 저장 (변경 감지용)
                 prev_l1_count = len(runtime.manager.l1_segments)
                 prev_pending = len(runtime.manager._pending_l1_chunks)
 
-                runtime.last_utterance_id += 1
-                utterance = ContextUtterance(
-                    id=runtime.last_utterance_id,
-                    speaker_id=str(transcript.user_id),
-                    speaker_name="",  # 조회 시점에 해결
-                    text=transcript.transcript_text,
-                    start_ms=transcript.start_ms,
-                    end_ms=transcript.end_ms,
-                    confidence=transcript.confidence,
-                    absolute_timestamp=transcript.created_at or datetime.now(timezone.utc),
-                )
-                await runtime.manager.add_utterance(utterance)
-                runtime.last_processed_start_ms = transcript.start_ms
+                await self._add_utterances(runtime, transcripts)
 
-                # L1 변경 감지 (새 토픽 생성 또는 pending 변경)
-                curr_l1_count = len(runtime.manager.l1_segments)
-                curr_pending = len(runtime.manager._pending_l1_chunks)
-
-                if curr_l1_count != prev_l1_count or curr_pending != prev_pending:
-                    should_publish = True
-                    publish_data = self._build_topic_payload(meeting_id_str, runtime)
-                    should_publish_after_l1 = curr_pending > 0
-
-                    # 새 L1 청크가 들어온 경우, 완료 시점 publish를 1회 예약
-                    if (
-                        should_publish_after_l1
-                        and (runtime.topic_publish_task is None or runtime.topic_publish_task.done())
-                    ):
-                        runtime.topic_publish_task = asyncio.create_task(
-                            self._publish_after_l1_idle(meeting_id_str, runtime)
-                        )
-
-            # Redis 발행 (lock 밖에서)
-            if should_publish and publish_data is not None:
-                await publish_topic_update(meeting_id_str, publish_data)
-                logger.debug(
-                    "토픽 업데이트 발행: meeting_id=%s, topics=%d, pending=%d",
-                    meeting_id_str,
-                    curr_l1_count,
-                    curr_pending,
-                )
+                self._request_topic_publish(meeting_id_str, runtime, prev_l1_count, prev_pending)
 
             logger.debug(
                 "Context 런타임 동기화 완료: meeting_id=%s, utterance_id=%d",
@@ -159,6 +126,75 @@ class TranscriptService:
             # 실패해도 transcript 저장은 성공해야 함
             logger.warning("Context 런타임 동기화 실패 (비치명적): %s", e)
 
+    @staticmethod
+    async def _add_utterances(
+        runtime: ContextRuntimeState,
+        transcripts: list[Transcript],
+    ) -> None:
+        """발화를 순서대로 런타임에 추가 (runtime.lock 안에서 호출)"""
+        for transcript in transcripts:
+            runtime.last_utterance_id += 1
+            utterance = ContextUtterance(
+                id=runtime.last_utterance_id,
+                speaker_id=str(transcript.user_id),
+                speaker_name="",  # 조회 시점에 해결
+                text=transcript.transcript_text,
+                start_ms=transcript.start_ms,
+                end_ms=transcript.end_ms,
+                confidence=transcript.confidence,
+                absolute_timestamp=transcript.created_at or datetime.now(timezone.utc),
+            )
+            await runtime.manager.add_utterance(utterance)
+            # 늦게 확정된 발화가 워터마크를 되돌리지 않도록 (/agent/meeting/call 중복 반영 방지)
+            if (
+                runtime.last_processed_start_ms is None
+                or transcript.start_ms > runtime.last_processed_start_ms
+            ):
+                runtime.last_processed_start_ms = transcript.start_ms
+
+    async def _sync_batch_to_context_runtime(
+        self,
+        meeting_id: UUID,
+        transcripts: list[Transcript],
+    ) -> None:
+        """커밋된 배치 발화를 Context 런타임에 반영 (best-effort)
+
+        새로 저장된 발화를 start_ms 순으로 그대로 추가합니다.
+        배치에는 여러 화자의 발화가 섞여 있어 늦게 확정된 긴 발화가 이미 반영된
+        발화보다 먼저 시작할 수 있으므로 start_ms 워터마크로 거르지 않습니다.
+        런타임이 없으면 만들고(스냅샷 복원) DB에서 따라잡습니다 (/agent/meeting/call과 같은 방식).
+
+        Args:
+            meeting_id: 회의 ID
+            transcripts: 이번 요청에서 새로 저장된 발화 (재전송 제외)
+        """
+        try:
+            meeting_id_str = str(meeting_id)
+            if not is_local_context_owner(meeting_id_str):
+                return
+
+            runtime = get_runtime_if_exists(meeting_id_str)
+            created = runtime is None
+            if created:
+                runtime = await get_or_create_runtime(meeting_id_str)
+
+            async with runtime.lock:
+                prev_l1_count = len(runtime.manager.l1_segments)
+                prev_pending = len(runtime.manager._pending_l1_chunks)
+
+                if created:
+                    # 커밋 이후이므로 이번 배치도 DB 조회에 포함됨
+                    await update_runtime_from_db(runtime, self.db, meeting_id_str, None)
+                else:
+                    await self._add_utterances(
+                        runtime, sorted(transcripts, key=lambda t: t.start_ms)
+                    )
+
+                self._request_topic_publish(meeting_id_str, runtime, prev_l1_count, prev_pending)
+        except Exception as e:
+            # 실패해도 transcript 저장은 성공해야 함
+            logger.warning("Context 런타임 동기화 실패 (비치명적): %s", e)
+
     async def create_transcript(
         self,
         meeting_id: UUID,
@@ -207,13 +243,114 @@ class TranscriptService:
         await self.db.refresh(transcript)
 
         # Context 런타임에 즉시 반영 (best-effort)
-        await self._sync_to_context_runtime(meeting_id, transcript)
+        await self._sync_to_context_runtime(meeting_id, [transcript])
 
         return CreateTranscriptResponse(
             id=transcript.id,
             created_at=transcript.created_at,
         )
 
+    async def create_transcripts_batch(
+        self,
+        meeting_id: UUID,
+        request: CreateTranscriptBatchRequest,
+    ) -> CreateTranscriptBatchResponse:
+        """발화 segment 배치 저장 (Worker → Backend)
+
+        다건 INSERT 1회로 저장하고 같은 요청에서 Context 런타임까지 반영합니다.
+        이미 저장된 idempotencyKey(재전송)는 새로 저장하지 않고 기존 segment를 반환합니다.
+
+        Args:
+            meeting_id: path에서 받은 meeting_id
+            request: body에서 받은 배치 데이터
+
+        Returns:
+            CreateTranscriptBatchResponse (요청 segments 순서)
+
+        Raises:
+            ValueError: validation 실패 시
+        """
+        if meeting_id != request.meeting_id:
+            raise ValueError("MEETING_ID_MISMATCH")
+        if any(segment.end_ms <= segment.start_ms for segment in request.segments):
+            raise ValueError("INVALID_TIME_RANGE")
+
+        # 같은 배치 안의 중복 키는 첫 segment만 저장
+        segments = {}
+        for segment in request.segments:
+            segments.setdefault(segment.idempotency_key, segment)
+
+        now = datetime.now(timezone.utc)
+        transcripts = {
+            key: Transcript(
+                id=uuid.uuid4(),
+                meeting_id=meeting_id,
+                user_id=segment.user_id,
+                start_ms=segment.start_ms,
+                end_ms=segment.end_ms,
+                transcript_text=segment.text,
+                confidence=segment.confidence,
+                min_confidence=segment.min_confidence,
+                agent_call=segment.agent_call,
+                agent_call_keyword=segment.agent_call_keyword,
+                agent_call_confidence=segment.agent_call_confidence,
+                status=segment.status,
+                idempotency_key=key,
+                created_at=now,
+            )
+            for key, segment in segments.items()
+        }
+
+        stmt = (
+            pg_insert(Transcript)
+            .values([_insert_values(transcript) for transcript in transcripts.values()])
+            .on_conflict_do_nothing(index_elements=["meeting_id", "idempotency_key"])
+            .returning(Transcript.idempotency_key)
+        )
+        result = await self.db.execute(stmt)
+        inserted = set(result.scalars().all())
+
+        # 재전송된 키 → 기존 segment
+        existing: dict[str, tuple[UUID, datetime]] = {}
+        duplicates = [key for key in transcripts if key not in inserted]
+        if duplicates:
+            rows = await self.db.execute(
+                select(Transcript.idempotency_key, Transcript.id, Transcript.created_at).where(
+                    Transcript.meeting_id == meeting_id,
+                    Transcript.idempotency_key.in_(duplicates),
+                )
+            )
+            existing = {key: (row_id, created_at) for key, row_id, created_at in rows.all()}
+
+        # 커밋 후 Context 런타임 반영 - 롤백 시 런타임만 앞서가지 않도록,
+        # /agent/meeting/call 왕복 불필요
+        await self.db.commit()
+        await self._sync_batch_to_context_runtime(
+            meeting_id, [transcripts[key] for key in inserted]
+        )
+
+        items = []
+        for segment in request.segments:
+            key = segment.idempotency_key
+            if key in existing:
+                row_id, created_at = existing[key]
+                items.append(
+                    {"idempotency_key": key, "id": row_id, "created_at": created_at, "duplicate": True}
+                )
+            else:
+                transcript = transcripts[key]
+                items.append(
+                    {"idempotency_key": key, "id": transcript.id, "created_at": transcript.created_at}
+                )
+
+        logger.debug(
+            "Transcript 배치 저장: meeting_id=%s, received=%d, inserted=%d",
+            meeting_id,
+            len(request.segments),
+            len(inserted),
+        )
+        return CreateTranscriptBatchResponse(items=items)
+
     async def get_meeting_transcripts(
         self, meeting_id: UUID
     ) -> GetMeetingTranscriptsResponse:
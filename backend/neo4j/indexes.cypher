@@ -24,3 +24,16 @@ FOR (m:Meeting) ON EACH [m.title, m.summary];
 
 CREATE FULLTEXT INDEX decision_search IF NOT EXISTS
 FOR (d:Decision) ON EACH [d.content, d.context];
+
+// 벡터 인덱스 (bge-m3 1024차원, cosine) - hybrid 검색용
+CREATE VECTOR INDEX decision_embedding IF NOT EXISTS
+FOR (d:Decision) ON d.embedding
+OPTIONS {indexConfig: {`vector.dimensions`: 1024, `vector.similarity_function`: 'cosine'}};
+
+CREATE VECTOR INDEX agenda_embedding IF NOT EXISTS
+FOR (a:Agenda) ON a.embedding
+OPTIONS {indexConfig: {`vector.dimensions`: 1024, `vector.similarity_function`: 'cosine'}};
+
+CREATE VECTOR INDEX meeting_embedding IF NOT EXISTS
+FOR (m:Meeting) ON m.embedding
+OPTIONS {indexConfig: {`vector.dimensions`: 1024, `vector.similarity_function`: 'cosine'}};
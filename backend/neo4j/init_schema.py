@@ -87,8 +87,8 @@ def _execute_cypher_file(driver, file_path: Path) -> None:
     statements = []
     for line in content.split(";"):
         line = line.strip()
-        # 빈 줄과 주석만 있는 경우 스킵
-        if line and not line.startswith("//"):
+        # 빈 줄 스킵 (주석 줄은 아래에서 제거, 주석만 있는 경우 statement가 비어 스킵)
+        if line:
             # 줄 단위 주석 제거
             clean_lines = [l for l in line.split("\n") if not l.strip().startswith("//")]
             statement = "\n".join(clean_lines).strip()
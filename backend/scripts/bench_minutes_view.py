@@ -0,0 +1,311 @@
+"""Minutes View 조회 벤치마크 (Neo4j 왕복 수 / 지연).
+
+기존 Agenda/Decision별 개별 쿼리 경로와 배치 조회(KGRepository.get_minutes_view)를
+시드 데이터(seeds/neo4j_seed.py) 회의에 대해 비교하고, 두 경로의 결과가 같은지 확인합니다.
+
+사용법 (backend 디렉토리에서):
+    python scripts/bench_minutes_view.py
+    python scripts/bench_minutes_view.py --meetings 20 --repeat 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.neo4j import close_neo4j, get_neo4j_driver
+from app.repositories.kg.repository import (
+    KGRepository,
+    _build_comment_tree,
+    _convert_neo4j_datetime,
+    _parse_evidence,
+)
+
+# ── 기존 구현 (비교 기준) ─────────────────────────────────────
+
+
+async def legacy_get_minutes_view(repo: KGRepository, meeting_id: str) -> dict:
+    """기존 get_minutes_view (Agenda/Decision별 개별 쿼리)"""
+    # 1. Meeting + Summary 조회
+    meeting_query = """
+    MATCH (m:Meeting {id: $meeting_id})
+    RETURN m.id as meeting_id, m.title as meeting_title, m.summary as summary
+    """
+    meeting_records = await repo._execute_read(meeting_query, {"meeting_id": meeting_id})
+    if not meeting_records:
+        return {}
+
+    meeting = meeting_records[0]
+
+    # 2. Agendas 조회
+    agenda_query = """
+    MATCH (m:Meeting {id: $meeting_id})-[rel:CONTAINS]->(a:Agenda)
+    RETURN a.id as id, a.topic as topic, a.description as description, a.evidence as evidence, rel.order as order
+    ORDER BY rel.order
+    """
+    agenda_records = await repo._execute_read(agenda_query, {"meeting_id": meeting_id})
+
+    agendas = []
+    for a in agenda_records:
+        # 3. Decisions per Agenda (with approvers/rejectors)
+        # active Decision만 조회 (superseded, outdated 제외 - rejected는 포함)
+        decision_query = """
+        MATCH (a:Agenda {id: $agenda_id})-[:HAS_DECISION]->(d:Decision)
+        WHERE NOT (d.status IN ['superseded', 'outdated'])
+        OPTIONAL MATCH (approver:User)-[:APPROVES]->(d)
+        OPTIONAL MATCH (rejector:User)-[:REJECTS]->(d)
+        // 이전 GT 조회 (OUTDATES 관계 - latest → outdated)
+        OPTIONAL MATCH (d)-[:OUTDATES]->(prev:Decision)
+        WHERE prev.status = 'outdated'
+        RETURN d.id as id, d.content as content, d.context as context,
+               d.status as status, d.meeting_id as meeting_id,
+               d.created_at as created_at, d.updated_at as updated_at,
+               d.evidence as evidence,
+               [x IN collect(DISTINCT approver.id) WHERE x IS NOT NULL] as approvers,
+               [x IN collect(DISTINCT rejector.id) WHERE x IS NOT NULL] as rejectors,
+               prev.id as supersedes_id, prev.content as supersedes_content,
+               prev.meeting_id as supersedes_meeting_id
+        """
+        decision_records = await repo._execute_read(decision_query, {"agenda_id": a["id"]})
+
+        decisions = []
+        for d in decision_records:
+            # 4. Suggestions per Decision ([:ON] 관계로 조회 - AI 분석 전 Suggestion도 포함)
+            suggestion_query = """
+            MATCH (s:Suggestion)-[:ON]->(d:Decision {id: $decision_id})
+            MATCH (u:User)-[:SUGGESTS]->(s)
+            OPTIONAL MATCH (s)-[:CREATES]->(cd:Decision)
+            RETURN s.id as id, s.content as content,
+                   u.id as author_id, u.name as author_name, u.email as author_email,
+                   s.status as status,
+                   cd.id as cd_id, cd.content as cd_content, cd.status as cd_status,
+                   s.created_at as created_at
+            """
+            suggestion_records = await repo._execute_read(suggestion_query, {"decision_id": d["id"]})
+            suggestions = [
+                {
+                    "id": s["id"],
+                    "content": s["content"],
+                    "author": {
+                        "id": s["author_id"],
+                        "name": s["author_name"] or "",
+                        "email": s["author_email"] or "",
+                    },
+                    "created_decision": {
+                        "id": s["cd_id"],
+                        "content": s["cd_content"] or "",
+                        "status": s["cd_status"] or "draft",
+                    } if s["cd_id"] else None,
+                    "created_at": _convert_neo4j_datetime(s["created_at"]).isoformat(),
+                }
+                for s in suggestion_records
+            ]
+
+            # 5. Comments per Decision (모든 depth를 단일 쿼리로 조회)
+            comment_query = """
+            MATCH (u:User)-[:COMMENTS]->(c:Comment)-[:ON]->(d:Decision {id: $decision_id})
+            OPTIONAL MATCH (c)-[:REPLY_TO]->(parent:Comment)
+            RETURN c.id as id, c.content as content,
+                   u.id as author_id, u.name as author_name, u.email as author_email,
+                   c.pending_agent_reply as pending_agent_reply,
+                   c.is_error_response as is_error_response,
+                   c.created_at as created_at,
+                   parent.id as parent_id
+            ORDER BY c.created_at
+            """
+            comment_records = await repo._execute_read(comment_query, {"decision_id": d["id"]})
+
+            # 6. History: SUPERSEDES 체인을 따라 superseded된 Decision들 조회
+            # 같은 Meeting 스코프 내 + superseded 상태만 (Suggestion 히스토리)
+            # OUTDATES 관계(GT 변화)는 제외
+            history_query = """
+            MATCH (current:Decision {id: $decision_id})-[:SUPERSEDES*]->(prev:Decision)
+            WHERE prev.meeting_id = $meeting_id AND prev.status = 'superseded'
+            RETURN prev.id as id, prev.content as content, prev.status as status,
+                   prev.created_at as created_at
+            ORDER BY prev.created_at DESC
+            """
+            history_records = await repo._execute_read(
+                history_query, {"decision_id": d["id"], "meeting_id": meeting_id}
+            )
+            history = [
+                {
+                    "id": h["id"],
+                    "content": h["content"] or "",
+                    "status": h["status"] or "superseded",
+                    "created_at": _convert_neo4j_datetime(h["created_at"]).isoformat(),
+                }
+                for h in history_records
+            ]
+
+            # Flat list 생성
+            flat_comments = [
+                {
+                    "id": c["id"],
+                    "content": c["content"],
+                    "author": {
+                        "id": c["author_id"],
+                        "name": c["author_name"] or "",
+                        "email": c["author_email"] or "",
+                    },
+                    "pending_agent_reply": c["pending_agent_reply"] or False,
+                    "is_error_response": c.get("is_error_response") or False,
+                    "created_at": _convert_neo4j_datetime(c["created_at"]).isoformat(),
+                    "parent_id": c["parent_id"],
+                }
+                for c in comment_records
+            ]
+
+            # Tree 구조로 변환 (무제한 depth 지원)
+            comments = _build_comment_tree(flat_comments)
+
+            decisions.append({
+                "id": d["id"],
+                "content": d["content"] or "",
+                "context": d["context"],
+                "status": d["status"] or "draft",
+                "meeting_id": d["meeting_id"],
+                "approvers": d["approvers"] or [],
+                "rejectors": d["rejectors"] or [],
+                "evidence": _parse_evidence(d.get("evidence")),
+                "created_at": _convert_neo4j_datetime(d["created_at"]).isoformat(),
+                "updated_at": _convert_neo4j_datetime(d["updated_at"]).isoformat() if d.get("updated_at") else None,
+                "suggestions": suggestions,
+                "comments": comments,
+                # 이전 버전 정보 (GT 표시용)
+                "supersedes": {
+                    "id": d["supersedes_id"],
+                    "content": d["supersedes_content"] or "",
+                    "meeting_id": d["supersedes_meeting_id"],
+                } if d.get("supersedes_id") else None,
+                # 히스토리: 같은 Meeting 스코프 내 superseded된 모든 이전 버전
+                "history": history,
+            })
+
+        agendas.append({
+            "id": a["id"],
+            "topic": a["topic"] or "",
+            "description": a["description"],
+            "order": a["order"] or 0,
+            "decisions": decisions,
+            "evidence": _parse_evidence(a.get("evidence")),
+        })
+
+    # 7. ActionItems 조회
+    action_item_query = """
+    MATCH (m:Meeting {id: $meeting_id})-[:CONTAINS]->(a:Agenda)-[:HAS_DECISION]->(d:Decision)-[:TRIGGERS]->(ai:ActionItem)
+    OPTIONAL MATCH (assignee:User)-[:ASSIGNED_TO]->(ai)
+    RETURN ai.id as id, ai.content as content, ai.status as status,
+           assignee.id as assignee_id, ai.due_date as due_date
+    """
+    action_item_records = await repo._execute_read(action_item_query, {"meeting_id": meeting_id})
+    action_items = [
+        {
+            "id": ai["id"],
+            "content": ai["content"] or "",
+            "status": ai["status"] or "pending",
+            "assignee_id": ai["assignee_id"],
+            "due_date": _convert_neo4j_datetime(ai["due_date"]).isoformat() if ai["due_date"] else None,
+        }
+        for ai in action_item_records
+    ]
+
+    return {
+        "meeting_id": meeting["meeting_id"],
+        "meeting_title": meeting.get("meeting_title"),
+        "summary": meeting["summary"] or "",
+        "agendas": agendas,
+        "action_items": action_items,
+    }
+
+
+# ── 벤치마크 ─────────────────────────────────────────────────
+
+
+class CountingKGRepository(KGRepository):
+    """_execute_read 호출 수(= Neo4j 왕복 수)를 세는 Repository"""
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.round_trips = 0
+
+    async def _execute_read(self, query, parameters=None):
+        self.round_trips += 1
+        return await super()._execute_read(query, parameters)
+
+
+async def _busiest_meetings(repo: KGRepository, limit: int) -> list[str]:
+    """Decision이 많은 회의 순으로 ID 조회"""
+    records = await repo._execute_read(
+        """
+        MATCH (m:Meeting)-[:CONTAINS]->(:Agenda)-[:HAS_DECISION]->(d:Decision)
+        RETURN m.id AS id, count(d) AS decisions
+        ORDER BY decisions DESC
+        LIMIT $limit
+        """,
+        {"limit": limit},
+    )
+    return [r["id"] for r in records]
+
+
+async def _measure(repo: CountingKGRepository, fn, meeting_id: str, repeat: int):
+    latencies = []
+    result = None
+    for _ in range(repeat):
+        repo.round_trips = 0
+        start = time.perf_counter()
+        result = await fn(repo, meeting_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(latencies), repo.round_trips
+
+
+async def _batched(repo: KGRepository, meeting_id: str) -> dict:
+    return await repo.get_minutes_view(meeting_id)
+
+
+def _normalize(view: dict) -> dict:
+    """비교용 정규화 (Decision 순서는 쿼리 계획에 따라 달라질 수 있음)"""
+    for agenda in view.get("agendas", []):
+        agenda["decisions"].sort(key=lambda d: d["id"])
+    view.get("action_items", []).sort(key=lambda ai: (ai["id"], ai["assignee_id"] or ""))
+    return view
+
+
+async def main(meetings: int, repeat: int) -> None:
+    repo = CountingKGRepository(get_neo4j_driver())
+    try:
+        meeting_ids = await _busiest_meetings(repo, meetings)
+        if not meeting_ids:
+            print("Decision이 있는 회의가 없습니다. seeds/neo4j_seed.py로 시드 데이터를 먼저 넣어주세요.")
+            return
+
+        print(f"{'meeting':<38} {'legacy ms':>10} {'trips':>6} {'batched ms':>11} {'trips':>6}  same")
+        legacy_ms, batched_ms = [], []
+        for meeting_id in meeting_ids:
+            legacy, l_ms, l_trips = await _measure(repo, legacy_get_minutes_view, meeting_id, repeat)
+            batched, b_ms, b_trips = await _measure(repo, _batched, meeting_id, repeat)
+            same = _normalize(legacy) == _normalize(batched)
+            legacy_ms.append(l_ms)
+            batched_ms.append(b_ms)
+            print(f"{meeting_id:<38} {l_ms:>10.1f} {l_trips:>6} {b_ms:>11.1f} {b_trips:>6}  {same}")
+
+        print(
+            f"\nmedian: legacy {statistics.median(legacy_ms):.1f}ms, "
+            f"batched {statistics.median(batched_ms):.1f}ms "
+            f"(x{statistics.median(legacy_ms) / max(statistics.median(batched_ms), 1e-6):.1f})"
+        )
+    finally:
+        await close_neo4j()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Minutes View 조회 벤치마크")
+    parser.add_argument("--meetings", type=int, default=10, help="비교할 회의 수 (Decision 많은 순)")
+    parser.add_argument("--repeat", type=int, default=3, help="회의별 반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+    asyncio.run(main(args.meetings, args.repeat))
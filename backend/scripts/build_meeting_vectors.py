@@ -1,7 +1,153 @@
 #!/usr/bin/env python3
-"""Deprecated vector build script.
+"""KG 벡터 인덱스 백필 스크립트
 
-Vector index backfill utilities were removed with vector_search parallelization.
+Decision / Agenda / Meeting 노드 임베딩을 생성해 벡터 인덱스를 채움.
+id 오름차순 커서를 체크포인트 파일에 저장하므로 중단 후 재실행하면 이어서 진행.
+원문 해시가 같은 노드는 재임베딩하지 않음.
+
+사용법:
+    python scripts/build_meeting_vectors.py
+    python scripts/build_meeting_vectors.py --labels Decision --batch-size 50
+    python scripts/build_meeting_vectors.py --reset  # 체크포인트 무시하고 처음부터
 """
 
-raise SystemExit("Vector backfill script is deprecated and no longer supported.")
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.neo4j import close_neo4j, get_neo4j_driver
+from app.infrastructure.context.embedding import TopicEmbedder, close_embedding_client
+from app.infrastructure.graph.integration.neo4j_vector import (
+    VECTOR_INDEXES,
+    ensure_vector_indexes,
+    fetch_node_id_page,
+    upsert_node_embeddings,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = Path(__file__).parent / ".vector_backfill_checkpoint.json"
+
+
+def _load_checkpoint(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"체크포인트 로드 실패, 처음부터 시작: {e}")
+        return {}
+
+
+def _save_checkpoint(path: Path, checkpoint: dict[str, str]) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(checkpoint, ensure_ascii=False, indent=2))
+    tmp_path.replace(path)
+
+
+async def build_vectors(
+    labels: list[str],
+    batch_size: int,
+    checkpoint_path: Path,
+    reset: bool = False,
+    force: bool = False,
+) -> None:
+    """라벨별로 id 커서를 따라 임베딩 upsert (배치 단위 체크포인트)"""
+    driver = get_neo4j_driver()
+    embedder = TopicEmbedder()
+    if not embedder.is_available:
+        raise SystemExit("CLOVA 임베딩 API 키가 설정되지 않았습니다.")
+
+    await ensure_vector_indexes(driver)
+
+    checkpoint = {} if reset else _load_checkpoint(checkpoint_path)
+    start_time = time.time()
+
+    for label in labels:
+        cursor = checkpoint.get(label)
+        scanned = 0
+        updated = 0
+        logger.info(f"{label} 백필 시작 (cursor={cursor})")
+
+        while True:
+            node_ids = await fetch_node_id_page(driver, label, cursor, batch_size)
+            if not node_ids:
+                break
+
+            updated += await upsert_node_embeddings(
+                driver, label, node_ids, embedder=embedder, force=force
+            )
+            scanned += len(node_ids)
+            cursor = node_ids[-1]
+            checkpoint[label] = cursor
+            _save_checkpoint(checkpoint_path, checkpoint)
+            logger.info(f"{label}: {scanned}건 확인, {updated}건 갱신 (cursor={cursor})")
+
+        logger.info(f"{label} 백필 완료: {scanned}건 확인, {updated}건 갱신")
+
+    # 모든 라벨 완료 → 다음 실행은 처음부터 (변경분만 해시 비교로 갱신)
+    if checkpoint_path.exists():
+        checkpoint_path.unlink()
+
+    elapsed = time.time() - start_time
+    logger.info(f"벡터 백필 완료 ({elapsed:.1f}s)")
+
+
+async def _main(args: argparse.Namespace) -> None:
+    try:
+        await build_vectors(
+            labels=args.labels,
+            batch_size=args.batch_size,
+            checkpoint_path=Path(args.checkpoint),
+            reset=args.reset,
+            force=args.force,
+        )
+    finally:
+        await close_embedding_client()
+        await close_neo4j()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="KG 벡터 인덱스 백필 (Decision/Agenda/Meeting)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+    python scripts/build_meeting_vectors.py                     # 전체 (체크포인트에서 재개)
+    python scripts/build_meeting_vectors.py --labels Meeting    # 회의만
+    python scripts/build_meeting_vectors.py --reset --force     # 처음부터 전부 재임베딩
+        """,
+    )
+    parser.add_argument(
+        "--labels",
+        nargs="+",
+        choices=list(VECTOR_INDEXES),
+        default=list(VECTOR_INDEXES),
+        help="백필 대상 라벨",
+    )
+    parser.add_argument("--batch-size", type=int, default=100, help="배치 크기")
+    parser.add_argument(
+        "--checkpoint",
+        default=str(DEFAULT_CHECKPOINT),
+        help="체크포인트 파일 경로",
+    )
+    parser.add_argument("--reset", action="store_true", help="체크포인트 무시")
+    parser.add_argument("--force", action="store_true", help="원문 해시가 같아도 재임베딩")
+
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
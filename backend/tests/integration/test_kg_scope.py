@@ -0,0 +1,110 @@
+"""KG 쓰기 → 검색 캐시 무효화 범위 통합 테스트 (실제 Neo4j)
+
+동기화 경로(KGSyncRepository)와 회의록 쓰기 경로로 만든 실제 그래프에서
+노드가 속한 (meeting_id, team_id)를 조회하고, 쓰기 시 팀 버전이 증가하는지 확인합니다.
+
+환경변수 TEST_NEO4J_URI가 없으면 건너뜁니다.
+(TEST_NEO4J_USER / TEST_NEO4J_PASSWORD, 기본값 neo4j / 빈 문자열)
+"""
+
+import os
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.cache import kg_version
+from app.repositories.kg.repository import KGRepository
+from app.repositories.kg.sync_repository import KGSyncRepository
+from neo4j import AsyncGraphDatabase
+
+
+@pytest.fixture
+async def neo4j_driver():
+    uri = os.getenv("TEST_NEO4J_URI")
+    if not uri:
+        pytest.skip("TEST_NEO4J_URI 미설정")
+
+    driver = AsyncGraphDatabase.driver(
+        uri,
+        auth=(os.getenv("TEST_NEO4J_USER", "neo4j"), os.getenv("TEST_NEO4J_PASSWORD", "")),
+    )
+    yield driver
+    await driver.close()
+
+
+@pytest.fixture
+def bumps(monkeypatch) -> list[tuple[list, list]]:
+    """bump_kg_versions 호출 기록 (Redis 없이)"""
+    calls: list[tuple[list, list]] = []
+
+    async def _record(meeting_ids=None, team_ids=None):
+        calls.append((list(meeting_ids or []), list(team_ids or [])))
+
+    monkeypatch.setattr(kg_version, "bump_kg_versions", _record)
+    return calls
+
+
+@pytest.fixture
+async def graph(neo4j_driver, bumps, monkeypatch):
+    """Team -[HOSTS]-> Meeting -[CONTAINS]-> Agenda -[HAS_DECISION]-> Decision -[TRIGGERS]-> ActionItem"""
+    # 임베딩 갱신(외부 API) 예약 생략
+    monkeypatch.setattr(KGRepository, "_schedule_meeting_embeddings", lambda self, *args: None)
+    monkeypatch.setattr(KGRepository, "_schedule_node_embeddings", lambda self, *args: None)
+    repo = KGRepository(neo4j_driver)
+    sync = KGSyncRepository(neo4j_driver)
+
+    team_id = f"team-{uuid4()}"
+    meeting_id = f"meeting-{uuid4()}"
+    await sync.upsert_team(team_id, "스코프 테스트 팀", None)
+    await sync.upsert_meeting(
+        meeting_id, team_id, "스코프 테스트 회의", "completed", datetime.now(timezone.utc)
+    )
+    minutes = await repo.create_minutes(
+        meeting_id,
+        "요약",
+        [{"topic": "예산", "decision": {"content": "예산 증액"}}],
+    )
+    agenda = minutes.agendas[0]
+    [action_item_id] = await repo.create_action_items_batch(
+        agenda.decision.id, [{"content": "예산안 작성", "due_date": None, "assignee_id": None}]
+    )
+
+    yield {
+        "repo": repo,
+        "team_id": team_id,
+        "Meeting": meeting_id,
+        "Agenda": agenda.id,
+        "Decision": agenda.decision.id,
+        "ActionItem": action_item_id,
+    }
+
+    async with neo4j_driver.session() as session:
+        await session.run(
+            "MATCH (n) WHERE n.id IN $ids DETACH DELETE n",
+            {"ids": [team_id, meeting_id, agenda.id, agenda.decision.id, action_item_id]},
+        )
+
+
+@pytest.mark.parametrize("label", ["Meeting", "Agenda", "Decision", "ActionItem"])
+async def test_scope_resolves_hosting_team(graph, label):
+    """모든 노드 종류에서 HOSTS 관계로 팀을 찾음"""
+    scope = await graph["repo"]._resolve_kg_scope(label, graph[label])
+
+    assert scope == (graph["Meeting"], graph["team_id"])
+
+
+async def test_kg_write_bumps_team_version(graph, bumps):
+    """KG 쓰기는 회의 버전과 함께 팀 버전도 증가 (팀 범위 검색 캐시 무효화)"""
+    bumps.clear()
+
+    await graph["repo"].update_decision_content(graph["Decision"], "예산 동결")
+
+    assert bumps == [([graph["Meeting"]], [graph["team_id"]])]
+
+
+async def test_unknown_node_has_no_scope(graph):
+    assert await graph["repo"]._resolve_kg_scope("Decision", f"decision-{uuid4()}") == (
+        None,
+        None,
+    )
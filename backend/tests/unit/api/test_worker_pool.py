@@ -0,0 +1,40 @@
+"""워커 풀 API 단위 테스트
+
+테스트 케이스:
+- X-Worker-Key 검증: 누락/불일치/키 미설정 시 401, 일치 시 통과
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.worker_pool import verify_worker_key
+
+
+def _settings(key: str):
+    return patch(
+        "app.api.v1.endpoints.worker_pool.get_settings",
+        return_value=MagicMock(backend_api_key=key),
+    )
+
+
+@pytest.mark.parametrize("header", [None, "", "wrong-key"])
+def test_invalid_worker_key_rejected(header):
+    with _settings("worker-secret"), pytest.raises(HTTPException) as exc_info:
+        verify_worker_key(header)
+
+    assert exc_info.value.status_code == 401
+
+
+def test_unconfigured_key_rejects_all():
+    """BACKEND_API_KEY 미설정 시 빈 헤더도 통과하지 않음"""
+    with _settings(""), pytest.raises(HTTPException) as exc_info:
+        verify_worker_key("")
+
+    assert exc_info.value.status_code == 401
+
+
+def test_valid_worker_key_accepted():
+    with _settings("worker-secret"):
+        assert verify_worker_key("worker-secret") is None
@@ -0,0 +1,114 @@
+"""PubSubHub 팬아웃 단위 테스트"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.pubsub_hub import HEARTBEAT, PubSubHub
+
+
+class FakePubSub:
+    """psubscribe/listen만 지원하는 테스트용 pubsub"""
+
+    def __init__(self):
+        self.patterns: tuple[str, ...] = ()
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    async def psubscribe(self, *patterns):
+        self.patterns = patterns
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    async def close(self):
+        self.closed = True
+
+    def publish(self, channel: str, data: dict) -> None:
+        self.messages.put_nowait(
+            {"type": "pmessage", "pattern": "minutes:*", "channel": channel, "data": json.dumps(data)}
+        )
+
+
+@pytest.fixture
+def hub_factory(monkeypatch):
+    connections: list[FakePubSub] = []
+
+    def _factory(**kwargs) -> PubSubHub:
+        hub = PubSubHub("redis://test", **kwargs)
+
+        async def _connect():
+            pubsub = FakePubSub()
+            await pubsub.psubscribe(*hub.patterns)
+            connections.append(pubsub)
+            return pubsub
+
+        monkeypatch.setattr(hub, "_connect", _connect)
+        return hub
+
+    _factory.connections = connections
+    return _factory
+
+
+async def _next(subscription, timeout=1.0):
+    return await asyncio.wait_for(subscription.__anext__(), timeout)
+
+
+class TestFanOut:
+    """채널별 브로드캐스트 테스트"""
+
+    async def test_single_subscription_shared_by_channels(self, hub_factory):
+        """연결 1개로 여러 채널 구독자에게 전달 (같은 채널은 같은 메시지 공유)"""
+        hub = hub_factory()
+
+        async with hub.subscribe("minutes:m1") as first, hub.subscribe("minutes:m1") as second:
+            async with hub.subscribe("meeting:topics:m2") as other:
+                pubsub = hub_factory.connections[0]
+                pubsub.publish("minutes:m1", {"event": "comment_created"})
+
+                received = await _next(first)
+                assert received == {"event": "comment_created"}
+                assert await _next(second) is received
+                assert other._queue.empty()
+
+        assert len(hub_factory.connections) == 1
+        assert hub_factory.connections[0].patterns == ("minutes:*", "meeting:topics:*")
+
+    async def test_last_subscriber_closes_connection(self, hub_factory):
+        """마지막 구독자가 나가면 연결 정리, 다음 구독 시 재연결"""
+        hub = hub_factory()
+
+        async with hub.subscribe("minutes:m1"):
+            pass
+        assert hub_factory.connections[0].closed
+        assert hub.subscriber_count == 0
+
+        async with hub.subscribe("minutes:m1"):
+            assert len(hub_factory.connections) == 2
+
+
+class TestBackpressure:
+    """느린 구독자 퇴출 / 공용 heartbeat 테스트"""
+
+    async def test_slow_consumer_evicted(self, hub_factory):
+        """버퍼를 넘긴 구독자만 퇴출되고 스트림이 끝남"""
+        hub = hub_factory(buffer_size=2)
+
+        async with hub.subscribe("minutes:m1") as slow, hub.subscribe("minutes:m1") as fast:
+            for index in range(3):
+                hub.dispatch("minutes:m1", json.dumps({"index": index}))
+                assert (await _next(fast))["index"] == index
+
+            assert slow.evicted
+            assert [message async for message in slow] == []
+            assert hub.subscriber_count == 1
+
+    async def test_shared_heartbeat(self, hub_factory):
+        """허브 타이머 하나가 모든 구독자에게 HEARTBEAT 전달"""
+        hub = hub_factory(heartbeat_seconds=0.01)
+
+        async with hub.subscribe("minutes:m1") as first, hub.subscribe("meeting:topics:m2") as second:
+            assert await _next(first) is HEARTBEAT
+            assert await _next(second) is HEARTBEAT
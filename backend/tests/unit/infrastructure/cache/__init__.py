@@ -0,0 +1 @@
+"""Cache 인프라 테스트"""
@@ -0,0 +1,92 @@
+"""EmbeddingCache 단위 테스트"""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.cache.embedding_cache import EmbeddingCache, make_embedding_key
+
+MODEL = "bge-m3"
+
+
+class FakeRedis:
+    """mget/pipeline만 지원하는 테스트용 Redis"""
+
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+
+    async def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=False):
+        return self
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def execute(self):
+        return []
+
+
+def _vec(size: int = 4, value: float = 1.0) -> np.ndarray:
+    return np.full(size, value, dtype=np.float32)
+
+
+class TestKey:
+    """캐시 키 테스트"""
+
+    def test_key_normalizes_whitespace(self):
+        """공백 차이는 같은 키"""
+        assert make_embedding_key(MODEL, " 예산  확정\n") == make_embedding_key(MODEL, "예산 확정")
+
+    def test_key_depends_on_model(self):
+        """모델이 다르면 다른 키"""
+        assert make_embedding_key("a", "text") != make_embedding_key("b", "text")
+
+
+class TestLocalLRU:
+    """인메모리 LRU 테스트"""
+
+    def test_evicts_by_bytes(self):
+        """바이트 상한 초과 시 오래된 항목부터 제거"""
+        cache = EmbeddingCache(max_bytes=32)  # float32 x4 = 16 bytes -> 2개
+        cache.put_local(MODEL, "a", _vec())
+        cache.put_local(MODEL, "b", _vec())
+        assert cache.get_local(MODEL, "a") is not None  # a 최근 사용
+        cache.put_local(MODEL, "c", _vec())
+
+        assert cache.get_local(MODEL, "b") is None
+        assert cache.get_local(MODEL, "a") is not None
+        assert cache.get_stats()["memory_bytes"] == 32
+
+    def test_skips_zero_vector(self):
+        """영벡터(실패 결과)는 저장하지 않음"""
+        cache = EmbeddingCache(max_bytes=1024)
+        cache.put_local(MODEL, "a", _vec(value=0.0))
+        assert cache.get_local(MODEL, "a") is None
+
+
+class TestRedisTier:
+    """Redis 2차 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_float16(self, monkeypatch):
+        """Redis에는 float16으로 저장되고 조회 시 float32로 복원"""
+        fake = FakeRedis()
+
+        async def _get_binary_redis():
+            return fake
+
+        monkeypatch.setattr("app.core.redis.get_binary_redis", _get_binary_redis)
+
+        writer = EmbeddingCache(max_bytes=1024, redis_enabled=True)
+        await writer.put(MODEL, "예산", _vec(value=0.5))
+        assert all(len(blob) == 8 for blob in fake.store.values())
+
+        reader = EmbeddingCache(max_bytes=1024, redis_enabled=True)
+        vectors = await reader.get_many(MODEL, ["예산", "없음"])
+
+        assert vectors[0].dtype == np.float32
+        assert np.allclose(vectors[0], 0.5)
+        assert vectors[1] is None
+        assert reader.get_stats()["redis_hits"] == 1
+        assert reader.get_stats()["misses"] == 1
@@ -0,0 +1,210 @@
+"""MinutesViewCache 단위 테스트"""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache.kg_version import MEETING_VERSION_PREFIX
+from app.infrastructure.cache.minutes_cache import (
+    _RECORD_CHANGE_SCRIPT,
+    _SYNC_KG_VERSION_SCRIPT,
+    VIEW_KEY_PREFIX,
+    MinutesViewCache,
+    changed_decision_ids,
+    parse_change_log,
+)
+
+VIEW = {"meeting_id": "meeting-1", "summary": "", "agendas": [], "action_items": []}
+
+
+class FakeRedis:
+    """string/list 명령 + 버전 증가 스크립트만 지원하는 테스트용 Redis"""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.lists: dict[str, list[str]] = {}
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def _record(self, version_key, log_key, payload, log_size):
+        version = int(self.values.get(version_key, 0)) + 1
+        self.values[version_key] = str(version)
+        self.lists.setdefault(log_key, []).append(f"{version}|{payload}")
+        self.lists[log_key] = self.lists[log_key][-log_size:]
+        return version
+
+    async def eval(self, script, numkeys, *args):
+        if script == _RECORD_CHANGE_SCRIPT:
+            version_key, log_key, payload, log_size, _ttl = args
+            return self._record(version_key, log_key, payload, log_size)
+
+        assert script == _SYNC_KG_VERSION_SCRIPT
+        version_key, log_key, seen_key, version, kg_version, log_size, _ttl = args
+        seen = self.values.get(seen_key)
+        if seen is not None:
+            seen_version, seen_kg_version = map(int, seen.split("|"))
+            if seen_version == version and kg_version > seen_kg_version:
+                version = self._record(version_key, log_key, "*", log_size)
+            elif (seen_version, seen_kg_version) >= (version, kg_version):
+                return version
+        self.values[seen_key] = f"{version}|{kg_version}"
+        return version
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+
+    async def _get_redis():
+        return redis
+
+    monkeypatch.setattr("app.core.redis.get_redis", _get_redis)
+    return redis
+
+
+class CountingBuilder:
+    """KG 조회 호출 수를 세는 build 함수"""
+
+    def __init__(self, view=VIEW, delay=0.0):
+        self.view = view
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return dict(self.view)
+
+
+class TestChangeLog:
+    """이벤트 → 변경 로그 → 델타 범위 테스트"""
+
+    def test_changed_decision_ids_from_event(self):
+        """*decision_id 필드를 모으고, Agenda 이벤트는 전체 변경"""
+        event = {"event": "suggestion_created", "decision_id": "d1", "created_decision_id": "d2"}
+
+        assert sorted(changed_decision_ids(event)) == ["d1", "d2"]
+        assert changed_decision_ids({"event": "agenda_deleted", "agenda_id": "a1"}) is None
+
+    def test_parse_change_log_covers_range(self):
+        """구간의 모든 버전이 있으면 바뀐 Decision 합집합"""
+        entries = ["1|d0", "2|d1", "3|d1,d2"]
+
+        assert parse_change_log(entries, 1, 3) == {"d1", "d2"}
+
+    def test_parse_change_log_requires_full_on_gap_or_full_change(self):
+        """로그가 잘렸거나 전체 변경이 있으면 None"""
+        assert parse_change_log(["3|d1"], 1, 3) is None
+        assert parse_change_log(["2|*", "3|d1"], 1, 3) is None
+
+
+class TestSnapshot:
+    """스냅샷 재사용/무효화 테스트"""
+
+    async def test_snapshot_reused_until_change(self, fake_redis):
+        """버전이 같으면 KG 재조회 없음, 이벤트로 버전이 오르면 재구성"""
+        cache = MinutesViewCache()
+        build = CountingBuilder()
+
+        first = await cache.get("meeting-1", build)
+        again = await cache.get("meeting-1", build)
+        assert build.calls == 1
+        assert again.etag == first.etag
+
+        await cache.record_change("meeting-1", ["d1"])
+        changed = await cache.get("meeting-1", build)
+
+        assert build.calls == 2
+        assert changed.version == first.version + 1
+        assert changed.etag != first.etag
+
+    async def test_snapshot_shared_across_instances(self, fake_redis):
+        """다른 레플리카가 저장한 스냅샷을 Redis에서 재사용"""
+        build = CountingBuilder()
+        await MinutesViewCache().get("meeting-1", build)
+
+        snapshot = await MinutesViewCache().get("meeting-1", build)
+
+        assert build.calls == 1
+        assert snapshot.data == VIEW
+
+    async def test_kg_write_without_event_recorded_as_full_change(self, fake_redis):
+        """이벤트 없는 KG 쓰기는 버전을 올리고 델타 대신 전체 응답"""
+        cache = MinutesViewCache()
+        build = CountingBuilder()
+        first = await cache.get("meeting-1", build)
+
+        fake_redis.values[f"{MEETING_VERSION_PREFIX}meeting-1"] = "7"
+        snapshot = await cache.get("meeting-1", build)
+
+        assert build.calls == 2
+        assert snapshot.version == first.version + 1
+        assert await cache.changes_since("meeting-1", first.version, snapshot.version) is None
+
+    async def test_kg_write_after_snapshot_expired_recorded_as_full_change(self, fake_redis):
+        """스냅샷이 만료된 뒤의 KG 쓰기도 감지 (같은 버전의 빈 델타를 반환하지 않음)"""
+        cache = MinutesViewCache()
+        build = CountingBuilder()
+        first = await cache.get("meeting-1", build)
+
+        del fake_redis.values[f"{VIEW_KEY_PREFIX}meeting-1"]
+        cache._local.clear()
+        fake_redis.values[f"{MEETING_VERSION_PREFIX}meeting-1"] = "7"
+        snapshot = await cache.get("meeting-1", build)
+
+        assert snapshot.version == first.version + 1
+        assert await cache.changes_since("meeting-1", first.version, snapshot.version) is None
+
+    async def test_expired_snapshot_without_kg_change_keeps_version(self, fake_redis):
+        """KG 변화 없이 스냅샷만 만료되면 버전 유지 (델타 구독자는 빈 델타)"""
+        cache = MinutesViewCache()
+        build = CountingBuilder()
+        first = await cache.get("meeting-1", build)
+
+        del fake_redis.values[f"{VIEW_KEY_PREFIX}meeting-1"]
+        cache._local.clear()
+        snapshot = await cache.get("meeting-1", build)
+
+        assert build.calls == 2
+        assert snapshot.version == first.version
+        assert await cache.changes_since("meeting-1", first.version, snapshot.version) == set()
+
+    async def test_event_with_kg_write_keeps_delta(self, fake_redis):
+        """이벤트와 함께 일어난 KG 쓰기는 전체 변경으로 기록하지 않음"""
+        cache = MinutesViewCache()
+        build = CountingBuilder()
+        first = await cache.get("meeting-1", build)
+
+        await cache.record_change("meeting-1", ["d1"])
+        fake_redis.values[f"{MEETING_VERSION_PREFIX}meeting-1"] = "3"
+        snapshot = await cache.get("meeting-1", build)
+
+        assert snapshot.version == first.version + 1
+        assert await cache.changes_since("meeting-1", first.version, snapshot.version) == {"d1"}
+
+    async def test_concurrent_misses_build_once(self, fake_redis):
+        """같은 버전 동시 미스는 KG 조회 1회로 합침"""
+        cache = MinutesViewCache()
+        build = CountingBuilder(delay=0.01)
+
+        results = await asyncio.gather(*(cache.get("meeting-1", build) for _ in range(5)))
+
+        assert build.calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_missing_meeting_not_cached(self, fake_redis):
+        """회의가 없으면 None (빈 View는 저장하지 않음)"""
+        cache = MinutesViewCache()
+
+        assert await cache.get("missing", CountingBuilder(view={})) is None
+        assert fake_redis.values == {}
@@ -0,0 +1,109 @@
+"""SearchResultCache + KG 버전 카운터 단위 테스트"""
+
+import pytest
+
+from app.infrastructure.cache.kg_version import bump_kg_versions
+from app.infrastructure.cache.search_result_cache import (
+    SearchResultCache,
+    make_result_key,
+    referenced_parameters,
+)
+
+CYPHER = "MATCH (d:Decision) WHERE d.content CONTAINS $query RETURN d.id AS id LIMIT 20"
+
+
+class FakeRedis:
+    """get/set/mget/incr만 지원하는 테스트용 Redis"""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=False):
+        return self
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+
+    async def execute(self):
+        return []
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+
+    async def _get_redis():
+        return redis
+
+    monkeypatch.setattr("app.core.redis.get_redis", _get_redis)
+    return redis
+
+
+@pytest.fixture
+def cache(monkeypatch, fake_redis):
+    cache = SearchResultCache(ttl_seconds=60)
+
+    async def _teams(user_id):
+        return ["team-1"]
+
+    monkeypatch.setattr(cache, "_get_user_team_ids", _teams)
+    return cache
+
+
+class TestKey:
+    """캐시 키 테스트"""
+
+    def test_only_referenced_parameters(self):
+        """Cypher가 쓰지 않는 파라미터(user_id 등)는 키에서 제외"""
+        params = referenced_parameters(CYPHER, {"query": "예산", "user_id": "u1", "keyword": "예산"})
+        assert params == {"query": "예산"}
+
+    def test_whitespace_insensitive(self):
+        spaced = CYPHER.replace(" WHERE", "\n   WHERE")
+        assert make_result_key(CYPHER, {"query": "예산"}, {}) == make_result_key(spaced, {"query": "예산"}, {})
+
+    def test_team_version_changes_key(self):
+        assert make_result_key(CYPHER, {}, {"team-1": 0}) != make_result_key(CYPHER, {}, {"team-1": 1})
+
+
+class TestSearchResultCache:
+    """조회/저장/무효화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, cache):
+        key, cached = await cache.lookup(CYPHER, {"query": "예산", "user_id": "u1"})
+        assert cached is None
+
+        await cache.store(key, [{"id": "d1", "created_at": "2026-01-01T00:00:00"}])
+        _, cached = await cache.lookup(CYPHER, {"query": "예산", "user_id": "u2"})
+        assert cached == [{"id": "d1", "created_at": "2026-01-01T00:00:00"}]
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_team_bump_invalidates(self, cache):
+        key, _ = await cache.lookup(CYPHER, {"query": "예산", "user_id": "u1"})
+        await cache.store(key, [{"id": "d1"}])
+
+        await bump_kg_versions(meeting_ids=["m1"], team_ids=["team-1"])
+
+        _, cached = await cache.lookup(CYPHER, {"query": "예산", "user_id": "u1"})
+        assert cached is None
+
+    @pytest.mark.asyncio
+    async def test_other_team_bump_keeps_entry(self, cache):
+        key, _ = await cache.lookup(CYPHER, {"query": "예산", "user_id": "u1"})
+        await cache.store(key, [{"id": "d1"}])
+
+        await bump_kg_versions(team_ids=["team-2"])
+
+        _, cached = await cache.lookup(CYPHER, {"query": "예산", "user_id": "u1"})
+        assert cached == [{"id": "d1"}]
@@ -0,0 +1,203 @@
+"""SemanticCacheManager 단위 테스트"""
+
+import json
+import time
+
+import numpy as np
+import pytest
+
+from app.infrastructure.cache import semantic_cache
+from app.infrastructure.cache.semantic_cache import CacheEntry, SemanticCacheManager
+
+VERSIONS = {"team:team-1": 3}
+
+
+class FakeRedis:
+    """hash / sorted set 명령만 지원하는 테스트용 Redis"""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    # 동기 구현 (직접 호출 / 파이프라인 공용)
+    def _hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def _hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    def _zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def _zrange(self, key, start, end):
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        end = len(members) + end if end < 0 else end
+        return [member for member, _ in members[start : end + 1]]
+
+    def _zrangebyscore(self, key, low, high):
+        low = float(low)
+        return [m for m, score in self.zsets.get(key, {}).items() if low <= score <= high]
+
+    def _zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    def _expire(self, key, seconds):
+        pass
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.zsets.pop(key, None)
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._results: list = []
+
+    def __getattr__(self, name):
+        op = getattr(self._redis, f"_{name}")
+
+        def _queue(*args):
+            self._results.append(op(*args))
+            return self
+
+        return _queue
+
+    async def execute(self):
+        return self._results
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+
+    async def _get_redis():
+        return redis
+
+    monkeypatch.setattr("app.core.redis.get_redis", _get_redis)
+    return redis
+
+
+def _vec(*values):
+    return np.array(values, dtype=np.float32)
+
+
+class TestLookup:
+    """유사도/버전 기반 조회 테스트"""
+
+    async def test_similar_query_hits(self):
+        """threshold 이상으로 가까운 질의는 캐시 답변 반환"""
+        cache = SemanticCacheManager(similarity_threshold=0.9)
+        await cache.cache_answer("예산 얼마야?", "2억입니다", _vec(1.0, 0.0), "spotlight:u1", VERSIONS)
+
+        hit = await cache.get_cached_answer("예산이 얼마지?", _vec(0.99, 0.05), "spotlight:u1", VERSIONS)
+
+        assert hit["answer"] == "2억입니다"
+        assert hit["cached_query"] == "예산 얼마야?"
+
+    async def test_dissimilar_query_and_other_scope_miss(self):
+        """유사도가 낮거나 scope가 다르면 미스"""
+        cache = SemanticCacheManager(similarity_threshold=0.9)
+        await cache.cache_answer("예산 얼마야?", "2억입니다", _vec(1.0, 0.0), "spotlight:u1", VERSIONS)
+
+        assert await cache.get_cached_answer("출시일?", _vec(0.0, 1.0), "spotlight:u1", VERSIONS) is None
+        assert await cache.get_cached_answer("예산?", _vec(1.0, 0.0), "spotlight:u2", VERSIONS) is None
+
+    async def test_kg_version_change_evicts_entry(self):
+        """KG 버전이 바뀌면 stale로 폐기"""
+        cache = SemanticCacheManager()
+        await cache.cache_answer("예산 얼마야?", "2억입니다", _vec(1.0, 0.0), "spotlight:u1", VERSIONS)
+
+        stale = await cache.get_cached_answer("예산 얼마야?", _vec(1.0, 0.0), "spotlight:u1", {"team:team-1": 4})
+
+        assert stale is None
+        assert cache.total_stale == 1
+        assert cache.get_cache_stats()["cache_size"] == 0
+
+
+class TestEviction:
+    """메모리 상한 축출 테스트"""
+
+    async def test_least_frequently_used_evicted_first(self):
+        """상한 초과 시 접근 횟수가 적은 항목부터 축출"""
+        entry_bytes = CacheEntry("q0", "a", _vec(1.0, 0.0, 0.0), "s", VERSIONS, 0.95).nbytes
+
+        cache = SemanticCacheManager(max_bytes=entry_bytes * 2)
+        await cache.cache_answer("q0", "a", _vec(1.0, 0.0, 0.0), "s", VERSIONS)
+        await cache.cache_answer("q1", "b", _vec(0.0, 1.0, 0.0), "s", VERSIONS)
+        await cache.get_cached_answer("q0", _vec(1.0, 0.0, 0.0), "s", VERSIONS)
+
+        await cache.cache_answer("q2", "c", _vec(0.0, 0.0, 1.0), "s", VERSIONS)
+
+        assert await cache.get_cached_answer("q0", _vec(1.0, 0.0, 0.0), "s", VERSIONS) is not None
+        assert await cache.get_cached_answer("q1", _vec(0.0, 1.0, 0.0), "s", VERSIONS) is None
+
+
+class TestRedisTier:
+    """Redis 공유 계층 테스트"""
+
+    async def test_entry_shared_across_instances(self, fake_redis):
+        """다른 인스턴스(레플리카)가 저장한 항목을 scope 첫 조회 시 로드"""
+        writer = SemanticCacheManager(redis_enabled=True)
+        await writer.cache_answer("예산 얼마야?", "2억입니다", _vec(0.6, 0.8), "voice:m1:u1", VERSIONS)
+
+        reader = SemanticCacheManager(redis_enabled=True)
+        hit = await reader.get_cached_answer("예산 얼마야?", _vec(0.6, 0.8), "voice:m1:u1", VERSIONS)
+
+        assert hit["answer"] == "2억입니다"
+
+    async def test_invalidate_scope_clears_redis(self, fake_redis):
+        """invalidate_scope는 인메모리와 Redis 모두 삭제"""
+        cache = SemanticCacheManager(redis_enabled=True)
+        await cache.cache_answer("예산 얼마야?", "2억입니다", _vec(1.0, 0.0), "spotlight:u1", VERSIONS)
+
+        await cache.invalidate_scope("spotlight:u1")
+
+        assert fake_redis.hashes == {}
+        assert fake_redis.zsets == {}
+        assert await cache.get_cached_answer("예산", _vec(1.0, 0.0), "spotlight:u1", VERSIONS) is None
+
+    async def test_scope_hash_is_capped(self, fake_redis):
+        """활성 scope의 Redis hash는 상한을 넘으면 오래된 항목부터 제거"""
+        cache = SemanticCacheManager(redis_enabled=True, max_entries_per_scope=2)
+        for idx in range(4):
+            await cache.cache_answer(f"q{idx}", f"a{idx}", _vec(1.0, float(idx)), "spotlight:u1", VERSIONS)
+
+        stored = fake_redis.hashes["semcache:spotlight:u1"]
+        assert sorted(json.loads(raw)["query"] for raw in stored.values()) == ["q2", "q3"]
+        assert set(fake_redis.zsets["semcache_order:spotlight:u1"]) == set(stored)
+
+    async def test_expired_entries_pruned_on_store(self, fake_redis, monkeypatch):
+        """TTL이 지난 항목은 다음 저장 시 hash에서 제거"""
+        cache = SemanticCacheManager(redis_enabled=True, ttl_seconds=60)
+        await cache.cache_answer("오래된 질문", "a", _vec(1.0, 0.0), "spotlight:u1", VERSIONS)
+
+        later = time.time() + 120
+        monkeypatch.setattr(semantic_cache.time, "time", lambda: later)
+        await cache.cache_answer("새 질문", "b", _vec(0.0, 1.0), "spotlight:u1", VERSIONS)
+
+        stored = fake_redis.hashes["semcache:spotlight:u1"]
+        assert [json.loads(raw)["query"] for raw in stored.values()] == ["새 질문"]
+
+
+class TestScopeCap:
+    """인메모리 scope 항목 수 상한"""
+
+    async def test_oldest_entry_in_scope_evicted(self):
+        cache = SemanticCacheManager(max_entries_per_scope=2)
+        for idx in range(3):
+            await cache.cache_answer(f"q{idx}", f"a{idx}", _vec(1.0, float(idx), 0.0), "s", VERSIONS)
+        await cache.cache_answer("other", "x", _vec(0.0, 0.0, 1.0), "s2", VERSIONS)
+
+        assert await cache.get_cached_answer("q0", _vec(1.0, 0.0, 0.0), "s", VERSIONS, 0.999) is None
+        assert (await cache.get_cached_answer("q2", _vec(1.0, 2.0, 0.0), "s", VERSIONS))["answer"] == "a2"
+        assert cache.get_cache_stats()["cache_size"] == 3
@@ -0,0 +1 @@
+"""Context 인프라 테스트"""
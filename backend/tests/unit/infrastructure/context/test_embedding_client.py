@@ -0,0 +1,186 @@
+"""ClovaEmbeddingClient 단위 테스트 (httpx.MockTransport)
+
+테스트 케이스:
+- 동일 텍스트 동시 요청은 API 1회 호출로 병합
+- 429 응답 시 Retry-After만큼 대기 후 재시도
+- 재시도 한도 초과 시 None 반환
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.infrastructure.context import embedding
+from app.infrastructure.context.embedding import ClovaEmbeddingClient
+
+VECTOR = [0.1, 0.2, 0.3]
+
+
+def _ok(vector: list[float] = VECTOR) -> httpx.Response:
+    return httpx.Response(200, json={"status": {"code": "20000"}, "result": {"embedding": vector}})
+
+
+def _client(handler, max_retries: int = 3) -> ClovaEmbeddingClient:
+    client = ClovaEmbeddingClient(api_key="test-key", max_retries=max_retries)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """백오프 대기 시간 기록 (실제 대기 없음)"""
+    delays: list[float] = []
+
+    async def _sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(embedding.asyncio, "sleep", _sleep)
+    return delays
+
+
+class TestCoalescing:
+    async def test_concurrent_identical_inputs_share_one_call(self):
+        release = asyncio.Event()
+        requests: list[bytes] = []
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.content)
+            await release.wait()
+            return _ok()
+
+        client = _client(_handler)
+        callers = [asyncio.create_task(client.embed("예산 확정")) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert len(client._inflight) == 1
+
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert results == [VECTOR] * 5
+        assert len(requests) == 1
+        assert client._inflight == {}
+        await client.aclose()
+
+    async def test_embed_many_deduplicates_and_keeps_order(self):
+        texts: list[str] = []
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            text = request.read().decode()
+            texts.append(text)
+            return _ok([float(len(texts))])
+
+        client = _client(_handler)
+        results = await client.embed_many(["a", "b", "a"])
+
+        assert len(texts) == 2
+        assert results[0] == results[2]
+        assert results[0] != results[1]
+        await client.aclose()
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        release = asyncio.Event()
+        calls = 0
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return _ok()
+
+        client = _client(_handler)
+        first = asyncio.create_task(client.embed("예산 확정"))
+        second = asyncio.create_task(client.embed("예산 확정"))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        release.set()
+
+        assert await second == VECTOR
+        assert calls == 1
+        await client.aclose()
+
+
+class TestRetry:
+    async def test_429_waits_retry_after(self, sleeps):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            _ok(),
+        ]
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            return responses.pop(0)
+
+        client = _client(_handler)
+
+        assert await client.embed("예산 확정") == VECTOR
+        assert sleeps == [2.0]
+        assert responses == []
+        await client.aclose()
+
+    async def test_retry_after_capped(self, sleeps):
+        responses = [httpx.Response(429, headers={"Retry-After": "120"}), _ok()]
+
+        client = _client(lambda request: responses.pop(0))
+
+        assert await client.embed("예산 확정") == VECTOR
+        assert sleeps == [embedding.EMBEDDING_BACKOFF_MAX]
+        await client.aclose()
+
+    async def test_gives_up_after_retry_limit(self, sleeps):
+        calls = 0
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503)
+
+        client = _client(_handler, max_retries=2)
+
+        assert await client.embed("예산 확정") is None
+        # 최초 1회 + 재시도 2회, 마지막 실패 후에는 대기하지 않음
+        assert calls == 3
+        assert len(sleeps) == 2
+        assert client._inflight == {}
+        await client.aclose()
+
+    async def test_transport_error_gives_up_after_retry_limit(self, sleeps):
+        calls = 0
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = _client(_handler, max_retries=1)
+
+        assert await client.embed("예산 확정") is None
+        assert calls == 2
+        assert len(sleeps) == 1
+        await client.aclose()
+
+    async def test_non_retryable_status_not_retried(self, sleeps):
+        calls = 0
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(400)
+
+        client = _client(_handler)
+
+        assert await client.embed("예산 확정") is None
+        assert calls == 1
+        assert sleeps == []
+        await client.aclose()
+
+
+async def test_missing_api_key_skips_request():
+    def _handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("API 키 없이 요청하면 안 됨")
+
+    client = ClovaEmbeddingClient(api_key="")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+    assert await client.embed("예산 확정") is None
+    await client.aclose()
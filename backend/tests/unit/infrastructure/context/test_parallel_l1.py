@@ -0,0 +1,154 @@
+"""ContextManager 병렬 L1 처리 단위 테스트
+
+테스트 케이스:
+- 병렬 1차 요약은 동시성 제한을 지키고 청크 순서대로 반영
+- 병렬 경로의 청크 타임아웃은 fallback 세그먼트로 대체 (실시간 단일 청크 경로는 미적용)
+- 재조정: 새 토픽이 유사한 앞선 토픽에 흡수되고 target은 즉시 재임베딩
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from app.infrastructure.context import ContextConfig, ContextManager, TopicSegment, Utterance
+
+MEETING_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _chunk(start: int, size: int = 3) -> list[Utterance]:
+    return [
+        Utterance(
+            id=idx,
+            speaker_id="user-1",
+            speaker_name="화자",
+            text=f"발화 {idx}",
+            start_ms=idx * 1000,
+            end_ms=idx * 1000 + 500,
+            confidence=0.9,
+            absolute_timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+        for idx in range(start, start + size)
+    ]
+
+
+def _segment(name: str, summary: str, chunk: list[Utterance]) -> TopicSegment:
+    return TopicSegment(
+        id=f"{name}-{chunk[0].id}",
+        name=name,
+        summary=summary,
+        start_utterance_id=chunk[0].id,
+        end_utterance_id=chunk[-1].id,
+        keywords=[name],
+    )
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """LLM 호출 없이 요약 키워드로 임베딩을 만드는 ContextManager"""
+    ctx = ContextManager(
+        meeting_id=MEETING_ID,
+        config=ContextConfig(l1_max_concurrency=2, l1_chunk_timeout_seconds=0.05),
+    )
+    axes = {"예산": 0, "일정": 1, "채용": 2}
+    ctx.embedded_summaries = []
+
+    async def _embed(segments):
+        for seg in segments:
+            vector = np.zeros(ctx._topic_embeddings.dimension, dtype=np.float32)
+            for word, axis in axes.items():
+                vector[axis] = seg.summary.count(word)
+            ctx._topic_embeddings.upsert(seg.id, vector)
+            ctx.embedded_summaries.append(seg.summary)
+        return len(segments)
+
+    monkeypatch.setattr(ctx, "_embed_topics_batch_async", _embed)
+    return ctx
+
+
+class TestParallelFirstPass:
+    """청크 병렬 1차 요약"""
+
+    async def test_bounded_concurrency_and_chunk_order(self, manager, monkeypatch):
+        """동시 실행 수는 l1_max_concurrency 이하, 반영 순서는 청크 순서"""
+        running = 0
+        peak = 0
+        names = ["예산", "일정", "채용", "회고"]
+
+        async def _separate(utterances, is_first=True):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # 앞 청크일수록 늦게 끝나도록
+            await asyncio.sleep(0.005 * (5 - utterances[0].id // 10))
+            running -= 1
+            name = names[utterances[0].id // 10]
+            return [_segment(name, f"{name} 논의", utterances)]
+
+        monkeypatch.setattr(manager, "_separate_topics_lightweight", _separate)
+        manager._pending_l1_chunks = [_chunk(0), _chunk(10), _chunk(20), _chunk(30)]
+
+        await manager.await_pending_l1()
+
+        assert peak == 2
+        assert [seg.name for seg in manager.l1_segments] == names
+        assert manager.current_topic == "회고"
+
+    async def test_parallel_chunk_timeout_uses_fallback(self, manager, monkeypatch):
+        """병렬 경로에서 타임아웃된 청크는 fallback 세그먼트"""
+
+        async def _separate(utterances, is_first=True):
+            if utterances[0].id == 10:
+                await asyncio.sleep(1)
+            return [_segment("예산", "예산 논의", utterances)]
+
+        monkeypatch.setattr(manager, "_separate_topics_lightweight", _separate)
+        manager._pending_l1_chunks = [_chunk(0), _chunk(10)]
+
+        await manager.await_pending_l1()
+
+        assert [seg.name for seg in manager.l1_segments] == ["예산", "Topic_10_12"]
+
+    async def test_realtime_chunk_has_no_timeout(self, manager, monkeypatch):
+        """단일 청크(실시간) 경로는 청크 타임아웃을 적용하지 않음"""
+
+        async def _separate(utterances, is_first=True):
+            await asyncio.sleep(0.1)
+            return [_segment("예산", "예산 논의", utterances)]
+
+        monkeypatch.setattr(manager, "_separate_topics_lightweight", _separate)
+        manager._pending_l1_chunks = [_chunk(0)]
+
+        await manager.await_pending_l1()
+
+        assert [seg.name for seg in manager.l1_segments] == ["예산"]
+
+
+class TestReconcile:
+    """병렬 결과 재조정"""
+
+    async def test_similar_topic_absorbed_and_target_reembedded(self, manager, monkeypatch):
+        """토픽명이 달라도 유사한 새 토픽은 앞선 토픽에 흡수, target 임베딩 갱신"""
+        results = {
+            0: [("예산", "예산 초안")],
+            10: [("비용", "예산 증액")],
+            20: [("인력", "채용 계획"), ("지출", "예산 확정")],
+        }
+
+        async def _separate(utterances, is_first=True):
+            return [
+                _segment(name, summary, utterances) for name, summary in results[utterances[0].id]
+            ]
+
+        monkeypatch.setattr(manager, "_separate_topics_lightweight", _separate)
+        manager._pending_l1_chunks = [_chunk(0), _chunk(10), _chunk(20)]
+
+        await manager.await_pending_l1()
+
+        assert [seg.name for seg in manager.l1_segments] == ["예산", "인력"]
+        target = manager.l1_segments[0]
+        assert target.summary == "예산 초안 예산 증액 예산 확정"
+        assert (target.start_utterance_id, target.end_utterance_id) == (0, 22)
+        assert manager.embedded_summaries[-1] == target.summary
+        assert set(manager._topic_embeddings.ids()) == {seg.id for seg in manager.l1_segments}
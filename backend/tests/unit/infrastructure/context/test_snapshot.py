@@ -0,0 +1,87 @@
+"""Context 스냅샷 캡처/복원 단위 테스트"""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from app.infrastructure.context import ContextManager, TopicSegment, Utterance
+from app.infrastructure.context.snapshot import (
+    ContextSnapshot,
+    capture_snapshot,
+    restore_snapshot,
+)
+
+MEETING_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _utterance(idx: int) -> Utterance:
+    return Utterance(
+        id=idx,
+        speaker_id="user-1",
+        speaker_name="화자",
+        text=f"발화 {idx}",
+        start_ms=idx * 1000,
+        end_ms=idx * 1000 + 500,
+        confidence=0.9,
+        absolute_timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+def manager():
+    """L1/L0/임베딩 상태를 가진 ContextManager"""
+    ctx = ContextManager(meeting_id=MEETING_ID)
+    for idx in range(1, 4):
+        ctx.l0_buffer.append(_utterance(idx))
+        ctx.l0_topic_buffer.append(_utterance(idx))
+    ctx._last_summarized_utterance_id = 2
+    ctx.l1_segments = [
+        TopicSegment(
+            id="topic-1",
+            name="예산",
+            summary="예산 2억 확정",
+            start_utterance_id=1,
+            end_utterance_id=2,
+            keywords=["예산"],
+        )
+    ]
+    ctx.current_topic = "예산"
+    vector = np.zeros(ctx._topic_embeddings.dimension, dtype=np.float32)
+    vector[0] = 2.0
+    ctx._topic_embeddings.upsert("topic-1", vector)
+    return ctx
+
+
+class TestSnapshotRoundtrip:
+    """캡처 → 직렬화 → 복원"""
+
+    def test_roundtrip_restores_state(self, manager):
+        """L1/L0/임베딩/진행 위치가 그대로 복원"""
+        snapshot, embeddings = capture_snapshot(
+            manager, last_utterance_id=3, last_processed_start_ms=3000
+        )
+        decoded = ContextSnapshot.model_validate_json(snapshot.model_dump_json())
+
+        restored = ContextManager(meeting_id=MEETING_ID)
+        restore_snapshot(restored, decoded, embeddings)
+
+        assert decoded.last_processed_start_ms == 3000
+        assert decoded.last_utterance_id == 3
+        assert [seg.name for seg in restored.l1_segments] == ["예산"]
+        assert restored.current_topic == "예산"
+        assert [u.id for u in restored.l0_buffer] == [1, 2, 3]
+        assert [u.id for u in restored._get_unsummarized_utterances()] == [3]
+        assert np.allclose(
+            restored._topic_embeddings.get("topic-1"),
+            manager._topic_embeddings.get("topic-1"),
+        )
+
+    def test_embeddings_are_binary(self, manager):
+        """임베딩은 JSON 리스트가 아닌 float32 bytes로 저장"""
+        snapshot, embeddings = capture_snapshot(
+            manager, last_utterance_id=3, last_processed_start_ms=3000
+        )
+
+        assert snapshot.embedding_ids == ["topic-1"]
+        assert len(embeddings) == snapshot.embedding_dimension * 4
@@ -0,0 +1,93 @@
+"""TopicEmbeddingIndex 단위 테스트"""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.context.topic_index import TopicEmbeddingIndex
+
+
+def _vec(*values: float) -> np.ndarray:
+    return np.array(values, dtype=np.float32)
+
+
+@pytest.fixture
+def index():
+    """3차원 테스트 인덱스"""
+    return TopicEmbeddingIndex(dimension=3)
+
+
+class TestUpsertAndRemove:
+    """추가/삭제 테스트"""
+
+    def test_upsert_normalizes(self, index):
+        """저장 시 L2 정규화"""
+        assert index.upsert("a", _vec(3.0, 4.0, 0.0))
+
+        stored = index.get("a")
+        assert stored is not None
+        assert np.isclose(np.linalg.norm(stored), 1.0)
+        assert len(index) == 1
+
+    def test_upsert_rejects_zero_and_wrong_dimension(self, index):
+        """영벡터/차원 불일치 거부"""
+        assert not index.upsert("zero", _vec(0.0, 0.0, 0.0))
+        assert not index.upsert("short", _vec(1.0, 0.0))
+        assert len(index) == 0
+
+    def test_remove_keeps_rows_contiguous(self, index):
+        """삭제 후 마지막 행이 빈 자리로 이동"""
+        index.upsert("a", _vec(1.0, 0.0, 0.0))
+        index.upsert("b", _vec(0.0, 1.0, 0.0))
+        index.upsert("c", _vec(0.0, 0.0, 1.0))
+
+        assert index.remove("a")
+        assert not index.remove("a")
+        assert index.ids() == ["c", "b"]
+        assert np.allclose(index.get("c"), _vec(0.0, 0.0, 1.0))
+        assert index.matrix.shape == (2, 3)
+
+    def test_capacity_grows(self, index):
+        """초기 용량 초과 시 확장"""
+        for i in range(100):
+            index.upsert(f"t{i}", _vec(1.0, float(i), 0.0))
+
+        assert len(index) == 100
+        assert np.allclose(index.get("t99"), _vec(1.0, 99.0, 0.0) / np.linalg.norm([1.0, 99.0]))
+
+
+class TestSimilarity:
+    """랭킹/쌍 탐색 테스트"""
+
+    def test_rank_orders_by_similarity(self, index):
+        """유사도 내림차순 + 임계값 필터"""
+        index.upsert("x", _vec(1.0, 0.0, 0.0))
+        index.upsert("xy", _vec(1.0, 1.0, 0.0))
+        index.upsert("z", _vec(0.0, 0.0, 1.0))
+
+        ranked = index.rank(_vec(2.0, 0.0, 0.0), top_k=5, threshold=0.3)
+
+        assert [topic_id for topic_id, _ in ranked] == ["x", "xy"]
+        assert ranked[0][1] == pytest.approx(1.0)
+
+    def test_rank_respects_top_k(self, index):
+        """top_k 제한"""
+        index.upsert("a", _vec(1.0, 0.0, 0.0))
+        index.upsert("b", _vec(1.0, 0.1, 0.0))
+
+        assert len(index.rank(_vec(1.0, 0.0, 0.0), top_k=1, threshold=0.0)) == 1
+
+    def test_most_similar_pair(self, index):
+        """최고 유사도 쌍 탐색"""
+        index.upsert("a", _vec(1.0, 0.0, 0.0))
+        index.upsert("b", _vec(0.0, 1.0, 0.0))
+        index.upsert("c", _vec(0.9, 0.1, 0.0))
+
+        topic_a, topic_b, similarity = index.most_similar_pair()
+
+        assert {topic_a, topic_b} == {"a", "c"}
+        assert similarity == pytest.approx(0.9 / np.linalg.norm([0.9, 0.1]))
+
+    def test_most_similar_pair_requires_two(self, index):
+        """토픽 2개 미만이면 None"""
+        index.upsert("a", _vec(1.0, 0.0, 0.0))
+        assert index.most_similar_pair() is None
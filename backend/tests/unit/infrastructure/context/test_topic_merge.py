@@ -0,0 +1,70 @@
+"""ContextManager 토픽 병합 단위 테스트"""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.context import ContextManager, TopicSegment
+
+MEETING_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _segment(seg_id: str, start: int) -> TopicSegment:
+    return TopicSegment(
+        id=seg_id,
+        name=f"{seg_id} 토픽",
+        summary=f"{seg_id} 요약",
+        start_utterance_id=start,
+        end_utterance_id=start + 9,
+        keywords=[seg_id],
+    )
+
+
+def _vector(ctx: ContextManager, *values: float) -> np.ndarray:
+    vector = np.zeros(ctx._topic_embeddings.dimension, dtype=np.float32)
+    vector[: len(values)] = values
+    return vector
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """LLM 병합/임베딩 호출 없이 병합 경로만 실행하는 ContextManager"""
+    ctx = ContextManager(meeting_id=MEETING_ID)
+
+    async def _no_llm(seg1, seg2):
+        return None
+
+    async def _no_embed(segments):
+        return 0
+
+    monkeypatch.setattr(ctx, "_merge_topics_with_llm", _no_llm)
+    monkeypatch.setattr(ctx, "_embed_topics_batch_async", _no_embed)
+    return ctx
+
+
+class TestMergeMostSimilarPair:
+    """최고 유사도 쌍 병합"""
+
+    async def test_stale_embedding_does_not_block_merge(self, manager):
+        """제거된 토픽의 임베딩이 최고 유사도 쌍이어도 다음 쌍으로 병합"""
+        manager.l1_segments = [_segment("t1", 1), _segment("t2", 11), _segment("t3", 21)]
+        manager._topic_embeddings.upsert("t1", _vector(manager, 1.0, 0.0, 0.0))
+        manager._topic_embeddings.upsert("stale", _vector(manager, 1.0, 0.0, 0.0))
+        manager._topic_embeddings.upsert("t2", _vector(manager, 0.0, 1.0, 0.1))
+        manager._topic_embeddings.upsert("t3", _vector(manager, 0.0, 1.0, 0.0))
+
+        assert await manager._merge_most_similar_pair()
+
+        assert "stale" not in manager._topic_embeddings
+        assert [seg.id for seg in manager.l1_segments[:1]] == ["t1"]
+        assert len(manager.l1_segments) == 2
+        assert manager.l1_segments[-1].start_utterance_id == 11
+        assert manager.l1_segments[-1].end_utterance_id == 30
+
+    async def test_no_pair_above_threshold(self, manager):
+        """임계값 이상인 쌍이 없으면 병합하지 않음"""
+        manager.l1_segments = [_segment("t1", 1), _segment("t2", 11)]
+        manager._topic_embeddings.upsert("t1", _vector(manager, 1.0, 0.0, 0.0))
+        manager._topic_embeddings.upsert("t2", _vector(manager, 0.0, 1.0, 0.0))
+
+        assert not await manager._merge_most_similar_pair()
+        assert len(manager.l1_segments) == 2
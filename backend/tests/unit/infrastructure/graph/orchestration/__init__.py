@@ -0,0 +1 @@
+"""Orchestration 테스트"""
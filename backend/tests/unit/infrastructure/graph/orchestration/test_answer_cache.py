@@ -0,0 +1,78 @@
+"""Orchestration 답변 캐시 헬퍼 단위 테스트
+
+테스트 케이스:
+- 스레드의 첫 질문만 캐시 키로 사용 (같은 턴의 도구 호출 메시지는 무시)
+- 후속 질문은 조회하지 않음 (임베딩/버전 조회 없음)
+"""
+
+from unittest.mock import AsyncMock, patch
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from app.infrastructure.graph.orchestration.shared import answer_cache
+from app.infrastructure.graph.orchestration.shared.answer_cache import (
+    cacheable_query,
+    lookup_cached_answer,
+)
+
+
+class TestCacheableQuery:
+    """캐시 키 질의 추출"""
+
+    def test_first_question(self):
+        """이전 턴이 없으면 최근 사용자 메시지"""
+        assert cacheable_query([HumanMessage(content="예산 결정 알려줘")]) == "예산 결정 알려줘"
+
+    def test_same_turn_tool_messages_ignored(self):
+        """같은 턴의 도구 호출/결과 메시지가 뒤에 있어도 첫 질문으로 취급"""
+        messages = [
+            HumanMessage(content="예산 결정 알려줘"),
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "mit_search", "args": {"query": "예산"}, "id": "call-1"}],
+            ),
+            ToolMessage(content="검색 결과", tool_call_id="call-1"),
+        ]
+
+        assert cacheable_query(messages) == "예산 결정 알려줘"
+
+    def test_follow_up_question_not_cached(self):
+        """이전 대화 턴이 있으면 빈 문자열"""
+        messages = [
+            HumanMessage(content="예산 결정 알려줘"),
+            AIMessage(content="3월 회의에서 증액으로 결정됐습니다."),
+            HumanMessage(content="그럼 그건 누가 담당해?"),
+        ]
+
+        assert cacheable_query(messages) == ""
+
+    def test_no_human_message(self):
+        assert cacheable_query([]) == ""
+
+
+class TestLookupCachedAnswer:
+    """답변 캐시 조회"""
+
+    async def test_follow_up_skips_lookup(self):
+        """후속 질문은 KG 버전/임베딩 조회 없이 미스 (버전 미확정 → 저장도 생략)"""
+        messages = [
+            HumanMessage(content="예산 결정 알려줘"),
+            AIMessage(content="증액으로 결정됐습니다."),
+            HumanMessage(content="그건 언제야?"),
+        ]
+
+        with (
+            patch.object(answer_cache, "resolve_kg_versions", AsyncMock()) as versions,
+            patch.object(answer_cache, "_embed", AsyncMock()) as embed,
+        ):
+            update = await lookup_cached_answer(
+                cacheable_query(messages), scope="spotlight:user-1", user_id="user-1"
+            )
+
+        assert update == {
+            "cached_answer": None,
+            "answer_cache_grounded": False,
+            "answer_cache_versions": None,
+        }
+        versions.assert_not_called()
+        embed.assert_not_called()
@@ -0,0 +1,99 @@
+"""로컬 의도 분류기 / Planner 계획 캐시 단위 테스트"""
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from app.infrastructure.graph.orchestration.shared.intent_classifier import (
+    LABEL_GUIDE,
+    LABEL_MIT_SEARCH,
+    LABEL_PLANNING,
+    LABEL_SIMPLE_TALK,
+    LocalIntentClassifier,
+    normalize_text,
+)
+from app.infrastructure.graph.orchestration.shared.plan_cache import (
+    PlanCache,
+    build_cached_plan_message,
+    is_cacheable_query,
+    is_first_planning_step,
+    plan_cache_key,
+)
+
+
+class TestLocalIntentClassifier:
+    """키워드 규칙 + n-gram 1-NN 분류 테스트"""
+
+    def test_greeting_phrase_rule(self):
+        """짧은 인사는 규칙으로 확신 1.0"""
+        assert LocalIntentClassifier().predict("안녕하세요!") == (LABEL_SIMPLE_TALK, 1.0)
+
+    def test_common_query_shapes(self):
+        """시드 예시와 비슷한 형태는 해당 라벨"""
+        classifier = LocalIntentClassifier()
+
+        assert classifier.predict("지난 회의에서 예산 관련 결정 뭐였지?")[0] == LABEL_MIT_SEARCH
+        assert classifier.predict("이거 어떻게 쓰는 거야?")[0] == LABEL_GUIDE
+        assert classifier.predict("회의 참석자 누구야")[0] == LABEL_PLANNING
+
+    def test_trained_examples_extend_seed(self):
+        """트레이스 예시를 추가 학습하면 새 표현도 분류"""
+        classifier = LocalIntentClassifier()
+        before = len(classifier)
+
+        classifier.train({LABEL_SIMPLE_TALK: ["오늘도 화이팅"]})
+
+        assert len(classifier) == before + 1
+        assert classifier.predict("오늘도 화이팅!")[0] == LABEL_SIMPLE_TALK
+
+    def test_normalize_text(self):
+        """구두점 제거 + 공백 정리"""
+        assert normalize_text("  예산, 얼마야?? ") == "예산 얼마야"
+
+
+class TestPlanCache:
+    """계획 캐시 테스트"""
+
+    def test_key_ignores_punctuation_and_scopes_context(self):
+        """구두점/공백 차이는 같은 키, 회의가 다르면 다른 키"""
+        assert plan_cache_key("예산 얼마야?", "m1") == plan_cache_key("예산  얼마야", "m1")
+        assert plan_cache_key("예산 얼마야?", "m1") != plan_cache_key("예산 얼마야?", "m2")
+
+    def test_lru_eviction(self):
+        """최근 조회한 계획은 남고 가장 오래된 계획이 축출"""
+        cache = PlanCache(max_plans=2)
+        cache.put(("a",), {"plan": "a", "selected_tool": None})
+        cache.put(("b",), {"plan": "b", "selected_tool": None})
+        cache.get(("a",))
+        cache.put(("c",), {"plan": "c", "selected_tool": None})
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",))["plan"] == "a"
+
+    def test_ttl_expiry(self):
+        """TTL이 지난 계획은 미스"""
+        cache = PlanCache(ttl_seconds=-1)
+        cache.put(("a",), {"plan": "a", "selected_tool": None})
+
+        assert cache.get(("a",)) is None
+
+    def test_cached_tool_plan_rebuilds_tool_call(self):
+        """도구 계획은 새 tool_call id를 가진 AIMessage로 재구성"""
+        plan = {"plan": "도구 실행: get_meetings", "selected_tool": "get_meetings", "tool_args": {"team_id": "t1"}}
+
+        first = build_cached_plan_message(plan)
+        second = build_cached_plan_message(plan)
+
+        assert first.tool_calls[0]["name"] == "get_meetings"
+        assert first.tool_calls[0]["args"] == {"team_id": "t1"}
+        assert first.tool_calls[0]["id"] != second.tool_calls[0]["id"]
+        assert build_cached_plan_message({"plan": "직접 응답", "selected_tool": None}) is None
+
+    def test_only_first_step_of_context_free_queries(self):
+        """도구 실행 이후 재계획과 지시어 질의는 캐시 대상 아님"""
+        assert is_first_planning_step([HumanMessage(content="예산 얼마야")])
+        assert not is_first_planning_step([
+            HumanMessage(content="예산 얼마야"),
+            AIMessage(content="", tool_calls=[{"name": "t", "args": {}, "id": "c1"}]),
+            ToolMessage(content="결과", tool_call_id="c1"),
+        ])
+        assert is_cacheable_query("이번 주 회의 목록 알려줘")
+        assert not is_cacheable_query("아까 그거 다시 알려줘")
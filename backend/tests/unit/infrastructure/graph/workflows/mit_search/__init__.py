@@ -0,0 +1 @@
+"""MIT Search 테스트"""
@@ -0,0 +1,152 @@
+"""Hybrid 검색 (BM25 + 벡터) 단위 테스트"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.infrastructure.graph.integration.neo4j_vector import (
+    build_embedding_text,
+    embedding_text_hash,
+)
+from app.infrastructure.graph.workflows.mit_search.tools.search_tools import (
+    execute_hybrid_search_async,
+)
+from app.infrastructure.graph.workflows.mit_search.utils.hybrid_fusion import (
+    fuse_hybrid_results,
+    normalize_bm25_scores,
+)
+from app.infrastructure.graph.workflows.mit_search.utils.search_strategy_router import (
+    SearchStrategyRouter,
+)
+
+ROUTER_SETTINGS = (
+    "app.infrastructure.graph.workflows.mit_search.utils.search_strategy_router.get_settings"
+)
+
+
+class TestEmbeddingText:
+    """임베딩 원문 테스트"""
+
+    def test_joins_non_empty_fields(self):
+        """비어있는 필드는 제외"""
+        text = build_embedding_text("Decision", {"content": "예산 확정", "context": None})
+        assert text == "예산 확정"
+
+    def test_hash_ignores_whitespace(self):
+        """공백 차이는 같은 해시 (재임베딩 생략)"""
+        assert embedding_text_hash("예산  확정\n") == embedding_text_hash("예산 확정")
+
+
+class TestFusion:
+    """점수 결합 테스트"""
+
+    def test_bm25_normalized_by_max(self):
+        scores = normalize_bm25_scores([{"id": "a", "score": 4.0}, {"id": "b", "score": 2.0}])
+        assert scores == {"a": 1.0, "b": 0.5}
+
+    def test_vector_only_hit_is_kept(self):
+        """BM25에 없는 의역 매칭도 결과에 포함"""
+        fused = fuse_hybrid_results(
+            [{"id": "a", "score": 2.0}],
+            [{"id": "b", "score": 0.9}],
+            alpha=0.5,
+        )
+        assert {item["id"] for item in fused} == {"a", "b"}
+
+    def test_both_paths_rank_first(self):
+        """양쪽 모두 매칭된 결과가 최상위"""
+        fused = fuse_hybrid_results(
+            [{"id": "a", "score": 2.0}, {"id": "b", "score": 1.8}],
+            [{"id": "b", "score": 0.9}, {"id": "c", "score": 0.95}],
+            alpha=0.5,
+        )
+        assert fused[0]["id"] == "b"
+        assert fused[0]["bm25_score"] == pytest.approx(0.9)
+        assert fused[0]["vector_score"] == pytest.approx(0.9)
+
+    def test_limit(self):
+        fused = fuse_hybrid_results(
+            [{"id": str(i), "score": float(i)} for i in range(10)], [], limit=3
+        )
+        assert [item["id"] for item in fused] == ["9", "8", "7"]
+
+
+class TestHybridRouting:
+    """전략 라우팅 테스트"""
+
+    @staticmethod
+    def _route(intent: dict, enabled: bool) -> str:
+        with patch(ROUTER_SETTINGS) as mock_settings:
+            mock_settings.return_value = MagicMock(kg_vector_index_enabled=enabled)
+            return SearchStrategyRouter.determine_strategy(
+                query_intent=intent,
+                entity_types=[],
+                normalized_keywords="예산 줄이기로 한 거",
+                user_id="user-1",
+            )["strategy"]
+
+    def test_content_query_uses_hybrid(self):
+        intent = {"intent_type": "general_search", "search_focus": "Decision", "confidence": 0.9}
+        assert self._route(intent, enabled=True) == "hybrid_search"
+
+    def test_disabled_keeps_text_to_cypher(self):
+        intent = {"intent_type": "general_search", "search_focus": "Decision", "confidence": 0.9}
+        assert self._route(intent, enabled=False) == "text_to_cypher"
+
+    def test_entity_query_keeps_text_to_cypher(self):
+        """인물 조건이 있으면 그래프 탐색 유지"""
+        intent = {
+            "intent_type": "entity_search",
+            "search_focus": "Decision",
+            "primary_entity": "신수효",
+            "confidence": 0.9,
+        }
+        assert self._route(intent, enabled=True) == "text_to_cypher"
+
+
+class _FakeResult:
+    async def data(self):
+        return []
+
+
+class _FakeSession:
+    def __init__(self, calls: list):
+        self.calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, cypher, params):
+        self.calls.append((cypher, params))
+        return _FakeResult()
+
+
+class TestHybridSearchScope:
+    """사용자 범위 제한 테스트"""
+
+    async def test_every_branch_scoped_to_user(self):
+        """BM25/벡터 모든 경로가 $user_id 참여 회의로 한정"""
+        calls: list = []
+        driver = MagicMock()
+        driver.session.side_effect = lambda **kwargs: _FakeSession(calls)
+        embedder = MagicMock(is_available=True)
+
+        async def _embed(text):
+            return np.ones(4, dtype=np.float32)
+
+        embedder.embed_text_async = _embed
+
+        with (
+            patch("app.core.neo4j.get_neo4j_driver", return_value=driver),
+            patch("app.infrastructure.context.embedding.TopicEmbedder", return_value=embedder),
+        ):
+            await execute_hybrid_search_async("예산 줄이기", user_id="user-1")
+
+        assert len(calls) == 5
+        for cypher, params in calls:
+            assert "(:User {id: $user_id})-[:PARTICIPATED_IN]->" in cypher
+            assert params["user_id"] == "user-1"
@@ -0,0 +1,215 @@
+"""Template fast path + plan 캐시 단위 테스트"""
+
+from unittest.mock import AsyncMock, patch
+
+from app.infrastructure.graph.workflows.mit_search.nodes import cypher_generation
+from app.infrastructure.graph.workflows.mit_search.utils.query_plan_cache import (
+    SOURCE_LLM,
+    SOURCE_PLAN_CACHE,
+    SOURCE_TEMPLATE,
+    QueryPlanCache,
+    get_query_plan_cache,
+    is_reusable_llm_cypher,
+)
+from app.infrastructure.graph.workflows.mit_search.utils.template_cypher import (
+    bind_template_parameters,
+    generate_template_cypher,
+    template_shape,
+)
+
+DATE_RANGE = {"start": "2026-01-01T00:00:00", "end": "2026-01-31T23:59:59"}
+
+
+class TestTemplateShape:
+    """형태 키 테스트"""
+
+    def test_same_shape_same_cypher(self):
+        """값만 다르면 같은 키, 같은 Cypher"""
+        first = dict(intent_type="entity_search", search_focus="Decision", primary_entity="신수효", keywords=["예산"])
+        second = dict(intent_type="entity_search", search_focus="Decision", primary_entity="김민수", keywords=["일정"])
+
+        assert template_shape(**first) == template_shape(**second)
+        assert generate_template_cypher(**first) == generate_template_cypher(**second)
+
+    def test_date_changes_shape(self):
+        base = dict(intent_type="general_search", search_focus="Decision", primary_entity=None, keywords=["예산"])
+        assert template_shape(**base) != template_shape(**base, date_filter=DATE_RANGE)
+
+    def test_partial_date_is_ignored(self):
+        """start/end 중 하나만 있으면 날짜 필터 없음과 동일"""
+        base = dict(intent_type="general_search", search_focus="Meeting", primary_entity=None, keywords=["회고"])
+        partial = {"start": DATE_RANGE["start"]}
+        assert template_shape(**base, date_filter=partial) == template_shape(**base)
+        assert generate_template_cypher(**base, date_filter=partial) == generate_template_cypher(**base)
+
+    def test_keyword_decision_has_template(self):
+        cypher = generate_template_cypher(
+            intent_type="general_search", search_focus="Decision", primary_entity=None, keywords=["예산"]
+        )
+        assert cypher is not None
+        assert "$search_term" in cypher and "$user_id" in cypher
+
+    def test_action_item_template_is_user_scoped(self):
+        """담당자 유무와 관계없이 사용자가 참여한 회의의 액션 아이템만 검색"""
+        for primary_entity in (None, "신수효"):
+            cypher = generate_template_cypher(
+                intent_type="general_search",
+                search_focus="Action",
+                primary_entity=primary_entity,
+                keywords=["보고서"],
+            )
+            assert "(me:User {id: $user_id})-[:PARTICIPATED_IN]->(m:Meeting)" in cypher
+
+
+class TestParameterBinder:
+    """파라미터 바인딩 테스트"""
+
+    def test_intent_date_range_wins(self):
+        date_range, params = bind_template_parameters(
+            "지난주 결정사항", {"date_range": DATE_RANGE, "keywords": ["예산"]}, "user-1"
+        )
+        assert date_range == DATE_RANGE
+        assert params["start_date"] == DATE_RANGE["start"]
+        assert params["search_term"] == "예산"
+
+    def test_extracts_date_from_query(self):
+        date_range, params = bind_template_parameters("지난주 결정사항", {}, "user-1")
+        assert date_range is not None
+        assert params["start_date"] == date_range["start"]
+
+
+class TestQueryPlanCache:
+    """plan 캐시 테스트"""
+
+    def test_lru_eviction(self):
+        cache = QueryPlanCache(max_plans=2)
+        cache.put(("a",), "A", "template_based")
+        cache.put(("b",), "B", "template_based")
+        cache.get(("a",))
+        cache.put(("c",), "C", "template_based")
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == ("A", "template_based")
+
+    def test_bypass_rate(self):
+        cache = QueryPlanCache()
+        for source in [SOURCE_TEMPLATE, SOURCE_PLAN_CACHE, SOURCE_PLAN_CACHE, SOURCE_LLM]:
+            cache.record_source(source)
+        assert cache.bypass_rate == 0.75
+
+    def test_inlined_literal_is_not_reusable(self):
+        cypher = (
+            "MATCH (u:User {id: $user_id})-[:PARTICIPATED_IN]->(m:Meeting) "
+            "WHERE m.title CONTAINS '회고' RETURN m LIMIT 5"
+        )
+        assert not is_reusable_llm_cypher(cypher)
+        assert is_reusable_llm_cypher(cypher.replace("'회고'", "$search_term"))
+
+    def test_unscoped_cypher_is_not_reusable(self):
+        """$user_id 범위 제한이 없으면 재사용하지 않음"""
+        assert not is_reusable_llm_cypher("MATCH (m:Meeting) WHERE m.title CONTAINS $query RETURN m")
+
+
+class TestLLMPlanCaching:
+    """LLM Cypher plan 캐시 저장 테스트"""
+
+    @staticmethod
+    async def _generate(llm_cypher: str | None, template_cypher: str | None = None) -> dict:
+        state = {
+            "mit_search_query": "내가 참여한 회의 알려줘",
+            "user_id": "0f8c2a1e-7d3b-4c55-9a61-2b7e4d9c1a20",
+            "mit_search_query_intent": {
+                "intent_type": "general_search",
+                "search_focus": "Meeting",
+                "keywords": ["회의"],
+            },
+        }
+        strategy = {"strategy": "text_to_cypher", "reasoning": "test"}
+        with (
+            patch.object(
+                cypher_generation.SearchStrategyRouter, "determine_strategy", return_value=strategy
+            ),
+            patch.object(
+                cypher_generation, "generate_template_cypher", return_value=template_cypher
+            ),
+            patch.object(
+                cypher_generation, "_generate_text_to_cypher", AsyncMock(return_value=llm_cypher)
+            ),
+        ):
+            return await cypher_generation.cypher_generator_async(state)
+
+    async def test_llm_cypher_with_inlined_user_id_not_cached(self):
+        """사용자 ID가 리터럴로 박힌 LLM Cypher는 다른 사용자에게 재사용되지 않음"""
+        cache = get_query_plan_cache()
+        cache.clear()
+        cypher = (
+            "MATCH (u:User {id: '0f8c2a1e-7d3b-4c55-9a61-2b7e4d9c1a20'})"
+            "-[:PARTICIPATED_IN]->(m:Meeting) "
+            "RETURN m.id AS id, m.title AS title, m.title AS graph_context LIMIT 10"
+        )
+
+        result = await self._generate(cypher)
+
+        assert result["mit_search_cypher"] == cypher
+        assert len(cache) == 0
+
+    async def test_parameterized_llm_cypher_cached(self):
+        """$user_id로만 범위를 지정한 LLM Cypher는 같은 형태에 재사용"""
+        cache = get_query_plan_cache()
+        cache.clear()
+        cypher = (
+            "MATCH (u:User {id: $user_id})-[:PARTICIPATED_IN]->(m:Meeting) "
+            "RETURN m.id AS id, m.title AS title, m.title AS graph_context LIMIT 10"
+        )
+
+        await self._generate(cypher)
+
+        assert len(cache) == 1
+        cache.clear()
+
+    async def test_template_cached_after_validation(self):
+        cache = get_query_plan_cache()
+        cache.clear()
+        template = generate_template_cypher(
+            intent_type="general_search", search_focus="Meeting", primary_entity=None, keywords=["회의"]
+        )
+
+        result = await self._generate(None, template_cypher=template)
+
+        assert result["mit_search_cypher"] == template
+        assert len(cache) == 1
+        cache.clear()
+
+    async def test_template_failing_validation_not_cached(self):
+        """품질/안전성 검증에 실패한 템플릿은 plan 캐시에 저장하지 않음"""
+        cache = get_query_plan_cache()
+        cache.clear()
+        # graph_context가 없어 안전성 검증 실패 → fallback
+        template = "MATCH (u:User {id: $user_id})-[:PARTICIPATED_IN]->(m:Meeting) RETURN m.id AS id"
+
+        result = await self._generate(None, template_cypher=template)
+
+        assert result["mit_search_cypher"] != template
+        assert len(cache) == 0
+
+
+class TestLLMCypherCache:
+    """질의별 LLM Cypher 캐시 테스트"""
+
+    async def test_cache_is_per_user(self):
+        """LLM 프롬프트에 사용자 ID가 들어가므로 다른 사용자와 공유하지 않음"""
+        cypher_generation._cypher_cache.clear()
+        intent = {"intent_type": "general_search", "search_focus": "Meeting"}
+        attempt = AsyncMock(side_effect=["CYPHER user-1", "CYPHER user-2"])
+
+        with (
+            patch.object(cypher_generation, "_extract_subqueries", AsyncMock(return_value=["q"])),
+            patch.object(cypher_generation, "_attempt_cypher_with_feedback", attempt),
+        ):
+            first = await cypher_generation._generate_text_to_cypher("q", intent, "user-1")
+            second = await cypher_generation._generate_text_to_cypher("q", intent, "user-2")
+            cached = await cypher_generation._generate_text_to_cypher("q", intent, "user-1")
+
+        assert (first, second, cached) == ("CYPHER user-1", "CYPHER user-2", "CYPHER user-1")
+        assert attempt.await_count == 2
+        cypher_generation._cypher_cache.clear()
@@ -0,0 +1,128 @@
+"""MIT Search 리랭커 / 지연 기반 정책 단위 테스트"""
+
+import asyncio
+
+from app.infrastructure.graph.workflows.mit_search.utils.rerankers import (
+    BACKEND_LOCAL,
+    BACKEND_REMOTE,
+    MIN_LATENCY_SAMPLES,
+    ClovaReranker,
+    LatencyAwareRerankerPolicy,
+    LexicalReranker,
+    tokenize,
+)
+
+
+class FakeRerankerClient:
+    """ClovaRerankerClient 대역 (지연/응답 제어)"""
+
+    def __init__(self, ranked=None, delay=0.0, latencies=None, available=True):
+        self.ranked = ranked
+        self.delay = delay
+        self.latencies = list(latencies or [])
+        self.is_available = available
+        self.calls = 0
+
+    @property
+    def sample_count(self):
+        return len(self.latencies)
+
+    def latency_percentile(self, percentile):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
+
+    async def rerank(self, query, documents):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.ranked
+
+
+CANDIDATES = [
+    {"id": "d1", "graph_context": "출시 일정 회의에서 도출된 결정: 3월 출시"},
+    {"id": "d2", "graph_context": "예산 회의에서 도출된 결정: 마케팅 예산 증액"},
+]
+
+
+class TestLexicalReranker:
+    """로컬 lexical 리랭커 테스트"""
+
+    def test_tokenize_adds_bigrams_for_korean_words(self):
+        """조사가 붙은 어절도 bigram으로 부분 일치"""
+        assert "예산" in tokenize("예산을")
+
+    def test_query_terms_rank_matching_candidate_higher(self):
+        """질의어를 포함한 후보가 더 높은 점수"""
+        scores = LexicalReranker().score("예산 증액", CANDIDATES, {})
+
+        assert scores[1] > scores[0]
+        assert all(0.0 <= score <= 1.0 for score in scores)
+
+    def test_entity_presence_boosts_score(self):
+        """primary_entity가 포함된 후보 가산"""
+        candidates = [
+            {"id": "a", "graph_context": "회의 결정", "assignee": "김민수"},
+            {"id": "b", "graph_context": "회의 결정", "assignee": "이영희"},
+        ]
+        scores = LexicalReranker().score("회의", candidates, {"primary_entity": "김민수"})
+
+        assert scores[0] > scores[1]
+
+
+class TestClovaReranker:
+    """원격 리랭커 응답 변환 테스트"""
+
+    async def test_maps_scores_back_to_candidate_order(self):
+        """id 기준으로 후보 순서에 맞춰 점수 반환 (100점 척도 정규화)"""
+        client = FakeRerankerClient(ranked=[{"id": "1", "score": 90}, {"id": "0", "score": 0.2}])
+
+        scores = await ClovaReranker(client).rerank("예산", CANDIDATES, {})
+
+        assert scores == [0.2, 0.9]
+
+
+class TestLatencyAwareRerankerPolicy:
+    """지연 기반 선택 정책 테스트"""
+
+    async def test_uses_remote_within_budget(self):
+        """원격이 예산 안에 응답하면 원격 점수 사용"""
+        client = FakeRerankerClient(ranked=[{"id": "0", "score": 0.7}, {"id": "1", "score": 0.1}])
+        policy = LatencyAwareRerankerPolicy(ClovaReranker(client), LexicalReranker(), budget_ms=500)
+
+        scores, backend = await policy.rerank("예산", CANDIDATES, {})
+
+        assert backend == BACKEND_REMOTE
+        assert scores == [0.7, 0.1]
+
+    async def test_falls_back_to_local_on_timeout(self):
+        """원격이 예산을 넘기면 로컬 점수로 응답"""
+        client = FakeRerankerClient(ranked=[], delay=1.0)
+        policy = LatencyAwareRerankerPolicy(ClovaReranker(client), LexicalReranker(), budget_ms=20)
+
+        scores, backend = await policy.rerank("예산", CANDIDATES, {})
+
+        assert backend == BACKEND_LOCAL
+        assert len(scores) == len(CANDIDATES)
+
+    async def test_skips_remote_when_recent_p90_over_budget(self):
+        """최근 p90 지연이 예산 초과면 원격을 호출하지 않음"""
+        client = FakeRerankerClient(ranked=[], latencies=[2.0] * MIN_LATENCY_SAMPLES)
+        policy = LatencyAwareRerankerPolicy(ClovaReranker(client), LexicalReranker(), budget_ms=500)
+
+        _, backend = await policy.rerank("예산", CANDIDATES, {})
+
+        assert backend == BACKEND_LOCAL
+        assert client.calls == 0
+
+    async def test_local_mode_never_calls_remote(self):
+        """local 모드는 원격 미사용"""
+        client = FakeRerankerClient(ranked=[])
+        policy = LatencyAwareRerankerPolicy(
+            ClovaReranker(client), LexicalReranker(), mode="local"
+        )
+
+        _, backend = await policy.rerank("예산", CANDIDATES, {})
+
+        assert backend == BACKEND_LOCAL
+        assert client.calls == 0
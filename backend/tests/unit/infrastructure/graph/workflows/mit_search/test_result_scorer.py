@@ -0,0 +1,94 @@
+"""SearchResultRelevanceScorer 배치 점수 계산 단위 테스트"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.infrastructure.cache.embedding_cache import EmbeddingCache
+from app.infrastructure.graph.workflows.mit_search.utils.recency_calculator import (
+    calculate_recency_score,
+    calculate_recency_scores,
+)
+from app.infrastructure.graph.workflows.mit_search.utils.result_scorer import (
+    SearchResultRelevanceScorer,
+)
+
+
+class FakeEmbeddingModel:
+    """encode 호출을 기록하는 임베딩 모델 대역"""
+
+    model_name = "fake"
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = []
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        return np.array([self.vectors[text] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def cache():
+    return EmbeddingCache(max_bytes=1024 * 1024)
+
+
+class TestBatchScoring:
+    """배치 점수 계산 테스트"""
+
+    def test_focus_weights_applied(self, cache):
+        """Decision 가중치: keyword 0.2 + entity 0.2 + recency 0.5*0.05 + rank 0.15"""
+        scorer = SearchResultRelevanceScorer(embedding_cache=cache)
+
+        scored = scorer.score_results([{"score": 10}], "예산", search_focus="Decision")
+
+        assert scored["quality_score"] == pytest.approx(57.5)
+
+    def test_low_intent_alignment_penalized(self, cache):
+        """intent_alignment < 0.3이면 점수 절반"""
+        scorer = SearchResultRelevanceScorer(embedding_cache=cache)
+        aligned = scorer.score_results([{"score": 10}], "예산")
+        misaligned = scorer.score_results([{"score": 10, "intent_alignment": 0.1}], "예산")
+
+        assert misaligned["quality_score"] == pytest.approx(aligned["quality_score"] / 2)
+
+    def test_semantic_similarity_embeds_in_one_batch(self, cache):
+        """질의 + 본문을 한 번의 encode 호출로 임베딩하고 캐시 재사용"""
+        model = FakeEmbeddingModel({
+            "예산": [1.0, 0.0],
+            "예산 확정": [1.0, 0.0],
+            "출시 일정": [0.0, 1.0],
+        })
+        scorer = SearchResultRelevanceScorer(embedding_model=model, embedding_cache=cache)
+        results = [{"graph_context": "예산 확정"}, {"content": "출시 일정"}, {"content": ""}]
+
+        similarities = scorer._calculate_semantic_similarities(results, "예산")
+        scorer._calculate_semantic_similarities(results, "예산")
+
+        assert similarities.tolist() == pytest.approx([1.0, 0.0, 0.3])
+        assert model.calls == [["예산", "예산 확정", "출시 일정"]]
+
+
+class TestRecencyScores:
+    """배치 최신성 점수 테스트"""
+
+    def test_matches_scalar_exponential_decay(self):
+        """calculate_recency_score(exponential)와 동일한 값"""
+        now = datetime(2025, 6, 1)
+        results = [
+            {"created_at": (now - timedelta(days=days)).isoformat()}
+            for days in (1, 45, 400)
+        ]
+
+        batch = calculate_recency_scores(results, reference_date=now)
+        scalar = [calculate_recency_score(r["created_at"], reference_date=now) for r in results]
+
+        assert batch.tolist() == pytest.approx(scalar)
+
+    def test_missing_and_future_dates(self):
+        """날짜 없음 0.5, 미래 날짜 1.0"""
+        now = datetime(2025, 6, 1)
+        results = [{}, {"created_at": (now + timedelta(days=3)).isoformat()}]
+
+        assert calculate_recency_scores(results, reference_date=now).tolist() == [0.5, 1.0]
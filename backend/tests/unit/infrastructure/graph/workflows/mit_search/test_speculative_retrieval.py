@@ -0,0 +1,161 @@
+"""Voice 투기적 검색 단위 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.infrastructure.graph.workflows.mit_search.nodes import speculative_retrieval
+from app.infrastructure.graph.workflows.mit_search.nodes.speculative_retrieval import (
+    gather_within_budget,
+    prefetch_candidates_async,
+    speculative_search_async,
+)
+from app.infrastructure.graph.workflows.mit_search.utils.hybrid_fusion import (
+    merge_candidate_sets,
+)
+
+MODULE = "app.infrastructure.graph.workflows.mit_search.nodes.speculative_retrieval"
+
+
+async def _results(rows, delay=0.0):
+    await asyncio.sleep(delay)
+    return rows
+
+
+class TestMergeCandidateSets:
+    """후보 병합 테스트"""
+
+    def test_dedupes_by_id_keeping_first_row_and_max_score(self):
+        """같은 id는 첫 행 유지 + 최대 점수"""
+        merged = merge_candidate_sets(
+            [{"id": "d1", "graph_context": "템플릿", "score": 0.4}],
+            [{"id": "d1", "graph_context": "fulltext", "score": 2.0}, {"id": "d2", "score": 1.0}],
+        )
+
+        assert [row["id"] for row in merged] == ["d1", "d2"]
+        assert merged[0]["graph_context"] == "템플릿"
+        assert merged[0]["score"] == 2.0
+
+    def test_keeps_rows_without_id_and_applies_limit(self):
+        """id 없는 행 포함, limit 적용"""
+        merged = merge_candidate_sets(
+            [{"id": "d1"}, {"title": "id 없음"}],
+            [{"id": "d2"}],
+            limit=2,
+        )
+
+        assert merged == [{"id": "d1"}, {"id": "d2"}]
+
+    def test_does_not_mutate_inputs(self):
+        """입력 행은 변경하지 않음"""
+        first = {"id": "d1", "score": 0.1}
+        merge_candidate_sets([first], [{"id": "d1", "score": 0.9}])
+
+        assert first["score"] == 0.1
+
+
+class TestGatherWithinBudget:
+    """지연 예산 테스트"""
+
+    async def test_cancels_branches_over_budget(self):
+        """예산을 넘긴 경로는 결과에서 제외"""
+        results = await gather_within_budget(
+            {
+                "template": _results([{"id": "t"}]),
+                "llm": _results([{"id": "l"}], delay=1.0),
+            },
+            budget_seconds=0.05,
+        )
+
+        assert results == {"template": [{"id": "t"}]}
+
+    async def test_failed_branch_is_skipped(self):
+        """실패한 경로는 결과에서 제외"""
+
+        async def _boom():
+            raise RuntimeError("neo4j down")
+
+        results = await gather_within_budget({"llm": _boom()}, budget_seconds=1.0)
+
+        assert results == {}
+
+
+class TestPrefetch:
+    """선조회 테스트"""
+
+    async def test_prefetch_scoped_to_user_meetings(self):
+        """선조회 Cypher는 $user_id가 참여한 회의로 한정"""
+        search = AsyncMock(return_value=[{"id": "p"}])
+        with patch(f"{MODULE}.execute_cypher_search_async", search):
+            rows = await prefetch_candidates_async("예산 결정 사항", "user-1")
+
+        cypher, params = search.await_args.args
+        assert rows == [{"id": "p"}]
+        assert "(:User {id: $user_id})-[:PARTICIPATED_IN]->(m:Meeting)" in cypher
+        assert params["user_id"] == "user-1"
+
+    async def test_prefetch_skipped_without_user(self):
+        """user_id가 없으면 범위를 정할 수 없으므로 조회하지 않음"""
+        search = AsyncMock(return_value=[{"id": "p"}])
+        with patch(f"{MODULE}.execute_cypher_search_async", search):
+            assert await prefetch_candidates_async("예산 결정 사항", "") == []
+
+        search.assert_not_called()
+
+
+class TestSpeculativeSearch:
+    """투기적 검색 흐름 테스트"""
+
+    @pytest.fixture
+    def reranker(self):
+        async def _rerank(state):
+            return {"mit_search_ranked_results": state["mit_search_raw_results"]}
+
+        with patch(f"{MODULE}.reranker_async", side_effect=_rerank) as mock:
+            yield mock
+
+    async def test_template_path_skips_llm(self, reranker):
+        """템플릿이 있으면 LLM 경로를 실행하지 않음"""
+        llm = AsyncMock(return_value=[{"id": "l"}])
+        with (
+            patch(f"{MODULE}._build_template_cypher", return_value=("MATCH ...", None)),
+            patch(f"{MODULE}._run_template_branch", AsyncMock(return_value=[{"id": "t"}])),
+            patch(f"{MODULE}._run_llm_branch", llm),
+        ):
+            ranked = await speculative_search_async(
+                "예산 결정", {}, "user-1", prefetched=[{"id": "p"}], budget_ms=500
+            )
+
+        llm.assert_not_called()
+        assert [row["id"] for row in ranked] == ["t", "p"]
+        reranker.assert_awaited_once()
+
+    async def test_slow_llm_falls_back_to_prefetched(self, reranker):
+        """LLM 경로가 예산을 넘기면 선조회 후보만 리랭크"""
+
+        async def _slow_llm(*args, **kwargs):
+            await asyncio.sleep(1.0)
+            return [{"id": "l"}]
+
+        with (
+            patch(f"{MODULE}._build_template_cypher", return_value=(None, None)),
+            patch.object(speculative_retrieval, "_run_llm_branch", _slow_llm),
+        ):
+            ranked = await speculative_search_async(
+                "지난주 회의", {}, "user-1", prefetched=[{"id": "p"}], budget_ms=50
+            )
+
+        assert [row["id"] for row in ranked] == ["p"]
+        reranker.assert_awaited_once()
+
+    async def test_no_candidates_skips_reranker(self, reranker):
+        """후보가 없으면 리랭커를 호출하지 않음"""
+        with (
+            patch(f"{MODULE}._build_template_cypher", return_value=(None, None)),
+            patch(f"{MODULE}._run_llm_branch", AsyncMock(return_value=[])),
+        ):
+            ranked = await speculative_search_async("질문", {}, "user-1", budget_ms=500)
+
+        assert ranked == []
+        reranker.assert_not_called()
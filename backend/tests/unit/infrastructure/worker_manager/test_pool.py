@@ -0,0 +1,220 @@
+"""워커 풀 WorkerManager 단위 테스트
+
+테스트 케이스:
+- 호스트 정렬: best-fit, 가득 찬 호스트 제외
+- 배정: 풀 우선, 여유 없으면 fallback, 멱등성, 다른 호스트에 예약된 회의는 이중 배정하지 않음
+- 하트비트: 배정 목록 반환, 죽은 호스트 회의 재배정
+- 상태/종료: PENDING → RUNNING, 배정 해제
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.infrastructure.worker_manager import WorkerStatus, WorkerStatusEnum, pool
+from app.infrastructure.worker_manager.pool import (
+    _RESERVE_SCRIPT,
+    HostLoad,
+    PooledWorkerManager,
+    rank_hosts,
+)
+
+
+class FakeRedis:
+    """워커 풀 키 구조와 예약 Lua 스크립트를 시뮬레이션하는 Redis Mock"""
+
+    def __init__(self):
+        self.strings: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.strings[key] = value
+
+    async def mget(self, keys):
+        return [self.strings.get(key) for key in keys]
+
+    async def exists(self, key):
+        return int(key in self.strings)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.strings.pop(key, None)
+            self.hashes.pop(key, None)
+
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    async def srem(self, key, *members):
+        current = self.sets.get(key, set())
+        removed = len(current & set(members))
+        current.difference_update(members)
+        return removed
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hkeys(self, key):
+        return list(self.hashes.get(key, {}))
+
+    async def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    async def eval(self, script, numkeys, assignments_key, meeting_key, *args):
+        assert script == _RESERVE_SCRIPT
+        meeting_id, key_index, capacity, host_id = args
+        if meeting_key in self.strings:
+            return int(self.strings[meeting_key] == host_id)
+        assignments = self.hashes.setdefault(assignments_key, {})
+        if meeting_id in assignments:
+            return 1
+        if len(assignments) >= int(capacity):
+            return 0
+        assignments[meeting_id] = str(key_index)
+        self.strings[meeting_key] = host_id
+        return 1
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+
+    async def _get_redis():
+        return redis
+
+    monkeypatch.setattr(pool, "get_redis", _get_redis)
+    return redis
+
+
+@pytest.fixture
+def key_manager(monkeypatch):
+    manager = AsyncMock()
+    manager.allocate_key.return_value = 2
+
+    async def _get_clova_key_manager():
+        return manager
+
+    monkeypatch.setattr(
+        "app.services.clova_key_manager.get_clova_key_manager",
+        _get_clova_key_manager,
+    )
+    return manager
+
+
+@pytest.fixture
+def fallback():
+    manager = AsyncMock()
+    manager.start_worker.side_effect = lambda meeting_id: f"realtime-worker-{meeting_id}"
+    manager.get_status.side_effect = lambda worker_id: WorkerStatus(
+        worker_id=worker_id,
+        meeting_id=worker_id.removeprefix("realtime-worker-"),
+        status=WorkerStatusEnum.NOT_FOUND,
+    )
+    return manager
+
+
+@pytest.fixture
+def manager(fake_redis, key_manager, fallback):
+    return PooledWorkerManager(fallback=fallback, host_ttl_seconds=10)
+
+
+class TestRankHosts:
+    def test_prefers_most_loaded_host_with_free_slot(self):
+        hosts = [
+            HostLoad("a", capacity=4, assigned=1),
+            HostLoad("b", capacity=4, assigned=3),
+            HostLoad("c", capacity=4, assigned=4),
+        ]
+
+        ranked = rank_hosts(hosts)
+
+        assert [host.host_id for host in ranked] == ["b", "a"]
+
+    def test_empty_when_all_full(self):
+        assert rank_hosts([HostLoad("a", capacity=1, assigned=1)]) == []
+
+
+class TestPooledWorkerManager:
+    @pytest.mark.asyncio
+    async def test_start_assigns_to_pool_host(self, manager, fallback):
+        await manager.heartbeat("host-a", capacity=2, meetings=[])
+
+        worker_id = await manager.start_worker("meeting-1")
+
+        assert worker_id == "realtime-worker-meeting-1"
+        fallback.start_worker.assert_not_called()
+        assert await manager.heartbeat("host-a", capacity=2, meetings=[]) == [("meeting-1", 2)]
+
+    @pytest.mark.asyncio
+    async def test_start_is_idempotent(self, manager, key_manager):
+        await manager.heartbeat("host-a", capacity=2, meetings=[])
+
+        await manager.start_worker("meeting-1")
+        await manager.start_worker("meeting-1")
+
+        assert key_manager.allocate_key.await_count == 1
+        assert len(await manager.heartbeat("host-a", capacity=2, meetings=[])) == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_pool_is_full(self, manager, fallback):
+        await manager.heartbeat("host-a", capacity=1, meetings=[])
+        await manager.start_worker("meeting-1")
+
+        worker_id = await manager.start_worker("meeting-2")
+
+        assert worker_id == "realtime-worker-meeting-2"
+        fallback.start_worker.assert_awaited_once_with("meeting-2")
+
+    @pytest.mark.asyncio
+    async def test_status_and_stop(self, manager, fallback):
+        await manager.heartbeat("host-a", capacity=2, meetings=[])
+        worker_id = await manager.start_worker("meeting-1")
+
+        assert (await manager.get_status(worker_id)).status == WorkerStatusEnum.PENDING
+
+        await manager.heartbeat("host-a", capacity=2, meetings=["meeting-1"])
+        assert (await manager.get_status(worker_id)).status == WorkerStatusEnum.RUNNING
+
+        assert await manager.stop_worker(worker_id) is True
+        assert await manager.heartbeat("host-a", capacity=2, meetings=["meeting-1"]) == []
+        assert (await manager.get_status(worker_id)).status == WorkerStatusEnum.NOT_FOUND
+        fallback.stop_worker.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dead_host_meetings_are_reassigned(self, manager, fake_redis):
+        await manager.heartbeat("host-a", capacity=1, meetings=[])
+        await manager.start_worker("meeting-1")
+
+        # host-a 하트비트 TTL 만료
+        del fake_redis.strings["worker:host:host-a"]
+        assignments = await manager.heartbeat("host-b", capacity=2, meetings=[])
+
+        assert assignments == [("meeting-1", 2)]
+        assert "host-a" not in fake_redis.sets["worker:hosts"]
+        assert await fake_redis.get("worker:meeting:meeting-1") == "host-b"
+
+    @pytest.mark.asyncio
+    async def test_meeting_reserved_by_other_host_is_not_double_assigned(
+        self, manager, fake_redis, fallback
+    ):
+        """동시 start_worker로 다른 호스트가 먼저 예약하면 추가 배정/fallback 없음"""
+        await manager.heartbeat("host-a", capacity=2, meetings=[])
+        await manager.heartbeat("host-b", capacity=2, meetings=[])
+        fake_redis.hashes["worker:host:host-b:assignments"] = {"meeting-1": "2"}
+        fake_redis.strings["worker:meeting:meeting-1"] = "host-b"
+
+        worker_id = await manager._place("meeting-1", 2)
+
+        assert worker_id == "realtime-worker-meeting-1"
+        assert fake_redis.hashes.get("worker:host:host-a:assignments", {}) == {}
+        fallback.start_worker.assert_not_called()
@@ -0,0 +1,117 @@
+"""Minutes View 배치 조회 결과 조립 단위 테스트"""
+
+from datetime import datetime, timezone
+
+from app.repositories.kg.repository import _assemble_minutes_view
+
+CREATED = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def _decision(decision_id, agenda_id, **overrides):
+    record = {
+        "id": decision_id,
+        "agenda_id": agenda_id,
+        "content": f"{decision_id} 내용",
+        "context": None,
+        "status": "draft",
+        "meeting_id": "meeting-1",
+        "created_at": CREATED,
+        "updated_at": None,
+        "evidence": None,
+        "approvers": ["user-1"],
+        "rejectors": [],
+        "supersedes_id": None,
+        "supersedes_content": None,
+        "supersedes_meeting_id": None,
+    }
+    record.update(overrides)
+    return record
+
+
+def _comment(comment_id, parent_id=None):
+    return {
+        "id": comment_id,
+        "content": f"{comment_id} 댓글",
+        "author_id": "user-2",
+        "author_name": "김철수",
+        "author_email": None,
+        "pending_agent_reply": None,
+        "is_error_response": None,
+        "created_at": CREATED,
+        "parent_id": parent_id,
+    }
+
+
+VIEW = {
+    "meeting_id": "meeting-1",
+    "meeting_title": "스프린트 계획 회의",
+    "summary": None,
+    "agendas": [
+        {"id": "agenda-1", "topic": "예산", "description": None, "evidence": None, "order": 0},
+        {"id": "agenda-2", "topic": "일정", "description": None, "evidence": "[{\"quote\": \"q\"}]", "order": 1},
+    ],
+    "decisions": [
+        _decision("decision-1", "agenda-1"),
+        _decision("decision-2", "agenda-1", supersedes_id="decision-0", supersedes_content="이전"),
+    ],
+    "action_items": [
+        {"id": "ai-1", "content": "정리", "status": None, "assignee_id": "user-1", "due_date": None},
+    ],
+}
+
+
+class TestAssembleMinutesView:
+    """쿼리 레코드 → 중첩 구조 조립 테스트"""
+
+    def test_decisions_grouped_under_agendas(self):
+        """Decision은 agenda_id 기준으로 Agenda에 배치 (Decision 없는 Agenda는 빈 리스트)"""
+        view = _assemble_minutes_view(VIEW, [])
+
+        agendas = view["agendas"]
+        assert [a["id"] for a in agendas] == ["agenda-1", "agenda-2"]
+        assert [d["id"] for d in agendas[0]["decisions"]] == ["decision-1", "decision-2"]
+        assert agendas[1]["decisions"] == []
+        assert agendas[1]["evidence"] == [{"quote": "q"}]
+        assert view["summary"] == ""
+        assert view["action_items"][0]["status"] == "pending"
+
+    def test_children_attached_by_decision_id(self):
+        """Suggestions / 댓글 트리 / 히스토리를 decision_id로 연결"""
+        children = [
+            {
+                "decision_id": "decision-2",
+                "suggestions": [
+                    {
+                        "id": "sug-1",
+                        "content": "예산 증액",
+                        "status": "pending",
+                        "created_at": CREATED,
+                        "author_id": "user-2",
+                        "author_name": "김철수",
+                        "author_email": "kim@example.com",
+                        "cd_id": "decision-3",
+                        "cd_content": None,
+                        "cd_status": None,
+                    }
+                ],
+                "comments": [_comment("c-1"), _comment("c-2", parent_id="c-1")],
+                "history": [
+                    {"id": "decision-0", "content": "이전", "status": None, "created_at": CREATED},
+                ],
+            }
+        ]
+
+        view = _assemble_minutes_view(VIEW, children)
+
+        first, second = view["agendas"][0]["decisions"]
+        assert first["suggestions"] == [] and first["comments"] == [] and first["history"] == []
+
+        assert second["suggestions"][0]["created_decision"] == {
+            "id": "decision-3",
+            "content": "",
+            "status": "draft",
+        }
+        assert [c["id"] for c in second["comments"]] == ["c-1"]
+        assert [r["id"] for r in second["comments"][0]["replies"]] == ["c-2"]
+        assert second["history"][0]["status"] == "superseded"
+        assert second["supersedes"]["id"] == "decision-0"
@@ -0,0 +1,65 @@
+"""Context 런타임 정리 단위 테스트
+
+테스트 케이스:
+- 회의 종료 시 로컬 런타임 제거 + 스냅샷 삭제
+- 정리된 런타임의 L1 완료 이벤트는 스냅샷을 다시 저장하지 않음
+"""
+
+import pytest
+
+from app.services import context_runtime
+from app.services.context_runtime import (
+    discard_runtime,
+    get_or_create_runtime,
+    get_runtime_if_exists,
+)
+
+MEETING_ID = "00000000-0000-0000-0000-000000000001"
+
+
+class FakeSnapshotStore:
+    def __init__(self):
+        self.saved: list[str] = []
+        self.deleted: list[str] = []
+
+    async def load(self, meeting_id):
+        return None
+
+    async def save(self, snapshot, embeddings):
+        self.saved.append(snapshot.meeting_id)
+        return True
+
+    async def delete(self, meeting_id):
+        self.deleted.append(meeting_id)
+
+
+@pytest.fixture
+def store(monkeypatch):
+    fake = FakeSnapshotStore()
+    monkeypatch.setattr(context_runtime, "get_snapshot_store", lambda: fake)
+    yield fake
+    context_runtime._runtime_cache.pop(MEETING_ID, None)
+
+
+class TestDiscardRuntime:
+    """회의 종료 정리"""
+
+    async def test_discard_removes_runtime_and_snapshot(self, store):
+        """런타임 캐시에서 제거하고 스냅샷 삭제"""
+        await get_or_create_runtime(MEETING_ID)
+
+        await discard_runtime(MEETING_ID)
+
+        assert get_runtime_if_exists(MEETING_ID) is None
+        assert store.deleted == [MEETING_ID]
+
+    async def test_discarded_runtime_does_not_save_snapshot(self, store):
+        """정리 이후 늦게 끝난 L1 처리는 스냅샷을 되살리지 않음"""
+        runtime = await get_or_create_runtime(MEETING_ID)
+        context_runtime._schedule_snapshot_save(runtime)
+
+        await discard_runtime(MEETING_ID)
+        context_runtime._schedule_snapshot_save(runtime)
+
+        assert store.saved == [MEETING_ID]
+        assert runtime.snapshot_task.done()
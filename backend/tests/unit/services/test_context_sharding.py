@@ -0,0 +1,300 @@
+"""Context 런타임 샤딩 단위 테스트
+
+테스트 케이스:
+- Consistent hash 링: 결정성, 노드 추가 시 최소 이동
+- 오너 결정: 살아있는 오너, 죽은 오너 인계, 포워딩 요청 로컬 처리
+- 포워딩 요청도 살아있는 오너의 lease는 빼앗지 않고, claim 경쟁에서 지면 오너로 포워딩
+- failover: 하트비트가 살아있는 오너는 인계하지 않음, claim 경쟁에서 지면 새 오너로 포워딩
+- 라우팅: 포워딩된 요청은 재포워딩하지 않음, 인계 불가 시 503
+"""
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.services import context_sharding
+from app.services.context_sharding import (
+    _CLAIM_SCRIPT,
+    _RELEASE_SCRIPT,
+    _RENEW_SCRIPT,
+    ConsistentHashRing,
+    ContextShardRouter,
+)
+
+
+class FakeRedis:
+    """오너십 Lua 스크립트를 Python으로 시뮬레이션하는 Redis Mock"""
+
+    def __init__(self):
+        self.strings: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def mget(self, keys):
+        return [self.strings.get(key) for key in keys]
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(members)
+
+    async def exists(self, key):
+        return int(key in self.strings)
+
+    async def eval(self, script, numkeys, key, *args):
+        current = self.strings.get(key)
+        if script == _CLAIM_SCRIPT:
+            stale_heartbeat_key, me, stale, _ttl = args
+            if (
+                current is None
+                or current == me
+                or (current == stale and stale_heartbeat_key not in self.strings)
+            ):
+                self.strings[key] = me
+                return 1
+            return 0
+        if script == _RENEW_SCRIPT:
+            return 1 if current == args[0] else 0
+        if script == _RELEASE_SCRIPT:
+            if current == args[0]:
+                del self.strings[key]
+                return 1
+            return 0
+        raise AssertionError("unknown script")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+
+    async def _get_redis():
+        return redis
+
+    monkeypatch.setattr(context_sharding, "get_redis", _get_redis)
+    return redis
+
+
+def _register(redis: FakeRedis, replica_id: str, url: str) -> None:
+    redis.strings[f"context:replica:{replica_id}"] = url
+    redis.sets.setdefault("context:replicas", set()).add(replica_id)
+
+
+def _expire_heartbeat(redis: FakeRedis, replica_id: str) -> None:
+    del redis.strings[f"context:replica:{replica_id}"]
+
+
+def _request(forwarded: bool = False) -> Request:
+    headers = [(b"x-mit-context-forwarded", b"other")] if forwarded else []
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": headers})
+
+
+class TestConsistentHashRing:
+    def test_deterministic(self):
+        ring_a = ConsistentHashRing(["a", "b", "c"])
+        ring_b = ConsistentHashRing(["c", "a", "b"])
+
+        for i in range(50):
+            assert ring_a.get(f"meeting-{i}") == ring_b.get(f"meeting-{i}")
+
+    def test_empty_ring(self):
+        assert ConsistentHashRing().get("meeting-1") is None
+
+    def test_adding_node_moves_only_its_share(self):
+        keys = [f"meeting-{i}" for i in range(1000)]
+        before = ConsistentHashRing(["a", "b", "c"])
+        after = ConsistentHashRing(["a", "b", "c", "d"])
+
+        moved = [key for key in keys if before.get(key) != after.get(key)]
+
+        # 이동한 키는 모두 새 노드로만 이동
+        assert all(after.get(key) == "d" for key in moved)
+        assert len(moved) < len(keys) / 2
+
+
+class TestResolveOwner:
+    @pytest.mark.asyncio
+    async def test_live_remote_owner_is_kept(self, fake_redis):
+        _register(fake_redis, "other", "http://other:8000")
+        fake_redis.strings["context:owner:m1"] = "other"
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+
+        assert await router.resolve_owner("m1") == "other"
+        assert not router.owns("m1")
+
+    @pytest.mark.asyncio
+    async def test_dead_owner_is_taken_over(self, fake_redis):
+        fake_redis.strings["context:owner:m1"] = "dead"
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+
+        assert await router.resolve_owner("m1") == "me"
+        assert router.owns("m1")
+        assert fake_redis.strings["context:owner:m1"] == "me"
+
+    @pytest.mark.asyncio
+    async def test_forwarded_request_is_served_locally(self, fake_redis):
+        _register(fake_redis, "other", "http://other:8000")
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+
+        assert await router.resolve_owner("m1", forwarded=True) == "me"
+        assert router.owns("m1")
+
+    @pytest.mark.asyncio
+    async def test_forwarded_request_keeps_live_owner(self, fake_redis):
+        _register(fake_redis, "other", "http://other:8000")
+        fake_redis.strings["context:owner:m1"] = "other"
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+
+        assert await router.resolve_owner("m1", forwarded=True) == "other"
+        assert not router.owns("m1")
+        assert fake_redis.strings["context:owner:m1"] == "other"
+
+    @pytest.mark.asyncio
+    async def test_lost_claim_forwards_to_winner(self, fake_redis, monkeypatch):
+        _register(fake_redis, "other", "http://other:8000")
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+        claim = fake_redis.eval
+
+        async def _racing_eval(script, numkeys, key, *args):
+            # 조회와 claim 사이에 다른 레플리카가 먼저 claim
+            fake_redis.strings.setdefault(key, "other")
+            return await claim(script, numkeys, key, *args)
+
+        monkeypatch.setattr(fake_redis, "eval", _racing_eval)
+
+        assert await router.resolve_owner("m1", forwarded=True) == "other"
+        assert not router.owns("m1")
+
+    @pytest.mark.asyncio
+    async def test_owner_registered_after_refresh_is_kept(self, fake_redis):
+        """레플리카 목록 갱신 전 등록된 오너도 URL을 다시 읽어 포워딩 대상으로 반환"""
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+        await router.resolve_owner("m0")
+        _register(fake_redis, "new", "http://new:8000")
+        fake_redis.strings["context:owner:m1"] = "new"
+
+        assert await router.resolve_owner("m1") == "new"
+        assert router._replica_urls["new"] == "http://new:8000"
+
+    @pytest.mark.asyncio
+    async def test_lost_claim_to_dead_owner_is_taken_over(self, fake_redis, monkeypatch):
+        """claim 경쟁에서 이긴 오너의 하트비트가 없으면 반환하지 않고 claim (forward KeyError 방지)"""
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+        claim = fake_redis.eval
+        raced = False
+
+        async def _racing_eval(script, numkeys, key, *args):
+            nonlocal raced
+            if not raced:
+                # 하트비트 키가 없는 레플리카가 먼저 claim
+                fake_redis.strings[key] = "ghost"
+                raced = True
+            return await claim(script, numkeys, key, *args)
+
+        monkeypatch.setattr(fake_redis, "eval", _racing_eval)
+
+        assert await router.resolve_owner("m1", forwarded=True) == "me"
+        assert router.owns("m1")
+        assert fake_redis.strings["context:owner:m1"] == "me"
+
+
+class TestFailover:
+    @pytest.mark.asyncio
+    async def test_failover_claims_after_heartbeat_expired(self, fake_redis):
+        _register(fake_redis, "other", "http://other:8000")
+        fake_redis.strings["context:owner:m1"] = "other"
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+        await router.resolve_owner("m1")
+        _expire_heartbeat(fake_redis, "other")
+
+        assert await router.failover("m1", "other") == "me"
+
+        assert router.owns("m1")
+        assert fake_redis.strings["context:owner:m1"] == "me"
+
+    @pytest.mark.asyncio
+    async def test_failover_keeps_lease_while_heartbeat_alive(self, fake_redis):
+        """일시적 연결 실패로 살아있는 오너의 lease를 빼앗지 않음 (split-brain 방지)"""
+        _register(fake_redis, "other", "http://other:8000")
+        fake_redis.strings["context:owner:m1"] = "other"
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+        await router.resolve_owner("m1")
+
+        assert await router.failover("m1", "other") is None
+
+        assert not router.owns("m1")
+        assert fake_redis.strings["context:owner:m1"] == "other"
+
+    @pytest.mark.asyncio
+    async def test_failover_lost_claim_returns_new_owner(self, fake_redis):
+        _register(fake_redis, "other", "http://other:8000")
+        _register(fake_redis, "third", "http://third:8000")
+        _expire_heartbeat(fake_redis, "other")
+        # 다른 레플리카가 먼저 인계
+        fake_redis.strings["context:owner:m1"] = "third"
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+
+        assert await router.failover("m1", "other") == "third"
+        assert not router.owns("m1")
+
+
+class TestRouteContextRequest:
+    @pytest.fixture
+    def router(self, fake_redis, monkeypatch):
+        router = ContextShardRouter("me", "http://me:8000", lease_seconds=30)
+        monkeypatch.setattr(context_sharding, "get_context_shard_router", lambda: router)
+        return router
+
+    @pytest.mark.asyncio
+    async def test_forwarded_request_is_never_reforwarded(self, fake_redis, router, monkeypatch):
+        _register(fake_redis, "other", "http://other:8000")
+        fake_redis.strings["context:owner:m1"] = "other"
+
+        async def _forward(request, owner):
+            raise AssertionError("re-forwarded")
+
+        monkeypatch.setattr(router, "forward", _forward)
+
+        assert await context_sharding.route_context_request(_request(forwarded=True), "m1") is None
+
+    @pytest.mark.asyncio
+    async def test_unreachable_live_owner_returns_503(self, fake_redis, router, monkeypatch):
+        _register(fake_redis, "other", "http://other:8000")
+        fake_redis.strings["context:owner:m1"] = "other"
+
+        async def _forward(request, owner):
+            raise httpx.ConnectError("refused")
+
+        monkeypatch.setattr(router, "forward", _forward)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await context_sharding.route_context_request(_request(), "m1")
+
+        assert exc_info.value.status_code == 503
+        assert fake_redis.strings["context:owner:m1"] == "other"
+        assert not router.owns("m1")
+
+    @pytest.mark.asyncio
+    async def test_lost_failover_forwards_to_new_owner(self, fake_redis, router, monkeypatch):
+        _register(fake_redis, "other", "http://other:8000")
+        _register(fake_redis, "third", "http://third:8000")
+        fake_redis.strings["context:owner:m1"] = "other"
+        forwarded_to = []
+
+        async def _forward(request, owner):
+            forwarded_to.append(owner)
+            if owner == "other":
+                # 오너가 죽고 다른 레플리카가 먼저 인계
+                _expire_heartbeat(fake_redis, "other")
+                fake_redis.strings["context:owner:m1"] = "third"
+                raise httpx.ConnectError("refused")
+            return "proxied"
+
+        monkeypatch.setattr(router, "forward", _forward)
+
+        assert await context_sharding.route_context_request(_request(), "m1") == "proxied"
+        assert forwarded_to == ["other", "third"]
+        assert not router.owns("m1")
@@ -0,0 +1,103 @@
+"""TopicFeedPublisher 단위 테스트
+
+테스트 케이스:
+- 발행 요청 burst는 debounce로 1회 발행
+- 두 번째 발행부터는 바뀐 토픽만 델타로 발행 (seq 증가)
+- 변경이 없으면 seq를 소모하지 않음
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from app.infrastructure.context import TopicSegment
+from app.services import topic_feed
+from app.services.topic_feed import TopicFeedPublisher
+
+
+@dataclass
+class FakeManager:
+    l1_segments: list = field(default_factory=list)
+    _pending_l1_chunks: list = field(default_factory=list)
+    is_l1_running: bool = False
+    current_topic: str = "Intro"
+
+
+@dataclass
+class FakeRuntime:
+    manager: FakeManager = field(default_factory=FakeManager)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    topic_feed: object = None
+
+
+def _segment(seg_id: str, start: int, summary: str = "요약") -> TopicSegment:
+    return TopicSegment(
+        id=seg_id,
+        name=f"{seg_id} 토픽",
+        summary=summary,
+        start_utterance_id=start,
+        end_utterance_id=start + 24,
+        keywords=["키워드"],
+    )
+
+
+@pytest.fixture
+def published(monkeypatch):
+    messages: list[dict] = []
+
+    async def _publish(meeting_id, data):
+        messages.append(data)
+
+    monkeypatch.setattr(topic_feed, "publish_topic_update", _publish)
+    return messages
+
+
+class TestTopicFeedPublisher:
+    """디바운스 / 델타 발행 테스트"""
+
+    async def test_burst_coalesced_into_one_publish(self, published):
+        """debounce 구간의 요청은 한 번만 발행"""
+        runtime = FakeRuntime()
+        runtime.manager.l1_segments = [_segment("t1", 1)]
+        feed = TopicFeedPublisher("meeting-1", runtime, debounce_seconds=0.01)
+
+        for _ in range(5):
+            feed.request_publish()
+        await feed._task
+
+        assert len(published) == 1
+        assert published[0]["seq"] == 1
+        assert [t["id"] for t in published[0]["changedTopics"]] == ["t1"]
+
+    async def test_delta_contains_only_changed_topics(self, published):
+        """이미 발행된 토픽은 다시 보내지 않고, 수정/삭제만 포함"""
+        runtime = FakeRuntime()
+        runtime.manager.l1_segments = [_segment("t1", 1), _segment("t2", 26)]
+        feed = TopicFeedPublisher("meeting-1", runtime)
+        await feed.flush()
+
+        runtime.manager.l1_segments = [_segment("t2", 26, summary="수정된 요약"), _segment("t3", 51)]
+        delta = await feed.flush()
+
+        assert delta["seq"] == 2
+        assert [t["id"] for t in delta["changedTopics"]] == ["t3", "t2"]
+        assert delta["removedTopicIds"] == ["t1"]
+        assert delta["epoch"] == published[0]["epoch"]
+
+    async def test_unchanged_state_not_published(self, published):
+        """토픽/상태 변경이 없으면 발행하지 않고 seq 유지"""
+        runtime = FakeRuntime()
+        runtime.manager.l1_segments = [_segment("t1", 1)]
+        feed = TopicFeedPublisher("meeting-1", runtime)
+        await feed.flush()
+
+        assert await feed.flush() is None
+        runtime.manager.is_l1_running = True
+        delta = await feed.flush()
+
+        assert delta["seq"] == 2
+        assert delta["changedTopics"] == [] and delta["isL1Running"] is True
+        async with runtime.lock:
+            assert feed.snapshot()["seq"] == 2
+        assert len(published) == 2
@@ -0,0 +1,160 @@
+"""Transcript 배치 수집 단위 테스트
+
+테스트 케이스:
+- 다건 저장 후 요청 순서대로 결과 반환
+- 같은 멱등성 키 재전송은 기존 segment 반환 (중복 저장 없음)
+- path/body meetingId 불일치 거부
+- 런타임이 없어도 생성 후 DB 기준으로 반영 (재전송은 중복 반영 없음)
+- 늦게 확정된 긴 발화(start_ms가 이미 반영된 발화보다 앞)도 런타임에 반영
+- 커밋 실패 시 런타임은 갱신하지 않음
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.meeting import Meeting
+from app.models.transcript import Transcript
+from app.models.user import User
+from app.schemas.transcript import CreateTranscriptBatchRequest
+from app.services import context_runtime
+from app.services.context_runtime import get_runtime_if_exists
+from app.services.transcript_service import TranscriptService
+
+
+def _batch(
+    meeting: Meeting, user: User, keys: list[str], starts: list[int] | None = None
+) -> CreateTranscriptBatchRequest:
+    starts = starts or [index * 1000 for index in range(len(keys))]
+    return CreateTranscriptBatchRequest(
+        meeting_id=meeting.id,
+        segments=[
+            {
+                "idempotencyKey": key,
+                "userId": str(user.id),
+                "startMs": start,
+                "endMs": start + 800,
+                "text": f"발화 {key}",
+                "confidence": 0.9,
+                "minConfidence": 0.8,
+            }
+            for key, start in zip(keys, starts)
+        ],
+    )
+
+
+async def _count(db_session, meeting: Meeting) -> int:
+    result = await db_session.execute(
+        select(func.count()).select_from(Transcript).where(Transcript.meeting_id == meeting.id)
+    )
+    return result.scalar_one()
+
+
+async def test_batch_inserts_in_request_order(db_session, test_meeting: Meeting, test_user: User):
+    """다건 INSERT 후 요청 순서대로 ID 반환"""
+    service = TranscriptService(db_session)
+
+    result = await service.create_transcripts_batch(
+        test_meeting.id, _batch(test_meeting, test_user, ["k1", "k2", "k3"])
+    )
+
+    assert [item.idempotency_key for item in result.items] == ["k1", "k2", "k3"]
+    assert not any(item.duplicate for item in result.items)
+    assert await _count(db_session, test_meeting) == 3
+
+
+async def test_batch_retry_is_idempotent(db_session, test_meeting: Meeting, test_user: User):
+    """재전송된 키는 기존 segment를 반환하고 새 키만 저장"""
+    service = TranscriptService(db_session)
+    first = await service.create_transcripts_batch(
+        test_meeting.id, _batch(test_meeting, test_user, ["k1", "k2"])
+    )
+
+    retried = await service.create_transcripts_batch(
+        test_meeting.id, _batch(test_meeting, test_user, ["k1", "k2", "k3"])
+    )
+
+    assert [item.id for item in retried.items[:2]] == [item.id for item in first.items]
+    assert [item.duplicate for item in retried.items] == [True, True, False]
+    assert await _count(db_session, test_meeting) == 3
+
+
+async def test_batch_meeting_id_mismatch(db_session, test_meeting: Meeting, test_user: User):
+    """path meeting_id와 body meetingId가 다르면 거부"""
+    service = TranscriptService(db_session)
+
+    with pytest.raises(ValueError, match="MEETING_ID_MISMATCH"):
+        await service.create_transcripts_batch(uuid4(), _batch(test_meeting, test_user, ["k1"]))
+
+
+async def test_batch_catches_up_context_runtime(
+    db_session, test_meeting: Meeting, test_user: User, monkeypatch
+):
+    """활성 런타임이 없어도 만들고, 저장된 발화를 DB에서 읽어 반영"""
+    monkeypatch.setattr(context_runtime, "get_snapshot_store", lambda: None)
+    meeting_id = str(test_meeting.id)
+    service = TranscriptService(db_session)
+
+    try:
+        await service.create_transcripts_batch(
+            test_meeting.id, _batch(test_meeting, test_user, ["k1", "k2"])
+        )
+        runtime = get_runtime_if_exists(meeting_id)
+        assert runtime is not None
+        assert runtime.last_utterance_id == 2
+
+        await service.create_transcripts_batch(
+            test_meeting.id, _batch(test_meeting, test_user, ["k1", "k2", "k3"])
+        )
+        assert runtime.last_utterance_id == 3
+        assert runtime.last_processed_start_ms == 2000
+    finally:
+        context_runtime._runtime_cache.pop(meeting_id, None)
+
+
+async def test_batch_appends_late_long_utterance(
+    db_session, test_meeting: Meeting, test_user: User, monkeypatch
+):
+    """워터마크보다 먼저 시작한 발화도 새로 저장됐으면 start_ms 순으로 반영"""
+    monkeypatch.setattr(context_runtime, "get_snapshot_store", lambda: None)
+    meeting_id = str(test_meeting.id)
+    service = TranscriptService(db_session)
+
+    try:
+        await service.create_transcripts_batch(
+            test_meeting.id, _batch(test_meeting, test_user, ["k1", "k2"], [0, 5000])
+        )
+        runtime = get_runtime_if_exists(meeting_id)
+
+        # 긴 발화는 다른 화자의 5000ms 발화보다 늦게 확정됨
+        await service.create_transcripts_batch(
+            test_meeting.id,
+            _batch(test_meeting, test_user, ["k4", "k3"], [6000, 1000]),
+        )
+
+        assert runtime.last_utterance_id == 4
+        assert runtime.last_processed_start_ms == 6000
+    finally:
+        context_runtime._runtime_cache.pop(meeting_id, None)
+
+
+async def test_batch_commit_failure_leaves_runtime(
+    db_session, test_meeting: Meeting, test_user: User, monkeypatch
+):
+    """커밋이 실패하면 런타임을 갱신하지 않음 (롤백된 발화가 런타임에 남지 않음)"""
+    monkeypatch.setattr(context_runtime, "get_snapshot_store", lambda: None)
+    meeting_id = str(test_meeting.id)
+    service = TranscriptService(db_session)
+
+    async def _failing_commit():
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(db_session, "commit", _failing_commit)
+
+    with pytest.raises(RuntimeError):
+        await service.create_transcripts_batch(
+            test_meeting.id, _batch(test_meeting, test_user, ["k1"])
+        )
+
+    assert get_runtime_if_exists(meeting_id) is None
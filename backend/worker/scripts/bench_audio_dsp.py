@@ -0,0 +1,110 @@
+"""오디오 DSP 마이크로벤치마크 (단일 코어 frames/sec).
+
+기존 순수 Python 구현과 NumPy 벡터화 구현(src.utils.audio_dsp)을 비교합니다.
+
+사용법 (worker 디렉토리에서):
+    uv run python -m scripts.bench_audio_dsp
+    uv run python -m scripts.bench_audio_dsp --frame-ms 100 --seconds 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import array
+import math
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from src.utils.audio_dsp import (
+    apply_gain_int16,
+    resample_int16,
+    rms_int16,
+    stereo_to_mono_int16,
+)
+
+SAMPLE_RATE = 16000
+
+
+# ── 기존 구현 (비교 기준) ─────────────────────────────────────
+
+
+def _legacy_rms(pcm_data: bytes) -> float:
+    samples = array.array("h", pcm_data)
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+def _legacy_stereo_to_mono(pcm_data: bytes) -> bytes:
+    samples = array.array("h")
+    samples.frombytes(pcm_data)
+    mono = array.array("h")
+    for i in range(0, len(samples), 2):
+        mono.append((samples[i] + samples[i + 1]) // 2)
+    return mono.tobytes()
+
+
+def _legacy_gain(pcm_data: bytes, gain: float) -> bytes:
+    samples = array.array("h")
+    samples.frombytes(pcm_data)
+    scaled_samples = array.array("h")
+    for sample in samples:
+        scaled = int(sample * gain)
+        if scaled > 32767:
+            scaled = 32767
+        elif scaled < -32768:
+            scaled = -32768
+        scaled_samples.append(scaled)
+    return scaled_samples.tobytes()
+
+
+# ── 측정 ──────────────────────────────────────────────────────
+
+
+def _frames_per_sec(fn: Callable[[], object], seconds: float) -> float:
+    """seconds 동안 fn을 반복 실행한 처리량 (frames/sec)"""
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frame-ms", type=int, default=20, help="프레임 길이 (ms)")
+    parser.add_argument("--seconds", type=float, default=1.0, help="케이스별 측정 시간")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    samples = SAMPLE_RATE * args.frame_ms // 1000
+    mono = rng.integers(-20000, 20000, size=samples, dtype=np.int16).tobytes()
+    stereo = rng.integers(-20000, 20000, size=samples * 2, dtype=np.int16).tobytes()
+    view = memoryview(mono)
+
+    cases: list[tuple[str, Callable[[], object], Callable[[], object] | None]] = [
+        ("rms", lambda: rms_int16(view), lambda: _legacy_rms(mono)),
+        (
+            "stereo_to_mono",
+            lambda: stereo_to_mono_int16(stereo),
+            lambda: _legacy_stereo_to_mono(stereo),
+        ),
+        ("gain(0.7)", lambda: apply_gain_int16(view, 0.7), lambda: _legacy_gain(mono, 0.7)),
+        ("resample 16k->24k", lambda: resample_int16(view, 16000, 24000), None),
+    ]
+
+    print(f"frame={args.frame_ms}ms ({samples} samples @ {SAMPLE_RATE}Hz), single core")
+    print(f"{'case':<20}{'numpy fps':>14}{'python fps':>14}{'speedup':>10}")
+    for name, vectorized, legacy in cases:
+        fast = _frames_per_sec(vectorized, args.seconds)
+        if legacy is None:
+            print(f"{name:<20}{fast:>14,.0f}{'-':>14}{'-':>10}")
+            continue
+        slow = _frames_per_sec(legacy, args.seconds)
+        print(f"{name:<20}{fast:>14,.0f}{slow:>14,.0f}{fast / slow:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
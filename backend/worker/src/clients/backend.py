@@ -38,6 +38,29 @@ class TranscriptSegmentResponse:
     created_at: datetime
 
 
+def _segment_payload(segment: TranscriptSegmentRequest) -> dict:
+    """세그먼트 → 요청 payload (meetingId 제외, camelCase)"""
+    payload = {
+        "userId": segment.user_id.replace("user-", ""),
+        "startMs": segment.start_ms,
+        "endMs": segment.end_ms,
+        "text": segment.text,
+        "confidence": segment.confidence,
+        "minConfidence": segment.min_confidence,
+    }
+
+    if segment.agent_call:
+        payload["agentCall"] = segment.agent_call
+
+    if segment.agent_call_keyword is not None:
+        payload["agentCallKeyword"] = segment.agent_call_keyword
+
+    if segment.agent_call_confidence is not None:
+        payload["agentCallConfidence"] = segment.agent_call_confidence
+
+    return payload
+
+
 class BackendAPIClient:
     """Backend API 클라이언트
 
@@ -93,26 +116,7 @@ class BackendAPIClient:
         try:
             # meeting_id에서 "meeting-" 접두사 제거 (순수 UUID만 사용)
             pure_meeting_id = segment.meeting_id.replace("meeting-", "")
-            pure_user_id = segment.user_id.replace("user-", "")
-
-            payload = {
-                "meetingId": pure_meeting_id,
-                "userId": pure_user_id,
-                "startMs": segment.start_ms,
-                "endMs": segment.end_ms,
-                "text": segment.text,
-                "confidence": segment.confidence,
-                "minConfidence": segment.min_confidence,
-            }
-
-            if segment.agent_call:
-                payload["agentCall"] = segment.agent_call
-
-            if segment.agent_call_keyword is not None:
-                payload["agentCallKeyword"] = segment.agent_call_keyword
-
-            if segment.agent_call_confidence is not None:
-                payload["agentCallConfidence"] = segment.agent_call_confidence
+            payload = {"meetingId": pure_meeting_id, **_segment_payload(segment)}
 
             response = await self._client.post(
                 f"/api/v1/meetings/{pure_meeting_id}/transcripts",
@@ -136,6 +140,65 @@ class BackendAPIClient:
             logger.exception(f"트랜스크립트 전송 오류: {e}")
             return None
 
+    async def send_transcript_batch(
+        self,
+        meeting_id: str,
+        segments: list[tuple[str, TranscriptSegmentRequest]],
+    ) -> dict[str, TranscriptSegmentResponse] | None:
+        """트랜스크립트 세그먼트 배치 전송 (저장 + Context 런타임 반영을 한 요청으로)
+
+        전송 오류 시 같은 멱등성 키로 1회 재시도합니다 (이미 저장된 세그먼트는 중복 저장되지 않음).
+
+        Args:
+            meeting_id: 회의 ID
+            segments: (멱등성 키, 세그먼트) 목록 (발화 순서)
+
+        Returns:
+            멱등성 키 → 저장된 세그먼트 정보, 또는 None (실패 시)
+        """
+        if self._client is None:
+            await self.connect()
+
+        if self._client is None:
+            raise RuntimeError("HTTP 클라이언트가 초기화되지 않음")
+
+        pure_meeting_id = meeting_id.replace("meeting-", "")
+        payload = {
+            "meetingId": pure_meeting_id,
+            "segments": [
+                {"idempotencyKey": key, **_segment_payload(segment)} for key, segment in segments
+            ],
+        }
+
+        for attempt in range(2):
+            try:
+                response = await self._client.post(
+                    f"/api/v1/meetings/{pure_meeting_id}/transcripts/batch",
+                    json=payload,
+                )
+            except httpx.TransportError as e:
+                if attempt == 0:
+                    logger.warning(f"트랜스크립트 배치 전송 재시도: {e}")
+                    continue
+                logger.exception(f"HTTP 오류: {e}")
+                return None
+            except Exception as e:
+                logger.exception(f"트랜스크립트 배치 전송 오류: {e}")
+                return None
+
+            if response.status_code != 201:
+                logger.error(f"트랜스크립트 배치 전송 실패: {response.status_code} - {response.text}")
+                return None
+
+            return {
+                item["idempotencyKey"]: TranscriptSegmentResponse(
+                    id=item["id"],
+                    created_at=datetime.fromisoformat(item["createdAt"].replace("Z", "+00:00")),
+                )
+                for item in response.json()["items"]
+            }
+        return None
+
     async def notify_meeting_joined(self, meeting_id: str, worker_id: str) -> bool:
         """회의 참여 알림
 
@@ -315,6 +378,40 @@ class BackendAPIClient:
                     logger.error(f"[SSE] error: {data}")
                     yield {"type": "error", "content": data}
 
+    async def send_worker_heartbeat(
+        self,
+        host_id: str,
+        capacity: int,
+        meetings: list[str],
+    ) -> list[dict] | None:
+        """멀티 회의 워커 하트비트 전송 + 배정 회의 조회
+
+        Args:
+            host_id: 워커 호스트 ID
+            capacity: 최대 동시 회의 수
+            meetings: 현재 실행 중인 회의 ID 목록
+
+        Returns:
+            배정된 회의 목록 [{"meetingId", "clovaKeyIndex"}] (실패 시 None)
+        """
+        if self._client is None:
+            await self.connect()
+
+        if self._client is None:
+            return None
+
+        try:
+            response = await self._client.post(
+                f"/api/v1/workers/hosts/{host_id}/heartbeat",
+                json={"capacity": capacity, "meetings": meetings},
+                timeout=5.0,
+            )
+            response.raise_for_status()
+            return response.json().get("assignments", [])
+        except Exception as e:
+            logger.warning(f"워커 하트비트 실패: {e}")
+            return None
+
     async def complete_meeting(self, meeting_id: str) -> bool:
         """회의 완료 요청 (모든 참여자 퇴장 시)
 
@@ -0,0 +1,47 @@
+"""회의 간 공유 클라이언트 묶음
+
+멀티 회의 모드에서 한 프로세스의 모든 RealtimeWorker가
+Backend HTTP 연결 풀, TTS HTTP 연결 풀, Clova gRPC 채널을 함께 사용합니다.
+단일 회의 모드에서는 RealtimeWorker가 자체 인스턴스를 만들어 소유합니다.
+"""
+
+import logging
+
+import grpc
+
+from src.clients.backend import BackendAPIClient
+from src.clients.tts import TTSClient
+from src.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class SharedClients:
+    """Backend / TTS / STT 공유 연결"""
+
+    def __init__(self) -> None:
+        self.config = get_config()
+        self.api_client = BackendAPIClient()
+        self.tts_client: TTSClient | None = TTSClient() if self.config.tts_server_url else None
+        self.stt_channel: grpc.aio.Channel | None = None
+
+    async def connect(self) -> None:
+        """모든 연결 초기화 (gRPC TLS 핸드셰이크는 채널 최초 사용 시)"""
+        await self.api_client.connect()
+        if self.tts_client:
+            await self.tts_client.connect()
+        if self.stt_channel is None:
+            self.stt_channel = grpc.aio.secure_channel(
+                self.config.clova_stt_endpoint,
+                grpc.ssl_channel_credentials(),
+            )
+            logger.info(f"공유 Clova Speech gRPC 채널 생성: {self.config.clova_stt_endpoint}")
+
+    async def close(self) -> None:
+        """모든 연결 종료"""
+        if self.stt_channel is not None:
+            await self.stt_channel.close()
+            self.stt_channel = None
+        if self.tts_client:
+            await self.tts_client.disconnect()
+        await self.api_client.disconnect()
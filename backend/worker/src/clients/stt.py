@@ -1,10 +1,8 @@
 """Clova Speech gRPC STT 클라이언트"""
 
-import array
 import asyncio
 import json
 import logging
-import math
 import time
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
@@ -16,7 +14,14 @@ import nest_pb2
 import nest_pb2_grpc
 
 from src.config import get_config
-from src.telemetry import get_livekit_connect_time
+from src.telemetry import (
+    RealtimeWorkerMetrics,
+    get_livekit_connect_time,
+    get_realtime_metrics,
+)
+from src.utils.audio_buffer import AudioRingBuffer
+from src.utils.audio_dsp import rms_int16
+from src.utils.vad import create_speech_segmenter
 
 logger = logging.getLogger(__name__)
 
@@ -31,24 +36,11 @@ def is_silence(pcm_data: bytes, threshold: float) -> bool:
     Returns:
         True if silence (RMS < threshold)
     """
-    if not pcm_data:
+    if not pcm_data or len(pcm_data) % 2 != 0:
+        # 빈 데이터 또는 데이터 크기가 홀수인 경우 (비정상)
         return True
 
-    # bytes -> int16 배열로 변환
-    try:
-        samples = array.array("h", pcm_data)  # 'h' = signed short (16-bit)
-    except ValueError:
-        # 데이터 크기가 홀수인 경우 (비정상)
-        return True
-
-    if not samples:
-        return True
-
-    # RMS (Root Mean Square) 계산
-    sum_squares = sum(s * s for s in samples)
-    rms = math.sqrt(sum_squares / len(samples))
-
-    return rms < threshold
+    return rms_int16(pcm_data) < threshold
 
 
 @dataclass
@@ -75,19 +67,41 @@ class ClovaSpeechSTTClient:
         self,
         language: str = "ko",
         on_result: Callable[[STTSegment], None] | None = None,
+        on_vad_event: Callable[[str], None] | None = None,
+        user_id: str = "",
+        channel: grpc.aio.Channel | None = None,
+        secret: str | None = None,
+        livekit_connect_time: float | None = None,
+        metrics: RealtimeWorkerMetrics | None = None,
     ):
         """
         Args:
             language: STT 언어 코드 (ko, en, ja, zh)
             on_result: STT 결과 수신 시 호출되는 콜백
+            on_vad_event: 서버측 VAD 이벤트 콜백 ("speech_start" / "speech_end")
+            user_id: 메트릭 라벨용 참가자 ID
+            channel: 공유 gRPC 채널 (None이면 자체 생성/종료)
+            secret: Clova STT 시크릿 (None이면 CLOVA_STT_SECRET)
+            livekit_connect_time: 회의 LiveKit 연결 시각 (None이면 프로세스 전역값)
+            metrics: 회의별 메트릭 (None이면 프로세스 전역값)
         """
         self.config = get_config()
         self.language = language
         self.on_result = on_result
-
-        self._channel: grpc.aio.Channel | None = None
-        self._stub: nest_pb2_grpc.NestServiceStub | None = None
-        self._audio_queue: asyncio.Queue[tuple[bytes, bool] | None] = asyncio.Queue()
+        self.user_id = user_id
+        self._secret = secret if secret is not None else self.config.clova_stt_secret
+        self._livekit_connect_time = livekit_connect_time
+        self._metrics = metrics or get_realtime_metrics()
+
+        # 서버측 VAD (None이면 RMS 임계값 필터 + 클라이언트 VAD epFlag)
+        self._segmenter = create_speech_segmenter(self.config, on_event=on_vad_event)
+
+        self._channel: grpc.aio.Channel | None = channel
+        self._owns_channel = channel is None
+        self._stub: nest_pb2_grpc.NestServiceStub | None = (
+            nest_pb2_grpc.NestServiceStub(channel) if channel is not None else None
+        )
+        self._audio_buffer = self._create_audio_buffer()
         self._is_running = False
         self._seq_id = 0
 
@@ -116,8 +130,11 @@ class ClovaSpeechSTTClient:
         logger.info(f"Clova Speech gRPC 연결: {self.config.clova_stt_endpoint}")
 
     async def disconnect(self) -> None:
-        """gRPC 채널 종료"""
+        """gRPC 채널 종료 (공유 채널은 소유자가 종료)"""
         self._is_running = False
+        if not self._owns_channel:
+            self._stub = None
+            return
         if self._channel is not None:
             await self._channel.close()
             self._channel = None
@@ -151,34 +168,38 @@ class ClovaSpeechSTTClient:
         )
         logger.debug(f"STT CONFIG 전송: {config_json}")
 
-        # 2. 오디오 데이터 요청 반복
-        while self._is_running:
-            try:
-                # 큐에서 오디오 청크 대기 (타임아웃 100ms)
-                item = await asyncio.wait_for(
-                    self._audio_queue.get(),
-                    timeout=0.1,
-                )
-
-                if item is None:
-                    # 종료 신호
-                    logger.debug("STT 스트림 종료 신호 수신")
-                    break
-
-                chunk, is_end_of_speech = item
-                extra = json.dumps({"seqId": self._seq_id, "epFlag": is_end_of_speech})
-                if is_end_of_speech:
-                    logger.info(f"발화 종료 신호 전송: seqId={self._seq_id}")
-
-                yield nest_pb2.NestRequest(
-                    type=nest_pb2.RequestType.DATA,
-                    data=nest_pb2.NestData(chunk=chunk, extra_contents=extra),
-                )
-                self._seq_id += 1
-
-            except asyncio.TimeoutError:
-                # 큐가 비어있으면 계속 대기
-                continue
+        # 2. 오디오 데이터 요청 반복 (버퍼가 청크 병합 후 반환, 종료 시 None)
+        audio_buffer = self._audio_buffer
+        metrics = self._metrics
+        while True:
+            item = await audio_buffer.get()
+            if item is None:
+                # 종료 신호
+                logger.debug("STT 스트림 종료 신호 수신")
+                break
+
+            if metrics:
+                metrics.record_stt_queue_depth(audio_buffer.depth_ms, self.user_id)
+
+            chunk, is_end_of_speech = item
+            extra = json.dumps({"seqId": self._seq_id, "epFlag": is_end_of_speech})
+            if is_end_of_speech:
+                logger.info(f"발화 종료 신호 전송: seqId={self._seq_id}")
+
+            yield nest_pb2.NestRequest(
+                type=nest_pb2.RequestType.DATA,
+                data=nest_pb2.NestData(chunk=chunk, extra_contents=extra),
+            )
+            self._seq_id += 1
+
+    def _create_audio_buffer(self) -> AudioRingBuffer:
+        """참가자 오디오 버퍼 생성 (스트림마다 새로 생성)"""
+        return AudioRingBuffer(
+            sample_rate=self.config.audio_sample_rate,
+            chunk_ms=self.config.stt_chunk_ms,
+            capacity_ms=self.config.stt_buffer_capacity_ms,
+            policy=self.config.stt_overflow_policy,
+        )
 
     def _reset_buffer(self) -> None:
         """텍스트 누적 버퍼 초기화"""
@@ -296,9 +317,16 @@ class ClovaSpeechSTTClient:
         self._is_running = True
         self._seq_id = 0
         self._reset_buffer()
+        self._audio_buffer = self._create_audio_buffer()
+        if self._segmenter:
+            self._segmenter.reset()
 
         # 세션 오프셋 계산 (LiveKit 연결 시점 기준)
-        livekit_connect = get_livekit_connect_time()
+        livekit_connect = (
+            self._livekit_connect_time
+            if self._livekit_connect_time is not None
+            else get_livekit_connect_time()
+        )
         if livekit_connect > 0:
             self._session_offset_ms = int((time.time() - livekit_connect) * 1000)
         else:
@@ -306,7 +334,7 @@ class ClovaSpeechSTTClient:
             logger.warning("LiveKit 연결 시간이 설정되지 않음, 오프셋=0")
 
         # 인증 메타데이터
-        metadata = (("authorization", f"Bearer {self.config.clova_stt_secret}"),)
+        metadata = (("authorization", f"Bearer {self._secret}"),)
 
         # 양방향 스트리밍 RPC 호출
         responses = self._stub.recognize(
@@ -323,13 +351,20 @@ class ClovaSpeechSTTClient:
         if not self._is_running:
             return
 
-        # 종료 신호 전송
-        await self._audio_queue.put(None)
+        # 종료 신호 전송 (남은 오디오 전송 후 요청 생성기 종료)
+        self._audio_buffer.close()
         self._is_running = False
         logger.debug("STT 스트리밍 종료")
 
-    async def send_audio(self, audio_data: bytes) -> None:
-        """오디오 데이터 전송 (무음 필터링)
+    @property
+    def has_server_vad(self) -> bool:
+        """서버측 VAD가 발화 종료(epFlag)를 직접 생성하는지 여부"""
+        return self._segmenter is not None
+
+    def send_audio(self, audio_data: bytes) -> None:
+        """오디오 데이터 전송 (무음 필터링, 동기 - 프레임 콜백에서 직접 호출)
+
+        버퍼 용량을 넘으면 설정된 드롭 정책에 따라 오디오를 버립니다.
 
         Args:
             audio_data: PCM 오디오 데이터 (16kHz, mono, 16-bit, 100ms 프레임)
@@ -338,14 +373,36 @@ class ClovaSpeechSTTClient:
             logger.warning("STT 스트리밍이 시작되지 않음")
             return
 
+        # 서버측 VAD: 발화 구간(pre-roll 포함)만 전송, hangover 후 epFlag
+        if self._segmenter:
+            for chunk, is_end in self._segmenter.process(audio_data):
+                if is_end:
+                    self._audio_buffer.put_end()
+                else:
+                    self._enqueue_audio(chunk)
+            return
+
         # 무음 필터링
         if is_silence(audio_data, self.config.silence_threshold):
             logger.debug(f"무음 감지, STT 전송 스킵 (RMS < {self.config.silence_threshold})")
             return
 
-        await self._audio_queue.put((audio_data, False))
+        self._enqueue_audio(audio_data)
+
+    def _enqueue_audio(self, audio_data: bytes) -> None:
+        dropped = self._audio_buffer.put_audio(audio_data)
+        if not dropped:
+            return
+
+        dropped_ms = self._audio_buffer.bytes_to_ms(dropped)
+        logger.warning(
+            f"STT 오디오 버퍼 초과, {dropped_ms:.0f}ms 드롭 "
+            f"(policy={self._audio_buffer.policy}, user={self.user_id})"
+        )
+        if self._metrics:
+            self._metrics.record_stt_audio_dropped(dropped_ms, self.user_id)
 
-    async def mark_end_of_speech(self) -> None:
+    def mark_end_of_speech(self) -> None:
         """발화 종료 표시 (VAD speech_end 시 호출)
 
         epFlag=true를 전송하여 Clova에 발화 종료를 알림
@@ -353,6 +410,12 @@ class ClovaSpeechSTTClient:
         if not self._is_running:
             return
 
+        if self._segmenter:
+            # 서버측 VAD가 이미 종료 마커를 보냈으면 중복 전송하지 않음
+            if self._segmenter.force_end():
+                self._audio_buffer.put_end()
+            return
+
         # epFlag=true 전송
-        await self._audio_queue.put((b"", True))
+        self._audio_buffer.put_end()
         logger.info("발화 종료 마커 큐 추가")
@@ -0,0 +1,104 @@
+"""발화 segment 전송 묶음 (회의별)
+
+STT final 결과마다 POST /transcripts + POST /agent/meeting/call 두 번 왕복하던 것을,
+짧은 구간(window) 동안 모은 segment를 배치 API 한 번으로 보냅니다.
+배치 API는 저장과 Context 런타임 반영을 같은 요청에서 처리합니다.
+
+- 첫 segment 이후 window_ms가 지나거나 max_size개가 모이면 전송
+- wake word 발화(urgent)는 Agent 응답 지연을 막기 위해 대기 중인 것과 함께 즉시 전송
+- 배치는 순서대로 하나씩 전송 (Context 런타임의 발화 순서 보장)
+- 각 segment에 멱등성 키를 붙여 재시도 시 중복 저장 방지
+"""
+
+import asyncio
+import logging
+import uuid
+
+from src.clients.backend import (
+    BackendAPIClient,
+    TranscriptSegmentRequest,
+    TranscriptSegmentResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptBatchSender:
+    """회의별 발화 segment 배치 전송기"""
+
+    def __init__(
+        self,
+        api_client: BackendAPIClient,
+        meeting_id: str,
+        window_ms: int = 150,
+        max_size: int = 8,
+    ):
+        self.api_client = api_client
+        self.meeting_id = meeting_id
+        self.window_seconds = window_ms / 1000
+        self.max_size = max_size
+        self._pending: list[tuple[str, TranscriptSegmentRequest, asyncio.Future]] = []
+        self._timer: asyncio.Task | None = None
+        self._sends: set[asyncio.Task] = set()
+        # asyncio.Lock은 FIFO → 배치가 만들어진 순서대로 전송
+        self._send_lock = asyncio.Lock()
+
+    async def send(
+        self,
+        segment: TranscriptSegmentRequest,
+        urgent: bool = False,
+    ) -> TranscriptSegmentResponse | None:
+        """segment 전송 (배치 응답까지 대기, 실패 시 None)
+
+        Args:
+            segment: 트랜스크립트 세그먼트 데이터
+            urgent: True면 window를 기다리지 않고 즉시 전송
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((uuid.uuid4().hex, segment, future))
+
+        if urgent or len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+
+        # 호출자가 취소돼도 segment 전송은 계속 (같은 배치의 다른 segment 공유)
+        return await asyncio.shield(future)
+
+    async def aclose(self) -> None:
+        """대기 중인 segment 전송 후 종료"""
+        self._flush()
+        if self._sends:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.window_seconds)
+        self._timer = None
+        self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._send(batch))
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _send(self, batch: list[tuple[str, TranscriptSegmentRequest, asyncio.Future]]) -> None:
+        results: dict[str, TranscriptSegmentResponse] | None = None
+        try:
+            async with self._send_lock:
+                results = await self.api_client.send_transcript_batch(
+                    self.meeting_id,
+                    [(key, segment) for key, segment, _ in batch],
+                )
+            logger.debug(f"트랜스크립트 배치 전송: size={len(batch)}, ok={results is not None}")
+        finally:
+            for key, _, future in batch:
+                if not future.done():
+                    future.set_result(results.get(key) if results else None)
+
@@ -1,6 +1,7 @@
 """TTS 클라이언트 (MIT-tts-server 연동)"""
 
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
@@ -8,6 +9,8 @@ from src.config import get_config
 
 logger = logging.getLogger(__name__)
 
+_STREAM_CHUNK_BYTES = 8192  # 스트리밍 수신 청크 크기 (44.1kHz mono 기준 약 93ms)
+
 
 class TTSClient:
     """TTS 서버 호출 클라이언트"""
@@ -75,21 +78,18 @@ class TTSClient:
             logger.error("TTS 서버 연결 불가: %s", exc)
             return False
 
-    async def synthesize(self, text: str) -> bytes | None:
-        """텍스트를 음성으로 변환"""
-        if not text.strip():
-            return None
-
-        if not self.config.tts_server_url:
-            return None
+    async def _ensure_client(self, text: str) -> bool:
+        """합성 요청 가능 여부 (필요 시 연결)"""
+        if not text.strip() or not self.config.tts_server_url:
+            return False
 
         if self._client is None:
             await self.connect()
 
-        if self._client is None:
-            return None
+        return self._client is not None
 
-        payload: dict[str, object] = {
+    def _build_payload(self, text: str) -> dict[str, object]:
+        return {
             "text": text,
             "voice": self.config.tts_voice,
             "lang": "ko",
@@ -97,6 +97,12 @@ class TTSClient:
             "output_format": "pcm",
         }
 
+    async def synthesize(self, text: str) -> bytes | None:
+        """텍스트를 음성으로 변환"""
+        if not await self._ensure_client(text):
+            return None
+
+        payload = self._build_payload(text)
         path = self.config.tts_synthesize_path
 
         try:
@@ -146,3 +152,55 @@ class TTSClient:
         except Exception as exc:
             logger.error("TTS 요청 오류: %s", exc, exc_info=True)
             return None
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """텍스트를 음성으로 변환 (PCM 청크를 수신되는 대로 반환)
+
+        서버가 응답을 청크 단위로 내려주면 전체 합성이 끝나기 전에 재생을 시작할 수 있습니다.
+        실패 시 예외 없이 스트림을 종료합니다 (synthesize의 None 반환과 동일).
+        """
+        if not await self._ensure_client(text):
+            return
+
+        payload = self._build_payload(text)
+        path = self.config.tts_synthesize_path
+
+        try:
+            logger.debug("TTS 스트리밍 요청: path=%s, payload=%s", path, payload)
+
+            async with self._client.stream("POST", path, json=payload) as response:
+                if response.status_code != 200:
+                    body = await response.aread()
+                    logger.warning(
+                        "TTS 요청 실패: path=%s, status=%s, body=%s",
+                        path,
+                        response.status_code,
+                        body[:200],
+                    )
+                    return
+
+                total = 0
+                async for chunk in response.aiter_bytes(_STREAM_CHUNK_BYTES):
+                    total += len(chunk)
+                    yield chunk
+
+            if total == 0:
+                logger.warning("TTS 응답이 비어 있음")
+                return
+
+            logger.info(
+                "TTS 스트리밍 합성 완료: text='%s...', 크기=%d bytes",
+                text[:30],
+                total,
+            )
+
+        except httpx.ConnectError as exc:
+            logger.error(
+                "TTS 서버 연결 실패(%s): %s",
+                self.config.tts_server_url,
+                exc,
+            )
+        except httpx.TimeoutException as exc:
+            logger.error("TTS 요청 타임아웃: text='%s...', %s", text[:30], exc)
+        except Exception as exc:
+            logger.error("TTS 요청 오류: %s", exc, exc_info=True)
@@ -31,6 +31,9 @@ class RealtimeWorkerConfig(BaseSettings):
     # Backend API 설정
     backend_api_url: str = ""
     backend_api_key: str = ""  # 내부 서비스 인증용
+    transcript_batch_enabled: bool = False  # 발화 segment를 묶어 배치 API로 전송 (Context 반영 포함)
+    transcript_batch_window_ms: int = 150  # 첫 segment 이후 묶음 대기 시간
+    transcript_batch_max_size: int = 8  # 이 개수가 모이면 즉시 전송
 
     # Agent (LLM) 설정
     agent_enabled: bool = True
@@ -49,9 +52,17 @@ class RealtimeWorkerConfig(BaseSettings):
         float,
         BeforeValidator(validate_tts_volume_scale),
     ] = 0.70
+    tts_lookahead: int = 2  # 재생 중 문장 뒤로 미리 병렬 합성할 문장 수
+    tts_first_clause_min_chars: int = 10  # 첫 청크를 절 경계에서 조기 분리할 최소 길이 (0=비활성)
+    tts_streaming_enabled: bool = False  # TTS 응답을 스트림으로 받아 수신 중에 재생 시작
 
     # Worker 설정
     log_level: str = "INFO"
+    worker_mode: str = "single"  # single (MEETING_ID 1개) | multi (백엔드 스케줄러가 회의 배정)
+    worker_host_id: str = ""  # 멀티 회의 모드 호스트 ID (비어있으면 hostname)
+    worker_capacity: int = 8  # 멀티 회의 모드 최대 동시 회의 수
+    worker_heartbeat_interval: float = 2.0  # 멀티 회의 모드 하트비트/배정 조회 주기 (초)
+    worker_restart_backoff_max: float = 60.0  # 오류 종료 회의 재시작 대기 상한 (초, 지수 백오프)
     audio_sample_rate: int = 16000  # 16kHz
     audio_channels: int = 1  # mono
     audio_bits_per_sample: int = 16  # 16-bit
@@ -60,6 +71,18 @@ class RealtimeWorkerConfig(BaseSettings):
     # 무음 필터링 설정
     silence_threshold: float = 300.0  # RMS 임계값 (0~32768, 낮을수록 민감)
 
+    # 서버측 VAD 설정 (STT 전송 전 발화 구간 검출 + epFlag 생성)
+    vad_engine: str = "energy"  # energy | webrtc (webrtcvad 설치 필요) | off (RMS 필터만)
+    vad_preroll_ms: int = 300  # 발화 시작 전 함께 전송할 오디오 길이
+    vad_hangover_ms: int = 500  # 발화 종료 판정까지 허용할 무음 길이
+    vad_noise_ratio: float = 3.0  # 노이즈 플로어 대비 발화 판정 배수 (energy)
+    vad_webrtc_mode: int = 2  # webrtcvad 공격성 (0~3)
+
+    # STT 오디오 버퍼 설정 (참가자별 고정 용량 큐)
+    stt_chunk_ms: int = 100  # gRPC 전송 단위 (작은 프레임 병합)
+    stt_buffer_capacity_ms: int = 5000  # 최대 대기 오디오 길이 (초과 시 드롭)
+    stt_overflow_policy: str = "drop_oldest"  # drop_oldest (최신 유지) | drop_newest
+
 
 @lru_cache
 def get_config() -> RealtimeWorkerConfig:
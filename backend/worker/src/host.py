@@ -0,0 +1,174 @@
+"""멀티 회의 워커 호스트
+
+한 프로세스(이벤트 루프)에서 여러 회의의 RealtimeWorker를 실행합니다.
+- 백엔드 스케줄러에 주기적으로 하트비트 (용량 + 실행 중 회의) 전송
+- 응답으로 받은 배정 목록과 실행 중 회의를 맞춤 (신규 시작 / 해제된 회의 종료)
+- 오류로 종료된 회의는 배정이 남아 있는 동안 지수 백오프로 재시작
+- Backend/TTS HTTP 풀과 Clova gRPC 채널은 모든 회의가 공유
+
+워밍된 프로세스가 회의를 바로 받으므로 Pod 기동(import, TLS, LiveKit 연결 준비)
+시간이 회의 시작 지연에서 빠집니다.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from contextlib import suppress
+
+from src.clients.shared import SharedClients
+from src.config import get_config
+from src.main import RealtimeWorker
+from src.telemetry import init_realtime_telemetry
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerHost:
+    """멀티 회의 워커 호스트"""
+
+    def __init__(self, host_id: str | None = None):
+        self.config = get_config()
+        self.host_id = host_id or self.config.worker_host_id or socket.gethostname()
+        self.capacity = self.config.worker_capacity
+
+        self._shared = SharedClients()
+        self._workers: dict[str, RealtimeWorker] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        # 스스로 종료한 회의 (배정이 해제될 때까지 재시작하지 않음)
+        self._finished: set[str] = set()
+        # 오류로 종료된 회의 → (연속 실패 수, 재시작 가능 시각)
+        self._restarts: dict[str, tuple[int, float]] = {}
+        self._started_at: dict[str, float] = {}
+        self._stop_event = asyncio.Event()
+
+    @property
+    def running_meetings(self) -> list[str]:
+        return [meeting_id for meeting_id, task in self._tasks.items() if not task.done()]
+
+    async def run_forever(self) -> None:
+        """하트비트 루프 실행 (시그널 수신 시 모든 회의 종료)"""
+        init_realtime_telemetry(self.host_id, host_id=self.host_id)
+        await self._shared.connect()
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stop_event.set)
+
+        logger.info(f"Worker host 시작: host={self.host_id}, capacity={self.capacity}")
+        try:
+            while not self._stop_event.is_set():
+                await self._sync_assignments()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._stop_event.wait(),
+                        timeout=self.config.worker_heartbeat_interval,
+                    )
+        finally:
+            await self._stop_all()
+            await self._shared.close()
+            logger.info(f"Worker host 종료: host={self.host_id}")
+
+    async def _sync_assignments(self) -> None:
+        """하트비트 전송 후 배정 목록과 실행 중 회의를 맞춤"""
+        self._reap_finished()
+
+        assignments = await self._shared.api_client.send_worker_heartbeat(
+            self.host_id,
+            self.capacity,
+            self.running_meetings,
+        )
+        if assignments is None:
+            # 백엔드 일시 장애: 실행 중 회의는 유지
+            return
+
+        assigned = {item["meetingId"]: item.get("clovaKeyIndex") for item in assignments}
+
+        # 배정 해제된 회의 종료
+        for meeting_id in list(self._tasks):
+            if meeting_id not in assigned:
+                logger.info(f"회의 배정 해제, 종료: meeting={meeting_id}")
+                self._workers[meeting_id].request_stop()
+
+        # 배정이 사라진 완료/재시작 대기 회의는 기록 정리
+        self._finished &= set(assigned)
+        self._restarts = {
+            meeting_id: retry
+            for meeting_id, retry in self._restarts.items()
+            if meeting_id in assigned
+        }
+
+        # 신규 배정 시작 (오류 종료 회의는 백오프 후 재시작)
+        now = time.monotonic()
+        for meeting_id, key_index in assigned.items():
+            if meeting_id in self._tasks or meeting_id in self._finished:
+                continue
+            if meeting_id in self._restarts and now < self._restarts[meeting_id][1]:
+                continue
+            if len(self.running_meetings) >= self.capacity:
+                logger.warning(f"용량 초과로 배정 보류: meeting={meeting_id}")
+                break
+            self._start_meeting(meeting_id, key_index)
+
+    def _start_meeting(self, meeting_id: str, key_index: int | None) -> None:
+        worker = RealtimeWorker(
+            meeting_id,
+            shared=self._shared,
+            clova_stt_secret=self._resolve_stt_secret(key_index),
+        )
+        self._workers[meeting_id] = worker
+        self._tasks[meeting_id] = asyncio.create_task(worker.run())
+        self._started_at[meeting_id] = time.monotonic()
+        logger.info(f"회의 시작: meeting={meeting_id}, key_index={key_index}")
+
+    def _resolve_stt_secret(self, key_index: int | None) -> str:
+        """배정된 키 인덱스의 Clova STT 시크릿 (CLOVA_STT_SECRET_{i})"""
+        if key_index is not None:
+            secret = os.environ.get(f"CLOVA_STT_SECRET_{key_index}")
+            if secret:
+                return secret
+            logger.warning(f"CLOVA_STT_SECRET_{key_index} 미설정, 기본 시크릿 사용")
+        return self.config.clova_stt_secret
+
+    def _reap_finished(self) -> None:
+        """종료된 회의 태스크 정리 (회의 완료 / 오류)
+
+        정상 완료된 회의는 배정이 해제될 때까지 재시작하지 않고,
+        오류로 종료된 회의는 재시작을 예약합니다 (PENDING으로 방치되지 않도록).
+        """
+        now = time.monotonic()
+        backoff_max = self.config.worker_restart_backoff_max
+        for meeting_id, task in list(self._tasks.items()):
+            if not task.done():
+                continue
+            self._tasks.pop(meeting_id)
+            self._workers.pop(meeting_id, None)
+            started_at = self._started_at.pop(meeting_id, now)
+
+            error = None if task.cancelled() else task.exception()
+            if error is None:
+                self._finished.add(meeting_id)
+                self._restarts.pop(meeting_id, None)
+                continue
+
+            # 충분히 오래 실행된 뒤의 오류는 연속 실패로 보지 않음
+            failures = 1
+            if now - started_at < backoff_max:
+                failures += self._restarts.get(meeting_id, (0, 0.0))[0]
+            delay = min(backoff_max, self.config.worker_heartbeat_interval * 2 ** (failures - 1))
+            self._restarts[meeting_id] = (failures, now + delay)
+            logger.error(
+                f"회의 워커 오류 종료, {delay:.0f}초 후 재시작: "
+                f"meeting={meeting_id}, failures={failures}, error={error}"
+            )
+
+    async def _stop_all(self) -> None:
+        for worker in self._workers.values():
+            worker.request_stop()
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+        self._workers.clear()
+        self._started_at.clear()
@@ -2,12 +2,12 @@
 
 import asyncio
 import logging
-from array import array
 from dataclasses import dataclass, field
 from typing import Callable
 
 from livekit import api, rtc
 from src.config import get_config
+from src.utils.tts_playback import PCMInput, TTSPlaybackEngine
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +71,7 @@ class LiveKitBot:
         self._tts_source: rtc.AudioSource | None = None
         self._tts_track: rtc.LocalAudioTrack | None = None
         self._tts_publish_lock = asyncio.Lock()
+        self._tts_engine: TTSPlaybackEngine | None = None
         self._tts_volume_scale = self.config.tts_volume_scale
 
         if self._tts_volume_scale != 1.0:
@@ -172,7 +173,7 @@ class LiveKitBot:
 
     async def play_pcm_bytes(
         self,
-        pcm_bytes: bytes,
+        pcm_bytes: PCMInput,
         sample_rate: int,
         num_channels: int = 1,
         *,
@@ -180,12 +181,12 @@ class LiveKitBot:
         frame_duration_ms: int = 20,
         interrupt_event: asyncio.Event | None = None,
     ) -> bool:
-        """PCM16LE 바이트를 LiveKit 오디오로 재생
+        """PCM16LE 오디오를 LiveKit 오디오로 재생
 
         Args:
-            pcm_bytes: raw PCM16LE 오디오 데이터
+            pcm_bytes: raw PCM16LE 오디오 데이터 또는 수신 중인 PCM 청크 스트림
             sample_rate: PCM 데이터의 sample rate (Hz)
-            num_channels: 채널 수 (기본 1=mono)
+            num_channels: 채널 수 (기본 1=mono, 2=stereo는 mono로 다운믹스)
             target_sample_rate: 출력 sample rate (None이면 입력과 동일)
             frame_duration_ms: 프레임 길이 (ms)
             interrupt_event: 설정 시 이 이벤트가 set되면 재생 중단
@@ -193,130 +194,35 @@ class LiveKitBot:
         Returns:
             True if playback completed, False if interrupted
         """
-        if not pcm_bytes:
+        if isinstance(pcm_bytes, (bytes, bytearray, memoryview)) and not pcm_bytes:
             return True
 
-        pcm = pcm_bytes
-
-        if num_channels == 2:
-            pcm = self._stereo_to_mono_int16(pcm)
-            num_channels = 1
-
-        pcm = self._apply_gain_int16(pcm, self._tts_volume_scale)
-
         output_rate = target_sample_rate or sample_rate
-        await self.ensure_tts_track(output_rate, num_channels)
+        await self.ensure_tts_track(output_rate, 1)
+        engine = self._get_tts_engine(output_rate, frame_duration_ms)
+        return await engine.play(
+            pcm_bytes,
+            sample_rate,
+            num_channels,
+            interrupt_event=interrupt_event,
+        )
 
-        if output_rate != sample_rate:
-            resampler = rtc.AudioResampler(
-                sample_rate,
+    def _get_tts_engine(self, output_rate: int, frame_duration_ms: int) -> TTSPlaybackEngine:
+        """TTS 재생 엔진 (리샘플러/버퍼 재사용, 출력 설정이 바뀔 때만 재생성)"""
+        engine = self._tts_engine
+        if (
+            engine is None
+            or engine.output_rate != output_rate
+            or engine.frame_duration_ms != frame_duration_ms
+        ):
+            engine = TTSPlaybackEngine(
+                self._tts_source,
                 output_rate,
-                num_channels=num_channels,
-                quality=rtc.AudioResamplerQuality.MEDIUM,
+                gain=self._tts_volume_scale,
+                frame_duration_ms=frame_duration_ms,
             )
-            async for frame in self._resample_and_chunk(
-                resampler, pcm, sample_rate, num_channels, frame_duration_ms
-            ):
-                if interrupt_event and interrupt_event.is_set():
-                    logger.info("TTS 재생 인터럽트 감지됨 (resample)")
-                    return False
-                await self._tts_source.capture_frame(frame)
-        else:
-            async for frame in self._chunk_pcm_frames(
-                pcm, sample_rate, num_channels, frame_duration_ms
-            ):
-                if interrupt_event and interrupt_event.is_set():
-                    logger.info("TTS 재생 인터럽트 감지됨")
-                    return False
-                await self._tts_source.capture_frame(frame)
-
-        return True
-
-    @staticmethod
-    def _stereo_to_mono_int16(pcm_data: bytes) -> bytes:
-        """16-bit stereo PCM을 mono로 변환"""
-        samples = array("h")
-        samples.frombytes(pcm_data)
-        if len(samples) % 2 != 0:
-            samples = samples[:-1]
-
-        mono = array("h")
-        for i in range(0, len(samples), 2):
-            mono.append((samples[i] + samples[i + 1]) // 2)
-
-        return mono.tobytes()
-
-    @staticmethod
-    def _apply_gain_int16(pcm_data: bytes, gain: float) -> bytes:
-        """16-bit PCM 데이터에 gain을 적용한다."""
-        if not pcm_data or gain == 1.0:
-            return pcm_data
-
-        if len(pcm_data) % 2 != 0:
-            logger.warning(
-                "PCM 데이터 길이가 홀수(%d bytes)여서 마지막 1바이트를 버립니다.",
-                len(pcm_data),
-            )
-            pcm_data = pcm_data[:-1]
-
-        if not pcm_data:
-            return b""
-
-        samples = array("h")
-        samples.frombytes(pcm_data)
-
-        scaled_samples = array("h")
-        for sample in samples:
-            scaled = int(sample * gain)
-            if scaled > 32767:
-                scaled = 32767
-            elif scaled < -32768:
-                scaled = -32768
-            scaled_samples.append(scaled)
-
-        return scaled_samples.tobytes()
-
-    @staticmethod
-    async def _chunk_pcm_frames(
-        pcm_data: bytes,
-        sample_rate: int,
-        num_channels: int,
-        frame_duration_ms: int,
-    ):
-        """PCM 바이트를 AudioFrame 단위로 분할"""
-        bytes_per_sample = 2
-        samples_per_frame = max(1, int(sample_rate * frame_duration_ms / 1000))
-        frame_size = samples_per_frame * num_channels * bytes_per_sample
-
-        for offset in range(0, len(pcm_data), frame_size):
-            chunk = pcm_data[offset : offset + frame_size]
-            samples = len(chunk) // (num_channels * bytes_per_sample)
-            if samples <= 0:
-                continue
-            yield rtc.AudioFrame(chunk, sample_rate, num_channels, samples)
-
-    @staticmethod
-    async def _resample_and_chunk(
-        resampler: rtc.AudioResampler,
-        pcm_data: bytes,
-        sample_rate: int,
-        num_channels: int,
-        frame_duration_ms: int,
-    ):
-        """리샘플링 후 AudioFrame 단위로 분할"""
-        bytes_per_sample = 2
-        samples_per_frame = max(1, int(sample_rate * frame_duration_ms / 1000))
-        frame_size = samples_per_frame * num_channels * bytes_per_sample
-
-        for offset in range(0, len(pcm_data), frame_size):
-            chunk = pcm_data[offset : offset + frame_size]
-            if not chunk:
-                continue
-            for frame in resampler.push(bytearray(chunk)):
-                yield frame
-
-        for frame in resampler.flush():
-            yield frame
+            self._tts_engine = engine
+        return engine
 
     async def send_chat_message(self, content: str, user_name: str = "부덕이") -> None:
         """DataPacket으로 채팅 메시지 전송"""
@@ -17,12 +17,20 @@ import time
 from contextlib import suppress
 from datetime import datetime, timezone
 
-from src.clients.backend import BackendAPIClient, TranscriptSegmentRequest
+from src.clients.backend import TranscriptSegmentRequest
+from src.clients.shared import SharedClients
+from src.clients.transcript_batch import TranscriptBatchSender
 from src.clients.stt import ClovaSpeechSTTClient, STTSegment
-from src.clients.tts import TTSClient
 from src.config import get_config
 from src.livekit import LiveKitBot
 from src.utils.tts_normalize import normalize_tts_text
+from src.utils.tts_pipeline import (
+    SentenceChunker,
+    StreamedAudio,
+    TTSPipeline,
+    extract_sentences,
+    open_streamed_audio,
+)
 from src.telemetry import (
     RealtimeWorkerMetrics,
     get_realtime_metrics,
@@ -53,13 +61,21 @@ class RealtimeWorker:
     6. TTS 변환 후 LiveKit으로 발화
     """
 
-    def __init__(self, meeting_id: str):
+    def __init__(
+        self,
+        meeting_id: str,
+        shared: SharedClients | None = None,
+        clova_stt_secret: str | None = None,
+    ):
         """
         Args:
             meeting_id: 회의 ID
+            shared: 공유 클라이언트 (멀티 회의 모드, None이면 자체 생성/소유)
+            clova_stt_secret: 회의에 할당된 Clova STT 시크릿 (None이면 CLOVA_STT_SECRET)
         """
         self.meeting_id = meeting_id
         self.config = get_config()
+        self._clova_stt_secret = clova_stt_secret
 
         # Telemetry 초기화
         self._metrics: RealtimeWorkerMetrics | None = init_realtime_telemetry(meeting_id)
@@ -70,15 +86,39 @@ class RealtimeWorker:
         # TTS 첫 발화 기록 여부
         self._tts_first_audio_recorded: bool = False
 
-        # 컴포넌트 초기화
-        self.api_client = BackendAPIClient()
+        # 컴포넌트 초기화 (공유 클라이언트가 없으면 이 워커가 소유)
+        self._owns_shared = shared is None
+        self._shared = shared or SharedClients()
+        self.api_client = self._shared.api_client
+        # 발화 segment 배치 전송 (저장 + Context 반영을 한 요청으로, 비활성화 시 segment마다 전송)
+        self._transcript_sender: TranscriptBatchSender | None = (
+            TranscriptBatchSender(
+                self.api_client,
+                meeting_id,
+                window_ms=self.config.transcript_batch_window_ms,
+                max_size=self.config.transcript_batch_max_size,
+            )
+            if self.config.transcript_batch_enabled
+            else None
+        )
         self._agent_enabled = bool(self.config.agent_enabled and self.config.backend_api_url)
         self._tts_enabled = bool(self.config.tts_server_url)
-        self._tts_client = TTSClient() if self._tts_enabled else None
+        self._tts_client = self._shared.tts_client if self._tts_enabled else None
         self._tts_queue: asyncio.Queue[str] | None = (
             asyncio.Queue(maxsize=50) if self._tts_enabled else None
         )
         self._tts_task: asyncio.Task | None = None
+        # N-ahead 병렬 합성 (재생 순서 보장)
+        self._tts_pipeline: TTSPipeline | None = (
+            TTSPipeline(
+                self._synthesize_tts_stream
+                if self.config.tts_streaming_enabled
+                else self._tts_client.synthesize,
+                lookahead=self.config.tts_lookahead,
+            )
+            if self._tts_client
+            else None
+        )
         self._tts_interrupt_event: asyncio.Event = asyncio.Event()
         # TTS 재생 중 플래그
         self._tts_playing: bool = False
@@ -110,6 +150,7 @@ class RealtimeWorker:
         self._is_running = False
         self._stop_event = asyncio.Event()
         self._meeting_start_time: datetime | None = None
+        self._livekit_connect_time: float | None = None
 
         # 회의 완료 태스크 (재입장 시 취소 가능)
         self._complete_task: asyncio.Task | None = None
@@ -127,16 +168,18 @@ class RealtimeWorker:
         self._is_running = True
         self._meeting_start_time = datetime.now(timezone.utc)
 
-        # API 클라이언트 연결
-        await self.api_client.connect()
+        # API/TTS/STT 공유 연결 (멀티 회의 모드에서는 호스트가 이미 연결)
+        if self._owns_shared:
+            await self._shared.connect()
 
         # LiveKit 연결
         await self.bot.connect()
-        set_livekit_connect_time()  # STT 타임스탬프 기준점 기록
+        self._livekit_connect_time = time.time()  # STT 타임스탬프 기준점 기록 (회의별)
+        if self._owns_shared:
+            set_livekit_connect_time()
 
         # TTS 루프 시작
         if self._tts_client:
-            await self._tts_client.connect()
             self._tts_task = asyncio.create_task(self._tts_loop())
             logger.info("TTS 파이프라인 활성화: server=%s", self.config.tts_server_url)
         else:
@@ -162,15 +205,18 @@ class RealtimeWorker:
                 await self._tts_task
             self._tts_task = None
 
-        if self._tts_client:
-            await self._tts_client.disconnect()
-            self._tts_client = None
+        self._tts_client = None
+
+        # 대기 중인 발화 segment 전송
+        if self._transcript_sender:
+            await self._transcript_sender.aclose()
 
         # LiveKit 연결 해제
         await self.bot.disconnect()
 
-        # API 클라이언트 종료
-        await self.api_client.disconnect()
+        # 공유 연결 종료 (소유한 경우만)
+        if self._owns_shared:
+            await self._shared.close()
 
         logger.info(f"Realtime Worker 종료: meeting={self.meeting_id}")
 
@@ -189,6 +235,18 @@ class RealtimeWorker:
         await self._stop_event.wait()
         await self.stop()
 
+    async def run(self) -> None:
+        """완료 이벤트까지 실행 (멀티 회의 모드, 시그널은 호스트가 처리)"""
+        try:
+            await self.start()
+            await self._stop_event.wait()
+        finally:
+            await self.stop()
+
+    def request_stop(self) -> None:
+        """종료 요청 (run() 종료 유도)"""
+        self._stop_event.set()
+
     def _on_participant_joined(self, user_id: str, participant_name: str) -> None:
         """참여자 입장 처리 - STT 클라이언트 생성"""
         # 재입장 시 pending 회의 완료 취소
@@ -207,6 +265,12 @@ class RealtimeWorker:
             on_result=lambda segment: asyncio.create_task(
                 self._on_stt_result(user_id, participant_name, segment)
             ),
+            on_vad_event=lambda event_type: self._on_server_vad_event(user_id, event_type),
+            user_id=user_id,
+            channel=self._shared.stt_channel,
+            secret=self._clova_stt_secret,
+            livekit_connect_time=self._livekit_connect_time,
+            metrics=self._metrics,
         )
         self._stt_clients[user_id] = stt_client
 
@@ -283,14 +347,21 @@ class RealtimeWorker:
             logger.debug(f"VAD speech_start: user={user_id}")
 
         elif event_type == "speech_end":
-            # VAD speech_end 타임스탬프 기록
-            if self._metrics:
+            stt_client = self._stt_clients.get(user_id)
+
+            # VAD speech_end 타임스탬프 기록 (서버측 VAD 사용 시 서버 이벤트 기준)
+            if self._metrics and not (stt_client and stt_client.has_server_vad):
                 self._metrics.mark_vad_speech_end(user_id)
 
-            # STT에 발화 종료 알림
-            if user_id in self._stt_clients:
-                stt_client = self._stt_clients[user_id]
-                asyncio.create_task(stt_client.mark_end_of_speech())
+            # STT에 발화 종료 알림 (서버측 VAD가 이미 종료했으면 no-op)
+            if stt_client:
+                stt_client.mark_end_of_speech()
+
+    def _on_server_vad_event(self, user_id: str, event_type: str) -> None:
+        """서버측 VAD 이벤트 처리 (STT 클라이언트에서 호출)"""
+        logger.debug(f"서버 VAD 이벤트: user={user_id}, type={event_type}")
+        if event_type == "speech_end" and self._metrics:
+            self._metrics.mark_vad_speech_end(user_id)
 
     def _on_audio_frame(
         self,
@@ -302,8 +373,8 @@ class RealtimeWorker:
         if user_id not in self._stt_clients:
             return
 
-        stt_client = self._stt_clients[user_id]
-        asyncio.create_task(stt_client.send_audio(pcm_data))
+        # 동기 push (프레임당 태스크 생성 없음, 버퍼가 용량/드롭 관리)
+        self._stt_clients[user_id].send_audio(pcm_data)
 
     async def _on_stt_result(
         self,
@@ -399,11 +470,15 @@ class RealtimeWorker:
             agent_call_confidence=wake_word_confidence,
         )
 
-        response = await self.api_client.send_transcript_segment(request)
+        if self._transcript_sender:
+            # wake word 발화는 Agent 응답 지연을 막기 위해 묶음 대기 없이 즉시 전송
+            response = await self._transcript_sender.send(request, urgent=wake_word_triggered)
+        else:
+            response = await self.api_client.send_transcript_segment(request)
         if response:
             logger.debug(f"트랜스크립트 저장: id={response.id}")
-            # 발화 저장 직후 Context 업데이트 (실시간)
-            if self._agent_enabled:
+            # 발화 저장 직후 Context 업데이트 (실시간, 배치 API는 저장 요청에서 이미 반영)
+            if self._agent_enabled and self._transcript_sender is None:
                 if self._context_update_task and not self._context_update_task.done():
                     self._context_update_task.cancel()
                 self._context_update_task = asyncio.create_task(
@@ -530,6 +605,8 @@ class RealtimeWorker:
 
             # 2. LLM 스트리밍 호출 (Planner → Tools → Generator)
             buffer = ""
+            # TTS는 첫 청크를 절 경계에서 먼저 잘라 첫 발화를 앞당김 (채팅은 문장 단위 유지)
+            tts_chunker = SentenceChunker(self.config.tts_first_clause_min_chars)
             event_count = 0
 
             async for event in self.api_client.stream_agent_response(
@@ -563,11 +640,12 @@ class RealtimeWorker:
                     if content:
                         logger.debug(f"[MESSAGE] len={len(content)}")
                         buffer += content
+                        for chunk in tts_chunker.feed(content):
+                            self._enqueue_tts(chunk)
                         sentences, buffer = self._extract_sentences(buffer)
                         for sentence in sentences:
                             logger.info(f"[CHAT SEND] {sentence[:50]}...")
                             await self.bot.send_chat_message(sentence)
-                            self._enqueue_tts(sentence)
                     continue
 
                 # ===== 완료/에러 =====
@@ -586,7 +664,9 @@ class RealtimeWorker:
             if tail:
                 logger.info(f"[CHAT SEND] 남은텍스트: {tail}")
                 await self.bot.send_chat_message(tail)
-                self._enqueue_tts(tail)
+            tts_tail = tts_chunker.flush()
+            if tts_tail:
+                self._enqueue_tts(tts_tail)
 
             # Agent 전체 응답 시간 기록
             if self._metrics:
@@ -603,18 +683,22 @@ class RealtimeWorker:
             await self.bot.send_agent_state("idle")
 
     async def _tts_loop(self) -> None:
-        """TTS 큐를 처리해 LiveKit으로 오디오 전송"""
-        if not self._tts_queue or not self._tts_client:
+        """TTS 큐를 처리해 LiveKit으로 오디오 전송
+
+        합성(앞선 문장 병렬)과 재생(입력 순서)을 분리해 문장 사이 대기를 없앱니다.
+        """
+        if not self._tts_queue or not self._tts_client or not self._tts_pipeline:
             return
 
-        consecutive_failures = 0
-        max_consecutive_failures = 5
+        try:
+            await asyncio.gather(self._tts_synthesis_loop(), self._tts_playback_loop())
+        finally:
+            self._tts_pipeline.cancel_pending()
 
+    async def _tts_synthesis_loop(self) -> None:
+        """큐의 문장을 꺼내 lookahead 한도 안에서 합성 시작"""
         while True:
-            try:
-                sentence = await self._tts_queue.get()
-            except asyncio.CancelledError:
-                break
+            sentence = await self._tts_queue.get()
 
             # 합성 전 인터럽트 체크 (큐에서 꺼낸 후 인터럽트 발생한 경우)
             if self._tts_interrupt_event.is_set():
@@ -623,18 +707,33 @@ class RealtimeWorker:
                 continue
 
             try:
-                tts_start_time = time.perf_counter()
-                audio_bytes = await self._tts_client.synthesize(sentence)
+                await self._tts_pipeline.schedule(sentence)
+            finally:
+                self._tts_queue.task_done()
+
+    async def _tts_playback_loop(self) -> None:
+        """합성 결과를 입력 순서대로 재생"""
+        consecutive_failures = 0
+        max_consecutive_failures = 5
+
+        while True:
+            try:
+                # 합성 중 발생한 예외는 여기서 전파됨
+                result = await self._tts_pipeline.next_result()
+                if result.cancelled:
+                    continue
+
+                audio_bytes = result.audio
                 if audio_bytes:
                     # TTS 합성 시간 기록
                     if self._metrics:
-                        tts_duration = time.perf_counter() - tts_start_time
-                        self._metrics.record_tts_duration(tts_duration)
+                        self._metrics.record_tts_duration(result.duration)
 
                     # 재생 직전 인터럽트 체크 (합성 중 인터럽트 발생한 경우)
                     if self._tts_interrupt_event.is_set():
                         logger.info("TTS 합성 후 인터럽트 감지, 재생 스킵")
-                        self._tts_queue.task_done()
+                        if isinstance(audio_bytes, StreamedAudio):
+                            audio_bytes.cancel()
                         continue
 
                     # TTS 첫 발화 시점 기록 (WakeWord→TTS 레이턴시)
@@ -659,7 +758,7 @@ class RealtimeWorker:
                     )
                     self._tts_playing = False  # 재생 완료/중단
                     if not completed:
-                        # 중단됨 - 큐 비우기
+                        # 중단됨 - 큐 및 미리 합성 중인 문장 비우기
                         logger.info("TTS 재생 중단됨, 큐 비우기")
                         self._clear_tts_queue()
                     consecutive_failures = 0
@@ -667,11 +766,12 @@ class RealtimeWorker:
                     consecutive_failures += 1
                     logger.warning(
                         "TTS 합성 실패 (None 반환): text='%s...' [연속 실패: %d/%d]",
-                        sentence[:30],
+                        result.text[:30],
                         consecutive_failures,
                         max_consecutive_failures,
                     )
             except Exception as exc:
+                self._tts_playing = False
                 consecutive_failures += 1
                 logger.warning(
                     "TTS 재생 실패: %s [연속 실패: %d/%d]",
@@ -689,7 +789,9 @@ class RealtimeWorker:
                 self._clear_tts_queue()
                 consecutive_failures = 0
 
-            self._tts_queue.task_done()
+    async def _synthesize_tts_stream(self, text: str) -> StreamedAudio | None:
+        """스트리밍 합성 (첫 PCM 청크가 도착하면 반환, 나머지는 재생 중에 수신)"""
+        return await open_streamed_audio(self._tts_client.synthesize_stream(text))
 
     def _enqueue_tts(self, text: str) -> None:
         """문장을 TTS 큐에 적재"""
@@ -706,7 +808,9 @@ class RealtimeWorker:
             logger.warning("TTS 큐가 가득 참, 메시지 드랍: %s...", message[:50])
 
     def _clear_tts_queue(self) -> None:
-        """TTS 큐 비우기 (대기 중인 문장 삭제)"""
+        """TTS 큐 비우기 (대기 중인 문장 + 미리 합성 중/완료된 문장 삭제)"""
+        if self._tts_pipeline:
+            self._tts_pipeline.cancel_pending()
         if not self._tts_queue:
             return
         while not self._tts_queue.empty():
@@ -719,43 +823,7 @@ class RealtimeWorker:
     @staticmethod
     def _extract_sentences(text: str) -> tuple[list[str], str]:
         """마침표/종결부호 또는 줄바꿈 기준으로 문장 분리"""
-        if not text:
-            return [], ""
-
-        endings = {".", "!", "?", "。", "！", "？"}
-        closing = {'"', "'", "\u201c", "\u201d", ")", "]", "}", "」", "』", "】"}
-
-        sentences: list[str] = []
-        start = 0
-        i = 0
-
-        while i < len(text):
-            ch = text[i]
-
-            # 줄바꿈도 문장 경계로 처리
-            if ch == "\n":
-                sentence = text[start:i].strip()
-                if sentence:
-                    sentences.append(sentence)
-                start = i + 1
-                i = start
-                continue
-
-            if ch in endings:
-                end = i + 1
-                while end < len(text) and (text[end] in endings or text[end] in closing):
-                    end += 1
-
-                sentence = text[start:end].strip()
-                if sentence:
-                    sentences.append(sentence)
-                start = end
-                i = end
-                continue
-
-            i += 1
-
-        return sentences, text[start:]
+        return extract_sentences(text)
 
 
 async def main():
@@ -766,6 +834,13 @@ async def main():
     # 환경변수에서 meeting_id 가져오기
     import os
 
+    if config.worker_mode == "multi":
+        # 멀티 회의 모드: 백엔드 스케줄러가 배정한 회의를 한 이벤트 루프에서 실행
+        from src.host import WorkerHost
+
+        await WorkerHost().run_forever()
+        return
+
     meeting_id = os.environ.get("MEETING_ID")
 
     if not meeting_id:
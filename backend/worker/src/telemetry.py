@@ -6,6 +6,7 @@ VAD → STT → Backend 및 Wake word → Agent → TTS 파이프라인의
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 import time
@@ -120,6 +121,25 @@ class RealtimeWorkerMetrics:
             description="Wake word 감지 횟수",
         )
 
+        # STT 오디오 버퍼 (참가자별 큐 깊이 / 드롭)
+        self.stt_audio_queue_depth = meter.create_histogram(
+            name="mit_stt_audio_queue_depth_ms",
+            description="STT 전송 시점 참가자 오디오 버퍼 대기 길이",
+            unit="ms",
+        )
+        self.stt_audio_dropped = meter.create_counter(
+            name="mit_stt_audio_dropped_ms_total",
+            description="버퍼 용량 초과로 드롭된 오디오 길이",
+            unit="ms",
+        )
+
+    def for_meeting(self, meeting_id: str) -> RealtimeWorkerMetrics:
+        """같은 instrument를 공유하는 다른 회의용 메트릭 (멀티 회의 모드)"""
+        clone = copy.copy(self)
+        clone.meeting_id = meeting_id
+        clone._timestamps = {}
+        return clone
+
     def get_timestamps(self, user_id: str) -> PipelineTimestamps:
         """사용자별 타임스탬프 가져오기 (없으면 생성)"""
         if user_id not in self._timestamps:
@@ -220,6 +240,20 @@ class RealtimeWorkerMetrics:
             {"meeting_id": self.meeting_id},
         )
 
+    def record_stt_queue_depth(self, depth_ms: float, user_id: str) -> None:
+        """STT 오디오 버퍼 대기 길이 기록"""
+        self.stt_audio_queue_depth.record(
+            depth_ms,
+            {"meeting_id": self.meeting_id, "user_id": user_id},
+        )
+
+    def record_stt_audio_dropped(self, dropped_ms: float, user_id: str) -> None:
+        """STT 오디오 드롭 길이 기록"""
+        self.stt_audio_dropped.add(
+            dropped_ms,
+            {"meeting_id": self.meeting_id, "user_id": user_id},
+        )
+
     def increment_stt_segment(self, user_id: str) -> None:
         """STT 최종 결과 세그먼트 카운트 증가"""
         self.stt_segment_count.add(
@@ -238,18 +272,22 @@ _initialized: bool = False
 _livekit_connect_time: float = 0.0  # LiveKit 연결 시간 (epoch seconds)
 
 
-def init_realtime_telemetry(meeting_id: str) -> RealtimeWorkerMetrics:
+def init_realtime_telemetry(meeting_id: str, host_id: str | None = None) -> RealtimeWorkerMetrics:
     """Realtime Worker Telemetry 초기화
 
     Args:
         meeting_id: 현재 회의 ID (리소스 속성으로 추가됨)
+        host_id: 멀티 회의 모드 호스트 ID (지정 시 meeting.id 대신 리소스 속성으로 사용)
 
     Returns:
-        RealtimeWorkerMetrics 인스턴스
+        RealtimeWorkerMetrics 인스턴스 (이미 초기화된 경우 해당 회의용 메트릭)
     """
     global _metrics, _tracer, _initialized
 
     if _initialized:
+        if _metrics is not None and _metrics.meeting_id != meeting_id:
+            # 멀티 회의 모드: MeterProvider 공유, 회의별 라벨만 분리
+            return _metrics.for_meeting(meeting_id)
         logger.warning("Realtime telemetry already initialized")
         return _metrics  # type: ignore
 
@@ -259,7 +297,7 @@ def init_realtime_telemetry(meeting_id: str) -> RealtimeWorkerMetrics:
         ResourceAttributes.SERVICE_NAME: "mit-realtime-worker",
         ResourceAttributes.SERVICE_VERSION: "0.1.0",
         ResourceAttributes.DEPLOYMENT_ENVIRONMENT: os.getenv("APP_ENV", "development"),
-        "meeting.id": meeting_id,
+        **({"worker.host_id": host_id} if host_id else {"meeting.id": meeting_id}),
     })
 
     # Tracer 설정
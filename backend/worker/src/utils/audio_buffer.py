@@ -0,0 +1,174 @@
+"""참가자별 STT 오디오 버퍼 (고정 용량 + 청크 병합 + 드롭 정책).
+
+LiveKit 프레임 콜백(동기)에서 push하고, gRPC 요청 생성기(비동기)에서 get합니다.
+- 용량: 오디오 길이(ms) 기준 고정 상한 → Clova 지연 시에도 메모리 증가 없음
+- 병합: 작은 프레임을 chunk_ms 단위로 합쳐 gRPC 메시지 수 감소
+- 드롭 정책: drop_oldest (최신 오디오 유지, 기본) / drop_newest (기존 오디오 유지)
+- epFlag 마커는 드롭하지 않음 (발화 경계 보존)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+
+@dataclass
+class _Chunk:
+    data: bytearray
+    is_end: bool = False
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class AudioRingBuffer:
+    """고정 용량 오디오 큐.
+
+    Example:
+        buffer = AudioRingBuffer(sample_rate=16000, chunk_ms=100, capacity_ms=5000)
+        buffer.put_audio(pcm)          # 동기, 블로킹 없음
+        buffer.put_end()               # epFlag 마커
+        item = await buffer.get()      # (chunk, is_end) 또는 None (종료)
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        chunk_ms: int = 100,
+        capacity_ms: int = 5000,
+        policy: str = DROP_OLDEST,
+    ):
+        if policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"지원하지 않는 드롭 정책: {policy}")
+
+        self._bytes_per_ms = sample_rate * 2 / 1000
+        self.chunk_ms = chunk_ms
+        self.chunk_bytes = max(2, int(self._bytes_per_ms * chunk_ms) // 2 * 2)
+        self.capacity_bytes = max(self.chunk_bytes, int(self._bytes_per_ms * capacity_ms))
+        self.policy = policy
+
+        self._chunks: deque[_Chunk] = deque()
+        self._audio_bytes = 0
+        self._closed = False
+        self._ready = asyncio.Event()
+
+        # 누적 통계
+        self.dropped_bytes = 0
+
+    @property
+    def depth_ms(self) -> float:
+        """대기 중인 오디오 길이 (ms)"""
+        return self._audio_bytes / self._bytes_per_ms
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def bytes_to_ms(self, size: int) -> float:
+        return size / self._bytes_per_ms
+
+    def put_audio(self, pcm_data: bytes) -> int:
+        """오디오 추가 (꼬리 청크에 병합)
+
+        Returns:
+            용량 초과로 드롭된 바이트 수
+        """
+        if self._closed or not pcm_data:
+            return 0
+
+        dropped = 0
+        if self.policy == DROP_NEWEST:
+            room = self.capacity_bytes - self._audio_bytes
+            if room <= 0:
+                self.dropped_bytes += len(pcm_data)
+                return len(pcm_data)
+            if len(pcm_data) > room:
+                dropped = len(pcm_data) - room
+                pcm_data = pcm_data[: room - room % 2]
+
+        tail = self._chunks[-1] if self._chunks else None
+        if tail is not None and not tail.is_end and len(tail.data) < self.chunk_bytes:
+            tail.data.extend(pcm_data)
+        else:
+            self._chunks.append(_Chunk(bytearray(pcm_data)))
+        self._audio_bytes += len(pcm_data)
+
+        if self.policy == DROP_OLDEST:
+            dropped += self._evict_oldest()
+
+        self.dropped_bytes += dropped
+        self._ready.set()
+        return dropped
+
+    def put_end(self) -> None:
+        """발화 종료(epFlag) 마커 추가"""
+        if self._closed:
+            return
+        self._chunks.append(_Chunk(bytearray(), is_end=True))
+        self._ready.set()
+
+    def close(self) -> None:
+        """종료 (대기 중인 get은 남은 항목 소진 후 None 반환)"""
+        self._closed = True
+        self._ready.set()
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._audio_bytes = 0
+
+    async def get(self) -> tuple[bytes, bool] | None:
+        """다음 청크 반환 (병합 대기 최대 chunk_ms)
+
+        Returns:
+            (chunk, is_end) 또는 None (종료)
+        """
+        while True:
+            timeout: float | None = None
+            if self._chunks:
+                head = self._chunks[0]
+                age_ms = (time.monotonic() - head.created_at) * 1000
+                if (
+                    head.is_end
+                    or len(head.data) >= self.chunk_bytes
+                    or len(self._chunks) > 1
+                    or age_ms >= self.chunk_ms
+                    or self._closed
+                ):
+                    return self._pop()
+                timeout = (self.chunk_ms - age_ms) / 1000
+            elif self._closed:
+                return None
+
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _pop(self) -> tuple[bytes, bool]:
+        chunk = self._chunks.popleft()
+        self._audio_bytes -= len(chunk.data)
+        return bytes(chunk.data), chunk.is_end
+
+    def _evict_oldest(self) -> int:
+        """용량 초과분을 가장 오래된 오디오 청크부터 제거 (마커는 유지)"""
+        dropped = 0
+        while self._audio_bytes > self.capacity_bytes:
+            victim = next((c for c in self._chunks if not c.is_end and c.data), None)
+            if victim is None:
+                break
+            overflow = self._audio_bytes - self.capacity_bytes
+            if len(victim.data) <= overflow:
+                size = len(victim.data)
+                self._chunks.remove(victim)
+            else:
+                # 샘플 경계(2바이트) 유지하며 앞부분만 잘라냄
+                size = overflow + overflow % 2
+                del victim.data[:size]
+            self._audio_bytes -= size
+            dropped += size
+        return dropped
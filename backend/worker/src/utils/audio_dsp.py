@@ -0,0 +1,89 @@
+"""PCM16 오디오 DSP 모듈 (NumPy 벡터화).
+
+참가자별 10~100ms 프레임마다 호출되는 핫패스용 함수 모음입니다.
+입력은 bytes / bytearray / memoryview 모두 허용하며,
+np.frombuffer로 입력 버퍼를 복사 없이 int16 배열로 해석합니다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+PCMBuffer = bytes | bytearray | memoryview
+
+_INT16_MIN = -32768
+_INT16_MAX = 32767
+
+
+def as_int16(pcm_data: PCMBuffer) -> np.ndarray:
+    """PCM16LE 버퍼를 int16 배열 뷰로 변환 (복사 없음).
+
+    길이가 홀수면 마지막 1바이트는 무시합니다.
+    반환 배열은 입력 버퍼를 공유하므로 읽기 전용으로 취급해야 합니다.
+    """
+    view = memoryview(pcm_data).cast("B")
+    usable = len(view) - (len(view) % 2)
+    return np.frombuffer(view[:usable], dtype="<i2")
+
+
+def rms_int16(pcm_data: PCMBuffer) -> float:
+    """PCM16 RMS 계산 (0~32768). 빈 입력은 0.0."""
+    samples = as_int16(pcm_data)
+    if samples.size == 0:
+        return 0.0
+    # int16 제곱은 오버플로우하므로 float64로 누적
+    floats = samples.astype(np.float64)
+    return float(np.sqrt(np.dot(floats, floats) / samples.size))
+
+
+def stereo_to_mono_int16(pcm_data: PCMBuffer) -> bytes:
+    """인터리브 stereo PCM16을 mono로 다운믹스 ((L + R) // 2)."""
+    samples = as_int16(pcm_data)
+    frames = samples.size // 2
+    if frames == 0:
+        return b""
+    pairs = samples[: frames * 2].reshape(frames, 2).astype(np.int32)
+    # 산술 시프트 = floor division (기존 Python // 동작과 동일)
+    mono = (pairs[:, 0] + pairs[:, 1]) >> 1
+    return mono.astype("<i2").tobytes()
+
+
+def apply_gain_int16(pcm_data: PCMBuffer, gain: float) -> bytes:
+    """PCM16에 gain 적용 (0 방향 절삭 + int16 범위 클리핑)."""
+    if gain == 1.0:
+        return bytes(pcm_data)
+    samples = as_int16(pcm_data)
+    if samples.size == 0:
+        return b""
+    # float64: 기존 int(sample * gain) 결과와 비트 단위로 동일
+    scaled = samples.astype(np.float64)
+    scaled *= gain
+    np.trunc(scaled, out=scaled)
+    np.clip(scaled, _INT16_MIN, _INT16_MAX, out=scaled)
+    return scaled.astype("<i2").tobytes()
+
+
+def resample_int16(
+    pcm_data: PCMBuffer,
+    src_rate: int,
+    dst_rate: int,
+) -> bytes:
+    """mono PCM16 선형 보간 리샘플링.
+
+    프레임 단위 경량 변환용입니다. 재생 품질이 중요한 경로(TTS)는
+    rtc.AudioResampler를 사용합니다.
+    """
+    samples = as_int16(pcm_data)
+    if src_rate == dst_rate or samples.size == 0:
+        return samples.tobytes()
+
+    out_size = max(1, int(round(samples.size * dst_rate / src_rate)))
+    src_positions = np.arange(out_size, dtype=np.float64) * (src_rate / dst_rate)
+    resampled = np.interp(
+        src_positions,
+        np.arange(samples.size, dtype=np.float64),
+        samples.astype(np.float64),
+    )
+    np.rint(resampled, out=resampled)
+    np.clip(resampled, _INT16_MIN, _INT16_MAX, out=resampled)
+    return resampled.astype("<i2").tobytes()
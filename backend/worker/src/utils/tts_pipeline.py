@@ -0,0 +1,261 @@
+"""TTS 파이프라인 (청크 분리 + N-ahead 병렬 합성).
+
+- SentenceChunker: LLM 토큰 스트림을 TTS 청크로 분리.
+  첫 청크는 문장 종결을 기다리지 않고 절 경계(쉼표, 연결어미)에서 먼저 잘라
+  첫 발화까지의 시간을 줄입니다.
+- TTSPipeline: 재생 중인 문장 뒤로 최대 lookahead개 문장을 미리 병렬 합성하고,
+  결과는 입력 순서대로 꺼냅니다 (문장 사이 공백 제거).
+  cancel_pending()으로 인터럽트 시 대기 중인 합성을 모두 취소합니다.
+- StreamedAudio: TTS 서버 PCM 스트림을 재생 전부터 백그라운드로 수신하는 버퍼.
+  스트리밍 합성이면 첫 청크 도착 시점에 결과를 내보내 클립 전체를 기다리지 않습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+
+_ENDINGS = {".", "!", "?", "。", "！", "？"}
+_CLOSING = {'"', "'", "“", "”", ")", "]", "}", "」", "』", "】"}
+
+# 절 경계: 뒤에 공백이 온 쉼표류 ("1,000" 같은 숫자 구분자 제외) 또는 연결어미
+_RE_CLAUSE_BOUNDARY = re.compile(r"[,，、;:](?=\s)|(?:는데|지만|으며|면서|니까)(?=\s)")
+
+
+def extract_sentences(text: str) -> tuple[list[str], str]:
+    """마침표/종결부호 또는 줄바꿈 기준으로 문장 분리 → (문장 목록, 남은 텍스트)"""
+    if not text:
+        return [], ""
+
+    sentences: list[str] = []
+    start = 0
+    i = 0
+
+    while i < len(text):
+        ch = text[i]
+
+        # 줄바꿈도 문장 경계로 처리
+        if ch == "\n":
+            sentence = text[start:i].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = i + 1
+            i = start
+            continue
+
+        if ch in _ENDINGS:
+            end = i + 1
+            while end < len(text) and (text[end] in _ENDINGS or text[end] in _CLOSING):
+                end += 1
+
+            sentence = text[start:end].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = end
+            i = end
+            continue
+
+        i += 1
+
+    return sentences, text[start:]
+
+
+def split_first_clause(text: str, min_chars: int) -> tuple[str, str] | None:
+    """min_chars 이후 첫 절 경계에서 분리 → (절, 나머지), 경계가 없으면 None"""
+    for match in _RE_CLAUSE_BOUNDARY.finditer(text):
+        if match.end() >= min_chars:
+            clause = text[: match.end()].strip()
+            if clause:
+                return clause, text[match.end():]
+    return None
+
+
+class SentenceChunker:
+    """토큰 스트림 → TTS 청크 (응답 하나당 인스턴스 하나)"""
+
+    def __init__(self, first_clause_min_chars: int = 10) -> None:
+        """
+        Args:
+            first_clause_min_chars: 첫 청크를 절 경계에서 자를 최소 길이 (0이면 조기 분리 안 함)
+        """
+        self._first_clause_min_chars = first_clause_min_chars
+        self._buffer = ""
+        self._emitted = False
+
+    def feed(self, text: str) -> list[str]:
+        """텍스트를 추가하고 완성된 청크 반환"""
+        self._buffer += text
+        chunks, self._buffer = extract_sentences(self._buffer)
+
+        if not chunks and not self._emitted and self._first_clause_min_chars > 0:
+            split = split_first_clause(self._buffer, self._first_clause_min_chars)
+            if split is not None:
+                clause, self._buffer = split
+                chunks = [clause]
+
+        if chunks:
+            self._emitted = True
+        return chunks
+
+    def flush(self) -> str:
+        """남은 텍스트 반환 (스트림 종료 시)"""
+        tail = self._buffer.strip()
+        self._buffer = ""
+        return tail
+
+
+class StreamedAudio:
+    """PCM 청크 스트림 선수신 버퍼 (async iterable, 한 번만 순회)"""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks: deque[bytes] = deque()
+        self._done = False
+        self._changed = asyncio.Event()
+        self._task = asyncio.create_task(self._receive(chunks))
+
+    async def _receive(self, chunks: AsyncIterator[bytes]) -> None:
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    self._chunks.append(chunk)
+                    self._changed.set()
+        finally:
+            self._done = True
+            self._changed.set()
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def wait_started(self) -> bool:
+        """첫 청크 도착까지 대기 → 수신된 데이터가 있으면 True"""
+        while not self._chunks and not self._done:
+            self._changed.clear()
+            await self._changed.wait()
+        return bool(self._chunks)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while True:
+            if self._chunks:
+                yield self._chunks.popleft()
+            elif self._done:
+                return
+            else:
+                self._changed.clear()
+                await self._changed.wait()
+
+    def cancel(self) -> None:
+        """수신 중단 (재생 중단/건너뜀)"""
+        self._task.cancel()
+
+    async def aclose(self) -> None:
+        self.cancel()
+
+
+async def open_streamed_audio(chunks: AsyncIterator[bytes]) -> StreamedAudio | None:
+    """스트림 수신 시작 후 첫 청크까지 대기 (데이터 없이 끝나면 None)"""
+    audio = StreamedAudio(chunks)
+    try:
+        if await audio.wait_started():
+            return audio
+    except asyncio.CancelledError:
+        audio.cancel()
+        raise
+    audio.cancel()
+    return None
+
+
+@dataclass
+class SynthesisResult:
+    """순서대로 꺼낸 합성 결과"""
+
+    text: str
+    audio: bytes | StreamedAudio | None
+    duration: float  # 합성 소요 시간 (초, 스트리밍은 첫 청크까지)
+    cancelled: bool = False
+
+
+class TTSPipeline:
+    """N-ahead 병렬 합성 + 순서 보장 결과 버퍼.
+
+    Example:
+        pipeline = TTSPipeline(tts_client.synthesize, lookahead=2)
+        await pipeline.schedule("첫 문장.")   # 슬롯이 없으면 대기 (버퍼 상한)
+        result = await pipeline.next_result()  # 입력 순서대로
+    """
+
+    def __init__(
+        self,
+        synthesize: Callable[[str], Awaitable[bytes | StreamedAudio | None]],
+        lookahead: int = 2,
+    ) -> None:
+        self._synthesize = synthesize
+        # 합성 중 + 합성 완료 후 재생 대기 중인 문장 수 상한
+        self._slots = asyncio.Semaphore(max(1, lookahead))
+        self._pending: deque[tuple[str, asyncio.Task]] = deque()
+        self._ready = asyncio.Event()
+        self._current: asyncio.Task | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def schedule(self, text: str) -> None:
+        """합성 시작 (lookahead 슬롯이 빌 때까지 대기)"""
+        await self._slots.acquire()
+        task = asyncio.create_task(self._timed_synthesize(text))
+        self._pending.append((text, task))
+        self._ready.set()
+
+    async def next_result(self) -> SynthesisResult:
+        """가장 먼저 스케줄된 문장의 합성 결과 (완료될 때까지 대기)"""
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+
+        text, task = self._pending.popleft()
+        self._current = task
+        try:
+            # 취소된 합성을 await하면 호출자까지 CancelledError가 전파되므로 wait 사용
+            await asyncio.wait({task})
+        finally:
+            self._current = None
+            self._slots.release()
+
+        if task.cancelled():
+            return SynthesisResult(text=text, audio=None, duration=0.0, cancelled=True)
+        audio, duration = task.result()
+        return SynthesisResult(text=text, audio=audio, duration=duration)
+
+    def cancel_pending(self) -> int:
+        """대기 중인(재생 전) 합성 모두 취소 → 취소된 문장 수"""
+        cancelled = 0
+        if self._current is not None and not self._current.done():
+            self._current.cancel()
+            cancelled += 1
+        while self._pending:
+            _, task = self._pending.popleft()
+            if task.done():
+                self._discard(task)
+            else:
+                task.cancel()
+            self._slots.release()
+            cancelled += 1
+        return cancelled
+
+    @staticmethod
+    def _discard(task: asyncio.Task) -> None:
+        """합성 완료 후 재생되지 않은 스트림 수신 중단"""
+        if task.cancelled() or task.exception() is not None:
+            return
+        audio, _ = task.result()
+        if isinstance(audio, StreamedAudio):
+            audio.cancel()
+
+    async def _timed_synthesize(self, text: str) -> tuple[bytes | StreamedAudio | None, float]:
+        start = time.perf_counter()
+        audio = await self._synthesize(text)
+        return audio, time.perf_counter() - start
@@ -0,0 +1,326 @@
+"""TTS 재생 엔진 (다운믹스/gain + 리샘플링 + 프레임 분할 + 페이싱).
+
+LiveKit AudioSource 하나로 TTS PCM을 내보내는 재생 경로입니다.
+- 리샘플러: 입력 sample rate별로 rtc.AudioResampler를 한 번만 만들어 재사용
+- 다운믹스/gain/프레임 분할: 미리 할당한 버퍼에서 처리 (20ms 프레임마다 bytes 슬라이스를 만들지 않음)
+- 페이싱: 절대 시계 기준으로 AudioSource 큐에 max_lead 이상 쌓이지 않게 전송
+  (sleep 오차가 누적되지 않고, 인터럽트 시 큐에 남는 오디오도 max_lead 이하)
+- 입력: 완성된 PCM bytes 또는 TTS 서버에서 수신 중인 PCM 청크 스트림
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable, AsyncIterator
+
+import numpy as np
+
+from livekit import rtc
+from src.utils.audio_dsp import as_int16
+
+logger = logging.getLogger(__name__)
+
+PCMInput = bytes | bytearray | memoryview | AsyncIterable[bytes]
+
+_INT16_MIN = -32768
+_INT16_MAX = 32767
+_BYTES_PER_SAMPLE = 2
+_BLOCK_SAMPLES = 4096  # bytes 입력을 나눠 변환하는 단위 (stereo 기준 샘플 쌍)
+
+
+def _create_frame(sample_rate: int, frame_duration_ms: int) -> tuple[rtc.AudioFrame, np.ndarray]:
+    """재사용할 mono 프레임과 그 데이터의 int16 쓰기 가능 뷰"""
+    samples_per_frame = max(1, sample_rate * frame_duration_ms // 1000)
+    frame = rtc.AudioFrame.create(sample_rate, 1, samples_per_frame)
+    return frame, np.frombuffer(frame.data, dtype="<i2")
+
+
+async def _iter_chunks(pcm: PCMInput) -> AsyncIterator[memoryview | bytes]:
+    """bytes 입력은 블록 단위 뷰로, 스트림 입력은 수신 청크 그대로"""
+    if isinstance(pcm, (bytes, bytearray, memoryview)):
+        view = memoryview(pcm).cast("B")
+        step = _BLOCK_SAMPLES * 2 * _BYTES_PER_SAMPLE
+        for offset in range(0, len(view), step):
+            yield view[offset : offset + step]
+        return
+
+    async for chunk in pcm:
+        if chunk:
+            yield chunk
+
+
+class TTSPlaybackEngine:
+    """AudioSource 하나에 대한 TTS 재생 엔진 (mono 출력)
+
+    AudioSource.capture_frame은 완료 시점에 프레임 데이터를 복사해 두므로
+    await가 끝난 프레임 버퍼는 다음 프레임에 그대로 재사용합니다.
+
+    Example:
+        engine = TTSPlaybackEngine(source, output_rate=48000, gain=0.7)
+        completed = await engine.play(pcm_bytes, sample_rate=44100)
+        completed = await engine.play(tts_client.synthesize_stream(text), sample_rate=44100)
+    """
+
+    def __init__(
+        self,
+        source: rtc.AudioSource,
+        output_rate: int,
+        *,
+        gain: float = 1.0,
+        frame_duration_ms: int = 20,
+        max_lead_ms: int = 200,
+    ) -> None:
+        """
+        Args:
+            source: 출력 AudioSource (output_rate, mono)
+            output_rate: 출력 sample rate (Hz)
+            gain: 볼륨 스케일 (1.0이면 적용 안 함)
+            frame_duration_ms: 출력 프레임 길이 (ms)
+            max_lead_ms: AudioSource 큐에 미리 넣어둘 최대 오디오 길이 (ms)
+        """
+        self.output_rate = output_rate
+        self.frame_duration_ms = frame_duration_ms
+        self._source = source
+        self._gain = gain
+        self._max_lead = max_lead_ms / 1000
+
+        self._out_frame, self._out_view = _create_frame(output_rate, frame_duration_ms)
+        self._out_fill = 0
+        self._frame_seconds = self._out_view.size / output_rate
+
+        # 입력 sample rate별 리샘플러 / 리샘플러 입력 프레임 (재사용)
+        self._resamplers: dict[int, rtc.AudioResampler] = {}
+        self._in_frames: dict[int, tuple[rtc.AudioFrame, np.ndarray]] = {}
+        self._in_fill = 0
+
+        # 다운믹스/gain 작업 버퍼 (부족하면 2배씩 확장)
+        self._work = np.empty(_BLOCK_SAMPLES, dtype=np.float64)
+        self._pcm = np.empty(_BLOCK_SAMPLES, dtype="<i2")
+        # 스트림 청크 경계에 걸린 샘플 바이트
+        self._remainder = bytearray()
+
+        # 페이싱 시계: clock_start + frames_sent * frame_seconds = 마지막 전송 프레임의 재생 종료 예정 시각
+        self._clock_start = 0.0
+        self._frames_sent = 0
+
+    async def play(
+        self,
+        pcm: PCMInput,
+        sample_rate: int,
+        num_channels: int = 1,
+        *,
+        interrupt_event: asyncio.Event | None = None,
+    ) -> bool:
+        """PCM16LE 재생 (bytes 또는 청크 스트림)
+
+        Args:
+            pcm: raw PCM16LE 바이트 또는 PCM 청크 async iterable
+            sample_rate: 입력 sample rate (Hz)
+            num_channels: 입력 채널 수 (1=mono, 2=stereo → mono 다운믹스)
+            interrupt_event: 설정 시 이 이벤트가 set되면 재생 중단
+
+        Returns:
+            True if playback completed, False if interrupted
+        """
+        if num_channels not in (1, 2):
+            raise ValueError(f"지원하지 않는 채널 수: {num_channels}")
+
+        chunks = _iter_chunks(pcm)
+        completed = False
+        try:
+            async for chunk in chunks:
+                if not await self._feed(chunk, sample_rate, num_channels, interrupt_event):
+                    break
+            else:
+                completed = await self._finish(sample_rate, interrupt_event)
+        finally:
+            await chunks.aclose()
+            if not completed:
+                self._abort(sample_rate)
+            # 스트림 입력은 재생 종료/중단 시 수신도 종료
+            aclose = getattr(pcm, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        if not completed:
+            logger.info("TTS 재생 인터럽트 감지됨")
+        return completed
+
+    async def _feed(
+        self,
+        chunk: memoryview | bytes,
+        sample_rate: int,
+        num_channels: int,
+        interrupt_event: asyncio.Event | None,
+    ) -> bool:
+        """청크 변환 후 입력 프레임에 채우고, 가득 찬 프레임 전송"""
+        data = chunk
+        if self._remainder:
+            # 이전 청크의 잘린 샘플과 이어붙임 (청크 경계가 샘플 경계와 어긋난 경우만)
+            data = bytes(self._remainder) + bytes(chunk)
+            self._remainder.clear()
+
+        align = _BYTES_PER_SAMPLE * num_channels
+        usable = len(data) - len(data) % align
+        if usable < len(data):
+            self._remainder.extend(data[usable:])
+        if usable == 0:
+            return True
+
+        samples = self._convert(memoryview(data)[:usable], num_channels)
+
+        in_frame, in_view = self._input_frame(sample_rate)
+        size = in_view.size
+        pos = 0
+        while pos < samples.size:
+            take = min(size - self._in_fill, samples.size - pos)
+            in_view[self._in_fill : self._in_fill + take] = samples[pos : pos + take]
+            self._in_fill += take
+            pos += take
+            if self._in_fill == size:
+                self._in_fill = 0
+                if not await self._submit(in_frame, sample_rate, interrupt_event):
+                    return False
+        return True
+
+    def _convert(self, pcm: memoryview, num_channels: int) -> np.ndarray:
+        """stereo 다운믹스 ((L + R) // 2) + gain (0 방향 절삭, int16 클리핑)
+
+        audio_dsp.stereo_to_mono_int16 / apply_gain_int16과 비트 단위로 같은 결과를
+        작업 버퍼에 씁니다. 반환 배열은 다음 호출 때 덮어써집니다.
+        """
+        samples = as_int16(pcm)
+        frames = samples.size // num_channels
+        if frames > self._work.size:
+            capacity = max(frames, self._work.size * 2)
+            self._work = np.empty(capacity, dtype=np.float64)
+            self._pcm = np.empty(capacity, dtype="<i2")
+
+        work = self._work[:frames]
+        if num_channels == 2:
+            pairs = samples.reshape(frames, 2)
+            np.add(pairs[:, 0], pairs[:, 1], out=work, dtype=np.float64)
+            np.floor_divide(work, 2, out=work)
+        else:
+            np.copyto(work, samples)
+
+        if self._gain != 1.0:
+            work *= self._gain
+            np.trunc(work, out=work)
+            np.clip(work, _INT16_MIN, _INT16_MAX, out=work)
+
+        out = self._pcm[:frames]
+        np.copyto(out, work, casting="unsafe")
+        return out
+
+    def _input_frame(self, sample_rate: int) -> tuple[rtc.AudioFrame, np.ndarray]:
+        if sample_rate == self.output_rate:
+            return self._out_frame, self._out_view
+        if sample_rate not in self._in_frames:
+            self._in_frames[sample_rate] = _create_frame(sample_rate, self.frame_duration_ms)
+        return self._in_frames[sample_rate]
+
+    def _resampler(self, sample_rate: int) -> rtc.AudioResampler:
+        resampler = self._resamplers.get(sample_rate)
+        if resampler is None:
+            resampler = rtc.AudioResampler(
+                sample_rate,
+                self.output_rate,
+                num_channels=1,
+                quality=rtc.AudioResamplerQuality.MEDIUM,
+            )
+            self._resamplers[sample_rate] = resampler
+        return resampler
+
+    async def _submit(
+        self,
+        in_frame: rtc.AudioFrame,
+        sample_rate: int,
+        interrupt_event: asyncio.Event | None,
+    ) -> bool:
+        """가득 찬 입력 프레임 → (리샘플링) → 출력 프레임 전송"""
+        if sample_rate == self.output_rate:
+            # 입력 프레임이 곧 출력 프레임
+            return await self._emit(interrupt_event)
+
+        for frame in self._resampler(sample_rate).push(in_frame):
+            if not await self._write_output(frame, interrupt_event):
+                return False
+        return True
+
+    async def _write_output(
+        self,
+        frame: rtc.AudioFrame,
+        interrupt_event: asyncio.Event | None,
+    ) -> bool:
+        """리샘플러 출력(가변 길이)을 고정 길이 출력 프레임으로 재분할"""
+        samples = np.frombuffer(frame.data, dtype="<i2")
+        size = self._out_view.size
+        pos = 0
+        while pos < samples.size:
+            take = min(size - self._out_fill, samples.size - pos)
+            self._out_view[self._out_fill : self._out_fill + take] = samples[pos : pos + take]
+            self._out_fill += take
+            pos += take
+            if self._out_fill == size:
+                self._out_fill = 0
+                if not await self._emit(interrupt_event):
+                    return False
+        return True
+
+    async def _finish(self, sample_rate: int, interrupt_event: asyncio.Event | None) -> bool:
+        """남은 샘플 전송 (마지막 부분 프레임은 무음으로 채움) + 리샘플러 flush"""
+        if self._remainder:
+            logger.debug("PCM 청크 끝의 불완전한 샘플 %d bytes 버림", len(self._remainder))
+            self._remainder.clear()
+
+        in_frame, in_view = self._input_frame(sample_rate)
+        if self._in_fill:
+            in_view[self._in_fill :] = 0
+            self._in_fill = 0
+            if not await self._submit(in_frame, sample_rate, interrupt_event):
+                return False
+
+        if sample_rate != self.output_rate:
+            for frame in self._resampler(sample_rate).flush():
+                if not await self._write_output(frame, interrupt_event):
+                    return False
+            if self._out_fill:
+                self._out_view[self._out_fill :] = 0
+                self._out_fill = 0
+                if not await self._emit(interrupt_event):
+                    return False
+        return True
+
+    def _abort(self, sample_rate: int) -> None:
+        """중단된 클립 상태 정리 (다음 클립에 이전 오디오가 섞이지 않도록)"""
+        self._in_fill = 0
+        self._out_fill = 0
+        self._remainder.clear()
+        # 리샘플러 내부 지연 샘플은 버리고 다음 재생 때 새로 생성
+        self._resamplers.pop(sample_rate, None)
+        # AudioSource 큐에 남은 오디오 제거 (지원하는 SDK 버전만)
+        clear_queue = getattr(self._source, "clear_queue", None)
+        if clear_queue is not None:
+            clear_queue()
+        self._frames_sent = 0
+
+    async def _emit(self, interrupt_event: asyncio.Event | None) -> bool:
+        """출력 프레임 1개를 페이싱에 맞춰 전송"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        lead = self._clock_start + self._frames_sent * self._frame_seconds - now
+        if lead < 0:
+            # 큐가 비었음 (클립 시작 또는 스트림 수신 지연) → 시계 재시작
+            self._clock_start = now
+            self._frames_sent = 0
+        elif lead > self._max_lead:
+            await asyncio.sleep(lead - self._max_lead)
+
+        if interrupt_event is not None and interrupt_event.is_set():
+            return False
+
+        await self._source.capture_frame(self._out_frame)
+        self._frames_sent += 1
+        return True
@@ -0,0 +1,237 @@
+"""서버측 VAD (Voice Activity Detection) 모듈.
+
+STT 전송 전에 참가자별 오디오를 발화 구간으로 자릅니다.
+- 엔진: 프레임 단위 발화 여부 판정 (교체 가능)
+- SpeechSegmenter: pre-roll 버퍼링 + hangover + 발화 종료(epFlag) 마커 생성
+
+무음 구간은 Clova로 전송하지 않고, hangover가 지나면 직접 epFlag를 보내
+클라이언트 VAD 이벤트를 기다리지 않고 final 결과를 앞당깁니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from typing import Callable, Protocol
+
+from src.utils.audio_dsp import as_int16, rms_int16
+
+logger = logging.getLogger(__name__)
+
+# (오디오 청크, epFlag) - STT 오디오 큐 항목과 동일한 형태
+VADOutput = tuple[bytes, bool]
+
+
+class VADEngine(Protocol):
+    """프레임 단위 발화 판정 엔진"""
+
+    def is_speech(self, pcm_data: bytes) -> bool:
+        """PCM16 mono 프레임이 발화인지 판정"""
+        ...
+
+
+class EnergyVADEngine:
+    """적응형 노이즈 플로어 기반 에너지 VAD.
+
+    무음 프레임의 RMS로 노이즈 플로어를 지수 이동 평균으로 추적하고,
+    RMS가 max(최소 임계값, 노이즈 플로어 × noise_ratio)를 넘으면 발화로 판정합니다.
+    """
+
+    def __init__(
+        self,
+        min_threshold: float,
+        noise_ratio: float = 3.0,
+        adapt_rate: float = 0.05,
+    ):
+        self.min_threshold = min_threshold
+        self.noise_ratio = noise_ratio
+        self.adapt_rate = adapt_rate
+        self.noise_floor = min_threshold / noise_ratio if noise_ratio > 0 else 0.0
+
+    @property
+    def threshold(self) -> float:
+        return max(self.min_threshold, self.noise_floor * self.noise_ratio)
+
+    def is_speech(self, pcm_data: bytes) -> bool:
+        rms = rms_int16(pcm_data)
+        if rms >= self.threshold:
+            return True
+        # 무음 프레임에서만 노이즈 플로어 갱신 (발화가 플로어를 끌어올리지 않도록)
+        self.noise_floor += self.adapt_rate * (rms - self.noise_floor)
+        return False
+
+
+class WebRTCVADEngine:
+    """webrtcvad 기반 VAD (선택 의존성).
+
+    webrtcvad는 10/20/30ms 프레임만 받으므로 20ms 단위로 나눠 과반수로 판정합니다.
+    """
+
+    _SUBFRAME_MS = 20
+
+    def __init__(self, sample_rate: int, mode: int = 2):
+        import webrtcvad
+
+        self._vad = webrtcvad.Vad(mode)
+        self.sample_rate = sample_rate
+        self._subframe_bytes = sample_rate * self._SUBFRAME_MS // 1000 * 2
+
+    def is_speech(self, pcm_data: bytes) -> bool:
+        size = self._subframe_bytes
+        total = len(pcm_data) // size
+        if total == 0:
+            return False
+        voiced = sum(
+            1
+            for i in range(total)
+            if self._vad.is_speech(pcm_data[i * size : (i + 1) * size], self.sample_rate)
+        )
+        return voiced * 2 >= total
+
+
+class SpeechSegmenter:
+    """참가자별 발화 구간 분할기.
+
+    Example:
+        segmenter = SpeechSegmenter(EnergyVADEngine(300.0), sample_rate=16000)
+        for chunk, is_end in segmenter.process(frame):
+            await audio_queue.put((chunk, is_end))
+    """
+
+    def __init__(
+        self,
+        engine: VADEngine,
+        sample_rate: int,
+        preroll_ms: int = 300,
+        hangover_ms: int = 500,
+        on_event: Callable[[str], None] | None = None,
+    ):
+        """
+        Args:
+            engine: 프레임 발화 판정 엔진
+            sample_rate: 입력 sample rate (mono PCM16)
+            preroll_ms: 발화 시작 전 함께 보낼 오디오 길이 (첫 음절 잘림 방지)
+            hangover_ms: 발화 종료로 판정하기까지 허용하는 무음 길이
+            on_event: "speech_start" / "speech_end" 이벤트 콜백
+        """
+        self.engine = engine
+        self.sample_rate = sample_rate
+        self.preroll_ms = preroll_ms
+        self.hangover_ms = hangover_ms
+        self.on_event = on_event
+
+        self._in_speech = False
+        self._silence_ms = 0.0
+        self._preroll: deque[tuple[bytes, float]] = deque()
+        self._preroll_total_ms = 0.0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._in_speech
+
+    def _duration_ms(self, pcm_data: bytes) -> float:
+        return as_int16(pcm_data).size * 1000 / self.sample_rate
+
+    def process(self, pcm_data: bytes) -> list[VADOutput]:
+        """프레임 1개 처리
+
+        Returns:
+            STT로 보낼 (청크, epFlag) 목록 (무음 구간이면 빈 리스트)
+        """
+        if not pcm_data:
+            return []
+
+        duration_ms = self._duration_ms(pcm_data)
+        speech = self.engine.is_speech(pcm_data)
+
+        if not self._in_speech:
+            if not speech:
+                self._push_preroll(pcm_data, duration_ms)
+                return []
+
+            # 발화 시작: pre-roll + 현재 프레임
+            self._in_speech = True
+            self._silence_ms = 0.0
+            outputs = [(chunk, False) for chunk, _ in self._preroll]
+            outputs.append((pcm_data, False))
+            self._preroll.clear()
+            self._preroll_total_ms = 0.0
+            self._emit("speech_start")
+            return outputs
+
+        outputs = [(pcm_data, False)]
+        if speech:
+            self._silence_ms = 0.0
+            return outputs
+
+        # 발화 중 무음: hangover 동안은 계속 전송 (끝음절 보존)
+        self._silence_ms += duration_ms
+        if self._silence_ms >= self.hangover_ms:
+            outputs.extend(self.force_end())
+        return outputs
+
+    def force_end(self) -> list[VADOutput]:
+        """발화 중이면 즉시 종료 마커 생성 (발화 중이 아니면 빈 리스트)"""
+        if not self._in_speech:
+            return []
+        self._in_speech = False
+        self._silence_ms = 0.0
+        self._emit("speech_end")
+        return [(b"", True)]
+
+    def reset(self) -> None:
+        """상태 초기화 (스트림 재시작 시)"""
+        self._in_speech = False
+        self._silence_ms = 0.0
+        self._preroll.clear()
+        self._preroll_total_ms = 0.0
+
+    def _push_preroll(self, pcm_data: bytes, duration_ms: float) -> None:
+        self._preroll.append((pcm_data, duration_ms))
+        self._preroll_total_ms += duration_ms
+        while self._preroll and self._preroll_total_ms - self._preroll[0][1] >= self.preroll_ms:
+            _, dropped_ms = self._preroll.popleft()
+            self._preroll_total_ms -= dropped_ms
+
+    def _emit(self, event: str) -> None:
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(event)
+        except Exception as e:
+            logger.warning(f"VAD 이벤트 콜백 오류: {e}")
+
+
+def create_vad_engine(config) -> VADEngine | None:
+    """설정에 맞는 VAD 엔진 생성 (vad_engine=off면 None)"""
+    engine = config.vad_engine.lower()
+    if engine == "off":
+        return None
+
+    if engine == "webrtc":
+        try:
+            return WebRTCVADEngine(config.audio_sample_rate, mode=config.vad_webrtc_mode)
+        except ImportError:
+            logger.warning("webrtcvad 미설치, energy VAD로 대체")
+
+    return EnergyVADEngine(
+        min_threshold=config.silence_threshold,
+        noise_ratio=config.vad_noise_ratio,
+    )
+
+
+def create_speech_segmenter(
+    config,
+    on_event: Callable[[str], None] | None = None,
+) -> SpeechSegmenter | None:
+    """설정 기반 SpeechSegmenter 생성 (VAD 비활성화 시 None)"""
+    engine = create_vad_engine(config)
+    if engine is None:
+        return None
+    return SpeechSegmenter(
+        engine,
+        sample_rate=config.audio_sample_rate,
+        preroll_ms=config.vad_preroll_ms,
+        hangover_ms=config.vad_hangover_ms,
+        on_event=on_event,
+    )
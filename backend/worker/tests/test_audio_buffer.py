@@ -0,0 +1,115 @@
+"""STT 오디오 버퍼 단위 테스트
+
+테스트 케이스:
+- 작은 프레임을 chunk_ms 단위로 병합
+- 용량 초과 시 드롭 정책 (drop_oldest / drop_newest), epFlag 마커는 유지
+- 병합 대기 시간 상한, 종료 후 남은 항목 소진
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.audio_buffer import DROP_NEWEST, DROP_OLDEST, AudioRingBuffer
+
+SAMPLE_RATE = 16000
+BYTES_PER_MS = SAMPLE_RATE * 2 // 1000  # 32
+
+
+def _audio(ms: int, value: int = 1) -> bytes:
+    return bytes([value]) * (ms * BYTES_PER_MS)
+
+
+def _size(ms: int) -> int:
+    return ms * BYTES_PER_MS
+
+
+def _buffer(**kwargs) -> AudioRingBuffer:
+    return AudioRingBuffer(sample_rate=SAMPLE_RATE, chunk_ms=100, capacity_ms=300, **kwargs)
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        _buffer(policy="drop_all")
+
+
+async def test_merges_small_frames_into_chunks():
+    buffer = _buffer()
+    for _ in range(10):
+        buffer.put_audio(_audio(20))
+
+    assert buffer.depth_ms == 200
+    chunk, is_end = await buffer.get()
+    assert (len(chunk), is_end) == (_size(100), False)
+    assert len(buffer._chunks) == 1
+
+
+async def test_end_marker_closes_chunk():
+    buffer = _buffer()
+    buffer.put_audio(_audio(20))
+    buffer.put_end()
+    buffer.put_audio(_audio(20, value=2))
+
+    assert await buffer.get() == (_audio(20), False)
+    assert await buffer.get() == (b"", True)
+    assert await buffer.get() == (_audio(20, value=2), False)
+
+
+def test_drop_oldest_keeps_latest_audio_and_markers():
+    buffer = _buffer(policy=DROP_OLDEST)
+    buffer.put_audio(_audio(100, value=1))
+    buffer.put_end()
+    buffer.put_audio(_audio(100, value=2))
+    buffer.put_audio(_audio(100, value=3))
+
+    dropped = buffer.put_audio(_audio(150, value=4))
+
+    assert dropped == _size(150)
+    assert buffer.dropped_bytes == dropped
+    assert buffer.depth_ms == 300
+    remaining = [(bytes(c.data[:1]), len(c.data), c.is_end) for c in buffer._chunks]
+    assert remaining == [
+        (b"", 0, True),
+        (b"\x02", _size(50), False),
+        (b"\x03", _size(100), False),
+        (b"\x04", _size(150), False),
+    ]
+
+
+def test_drop_newest_keeps_existing_audio():
+    buffer = _buffer(policy=DROP_NEWEST)
+    buffer.put_audio(_audio(250, value=1))
+
+    assert buffer.put_audio(_audio(100, value=2)) == _size(50)
+    assert buffer.put_audio(_audio(10, value=3)) == _size(10)
+    assert buffer.depth_ms == 300
+    assert buffer.dropped_bytes == _size(60)
+
+
+async def test_partial_chunk_released_after_chunk_ms():
+    buffer = AudioRingBuffer(sample_rate=SAMPLE_RATE, chunk_ms=20, capacity_ms=300)
+    buffer.put_audio(_audio(5))
+
+    chunk, _ = await asyncio.wait_for(buffer.get(), timeout=1)
+
+    assert chunk == _audio(5)
+
+
+async def test_close_drains_then_returns_none():
+    buffer = _buffer()
+    buffer.put_audio(_audio(10))
+    buffer.close()
+
+    assert await buffer.get() == (_audio(10), False)
+    assert await buffer.get() is None
+    assert buffer.put_audio(_audio(10)) == 0
+
+
+async def test_get_waits_for_audio():
+    buffer = _buffer()
+    getter = asyncio.create_task(buffer.get())
+    await asyncio.sleep(0)
+
+    buffer.put_audio(_audio(100))
+
+    assert await asyncio.wait_for(getter, timeout=1) == (_audio(100), False)
@@ -0,0 +1,111 @@
+"""PCM16 DSP 단위 테스트
+
+테스트 케이스:
+- 다운믹스/gain 결과가 기존 순수 Python 구현과 비트 단위로 동일
+- 홀수 길이/빈 입력, bytes 외 버퍼 입력 처리
+- RMS / 리샘플링 길이
+"""
+
+import array
+import math
+
+import numpy as np
+import pytest
+
+from src.utils.audio_dsp import (
+    apply_gain_int16,
+    as_int16,
+    resample_int16,
+    rms_int16,
+    stereo_to_mono_int16,
+)
+
+EXTREMES = [-32768, -32767, -1, 0, 1, 32766, 32767]
+
+
+def _pcm(samples) -> bytes:
+    return array.array("h", samples).tobytes()
+
+
+def _random_pcm(count: int, seed: int = 0) -> bytes:
+    rng = np.random.default_rng(seed)
+    samples = rng.integers(-32768, 32768, size=count).tolist()
+    return _pcm(samples + EXTREMES)
+
+
+def _reference_mono(pcm: bytes) -> bytes:
+    samples = array.array("h", pcm[: len(pcm) - len(pcm) % 4])
+    return _pcm([(samples[i] + samples[i + 1]) // 2 for i in range(0, len(samples), 2)])
+
+
+def _reference_gain(pcm: bytes, gain: float) -> bytes:
+    samples = array.array("h", pcm[: len(pcm) - len(pcm) % 2])
+    return _pcm([max(-32768, min(32767, int(sample * gain))) for sample in samples])
+
+
+class TestStereoToMono:
+    def test_matches_reference(self):
+        pcm = _random_pcm(4000) + _pcm([-32768, -32768, 32767, 32767, -1, 0])
+        assert stereo_to_mono_int16(pcm) == _reference_mono(pcm)
+
+    def test_trailing_partial_frame_ignored(self):
+        """샘플 쌍이 안 되는 꼬리(홀수 샘플/바이트)는 버림"""
+        pcm = _pcm([10, 20, 30]) + b"\x01"
+        assert stereo_to_mono_int16(pcm) == _pcm([15])
+
+    def test_empty(self):
+        assert stereo_to_mono_int16(b"") == b""
+        assert stereo_to_mono_int16(_pcm([7])) == b""
+
+
+class TestApplyGain:
+    @pytest.mark.parametrize("gain", [0.0, 0.3, 0.7, 1.5, 4.0, -1.0])
+    def test_matches_reference(self, gain):
+        pcm = _random_pcm(4000, seed=1)
+        assert apply_gain_int16(pcm, gain) == _reference_gain(pcm, gain)
+
+    def test_unity_gain_returns_copy(self):
+        pcm = bytearray(_pcm([1, 2, 3]))
+        result = apply_gain_int16(pcm, 1.0)
+        assert result == bytes(pcm)
+        assert isinstance(result, bytes)
+
+    def test_accepts_memoryview(self):
+        pcm = _random_pcm(100, seed=2)
+        assert apply_gain_int16(memoryview(pcm), 0.5) == _reference_gain(pcm, 0.5)
+
+
+class TestAsInt16:
+    def test_zero_copy_view(self):
+        buffer = bytearray(_pcm([1, 2, 3]))
+        samples = as_int16(buffer)
+        buffer[0:2] = _pcm([9])
+        assert samples.tolist() == [9, 2, 3]
+
+    def test_odd_length(self):
+        assert as_int16(_pcm([5, 6]) + b"\x00").tolist() == [5, 6]
+
+
+class TestRms:
+    def test_matches_reference(self):
+        samples = [-32768, 32767, 1000, -1000]
+        expected = math.sqrt(sum(s * s for s in samples) / len(samples))
+        assert rms_int16(_pcm(samples)) == pytest.approx(expected)
+
+    def test_empty(self):
+        assert rms_int16(b"") == 0.0
+
+
+class TestResample:
+    def test_same_rate_is_identity(self):
+        pcm = _random_pcm(100, seed=3)
+        assert resample_int16(pcm, 16000, 16000) == pcm
+
+    def test_output_length_follows_rate_ratio(self):
+        pcm = _pcm([0] * 480)
+        assert len(resample_int16(pcm, 48000, 16000)) == 160 * 2
+        assert len(resample_int16(pcm, 16000, 48000)) == 1440 * 2
+
+    def test_constant_signal_preserved(self):
+        pcm = _pcm([1234] * 300)
+        assert set(as_int16(resample_int16(pcm, 44100, 16000)).tolist()) == {1234}
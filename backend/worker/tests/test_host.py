@@ -0,0 +1,112 @@
+"""멀티 회의 워커 호스트 단위 테스트
+
+테스트 케이스:
+- 오류로 종료된 회의는 백오프 후 재시작, 연속 실패 시 대기 시간 증가
+- 정상 완료된 회의는 배정이 남아 있어도 재시작하지 않음
+- 배정이 해제되면 재시작 대기 기록 정리
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src import host as host_module
+from src.host import WorkerHost
+
+
+class FakeWorker:
+    """run()이 지정된 오류로 끝나는 RealtimeWorker 대역"""
+
+    errors: list[Exception | None] = []
+
+    def __init__(self, meeting_id, shared=None, clova_stt_secret=""):
+        self.meeting_id = meeting_id
+
+    async def run(self) -> None:
+        error = FakeWorker.errors.pop(0) if FakeWorker.errors else None
+        if error is not None:
+            raise error
+
+    def request_stop(self) -> None:
+        pass
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(host_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+@pytest.fixture
+def worker_host(monkeypatch, clock):
+    monkeypatch.setattr(host_module, "SharedClients", MagicMock())
+    monkeypatch.setattr(host_module, "RealtimeWorker", FakeWorker)
+    worker_host = WorkerHost(host_id="host-a")
+    worker_host.config = MagicMock(
+        worker_heartbeat_interval=2.0,
+        worker_restart_backoff_max=60.0,
+        clova_stt_secret="",
+    )
+    worker_host.capacity = 4
+    worker_host._shared.api_client.send_worker_heartbeat = AsyncMock(
+        return_value=[{"meetingId": "meeting-1", "clovaKeyIndex": None}]
+    )
+    return worker_host
+
+
+async def _sync(worker_host: WorkerHost) -> None:
+    await worker_host._sync_assignments()
+    # 시작된 태스크가 끝날 때까지 진행
+    await asyncio.sleep(0)
+
+
+async def test_crashed_meeting_restarts_with_backoff(worker_host, clock):
+    FakeWorker.errors = [RuntimeError("boom"), RuntimeError("boom again")]
+
+    await _sync(worker_host)  # 시작 → 오류 종료
+    await _sync(worker_host)  # 재시작 대기 (2초)
+    assert worker_host._restarts["meeting-1"] == (1, 1002.0)
+    assert "meeting-1" not in worker_host._tasks
+    assert "meeting-1" not in worker_host._finished
+
+    clock.now += 2
+    await _sync(worker_host)  # 재시작 → 다시 오류 종료
+    await _sync(worker_host)
+    assert worker_host._restarts["meeting-1"] == (2, clock.now + 4)
+
+    clock.now += 4
+    await _sync(worker_host)  # 재시작 → 정상 완료
+    await _sync(worker_host)
+    assert "meeting-1" in worker_host._finished
+    assert "meeting-1" not in worker_host._restarts
+
+
+async def test_completed_meeting_is_not_restarted(worker_host):
+    FakeWorker.errors = []
+
+    await _sync(worker_host)
+    await _sync(worker_host)
+    await _sync(worker_host)
+
+    assert "meeting-1" in worker_host._finished
+    assert "meeting-1" not in worker_host._tasks
+
+
+async def test_unassigned_meeting_restart_is_dropped(worker_host):
+    FakeWorker.errors = [RuntimeError("boom")]
+
+    await _sync(worker_host)
+    worker_host._shared.api_client.send_worker_heartbeat.return_value = []
+    await _sync(worker_host)
+
+    assert worker_host._restarts == {}
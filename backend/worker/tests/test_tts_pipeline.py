@@ -0,0 +1,159 @@
+"""TTS 파이프라인 단위 테스트
+
+테스트 케이스:
+- 문장 분리 / 첫 청크 절 경계 조기 분리
+- N-ahead 병렬 합성: 완료 순서와 무관하게 입력 순서로 반환, lookahead 상한
+- cancel_pending: 대기 중인 합성 취소, 재생되지 않은 스트림 수신 중단
+- StreamedAudio: 첫 청크 도착 시점 반환, 빈 스트림은 None
+"""
+
+import asyncio
+
+from src.utils.tts_pipeline import (
+    SentenceChunker,
+    StreamedAudio,
+    TTSPipeline,
+    extract_sentences,
+    open_streamed_audio,
+    split_first_clause,
+)
+
+
+class TestSentenceSplit:
+    def test_extract_sentences(self):
+        sentences, rest = extract_sentences('안녕하세요. "정말요?!" 네\n다음 줄 미완')
+        assert sentences == ["안녕하세요.", '"정말요?!"', "네"]
+        assert rest == "다음 줄 미완"
+
+    def test_split_first_clause_skips_number_separator(self):
+        assert split_first_clause("예산은 1,000만원 드는데 조정", 5) == (
+            "예산은 1,000만원 드는데",
+            " 조정",
+        )
+        assert split_first_clause("짧은, 문장", 10) is None
+
+    def test_chunker_splits_first_clause_only(self):
+        chunker = SentenceChunker(first_clause_min_chars=5)
+
+        assert chunker.feed("회의 결과를 보면, 예산") == ["회의 결과를 보면,"]
+        # 첫 청크 이후는 문장 단위
+        assert chunker.feed("은 증액, 일정") == []
+        assert chunker.feed("은 유지입니다. 끝") == ["예산은 증액, 일정은 유지입니다."]
+        assert chunker.flush() == "끝"
+        assert chunker.flush() == ""
+
+    def test_chunker_without_early_split(self):
+        chunker = SentenceChunker(first_clause_min_chars=0)
+        assert chunker.feed("회의 결과를 보면, 예산") == []
+
+
+class TestTTSPipeline:
+    async def test_results_in_schedule_order(self):
+        delays = {"a": 0.03, "b": 0.0, "c": 0.01}
+
+        async def _synthesize(text):
+            await asyncio.sleep(delays[text])
+            return text.encode()
+
+        pipeline = TTSPipeline(_synthesize, lookahead=3)
+        for text in "abc":
+            await pipeline.schedule(text)
+
+        results = [await pipeline.next_result() for _ in range(3)]
+
+        assert [(r.text, r.audio, r.cancelled) for r in results] == [
+            ("a", b"a", False),
+            ("b", b"b", False),
+            ("c", b"c", False),
+        ]
+
+    async def test_lookahead_bounds_running_synthesis(self):
+        running = 0
+        peak = 0
+
+        async def _synthesize(text):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.005)
+            running -= 1
+            return b""
+
+        pipeline = TTSPipeline(_synthesize, lookahead=2)
+
+        async def _produce():
+            for text in "abcde":
+                await pipeline.schedule(text)
+
+        producer = asyncio.create_task(_produce())
+        texts = [(await pipeline.next_result()).text for _ in range(5)]
+        await producer
+
+        assert texts == list("abcde")
+        assert peak == 2
+
+    async def test_cancel_pending(self):
+        started = asyncio.Event()
+
+        async def _synthesize(text):
+            if text == "slow":
+                started.set()
+                await asyncio.sleep(10)
+            return b"x"
+
+        pipeline = TTSPipeline(_synthesize, lookahead=2)
+        await pipeline.schedule("slow")
+        await pipeline.schedule("next")
+        waiter = asyncio.create_task(pipeline.next_result())
+        await started.wait()
+
+        assert pipeline.cancel_pending() == 2
+
+        result = await waiter
+        assert (result.text, result.cancelled, result.audio) == ("slow", True, None)
+        assert pipeline.pending_count == 0
+        # 슬롯이 모두 반환되어 다음 응답을 바로 스케줄 가능
+        await asyncio.wait_for(pipeline.schedule("a"), timeout=1)
+        await asyncio.wait_for(pipeline.schedule("b"), timeout=1)
+
+    async def test_cancel_stops_unplayed_stream(self):
+        async def _chunks():
+            yield b"\x00\x00"
+            await asyncio.sleep(10)
+
+        async def _synthesize(text):
+            return await open_streamed_audio(_chunks())
+
+        pipeline = TTSPipeline(_synthesize, lookahead=2)
+        await pipeline.schedule("a")
+        await asyncio.sleep(0.01)
+        _, task = pipeline._pending[0]
+        audio, _ = task.result()
+
+        pipeline.cancel_pending()
+        await asyncio.wait({audio._task}, timeout=1)
+
+        assert audio._task.cancelled()
+
+
+class TestStreamedAudio:
+    async def test_returns_on_first_chunk(self):
+        release = asyncio.Event()
+
+        async def _chunks():
+            yield b"a"
+            await release.wait()
+            yield b""
+            yield b"b"
+
+        audio = await asyncio.wait_for(open_streamed_audio(_chunks()), timeout=1)
+        assert isinstance(audio, StreamedAudio)
+
+        release.set()
+        assert [chunk async for chunk in audio] == [b"a", b"b"]
+
+    async def test_empty_stream(self):
+        async def _chunks():
+            yield b""
+
+        assert await open_streamed_audio(_chunks()) is None
@@ -0,0 +1,197 @@
+"""TTS 재생 엔진 단위 테스트
+
+테스트 케이스:
+- 다운믹스/gain 출력이 audio_dsp.stereo_to_mono_int16 / apply_gain_int16과 비트 단위로 동일
+- 스트림 청크 경계가 샘플/채널 경계와 어긋나도 bytes 입력과 같은 출력
+- 인터럽트 후 상태 초기화 (다음 클립에 이전 오디오가 섞이지 않음)
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.utils.audio_dsp import apply_gain_int16, stereo_to_mono_int16
+from src.utils.tts_playback import TTSPlaybackEngine
+
+OUTPUT_RATE = 48000
+FRAME_SAMPLES = OUTPUT_RATE * 20 // 1000  # 20ms
+FRAME_BYTES = FRAME_SAMPLES * 2
+EDGES = (-32768, -32767, -1, 0, 1, 32767)
+
+
+class FakeAudioSource:
+    """capture_frame 시점의 프레임 데이터를 복사해 기록"""
+
+    def __init__(self, interrupt_after: int | None = None, event: asyncio.Event | None = None):
+        self.frames: list[bytes] = []
+        self.cleared = 0
+        self._interrupt_after = interrupt_after
+        self._event = event
+
+    async def capture_frame(self, frame) -> None:
+        self.frames.append(bytes(frame.data))
+        if self._interrupt_after is not None and len(self.frames) == self._interrupt_after:
+            self._event.set()
+
+    def clear_queue(self) -> None:
+        self.cleared += 1
+
+    @property
+    def output(self) -> bytes:
+        return b"".join(self.frames)
+
+
+def _engine(source: FakeAudioSource, gain: float = 1.0) -> TTSPlaybackEngine:
+    # 페이싱 대기 없이 바로 전송
+    return TTSPlaybackEngine(source, OUTPUT_RATE, gain=gain, max_lead_ms=10**9)
+
+
+def _stereo_pcm(frames: int, seed: int = 0) -> bytes:
+    """경계값 (L, R) 조합 + 무작위 샘플"""
+    edges = np.array([(left, right) for left in EDGES for right in EDGES]).ravel()
+    rng = np.random.default_rng(seed)
+    samples = rng.integers(-32768, 32768, size=frames * 2 - edges.size)
+    return np.concatenate([edges, samples]).astype("<i2").tobytes()
+
+
+def _expected(pcm: bytes, gain: float, num_channels: int) -> bytes:
+    """기존 경로 결과 + 마지막 부분 프레임 무음 패딩"""
+    mono = stereo_to_mono_int16(pcm) if num_channels == 2 else pcm
+    out = apply_gain_int16(mono, gain)
+    return out + b"\x00" * (-len(out) % FRAME_BYTES)
+
+
+async def _stream(pcm: bytes, sizes: list[int]):
+    offset = 0
+    index = 0
+    while offset < len(pcm):
+        size = sizes[index % len(sizes)]
+        yield pcm[offset : offset + size]
+        offset += size
+        index += 1
+
+
+class TestBitIdentical:
+    @pytest.mark.parametrize("gain", [1.0, 0.7, 1.8, 0.0])
+    @pytest.mark.parametrize("num_channels", [1, 2])
+    async def test_matches_audio_dsp(self, gain, num_channels):
+        # 변환 블록(4096쌍)과 프레임 경계에 걸치는 길이
+        pcm = _stereo_pcm(FRAME_SAMPLES * 7 + 123, seed=num_channels)
+        source = FakeAudioSource()
+
+        completed = await _engine(source, gain).play(pcm, OUTPUT_RATE, num_channels)
+
+        assert completed
+        assert source.output == _expected(pcm, gain, num_channels)
+        assert all(len(frame) == FRAME_BYTES for frame in source.frames)
+
+    async def test_work_buffer_growth(self):
+        """작업 버퍼보다 큰 스트림 청크도 같은 결과"""
+        pcm = _stereo_pcm(10000, seed=3)
+        source = FakeAudioSource()
+
+        await _engine(source, 0.5).play(_stream(pcm, [len(pcm)]), OUTPUT_RATE, 2)
+
+        assert source.output == _expected(pcm, 0.5, 2)
+
+
+class TestStreamChunkBoundaries:
+    @pytest.mark.parametrize("sizes", [[1], [3], [5, 2, 7], [1001, 3, 4097]])
+    async def test_misaligned_chunks_match_bytes_input(self, sizes):
+        """청크가 샘플(2바이트)/채널 쌍(4바이트) 중간에서 끊겨도 잘린 샘플을 이어붙임"""
+        pcm = _stereo_pcm(FRAME_SAMPLES * 3 + 17, seed=4)
+        source = FakeAudioSource()
+
+        completed = await _engine(source, 0.7).play(_stream(pcm, sizes), OUTPUT_RATE, 2)
+
+        assert completed
+        assert source.output == _expected(pcm, 0.7, 2)
+
+    async def test_trailing_partial_sample_dropped(self):
+        pcm = _stereo_pcm(FRAME_SAMPLES, seed=5)
+        source = FakeAudioSource()
+        engine = _engine(source)
+
+        await engine.play(_stream(pcm + b"\x01\x02\x03", [7]), OUTPUT_RATE, 2)
+
+        assert source.output == _expected(pcm, 1.0, 2)
+        assert not engine._remainder
+
+    async def test_stream_closed_after_play(self):
+        closed = False
+
+        async def _chunks():
+            nonlocal closed
+            try:
+                yield b"\x00\x00" * FRAME_SAMPLES
+            finally:
+                closed = True
+
+        await _engine(FakeAudioSource()).play(_chunks(), OUTPUT_RATE)
+
+        assert closed
+
+
+class TestInterrupt:
+    async def test_interrupt_resets_state(self):
+        """중단된 클립의 잘린 샘플/부분 프레임이 다음 클립에 섞이지 않음"""
+        event = asyncio.Event()
+        source = FakeAudioSource(interrupt_after=2, event=event)
+        engine = _engine(source)
+        first = _stereo_pcm(FRAME_SAMPLES * 5 + 31, seed=6)
+
+        completed = await engine.play(
+            _stream(first, [FRAME_BYTES + 3]), OUTPUT_RATE, 2, interrupt_event=event
+        )
+
+        assert not completed
+        assert len(source.frames) == 2
+        assert source.cleared == 1
+        assert (engine._in_fill, engine._out_fill, engine._frames_sent) == (0, 0, 0)
+        assert not engine._remainder
+
+        source.frames.clear()
+        second = _stereo_pcm(FRAME_SAMPLES * 2 + 9, seed=7)
+        assert await engine.play(second, OUTPUT_RATE, 2)
+        assert source.output == _expected(second, 1.0, 2)
+
+    async def test_interrupt_drops_resampler(self):
+        """리샘플링 경로 중단 시 지연 샘플을 가진 리샘플러는 버리고 새로 생성"""
+        event = asyncio.Event()
+        source = FakeAudioSource(interrupt_after=1, event=event)
+        engine = _engine(source)
+        pcm = np.zeros(24000, dtype="<i2").tobytes()
+
+        assert not await engine.play(pcm, 24000, interrupt_event=event)
+        assert 24000 not in engine._resamplers
+
+        source.frames.clear()
+        assert await engine.play(pcm, 24000)
+        assert 24000 in engine._resamplers
+        # 1초 입력 → 48kHz 1초 분량 (중단된 클립의 지연 샘플 없음, 리샘플러 디더링만 허용)
+        output = np.frombuffer(source.output, dtype="<i2")
+        assert len(source.frames) == OUTPUT_RATE // FRAME_SAMPLES
+        assert np.abs(output).max() <= 1
+
+    async def test_interrupt_closes_stream(self):
+        event = asyncio.Event()
+        event.set()
+        closed = False
+
+        async def _chunks():
+            nonlocal closed
+            try:
+                while True:
+                    yield b"\x00\x00" * FRAME_SAMPLES
+            finally:
+                closed = True
+
+        assert not await _engine(FakeAudioSource()).play(
+            _chunks(), OUTPUT_RATE, interrupt_event=event
+        )
+        assert closed
+
+    async def test_invalid_channels(self):
+        with pytest.raises(ValueError):
+            await _engine(FakeAudioSource()).play(b"", OUTPUT_RATE, num_channels=6)
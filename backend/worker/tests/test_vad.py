@@ -0,0 +1,154 @@
+"""서버측 VAD 단위 테스트
+
+테스트 케이스:
+- 에너지 VAD: 임계값 판정, 무음 프레임에서만 노이즈 플로어 적응
+- SpeechSegmenter: pre-roll 포함 발화 시작, hangover 후 epFlag, 이벤트 콜백
+- 설정 기반 생성 (off / webrtcvad 미설치 시 energy 대체)
+"""
+
+import array
+import sys
+from types import SimpleNamespace
+
+from src.utils.vad import (
+    EnergyVADEngine,
+    SpeechSegmenter,
+    create_speech_segmenter,
+    create_vad_engine,
+)
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = SAMPLE_RATE // 100  # 10ms
+
+
+def _frame(amplitude: int) -> bytes:
+    return array.array("h", [amplitude] * FRAME_SAMPLES).tobytes()
+
+
+LOUD = _frame(3000)
+QUIET = _frame(10)
+
+
+class ScriptedEngine:
+    """프레임 내용(LOUD 여부)으로 발화 판정"""
+
+    def is_speech(self, pcm_data: bytes) -> bool:
+        return pcm_data == LOUD
+
+
+def _config(**overrides) -> SimpleNamespace:
+    values = {
+        "vad_engine": "energy",
+        "audio_sample_rate": SAMPLE_RATE,
+        "vad_webrtc_mode": 2,
+        "silence_threshold": 300.0,
+        "vad_noise_ratio": 3.0,
+        "vad_preroll_ms": 30,
+        "vad_hangover_ms": 50,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestEnergyVADEngine:
+    def test_threshold(self):
+        engine = EnergyVADEngine(min_threshold=300.0)
+        assert engine.is_speech(LOUD)
+        assert not engine.is_speech(QUIET)
+
+    def test_noise_floor_adapts_only_on_silence(self):
+        engine = EnergyVADEngine(min_threshold=300.0, noise_ratio=3.0, adapt_rate=0.5)
+        floor = engine.noise_floor
+
+        engine.is_speech(LOUD)
+        assert engine.noise_floor == floor
+
+        noisy = _frame(250)
+        for _ in range(20):
+            engine.is_speech(noisy)
+        assert 240 < engine.noise_floor <= 250
+        # 플로어가 오르면 임계값도 올라 같은 수준의 잡음은 계속 무음
+        assert engine.threshold > 700
+        assert not engine.is_speech(_frame(600))
+
+
+class TestSpeechSegmenter:
+    def _segmenter(self, events: list[str] | None = None) -> SpeechSegmenter:
+        return SpeechSegmenter(
+            ScriptedEngine(),
+            sample_rate=SAMPLE_RATE,
+            preroll_ms=20,
+            hangover_ms=30,
+            on_event=events.append if events is not None else None,
+        )
+
+    def test_silence_is_not_sent(self):
+        segmenter = self._segmenter()
+        assert segmenter.process(QUIET) == []
+        assert segmenter.process(b"") == []
+        assert not segmenter.in_speech
+
+    def test_speech_start_includes_preroll(self):
+        """발화 시작 시 pre-roll 길이만큼의 직전 무음을 함께 전송"""
+        events: list[str] = []
+        segmenter = self._segmenter(events)
+        first, second, third = _frame(11), _frame(12), _frame(13)
+        for frame in (first, second, third):
+            segmenter.process(frame)
+
+        outputs = segmenter.process(LOUD)
+
+        assert outputs == [(second, False), (third, False), (LOUD, False)]
+        assert segmenter.in_speech
+        assert events == ["speech_start"]
+
+    def test_hangover_then_end_marker(self):
+        """hangover 동안 무음도 전송, 지나면 epFlag 마커"""
+        events: list[str] = []
+        segmenter = self._segmenter(events)
+        segmenter.process(LOUD)
+
+        assert segmenter.process(QUIET) == [(QUIET, False)]
+        assert segmenter.process(LOUD) == [(LOUD, False)]  # 발화 재개 → 무음 누적 초기화
+        assert segmenter.process(QUIET) == [(QUIET, False)]
+        assert segmenter.process(QUIET) == [(QUIET, False)]
+        assert segmenter.process(QUIET) == [(QUIET, False), (b"", True)]
+        assert not segmenter.in_speech
+        assert events == ["speech_start", "speech_end"]
+
+    def test_force_end(self):
+        segmenter = self._segmenter()
+        assert segmenter.force_end() == []
+        segmenter.process(LOUD)
+        assert segmenter.force_end() == [(b"", True)]
+        assert segmenter.force_end() == []
+
+    def test_callback_error_does_not_break_processing(self):
+        def _raise(event):
+            raise RuntimeError(event)
+
+        segmenter = SpeechSegmenter(ScriptedEngine(), SAMPLE_RATE, on_event=_raise)
+        assert segmenter.process(LOUD) == [(LOUD, False)]
+
+    def test_reset(self):
+        segmenter = self._segmenter()
+        segmenter.process(QUIET)
+        segmenter.process(LOUD)
+        segmenter.reset()
+        assert not segmenter.in_speech
+        assert segmenter.process(LOUD) == [(LOUD, False)]
+
+
+class TestFactory:
+    def test_off(self):
+        assert create_vad_engine(_config(vad_engine="off")) is None
+        assert create_speech_segmenter(_config(vad_engine="OFF")) is None
+
+    def test_energy(self):
+        segmenter = create_speech_segmenter(_config())
+        assert isinstance(segmenter.engine, EnergyVADEngine)
+        assert (segmenter.preroll_ms, segmenter.hangover_ms) == (30, 50)
+
+    def test_webrtc_missing_falls_back_to_energy(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "webrtcvad", None)
+        assert isinstance(create_vad_engine(_config(vad_engine="webrtc")), EnergyVADEngine)
@@ -3,7 +3,7 @@
  */
 
 import { useCallback, useEffect, useRef, useState } from 'react';
-import type { TopicFeedResponse, TopicItem } from '@/types';
+import type { TopicFeedDelta, TopicFeedResponse, TopicItem } from '@/types';
 import { meetingTopicService } from '@/services/meetingTopicService';
 import logger from '@/utils/logger';
 
@@ -34,15 +34,41 @@ export function useMeetingTopics(
   const fallbackIntervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
   const mountedRef = useRef(true);
   const reconnectTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // 델타 기준점 (snapshot의 epoch + 마지막으로 적용한 seq)
+  const feedRef = useRef<{ epoch: string | null; seq: number } | null>(null);
+  const resyncingRef = useRef(false);
 
-  // 응답 데이터 업데이트 헬퍼
+  // 응답 데이터 업데이트 헬퍼 (snapshot)
   const updateFromResponse = useCallback((data: TopicFeedResponse) => {
     if (!mountedRef.current) return;
+    feedRef.current = { epoch: data.epoch ?? null, seq: data.seq ?? 0 };
     setTopics(data.topics);
     setIsL1Running(data.isL1Running);
     setPendingChunks(data.pendingChunks);
   }, []);
 
+  // 델타 적용 (seq 누락 또는 epoch 변경 시 false → snapshot 재동기화 필요)
+  const applyDelta = useCallback((delta: TopicFeedDelta): boolean => {
+    const feed = feedRef.current;
+    if (!feed || feed.epoch !== delta.epoch || delta.seq > feed.seq + 1) return false;
+    if (delta.seq <= feed.seq) return true; // 이미 snapshot에 반영됨
+
+    feed.seq = delta.seq;
+    const replaced = new Set([
+      ...delta.removedTopicIds,
+      ...delta.changedTopics.map((topic) => topic.id),
+    ]);
+    setTopics((prev) =>
+      prev
+        .filter((topic) => !replaced.has(topic.id))
+        .concat(delta.changedTopics)
+        .sort((a, b) => b.endTurn - a.endTurn)
+    );
+    setIsL1Running(delta.isL1Running);
+    setPendingChunks(delta.pendingChunks);
+    return true;
+  }, []);
+
   // 단발성 조회 (폴백용)
   const fetchTopics = useCallback(async () => {
     if (!meetingId || !mountedRef.current) return;
@@ -56,6 +82,17 @@ export function useMeetingTopics(
     }
   }, [meetingId, updateFromResponse]);
 
+  // snapshot 재동기화 (동시에 한 번만)
+  const resync = useCallback(async () => {
+    if (resyncingRef.current) return;
+    resyncingRef.current = true;
+    try {
+      await fetchTopics();
+    } finally {
+      resyncingRef.current = false;
+    }
+  }, [fetchTopics]);
+
   // SSE 연결 정리
   const cleanupSSE = useCallback(() => {
     if (eventSourceRef.current) {
@@ -120,13 +157,17 @@ export function useMeetingTopics(
       }
     });
 
-    // 업데이트 수신
+    // 업데이트 수신 (델타)
     eventSource.addEventListener('update', (event) => {
       if (!mountedRef.current) return;
       try {
-        const data = JSON.parse(event.data) as TopicFeedResponse;
-        updateFromResponse(data);
-        logger.debug('[useMeetingTopics] 토픽 업데이트 수신');
+        const delta = JSON.parse(event.data) as TopicFeedDelta;
+        if (applyDelta(delta)) {
+          logger.debug('[useMeetingTopics] 토픽 델타 적용:', delta.seq);
+        } else {
+          logger.info('[useMeetingTopics] 토픽 seq 누락, snapshot 재동기화');
+          resync();
+        }
       } catch (err) {
         logger.error('[useMeetingTopics] update 파싱 오류:', err);
       }
@@ -152,7 +193,16 @@ export function useMeetingTopics(
     eventSource.onopen = () => {
       logger.info('[useMeetingTopics] SSE 연결 열림');
     };
-  }, [meetingId, enabled, cleanupSSE, cleanupFallback, startFallbackPolling, updateFromResponse]);
+  }, [
+    meetingId,
+    enabled,
+    cleanupSSE,
+    cleanupFallback,
+    startFallbackPolling,
+    updateFromResponse,
+    applyDelta,
+    resync,
+  ]);
 
   // SSE 연결 관리
   useEffect(() => {
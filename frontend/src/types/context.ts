@@ -20,4 +20,21 @@ export interface TopicFeedResponse {
   currentTopic: string | null;
   topics: TopicItem[];
   updatedAt: string;
+  /** 토픽 피드 식별자 (오너 레플리카가 바뀌면 달라짐) */
+  epoch?: string | null;
+  /** 이 snapshot에 반영된 마지막 델타 번호 */
+  seq?: number;
+}
+
+/** 토픽 SSE update 이벤트 (마지막 발행 이후 변경분) */
+export interface TopicFeedDelta {
+  meetingId: string;
+  epoch: string;
+  seq: number;
+  pendingChunks: number;
+  isL1Running: boolean;
+  currentTopic: string | null;
+  changedTopics: TopicItem[];
+  removedTopicIds: string[];
+  updatedAt: string;
 }
@@ -92,7 +92,7 @@ export type {
 } from './kg';
 
 // Context/Topic types (local)
-export type { TopicItem, TopicFeedResponse } from './context';
+export type { TopicItem, TopicFeedResponse, TopicFeedDelta } from './context';
 
 // Invite Link types (local)
 export interface InviteLinkResponse {